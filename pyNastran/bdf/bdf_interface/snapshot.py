@@ -0,0 +1,567 @@
+"""
+Defines a columnar binary snapshot format for BDF models:
+ - save_bdf_snapshot(model, snapshot_filename)
+ - load_bdf_snapshot(snapshot_filename, xref=True)
+ - load_bdf_snapshot_arrays(snapshot_filename)
+
+Unlike ``BDF.save``, which pickles the object graph, the bulk data cards
+(nodes, elements, properties, ...) are stored by card type as typed
+arrays that are memory mapped when loaded.  The remaining cards and the
+executive/case control decks are stored as BDF text.
+
+File layout::
+
+    magic     : b'PYNSNAP1'
+    nheader   : uint64
+    header    : json metadata (the groups, the block offsets and the
+                card counts)
+    blocks    : 8-byte aligned arrays
+
+The cards in a group are stored as:
+
+ - GRID : nid, cp, cd, ps, seid, xyz, comment
+ - columns : a column for each of the ``repr_fields`` of the cards
+             (field0 is the card name), which is an int64, float64 or
+             string table index array.  A field with mixed types
+             (e.g., an optional int) stores a uint8 kind (None, int,
+             float, str) and a 64-bit value.  Blank fields aren't stored.
+ - fields : the cards that have different numbers of fields are stored
+            as the flattened ``repr_fields`` with a kind/value and the
+            number of fields per card
+
+The common elements (e.g., CQUAD4, CHEXA) are built directly from the
+columns; the other cards are parsed from their fields.  The comments
+are stored with the leading $, so they aren't reformatted on load.
+
+"""
+from __future__ import annotations
+import re
+import json
+from io import StringIO
+from collections import defaultdict
+from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+import numpy as np
+
+from pyNastran.bdf.cards.nodes import GRID
+from pyNastran.bdf.cards.elements.rods import CROD
+from pyNastran.bdf.cards.elements.shell import CQUAD4, CTRIA3
+from pyNastran.bdf.cards.elements.solid import (
+    CTETRA4, CTETRA10, CPENTA6, CPENTA15, CHEXA8, CHEXA20, CPYRAM5, CPYRAM13)
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+    from cpylog import SimpleLogger
+
+SNAPSHOT_MAGIC = b'PYNSNAP1'
+SNAPSHOT_VERSION = 2
+
+# dict[id] = card
+SINGLE_CARD_ATTRS = [
+    'nodes', 'coords', 'elements', 'masses', 'rigid_elements', 'plotels',
+    'properties', 'properties_mass', 'materials',
+]
+# dict[id] = List[card]
+LIST_CARD_ATTRS = ['loads', 'spcs', 'mpcs']
+
+# the repr_fields value kinds
+KIND_NONE = 0
+KIND_INT = 1
+KIND_FLOAT = 2
+KIND_STR = 3
+# a field column with more than one kind
+KIND_MIXED = 4
+VALUE_KINDS = {
+    type(None): KIND_NONE,
+    int: KIND_INT, np.int32: KIND_INT, np.int64: KIND_INT,
+    float: KIND_FLOAT, np.float32: KIND_FLOAT, np.float64: KIND_FLOAT,
+    str: KIND_STR,
+}
+
+
+def save_bdf_snapshot(model: BDF, snapshot_filename: str) -> None:
+    """
+    Saves a BDF model as a columnar binary snapshot
+
+    Parameters
+    ----------
+    model : BDF
+        the model; it will be uncross-referenced (like ``BDF.save``)
+    snapshot_filename : str
+        the path to the snapshot
+
+    """
+    model.uncross_reference()
+    strings = {}
+    blocks = []  # type: List[Tuple[str, np.ndarray]]
+    groups = []
+
+    # split the cards by type
+    cards_by_group = defaultdict(list)
+    for attr in SINGLE_CARD_ATTRS:
+        for key, card in getattr(model, attr).items():
+            if attr == 'coords' and key == 0:
+                continue
+            cards_by_group[(attr, card.type)].append(card)
+    for attr in LIST_CARD_ATTRS:
+        for cards in getattr(model, attr).values():
+            for card in cards:
+                cards_by_group[(attr, card.type)].append(card)
+
+    stored_groups = set()
+    for (attr, card_type), cards in cards_by_group.items():
+        name = f'{attr}/{card_type}'
+        if attr == 'nodes' and card_type == 'GRID':
+            group_blocks = _encode_grids(cards, strings)
+            card_format = 'grid'
+        else:
+            try:
+                columns = _encode_columns(cards, strings)
+                if columns is None:
+                    group_blocks = _encode_fields(cards, strings)
+                    card_format = 'fields'
+                else:
+                    group_blocks, kinds = columns
+                    card_format = 'columns'
+            except (KeyError, OverflowError):
+                # an unsupported field type; write it as text
+                model.log.debug(f'{name} will be stored as text')
+                continue
+        group = {'attr': attr, 'card_type': card_type,
+                 'format': card_format, 'ncards': len(cards)}
+        if card_format == 'columns':
+            group['kinds'] = kinds
+        groups.append(group)
+        blocks.extend((f'{name}/{key}', value) for key, value in group_blocks.items())
+        stored_groups.add((attr, card_type))
+
+    bdf_text = _write_remaining_cards(model, stored_groups)
+    punch = re.search(r'^\s*BEGIN', bdf_text, flags=re.IGNORECASE | re.MULTILINE) is None
+    blocks.append(('bdf_text', np.frombuffer(bdf_text.encode('utf8'), dtype='uint8')))
+
+    string_list = list(strings)
+    string_bytes = [string.encode('utf8') for string in string_list]
+    string_offsets = np.zeros(len(string_bytes) + 1, dtype='int64')
+    np.cumsum([len(string) for string in string_bytes], out=string_offsets[1:])
+    blocks.append(('strings/data', np.frombuffer(b''.join(string_bytes), dtype='uint8')))
+    blocks.append(('strings/offsets', string_offsets))
+
+    header = {
+        'version': SNAPSHOT_VERSION,
+        'punch': punch,
+        'card_count': model.card_count,
+        'groups': groups,
+        'blocks': {},
+    }
+    offset = 0
+    for name, array in blocks:
+        header['blocks'][name] = [offset, array.dtype.str, list(array.shape)]
+        offset += _aligned(array.nbytes)
+    header_bytes = json.dumps(header).encode('utf8')
+    header_bytes += b' ' * (_aligned(len(header_bytes)) - len(header_bytes))
+
+    with open(snapshot_filename, 'wb') as snapshot_file:
+        snapshot_file.write(SNAPSHOT_MAGIC)
+        snapshot_file.write(np.uint64(len(header_bytes)).tobytes())
+        snapshot_file.write(header_bytes)
+        for name, array in blocks:
+            data = np.ascontiguousarray(array).tobytes()
+            snapshot_file.write(data)
+            snapshot_file.write(b'\x00' * (_aligned(len(data)) - len(data)))
+
+
+def load_bdf_snapshot(snapshot_filename: str, xref: bool=True,
+                      log: Optional[SimpleLogger]=None, debug: bool=False) -> BDF:
+    """
+    Loads a BDF model from a snapshot created by ``save_bdf_snapshot``
+
+    Parameters
+    ----------
+    snapshot_filename : str
+        the path to the snapshot
+    xref : bool; default=True
+        cross reference the model
+    log : SimpleLogger; default=None
+        the logger
+    debug : bool; default=False
+        the debug level
+
+    Returns
+    -------
+    model : BDF
+        the model
+
+    """
+    from pyNastran.bdf.bdf import BDF
+    header, blocks, strings = _read_snapshot(snapshot_filename)
+
+    model = BDF(log=log, debug=debug)
+    bdf_text = blocks['bdf_text'].tobytes().decode('utf8')
+    model.read_bdf(StringIO(bdf_text), punch=header['punch'], xref=False, validate=False)
+
+    for group in header['groups']:
+        attr = group['attr']
+        card_type = group['card_type']
+        name = f'{attr}/{card_type}'
+        group_blocks = {key[len(name)+1:]: value for key, value in blocks.items()
+                        if key.startswith(name + '/')}
+        if group['format'] == 'grid':
+            _load_grids(model, group_blocks, strings)
+        elif group['format'] == 'columns':
+            _load_columns(model, attr, card_type, group_blocks, group['kinds'], strings)
+        else:
+            _load_fields(model, attr, group_blocks, strings)
+
+    # a card may define multiple objects (e.g., PVISC), so the count of
+    # the loaded objects isn't the number of cards
+    model.card_count = dict(header['card_count'])
+
+    if xref:
+        model.cross_reference()
+    return model
+
+
+def load_bdf_snapshot_arrays(snapshot_filename: str) -> Tuple[Dict[str, Dict[str, np.ndarray]],
+                                                              List[str]]:
+    """
+    Gets read-only, memory mapped views of the snapshot arrays without
+    building the card objects.
+
+    Parameters
+    ----------
+    snapshot_filename : str
+        the path to the snapshot
+
+    Returns
+    -------
+    arrays : dict[name] = dict[key] = ndarray
+        name : str
+            the group (e.g., 'nodes/GRID', 'elements/CQUAD4')
+        key : str
+            GRID    : nid, cp, cd, ps, seid, xyz, comment
+            columns : field0, field1, ..., comment
+                      (kind0, ... for the fields with mixed types)
+            fields  : nfields, kind, value, comment
+    strings : List[str]
+        the string table for the comment/str fields
+
+    """
+    header, blocks, strings = _read_snapshot(snapshot_filename)
+    arrays = {}
+    for group in header['groups']:
+        name = f'{group["attr"]}/{group["card_type"]}'
+        arrays[name] = {key[len(name)+1:]: value for key, value in blocks.items()
+                        if key.startswith(name + '/')}
+    return arrays, strings
+
+
+def _aligned(nbytes: int) -> int:
+    """pads the number of bytes to a multiple of 8"""
+    return (nbytes + 7) // 8 * 8
+
+
+def _read_snapshot(snapshot_filename: str) -> Tuple[Dict[str, Any],
+                                                   Dict[str, np.ndarray],
+                                                   List[str]]:
+    """memory maps the snapshot"""
+    with open(snapshot_filename, 'rb') as snapshot_file:
+        magic = snapshot_file.read(8)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError(f'{snapshot_filename!r} is not a BDF snapshot; magic={magic!r}')
+        nheader = int(np.frombuffer(snapshot_file.read(8), dtype='uint64')[0])
+        header = json.loads(snapshot_file.read(nheader).decode('utf8'))
+    if header['version'] != SNAPSHOT_VERSION:
+        raise ValueError(f'snapshot version={header["version"]} is not supported; '
+                         f'expected {SNAPSHOT_VERSION}')
+
+    data = np.memmap(snapshot_filename, dtype='uint8', mode='r', offset=16 + nheader)
+    blocks = {}
+    for name, (offset, dtype, shape) in header['blocks'].items():
+        dtype = np.dtype(dtype)
+        nbytes = int(np.prod(shape, dtype='int64')) * dtype.itemsize
+        blocks[name] = data[offset:offset+nbytes].view(dtype).reshape(shape)
+
+    string_data = blocks.pop('strings/data').tobytes()
+    string_offsets = blocks.pop('strings/offsets').tolist()
+    strings = [string_data[i0:i1].decode('utf8')
+               for i0, i1 in zip(string_offsets[:-1], string_offsets[1:])]
+    return header, blocks, strings
+
+
+def _get_comment_index(cards: List[Any], strings: Dict[str, int]) -> np.ndarray:
+    """
+    gets the comment index into the string table; -1 is no comment
+
+    The comments are stored with the leading $, so they may be set
+    without reformatting them.
+    """
+    icomment = [strings.setdefault(card.comment, len(strings))
+                if card.comment else -1
+                for card in cards]
+    return np.array(icomment, dtype='int64')
+
+
+def _get_comments(icomment: np.ndarray, strings: List[str]) -> List[str]:
+    """gets the comments from the string table"""
+    return [strings[i] if i >= 0 else '' for i in icomment.tolist()]
+
+
+def _encode_grids(grids: List[GRID], strings: Dict[str, int]) -> Dict[str, np.ndarray]:
+    """stores GRIDs as columns"""
+    nid = np.array([grid.nid for grid in grids], dtype='int64')
+    cp = np.array([grid.cp for grid in grids], dtype='int64')
+    cd = np.array([grid.cd for grid in grids], dtype='int64')
+    # blank -> -1
+    ps = np.array([int(grid.ps) if grid.ps not in ('', None) else -1 for grid in grids],
+                  dtype='int64')
+    seid = np.array([grid.seid for grid in grids], dtype='int64')
+    xyz = np.array([grid.xyz for grid in grids], dtype='float64').reshape(len(grids), 3)
+    return {
+        'nid': nid, 'cp': cp, 'cd': cd, 'ps': ps, 'seid': seid, 'xyz': xyz,
+        'comment': _get_comment_index(grids, strings),
+    }
+
+
+def _load_grids(model: BDF, blocks: Dict[str, np.ndarray], strings: List[str]) -> None:
+    """builds the GRIDs"""
+    # all the nodes share the same xyz array
+    xyz = np.array(blocks['xyz'])
+    comments = _get_comments(blocks['comment'], strings)
+    ps = [str(psi) if psi >= 0 else '' for psi in blocks['ps'].tolist()]
+    add_node = model._add_node_object
+    for i, (nid, cp, cd, psi, seid, comment) in enumerate(zip(
+            blocks['nid'].tolist(), blocks['cp'].tolist(), blocks['cd'].tolist(),
+            ps, blocks['seid'].tolist(), comments)):
+        grid = GRID(nid, xyz[i], cp=cp, cd=cd, ps=psi, seid=seid)
+        if comment:
+            grid._comment = comment
+        add_node(grid)
+
+
+def _encode_columns(cards: List[Any],
+                    strings: Dict[str, int]) -> Optional[Tuple[Dict[str, np.ndarray], List[int]]]:
+    """
+    stores the repr_fields of a set of cards as a typed column per field
+
+    Returns None if the cards don't have the same number of fields.
+    """
+    fields_list = [card.repr_fields() for card in cards]
+    nfields = len(fields_list[0])
+    if any(len(fields) != nfields for fields in fields_list):
+        return None
+
+    blocks = {'comment': _get_comment_index(cards, strings)}
+    kinds = []
+    for ifield, column in enumerate(zip(*fields_list)):
+        column_kinds = {VALUE_KINDS[type(value)] for value in column}
+        if len(column_kinds) > 1:
+            kind, value = _encode_values(column, strings)
+            blocks[f'kind{ifield}'] = kind
+            blocks[f'field{ifield}'] = value
+            kinds.append(KIND_MIXED)
+            continue
+
+        kind = column_kinds.pop()
+        if kind == KIND_INT:
+            blocks[f'field{ifield}'] = np.array(column, dtype='int64')
+        elif kind == KIND_FLOAT:
+            blocks[f'field{ifield}'] = np.array(column, dtype='float64')
+        elif kind == KIND_STR:
+            blocks[f'field{ifield}'] = np.array(
+                [strings.setdefault(value, len(strings)) for value in column], dtype='int64')
+        kinds.append(kind)
+    return blocks, kinds
+
+
+def _load_columns(model: BDF, attr: str, card_type: str,
+                  blocks: Dict[str, np.ndarray], kinds: List[int],
+                  strings: List[str]) -> None:
+    """builds the cards from their field columns"""
+    comments = _get_comments(blocks['comment'], strings)
+    ncards = len(comments)
+    columns = []
+    for ifield, kind in enumerate(kinds):
+        if kind == KIND_NONE:
+            columns.append([None] * ncards)
+        elif kind == KIND_STR:
+            columns.append([strings[i] for i in blocks[f'field{ifield}'].tolist()])
+        elif kind == KIND_MIXED:
+            columns.append(_decode_values(blocks[f'kind{ifield}'], blocks[f'field{ifield}'],
+                                          strings))
+        else:
+            columns.append(blocks[f'field{ifield}'].tolist())
+
+    build_element = ELEMENT_BUILDERS.get(card_type) if attr == 'elements' else None
+    if build_element is None:
+        for fields, comment in zip(zip(*columns), comments):
+            _add_card_fields(model, attr, list(fields), comment)
+        return
+
+    # skip the card parser for the common elements
+    add_element = model._add_element_object
+    for fields, comment in zip(zip(*columns), comments):
+        elem = build_element(fields)
+        if comment:
+            elem._comment = comment
+        add_element(elem)
+
+
+def _encode_fields(cards: List[Any], strings: Dict[str, int]) -> Dict[str, np.ndarray]:
+    """stores the repr_fields of a set of cards with different numbers of fields"""
+    fields_list = [card.repr_fields() for card in cards]
+    nfields = np.array([len(fields) for fields in fields_list], dtype='int32')
+    flat = [value for fields in fields_list for value in fields]
+    kind, value = _encode_values(flat, strings)
+    return {
+        'nfields': nfields, 'kind': kind, 'value': value,
+        'comment': _get_comment_index(cards, strings),
+    }
+
+
+def _load_fields(model: BDF, attr: str, blocks: Dict[str, np.ndarray],
+                 strings: List[str]) -> None:
+    """builds the cards from their repr_fields"""
+    flat = _decode_values(blocks['kind'], blocks['value'], strings)
+    comments = _get_comments(blocks['comment'], strings)
+    offsets = np.zeros(len(comments) + 1, dtype='int64')
+    np.cumsum(blocks['nfields'], out=offsets[1:])
+    for i0, i1, comment in zip(offsets[:-1].tolist(), offsets[1:].tolist(), comments):
+        _add_card_fields(model, attr, flat[i0:i1], comment)
+
+
+def _encode_values(values: List[Any], strings: Dict[str, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    stores a list of mixed type values as a uint8 kind and a 64-bit value
+    (a float or the bits of an int/string index)
+    """
+    kind = np.array([VALUE_KINDS[type(value)] for value in values], dtype='uint8')
+    value = np.zeros(len(values), dtype='float64')
+    ivalue = value.view('int64')
+    iint = np.flatnonzero(kind == KIND_INT)
+    ifloat = np.flatnonzero(kind == KIND_FLOAT)
+    istr = np.flatnonzero(kind == KIND_STR)
+    if len(iint):
+        ivalue[iint] = [values[i] for i in iint.tolist()]
+    if len(ifloat):
+        value[ifloat] = [values[i] for i in ifloat.tolist()]
+    if len(istr):
+        ivalue[istr] = [strings.setdefault(values[i], len(strings)) for i in istr.tolist()]
+    return kind, value
+
+
+def _decode_values(kind: np.ndarray, value: np.ndarray, strings: List[str]) -> List[Any]:
+    """gets the values stored by ``_encode_values``"""
+    ivalue = value.view('int64')
+    values = np.empty(len(kind), dtype='object')
+    iint = (kind == KIND_INT)
+    ifloat = (kind == KIND_FLOAT)
+    istr = (kind == KIND_STR)
+    values[iint] = ivalue[iint].tolist()
+    values[ifloat] = value[ifloat].tolist()
+    values[istr] = np.array(strings, dtype='object')[ivalue[istr]]
+    return values.tolist()
+
+
+def _add_card_fields(model: BDF, attr: str, fields: List[Any], comment: str) -> None:
+    """adds a card from its repr_fields"""
+    card_name = fields[0]
+    card_obj, card = model.create_card_object(fields, card_name, is_list=True,
+                                              has_none=True)
+    model._add_card_helper(card_obj, card, card_name, None)
+    if not comment:
+        return
+
+    # the id is the first field (e.g., eid, pid, sid)
+    cards = getattr(model, attr)
+    if attr in LIST_CARD_ATTRS:
+        card_object = cards[fields[1]][-1]
+    else:
+        card_object = cards[fields[1]]
+    card_object._comment = comment
+
+
+def _default(value: Any, default: Any) -> Any:
+    """replaces a blank field with the add_card default"""
+    return default if value is None else value
+
+
+def _build_crod(fields: Tuple[Any, ...]) -> CROD:
+    """builds a CROD from its repr_fields (see ``CROD.add_card``)"""
+    unused_card_name, eid, pid, n1, n2 = fields
+    return CROD(eid, _default(pid, eid), [n1, n2])
+
+
+def _build_ctria3(fields: Tuple[Any, ...]) -> CTRIA3:
+    """builds a CTRIA3 from its repr_fields (see ``CTRIA3.add_card``)"""
+    (unused_card_name, eid, pid, n1, n2, n3, theta_mcid, zoffset,
+     unused_blank1, unused_blank2, tflag, T1, T2, T3) = fields
+    return CTRIA3(eid, _default(pid, eid), [n1, n2, n3],
+                  zoffset=_default(zoffset, 0.0), theta_mcid=_default(theta_mcid, 0.0),
+                  tflag=_default(tflag, 0), T1=T1, T2=T2, T3=T3)
+
+
+def _build_cquad4(fields: Tuple[Any, ...]) -> CQUAD4:
+    """builds a CQUAD4 from its repr_fields (see ``CQUAD4.add_card``)"""
+    (unused_card_name, eid, pid, n1, n2, n3, n4, theta_mcid, zoffset,
+     unused_blank, tflag, T1, T2, T3, T4) = fields
+    return CQUAD4(eid, _default(pid, eid), [n1, n2, n3, n4],
+                  theta_mcid=_default(theta_mcid, 0.0), zoffset=_default(zoffset, 0.0),
+                  tflag=_default(tflag, 0), T1=T1, T2=T2, T3=T3, T4=T4)
+
+
+def _solid_builder(linear_class, quadratic_class, nnodes_linear: int,
+                   nnodes_quadratic: int):
+    """
+    gets a function that builds a linear/quadratic solid from its
+    repr_fields (see ``BDF._prepare_ctetra``)
+    """
+    def build_solid(fields: Tuple[Any, ...]):
+        nfields = len(fields)
+        while fields[nfields - 1] is None:
+            nfields -= 1
+        eid = fields[1]
+        pid = _default(fields[2], eid)
+        if nfields == 3 + nnodes_linear:
+            return linear_class(eid, pid, list(fields[3:nfields]))
+        nids = list(fields[3:3+nnodes_quadratic])
+        nids += [None] * (nnodes_quadratic - len(nids))
+        return quadratic_class(eid, pid, nids)
+    return build_solid
+
+
+# the elements that are built without the card parser
+ELEMENT_BUILDERS = {
+    'CROD': _build_crod,
+    'CTRIA3': _build_ctria3,
+    'CQUAD4': _build_cquad4,
+    'CTETRA': _solid_builder(CTETRA4, CTETRA10, 4, 10),
+    'CPENTA': _solid_builder(CPENTA6, CPENTA15, 6, 15),
+    'CHEXA': _solid_builder(CHEXA8, CHEXA20, 8, 20),
+    'CPYRAM': _solid_builder(CPYRAM5, CPYRAM13, 5, 13),
+}
+
+
+def _write_remaining_cards(model: BDF, stored_groups) -> str:
+    """writes the cards that aren't stored as arrays to a string"""
+    saved_attrs = {}
+    for attr in SINGLE_CARD_ATTRS:
+        cards = getattr(model, attr)
+        saved_attrs[attr] = cards
+        setattr(model, attr, {key: card for key, card in cards.items()
+                              if (attr, card.type) not in stored_groups or
+                              (attr == 'coords' and key == 0)})
+    for attr in LIST_CARD_ATTRS:
+        cards_dict = getattr(model, attr)
+        saved_attrs[attr] = cards_dict
+        cards_dict2 = {}
+        for key, cards in cards_dict.items():
+            cards2 = [card for card in cards if (attr, card.type) not in stored_groups]
+            if cards2:
+                cards_dict2[key] = cards2
+        setattr(model, attr, cards_dict2)
+
+    bdf_file = StringIO()
+    try:
+        model.write_bdf(bdf_file, size=16, is_double=True, close=False)
+    finally:
+        for attr, cards in saved_attrs.items():
+            setattr(model, attr, cards)
+    return bdf_file.getvalue()
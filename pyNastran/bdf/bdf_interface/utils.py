@@ -400,8 +400,11 @@ def fill_dmigs(model: BDF) -> None:
         else:  # pragma: no cover
             raise NotImplementedError(card_name)
 
-        for (card_obj, comment) in card_comments:
-            card._add_column(card_obj, comment=comment)
+        if card_name in {'DMIG', 'DMIJ', 'DMIJI', 'DMIK'} and name != 'UACCEL':
+            card._add_columns(card_comments)
+        else:
+            for (card_obj, comment) in card_comments:
+                card._add_column(card_obj, comment=comment)
         card.finalize()
 
     # empty the _dmig_temp variable
@@ -1675,6 +1675,42 @@ class TABRND1(Table):
     #def parse_fields(self, xy, nrepeated, is_data=False):
         #self.table = TableObj(xy, nrepeated, is_data)
 
+    def interpolate(self, x):
+        """
+        Interpolates G(F) for an array of frequencies
+
+        The spectrum is 0.0 outside the range of the table.
+        """
+        if isinstance(x, float):
+            x = [x]
+        x = np.asarray(x, dtype='float64')
+
+        # xj follow xi
+        i = np.clip(np.searchsorted(self.x, x, side='left') - 1, 0, len(self.x) - 2)
+        j = i + 1
+        xi = self.x[i]
+        yi = self.y[i]
+        xj = self.x[j]
+        yj = self.y[j]
+
+        is_out = (x < self.x[0]) | (x > self.x[-1])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            if self.xaxis == 'LINEAR':
+                dx = xj - xi
+                wi = (xj - x) / dx
+                wj = (x - xi) / dx
+            else:
+                dx = np.log(xj / xi)
+                wi = np.log(xj / x) / dx
+                wj = np.log(x / xi) / dx
+
+            if self.yaxis == 'LINEAR':
+                y = wi * yi + wj * yj
+            else:
+                y = np.exp(wi * np.log(yi) + wj * np.log(yj))
+        y[is_out] = 0.
+        return y
+
     def raw_fields(self):
         xy = []
         for xi, yi in zip(self.x, self.y):
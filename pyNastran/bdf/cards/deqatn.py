@@ -6,8 +6,13 @@ The capitalization of the sub-functions is important.
 
 """
 from __future__ import annotations
+import os
 import re
-from typing import Tuple, List, Dict, Union, Any, TYPE_CHECKING
+import sys
+import marshal
+import hashlib
+from types import CodeType
+from typing import Tuple, List, Dict, Union, Optional, Callable, Any, TYPE_CHECKING
 import numpy as np
 from numpy import (
     cos, sin, tan, log, log10, mean, exp, sqrt, square, mod, abs, sum,
@@ -142,6 +147,166 @@ def _get_ta(f: float) -> float:
 BUILTINS = ['del', 'eval', 'yield', 'async', 'await', 'property',
             'slice', 'filter', 'map']
 
+# the compiled DEQATN bytecode; keyed by the sha256 of the python source
+_CODE_CACHE: Dict[str, CodeType] = {}
+# the on-disk cache directory; None -> in-memory only
+_CODE_CACHE_DIRNAME: Optional[str] = None
+# an on-disk entry is MAGIC + sha256(source) + sha256(code) + marshal(code)
+_CODE_CACHE_MAGIC = b'DEQATN1\n'
+_NBYTES_HASH = 32
+
+def set_deqatn_cache_dir(dirname: Optional[str]) -> None:
+    """
+    Sets the directory used to cache compiled DEQATN equations
+
+    The cache is shared across models and processes.  Entries are
+    keyed on the generated source, so a stale entry cannot be loaded
+    for a modified equation.
+
+    The compiled code is written to a private ``deqatn`` subdirectory
+    (created with 0o700 permissions) that must be owned by the current
+    user.  Each entry stores the hash of its source and code, which is
+    checked before the code is loaded; that catches corrupt files, but
+    not a deliberately forged entry, so only use a directory that you
+    trust.  Compiled code from the cache is executed.
+
+    Parameters
+    ----------
+    dirname : str / None
+        the directory to write the compiled equations to;
+        None disables the on-disk cache
+
+    """
+    global _CODE_CACHE_DIRNAME
+    if dirname is None:
+        _CODE_CACHE_DIRNAME = None
+        return
+    if not os.path.isdir(dirname):
+        raise FileNotFoundError(f'dirname={dirname!r} does not exist')
+    cache_dirname = os.path.join(dirname, 'deqatn')
+    os.makedirs(cache_dirname, mode=0o700, exist_ok=True)
+    _check_private_dir(cache_dirname)
+    _CODE_CACHE_DIRNAME = cache_dirname
+
+def _check_private_dir(dirname: str) -> None:
+    """the directory must be owned by the current user and not shared"""
+    if not hasattr(os, 'getuid'):  # pragma: no cover
+        # windows; the permissions are inherited from the parent directory
+        return
+    stat = os.stat(dirname)
+    if stat.st_uid != os.getuid() or stat.st_mode & 0o077:
+        raise PermissionError(
+            f'the DEQATN cache directory {dirname!r} must be owned by the '
+            f'current user and not accessible by others; mode={oct(stat.st_mode & 0o777)}')
+
+def _compile_equation(func_str: str) -> CodeType:
+    """compiles the python source of a DEQATN using the code cache"""
+    source_hash = hashlib.sha256(func_str.encode('utf8')).digest()
+    key = source_hash.hex()
+    try:
+        return _CODE_CACHE[key]
+    except KeyError:
+        pass
+
+    cache_filename = None
+    if _CODE_CACHE_DIRNAME is not None:
+        cache_filename = os.path.join(
+            _CODE_CACHE_DIRNAME, f'deqatn_{key}.{sys.implementation.cache_tag}.bin')
+        if os.path.exists(cache_filename):
+            with open(cache_filename, 'rb') as cache_file:
+                data = cache_file.read()
+            code = _load_cache_entry(data, source_hash)
+            if code is not None:
+                _CODE_CACHE[key] = code
+                return code
+            # a truncated/corrupt/mismatched file; rebuild it
+
+    try:
+        code = compile(func_str, '<deqatn>', 'exec')
+    except SyntaxError:
+        print(func_str)
+        raise
+    _CODE_CACHE[key] = code
+
+    if cache_filename is not None:
+        # write to a temporary file, so a parallel reader never sees
+        # a partial file
+        code_bytes = marshal.dumps(code)
+        tmp_filename = f'{cache_filename}.{os.getpid()}'
+        with open(tmp_filename, 'wb') as cache_file:
+            cache_file.write(_CODE_CACHE_MAGIC + source_hash +
+                             hashlib.sha256(code_bytes).digest() + code_bytes)
+        os.replace(tmp_filename, cache_filename)
+    return code
+
+def _load_cache_entry(data: bytes, source_hash: bytes) -> Optional[CodeType]:
+    """loads the code from a cache entry; None -> the entry is invalid"""
+    nmagic = len(_CODE_CACHE_MAGIC)
+    i0 = nmagic + _NBYTES_HASH
+    i1 = i0 + _NBYTES_HASH
+    if len(data) < i1 or data[:nmagic] != _CODE_CACHE_MAGIC:
+        return None
+    code_bytes = data[i1:]
+    if (data[nmagic:i0] != source_hash or
+            data[i0:i1] != hashlib.sha256(code_bytes).digest()):
+        return None
+    try:
+        code = marshal.loads(code_bytes)
+    except (EOFError, ValueError, TypeError):
+        return None
+    if not isinstance(code, CodeType):
+        return None
+    return code
+
+
+def _stack(args) -> np.ndarray:
+    """broadcasts the arguments against each other and stacks them"""
+    return np.array(np.broadcast_arrays(*args))
+
+def _vmin(*args):
+    """elementwise min"""
+    return np.minimum.reduce(_stack(args))
+
+def _vmax(*args):
+    """elementwise max"""
+    return np.maximum.reduce(_stack(args))
+
+def _vrss(*args):
+    """elementwise 2-norm"""
+    return np.sqrt(np.square(_stack(args)).sum(axis=0))
+
+def _vavg(*args):
+    """elementwise average"""
+    return _stack(args).mean(axis=0)
+
+def _vssq(*args):
+    """elementwise sum of squares"""
+    return np.square(_stack(args)).sum(axis=0)
+
+def _vsum(*args):
+    """elementwise sum"""
+    return _stack(args).sum(axis=0)
+
+def _vdim(x, y):
+    """elementwise positive difference"""
+    return x - np.minimum(x, y)
+
+def _get_vectorized_namespace() -> Dict[str, Any]:
+    """
+    Gets the globals used to evaluate a DEQATN on arrays.
+
+    The elementwise functions (e.g., sin, exp) are already numpy ufuncs.
+    The reducing functions (e.g., max, rss) reduce over the arguments
+    rather than over the entire array.
+    """
+    namespace = dict(globals())
+    namespace.update({
+        'min': _vmin, 'max': _vmax,
+        'rss': _vrss, 'avg': _vavg, 'mean': _vavg,
+        'ssq': _vssq, 'sum': _vsum, 'dim': _vdim,
+    })
+    return namespace
+
 
 class DEQATN(BaseCard):  # needs work...
     """
@@ -192,6 +357,7 @@ class DEQATN(BaseCard):  # needs work...
             self.comment = comment
         self.dtable = None
         self.func = None
+        self.func_vectorized = None
         self.equation_id = equation_id
         self.eqs = eqs
         self.func_str = ''
@@ -265,18 +431,31 @@ class DEQATN(BaseCard):  # needs work...
             self.equation_id, self.eqs, default_values, str(self))
         self.func_str = func_str
         self.func_name = func_name
-        try:
-            exec(func_str)
-        except SyntaxError:
-            print(func_str)
-            raise
-        #print(locals().keys())
-        func = locals()[func_name]
+        code = _compile_equation(func_str)
+        local_dict = {}
+        exec(code, globals(), local_dict)
+        func = local_dict[func_name]
         setattr(self, func_name, func)
         #print(func)
         self.func = func
+        self.func_vectorized = None
         self.nargs = nargs
 
+    def _setup_vectorized_equation(self) -> Callable:
+        """
+        creates a version of ``self.func`` that operates on arrays
+
+        The equation is compiled once (see ``set_deqatn_cache_dir``) and
+        evaluated against elementwise versions of min, max, rss, etc.
+        """
+        if getattr(self, 'func', None) is None:
+            self._setup_equation()
+        code = _compile_equation(self.func_str)
+        local_dict = {}
+        exec(code, _get_vectorized_namespace(), local_dict)
+        self.func_vectorized = local_dict[self.func_name]
+        return self.func_vectorized
+
     def cross_reference(self, model: BDF) -> None:
         """
         Cross links the card so referenced cards can be extracted directly
@@ -298,13 +477,20 @@ class DEQATN(BaseCard):  # needs work...
 
     def uncross_reference(self) -> None:
         """Removes cross-reference links"""
-        del self.func
+        if not hasattr(self, 'func_name'):
+            # the card was never cross-referenced
+            return
+        # reset to the uncross-referenced state, so the equation can be
+        # set up again by evaluate_vectorized
+        self.func = None
+        self.func_vectorized = None
         #del self.f
         #del getattr(self, self.func_name)
         setattr(self, self.func_name, None)
         del self.func_name
         del self.nargs
-        del self.dtable, self.dtable_ref
+        del self.dtable_ref
+        self.dtable = None
 
     def _verify(self, xref: bool) -> None:
         pass
@@ -321,6 +507,38 @@ class DEQATN(BaseCard):  # needs work...
         return self.func(*args)
         #self.func(*args)
 
+    def evaluate_vectorized(self, *args) -> np.ndarray:
+        """
+        Evaluates the equation for many design points in one call
+
+        Parameters
+        ----------
+        *args : float / (n, ) float ndarray
+            the arguments to the equation; scalars are broadcast
+
+        Returns
+        -------
+        out : (n, ) float ndarray
+            the value of the equation at each point
+
+        """
+        func = getattr(self, 'func_vectorized', None)
+        if func is None:
+            func = self._setup_vectorized_equation()
+        if len(args) > self.nargs:
+            msg = 'len(args) > nargs\n'
+            msg += 'nargs=%s len(args)=%s; func_name=%s' % (
+                self.nargs, len(args), self.func_name)
+            raise RuntimeError(msg)
+
+        args = [np.asarray(arg, dtype='float64') for arg in args]
+        shape = np.broadcast_shapes(*[arg.shape for arg in args])
+        out = np.asarray(func(*args), dtype='float64')
+        if out.shape != shape:
+            # constant equations (e.g., f(x) = 1.)
+            out = np.broadcast_to(out, shape).copy()
+        return out
+
     def raw_fields(self) -> List[str]:
         return [self.write_card()]
 
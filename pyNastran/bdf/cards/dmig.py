@@ -2,11 +2,11 @@
 from __future__ import annotations
 from math import sin, cos, radians, atan2, sqrt, degrees
 from itertools import count
-from typing import Tuple, Dict, Any, TYPE_CHECKING
+from typing import List, Tuple, Dict, Any, Optional, TYPE_CHECKING
 
 import numpy as np
 from numpy import array, zeros
-from scipy.sparse import coo_matrix  # type: ignore
+from scipy.sparse import csc_matrix  # type: ignore
 
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.bdf.cards.base_card import BaseCard
@@ -481,6 +481,48 @@ class NastranMatrix(BaseCard):
         #if self.is_complex:
             #self.Complex(double(card, v, 'complex')
 
+    def _add_columns(self, card_comments) -> None:
+        """
+        Adds all the column entries of the matrix at once
+
+        The Gi/Ci/value fields of every column are cast with numpy
+        instead of field-by-field.  If any field is invalid, it falls
+        back to ``_add_column``, so the error message is the same.
+
+        Parameters
+        ----------
+        card_comments : List[(BDFCard, str)]
+            the column cards and their comments
+
+        """
+        cards = [card for card, unused_comment in card_comments]
+        try:
+            GCj, GCi, reals, complexs = _parse_columns(
+                cards, self.is_complex, self.is_polar)
+        except ValueError:
+            for card, comment in card_comments:
+                self._add_column(card, comment=comment)
+            return
+
+        for unused_card, comment in card_comments:
+            if comment:
+                if hasattr(self, '_comment'):
+                    self.comment += comment
+                else:
+                    self.comment = comment
+
+        if len(self.GCj):
+            GCj = np.vstack([np.asarray(self.GCj).reshape(-1, 2), GCj])
+            GCi = np.vstack([np.asarray(self.GCi).reshape(-1, 2), GCi])
+            reals = np.hstack([self.Real, reals])
+            if self.is_complex:
+                complexs = np.hstack([self.Complex, complexs])
+        self.GCj = GCj
+        self.GCi = GCi
+        self.Real = reals
+        if self.is_complex:
+            self.Complex = complexs
+
     def get_matrix(self, is_sparse: bool=False, apply_symmetry: bool=True):
         """
         Builds the Matrix
@@ -496,15 +538,13 @@ class NastranMatrix(BaseCard):
 
         Returns
         -------
-        M : numpy.ndarray or scipy.coomatrix
+        M : numpy.ndarray or scipy.sparse.csc_matrix
             the matrix
         rows : dict[int] = [int, int]
             dictionary of keys=rowID, values=(Grid,Component) for the matrix
         cols: dict[int] = [int, int]
             dictionary of keys=columnID, values=(Grid,Component) for the matrix
 
-        .. warning:: is_sparse=True WILL fail
-
         """
         return get_matrix(self, is_sparse=is_sparse, apply_symmetry=apply_symmetry)
 
@@ -1974,14 +2014,12 @@ class DMI(NastranMatrix):
 
         Returns
         -------
-        M : numpy.ndarray or scipy.coomatrix
+        M : numpy.ndarray or scipy.sparse.csc_matrix
             the matrix
-        rows : dict[int] = [int, int]
-            dictionary of keys=rowID, values=(Grid,Component) for the matrix
-        cols: dict[int] = [int, int]
-            dictionary of keys=columnID, values=(Grid,Component) for the matrix
-
-        .. warning:: is_sparse=True WILL fail
+        rows : None
+            unused
+        cols: None
+            unused
 
         """
         return get_dmi_matrix(self, is_sparse=is_sparse, apply_symmetry=apply_symmetry)
@@ -2030,17 +2068,47 @@ class DMI(NastranMatrix):
 def get_row_col_map(matrix: DMIG,
                     GCi: np.ndarray, GCj: np.ndarray,
                     ifo: int) -> Tuple[int, int, int,
-                                       np.ndarray, np.ndarray,
+                                       Dict[Any, int], Dict[Any, int],
                                        Dict[int, Any],
                                        Dict[int, Any]]:
+    """
+    Gets the row/column maps of a DMIG, DMIJ, DMIJI, or DMIK
+
+    The rows and columns are numbered in the order they're first used.
+    For a symmetric matrix (ifo=6), the rows and columns share a map.
+
+    Returns
+    -------
+    nrows / ncols : int
+        the number of rows/columns
+    ndim : int
+        1 : GCi/GCj are scalars
+        2 : GCi/GCj are (grid, component) pairs
+    rows / cols : Dict[(grid, component)] = int
+        the row/column index of a (grid, component)
+    rows_reversed / cols_reversed : Dict[int] = (grid, component)
+        the (grid, component) of a row/column index
+
+    """
+    GCi = np.asarray(GCi)
+    GCj = np.asarray(GCj)
     ndim = len(GCi.shape)
-    #print('ndim=%s' % ndim)
-    #print('GCj=%s' % GCj)
-    #print('GCi=%s' % GCi)
+    unused_irow, unused_jcol, urows, ucols = _get_row_col_index(GCi, GCj, ifo)
     if ndim == 1:
-        rows, cols, rows_reversed, cols_reversed = _get_row_col_map_1d(matrix, GCi, GCj, ifo)
+        row_keys = urows.tolist()
+        col_keys = ucols.tolist()
     else:
-        rows, cols, rows_reversed, cols_reversed = _get_row_col_map_2d(matrix, GCi, GCj, ifo)
+        row_keys = [tuple(key) for key in urows.tolist()]
+        col_keys = [tuple(key) for key in ucols.tolist()]
+
+    rows_reversed = dict(enumerate(row_keys))
+    rows = {key: i for i, key in rows_reversed.items()}
+    if ifo == 6:
+        cols = rows
+        cols_reversed = rows_reversed
+    else:
+        cols_reversed = dict(enumerate(col_keys))
+        cols = {key: j for j, key in cols_reversed.items()}
 
     nrows = len(rows)
     ncols = len(cols)
@@ -2048,260 +2116,200 @@ def get_row_col_map(matrix: DMIG,
     assert ncols > 0, 'ncols=%s' % ncols
     return nrows, ncols, ndim, rows, cols, rows_reversed, cols_reversed
 
-def _get_row_col_map_1d(matrix, GCi, GCj, ifo: int):
-    """helper for ``get_row_col_map``"""
-    rows = {}
-    rows_reversed = {}
-
-    cols = {}
-    cols_reversed = {}
-    i = 0
-    #nrows = np.unique(GCi)
-    #ncols = np.unique(GCj)
-    for gci in GCi:
-        if gci not in rows:
-            rows[gci] = i
-            rows_reversed[i] = gci
-            i += 1
+def _get_row_col_index(GCi: np.ndarray, GCj: np.ndarray,
+                       ifo: int) -> Tuple[np.ndarray, np.ndarray,
+                                          np.ndarray, np.ndarray]:
+    """
+    Vectorized helper for ``get_row_col_map``
 
-    if ifo == 6:
-        # symmetric
-        for gcj in GCj:
-            if gcj not in rows:
-                #print('row.gcj = %s' % str(gcj))
-                rows[gcj] = i
-                rows_reversed[i] = gcj
-                i += 1
-        cols = rows
-        cols_reversed = rows_reversed
-    else:
-        j = 0
-        for gcj in GCj:
-            if gcj not in cols:
-                cols[gcj] = j
-                cols_reversed[j] = gcj
-                j += 1
-    return rows, cols, rows_reversed, cols_reversed
-
-def _get_row_col_map_2d(matrix, GCi, GCj, ifo):
-    """helper for ``get_row_col_map``"""
-    rows = {}
-    rows_reversed = {}
-
-    cols = {}
-    cols_reversed = {}
-    #print('i0=%s j0=%s' % (i, j))
-    #nrows = len(GCi)
-    #ncols = len(GCj)
-    #rows_array = np.zeros((nrows, 2), dtype='int32')
-    #cols_array = np.zeros((ncols, 2), dtype='int32')
-    #for i, (nid, comp) in enumerate(GCi):
-        ##print('i=%s nid=%s comp=%s nrows=%s rows_array.shape=%s' % (
-            ##i, nid, comp, nrows, str(rows_array.shape)))
-        #rows_array[i, :] = [nid, comp]
-    #print('rows_array = \n%s' % rows_array)
-
-    #for j, (nid, comp) in enumerate(GCj):
-        #cols_array[j, :] = [nid, comp]
-
-    i = 0
-    for (nid, comp) in GCi:
-        gci = (nid, comp)
-        if gci not in rows:
-            rows[gci] = i
-            rows_reversed[i] = gci
-            i += 1
+    Returns
+    -------
+    irow / jcol : (nvalues, ) int array
+        the row/column index of each term
+    urows / ucols : (nrows, ) or (nrows, 2) int array
+        the (grid, component) of each row/column index
 
+    """
+    nvalues = len(GCi)
     if ifo == 6:
         # symmetric
-        for (nid, comp) in GCj:
-            gcj = (nid, comp)
-            if gcj not in rows:
-                rows[gcj] = i
-                rows_reversed[i] = gcj
-                i += 1
-        cols = rows
-        cols_reversed = rows_reversed
-    else:
-        j = 0
-        for (nid, comp) in GCj:
-            gcj = (nid, comp)
-            if gcj not in cols:
-                cols[gcj] = j
-                cols_reversed[j] = gcj
-                j += 1
-    return rows, cols, rows_reversed, cols_reversed
-
-def _fill_sparse_matrix(matrix: DMIG, nrows: int, ncols: int):
-    """helper method for ``get_matrix``"""
-    GCj = array(matrix.GCj, dtype='int32') - 1
-    GCi = array(matrix.GCi, dtype='int32') - 1
-    reals = array(matrix.Real, dtype='float32')
+        index, ukeys = _first_appearance_index(np.concatenate([GCi, GCj]))
+        irow = index[:nvalues]
+        jcol = index[nvalues:]
+        return irow, jcol, ukeys, ukeys
 
-    # TODO: matrix size:  is this correct?
-    nrows = max(GCi) + 1
-    ncols = max(GCj) + 1
+    irow, urows = _first_appearance_index(GCi)
+    jcol, ucols = _first_appearance_index(GCj)
+    return irow, jcol, urows, ucols
 
-    dtype = _get_dtype(matrix.is_complex, matrix.tin)
-    # TODO: no check for symmetry
-    # TODO: no check for dtype
-    if matrix.is_complex:
-        complexs = array(matrix.Complex, dtype='float32')
-        data = array([reals, complexs]).astype(complex)
-    else:
-        data = reals
+def _first_appearance_index(keys: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Numbers the unique keys (or rows of keys) in order of their first
+    appearance, which is the order a dictionary would number them.
 
-    if matrix.matrix_form in {1, 6}:
-        nrows = max(nrows, ncols)
-        ncols = nrows
+    Returns
+    -------
+    index : (n, ) int array
+        the index of each key
+    ukeys : (nunique, ...) array
+        the unique keys in index order
 
-    #A = coo_matrix( (entries,(rows,cols)),shape=(nrows,ncols),dtype=dtype) # test
-    sparse_matrix = coo_matrix((data, (matrix.GCi, matrix.GCj)),
-                               shape=(nrows, ncols), dtype=dtype)
-    #sparse_matrix = coo_matrix( (data,(matrix.GCi,matrix.GCj)),shape=(i,j)) # old
-    #sparse_matrix = coo_matrix( (data,(matrix.GCi,matrix.GCj)),shape=(nrows,ncols))
-    #print(sparse_matrix.toarray())
-    #print(sparse_matrix)
-    return sparse_matrix
+    """
+    if len(keys) == 0:
+        return np.zeros(0, dtype='int32'), keys
+    axis = None if keys.ndim == 1 else 0
+    ukeys, ifirst, inverse = np.unique(
+        keys, axis=axis, return_index=True, return_inverse=True)
+    isort = np.argsort(ifirst, kind='stable')
+    rank = np.empty(len(ifirst), dtype='int32')
+    rank[isort] = np.arange(len(ifirst), dtype='int32')
+    return rank[inverse.ravel()], ukeys[isort]
+
+def _assemble_matrix(irow: np.ndarray, jcol: np.ndarray, data: np.ndarray,
+                     shape: Tuple[int, int], dtype: str,
+                     is_sparse: bool, is_symmetric: bool,
+                     sum_duplicates: bool=False):
+    """
+    Builds a dense or sparse matrix from the (irow, jcol, value) terms
 
+    Parameters
+    ----------
+    is_symmetric : bool
+        mirror the terms across the diagonal
+    sum_duplicates : bool; default=False
+        True : duplicate terms are summed
+        False : the last duplicate term is used;  this is always the
+                case for the mirrored terms of a symmetric matrix
 
-def _fill_dense_rectangular_matrix(self, nrows, ncols, ndim, rows, cols, apply_symmetry):
-    """helper method for get_matrix"""
-    is_sparse = False
-    if self.is_complex:
-        dense_mat = zeros((nrows, ncols), dtype='complex128')
-        if self.matrix_form == 6 and apply_symmetry:  # symmetric
-            for (gcj, gci, reali, complexi) in zip(self.GCj, self.GCi,
-                                                   self.Real, self.Complex):
-                i = rows[(gci[0], gci[1])]
-                j = cols[(gcj[0], gcj[1])]
-                dense_mat[i, j] = complex(reali, complexi)
-                dense_mat[j, i] = complex(reali, complexi)
-        else:
-            for (gcj, gci, reali, complexi) in zip(self.GCj, self.GCi,
-                                                   self.Real, self.Complex):
-                i = rows[(gci[0], gci[1])]
-                j = cols[(gcj[0], gcj[1])]
-                dense_mat[i, j] = complex(reali, complexi)
-    else:
-        dense_mat = zeros((nrows, ncols), dtype='float64')
-        if self.matrix_form == 6 and apply_symmetry:  # symmetric
-            try:
-                for (gcj, gci, reali) in zip(self.GCj, self.GCi, self.Real):
-                    i = rows[(gci[0], gci[1])]
-                    j = cols[(gcj[0], gcj[1])]
-                    dense_mat[i, j] = reali
-                    dense_mat[j, i] = reali
-            except IndexError:
-                msg = ('name=%s ndim=%s i=%s j=%s matrix_type=%s '
-                       'is_polar=%s ncols=%s M.shape=%s\n' % (
-                           self.name, ndim, i, j, self.matrix_type,
-                           self.is_polar, self.ncols, dense_mat.shape))
-                msg += 'Rows:\n'
-                for i, row in enumerate(rows):
-                    msg += 'i=%s row=%s\n' % (i, row)
-                raise RuntimeError(msg)
-        else:
-            try:
-                for (gcj, gci, reali) in zip(self.GCj, self.GCi, self.Real):
-                    i = rows[(gci[0], gci[1])]
-                    j = cols[(gcj[0], gcj[1])]
-                    dense_mat[i, j] = reali
-            except KeyError:
-                msg = ('name=%s ndim=%s gci=%s gcj=%s matrix_type=%s '
-                       'is_polar=%s is_sparse=%s ncols=%s M.shape=%s\n\n' % (
-                           self.name, ndim, str(gci), str(gcj), self.matrix_type,
-                           self.is_polar, is_sparse, self.ncols, dense_mat.shape))
-
-                gci2 = (gci[0], gci[1])
-                gcj2 = (gcj[0], gcj[1])
-                if gci2 in rows:
-                    msg += 'gci/row_key=%s found\n' % str(gci2)
-                else:
-                    msg += 'gci/row_key=%s not found\n' % str(gci2)
-                    msg += 'Rows:\n'
-                    for i, row in enumerate(rows):
-                        msg += '  i=%s row=%s\n' % (i, row)
+    """
+    if is_symmetric:
+        # interleave each term with its transpose, so the last term
+        # defines both (i, j) and (j, i)
+        irow, jcol = (np.column_stack([irow, jcol]).ravel(),
+                      np.column_stack([jcol, irow]).ravel())
+        data = np.repeat(data, 2)
+        sum_duplicates = False
+
+    if not sum_duplicates and len(irow):
+        key = irow.astype('int64') * shape[1] + jcol
+        unused_key, ilast = np.unique(key[::-1], return_index=True)
+        ilast = len(key) - 1 - ilast
+        irow = irow[ilast]
+        jcol = jcol[ilast]
+        data = data[ilast]
 
-                if gcj2 in cols:
-                    msg += '\ngcj/col_key=%s found\n' % str(gcj2)
-                else:
-                    msg += '\ngcj/col_key=%s not found\n' % str(gcj2)
-                    msg += 'Cols:\n'
-                    for j, col in enumerate(cols):
-                        msg += '  j=%s row=%s\n' % (j, col)
-
-                msg += '\n'
-                print(msg)
-                raise KeyError(msg)
-            except IndexError:
-                msg = ('name=%s ndim=%s i=%s j=%s matrix_type=%s '
-                       'is_polar=%s is_sparse=%s ncols=%s M.shape=%s\n' % (
-                           self.name, ndim, i, j, self.matrix_type,
-                           self.is_polar, is_sparse, self.ncols, dense_mat.shape))
-                msg += 'Rows:\n'
-                for i, row in enumerate(rows):
-                    msg += '  i=%s row=%s\n' % (i, row)
-
-                msg += '\nCols:\n'
-                for j, row in enumerate(cols):
-                    msg += '  j=%s row=%s\n' % (j, col)
-                raise RuntimeError(msg)
-    return dense_mat
-
-
-def _fill_dense_column_matrix(self, nrows, ncols, ndim, rows, cols, apply_symmetry):
-    """helper method for get_matrix"""
-    is_sparse = False
-    if self.is_complex:
-        dense_mat = zeros((nrows, ncols), dtype='complex128')
-        if self.matrix_form == 6 and apply_symmetry:  # symmetric
-            assert nrows == ncols, 'nrows=%s ncols=%s' % (nrows, ncols)
-            for (gcj, gci, reali, complexi) in zip(self.GCj, self.GCi,
-                                                   self.Real, self.Complex):
-                i = rows[gci]
-                j = cols[gcj]
-                dense_mat[i, j] = complex(reali, complexi)
-                dense_mat[j, i] = complex(reali, complexi)
-        elif self.matrix_form == 2:  # rectangular
-            assert nrows == ncols, 'nrows=%s ncols=%s' % (nrows, ncols)
-            for (gcj, gci, reali, complexi) in zip(self.GCj, self.GCi,
-                                                   self.Real, self.Complex):
-                i = rows[gci]
-                j = cols[gcj]
-                dense_mat[i, j] = complex(reali, complexi)
-        else:
-            for (gcj, gci, reali, complexi) in zip(self.GCj, self.GCi,
-                                                   self.Real, self.Complex):
-                i = rows[gci]
-                j = cols[gcj]
+    if is_sparse:
+        return csc_matrix((data, (irow, jcol)), shape=shape, dtype=dtype)
+
+    matrix = zeros(shape, dtype=dtype)
+    if sum_duplicates:
+        np.add.at(matrix, (irow, jcol), data)
     else:
-        #print('nrows=%s ncols=%s' % (nrows, ncols))
-        dense_mat = zeros((nrows, ncols), dtype='float64')
-        if self.matrix_form == 6 and apply_symmetry:  # symmetric
-            assert nrows == ncols, 'nrows=%s ncols=%s' % (nrows, ncols)
-            for (gcj, gci, reali) in zip(self.GCj, self.GCi, self.Real):
-                i = rows[gci]
-                j = cols[gcj]
-                dense_mat[i, j] = reali
-                dense_mat[j, i] = reali
-        else:
-            try:
-                for (gcj, gci, reali) in zip(self.GCj, self.GCi, self.Real):
-                    i = rows[gci]
-                    j = cols[gcj]
-                    dense_mat[i, j] = reali
-            except IndexError:
-                msg = ('name=%s ndim=%s i=%s j=%s matrix_type=%s '
-                       'is_polar=%s is_sparse=%s ncols=%s M.shape=%s\n' % (
-                           self.name, ndim, i, j, self.matrix_type,
-                           self.is_polar, is_sparse, self.ncols, dense_mat.shape))
-                msg += 'Rows:\n'
-                for i, row in enumerate(rows):
-                    msg += '  i=%s row=%s\n' % (i, row)
-                raise RuntimeError(msg)
-    return dense_mat
+        matrix[irow, jcol] = data
+    return matrix
 
+def _parse_columns(cards: List[BDFCard],
+                   is_complex: bool, is_polar: bool) -> Tuple[np.ndarray, np.ndarray,
+                                                              np.ndarray, Optional[np.ndarray]]:
+    """
+    Parses the column entries of a DMIG, DMIJ, DMIJI, or DMIK
+
+    The Gj/Cj fields are parsed per card.  The (Gi, Ci, A, B) fields
+    of all the cards are stacked and cast as arrays.
+
+    Raises
+    ------
+    ValueError : a Gi/Ci/A/B field is invalid
+
+    """
+    Gj = []
+    Cj = []
+    nterms = []
+    fields = []
+    for card in cards:
+        gj = integer(card, 2, 'Gj')
+        cj = integer_or_blank(card, 3, 'Cj', 0)
+        assert 0 <= cj <= 6, 'C%i must be between [0, 6]; Cj=%s' % (0, cj)
+
+        nfields = len(card)
+        nloops = (nfields - 5) // 4
+        if (nfields - 5) % 4 in [2, 3]:  # real/complex
+            nloops += 1
+        assert nloops > 0, 'nloops=%s' % nloops
+
+        card_fields = card[5:5 + 4 * nloops]
+        fields.extend(card_fields)
+        fields.extend([None] * (4 * nloops - len(card_fields)))
+        Gj.append(gj)
+        Cj.append(cj)
+        nterms.append(nloops)
+
+    fields_array = np.array(fields, dtype=object).reshape(len(fields) // 4, 4)
+
+    gi = fields_array[:, 0].astype(str).astype('int64')
+    ci_fields = fields_array[:, 1]
+    ci_fields[np.equal(ci_fields, None) | np.equal(ci_fields, '')] = 0
+    ci = ci_fields.astype(str).astype('int64')
+    if ci.min(initial=0) < 0 or ci.max(initial=0) > 6:
+        raise ValueError('Ci must be between [0, 6]')
+
+    reals = _cast_nastran_floats(fields_array[:, 2])
+    complexs = None
+    if is_complex:
+        complexs = _cast_nastran_floats(fields_array[:, 3])
+        if is_polar:
+            phase = np.radians(complexs)
+            reals, complexs = reals * np.cos(phase), reals * np.sin(phase)
+
+    GCj = np.column_stack([np.repeat(Gj, nterms), np.repeat(Cj, nterms)])
+    GCi = np.column_stack([gi, ci])
+    return GCj, GCi, reals, complexs
+
+def _cast_nastran_floats(svalues: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of ``double`` that supports the Nastran forms
+    (e.g., 1.0, 1.0E+3, 1.0D+3, 1.0+3, -1.-3)
+
+    Raises
+    ------
+    ValueError : a value is blank, an integer, or not a float
+
+    """
+    svalues = np.asarray(svalues).astype(str)
+    nvalues = len(svalues)
+    if nvalues == 0:
+        return np.zeros(0, dtype='float64')
+    width = svalues.dtype.itemsize // 4
+    codes = svalues.view('uint32').reshape(nvalues, width).copy()
+
+    # 1, not +1, or -1
+    is_digit = (codes >= ord('0')) & (codes <= ord('9'))
+    if (is_digit.sum(axis=1) == (codes != 0).sum(axis=1)).any():
+        raise ValueError('a float field is blank or an integer')
+
+    # 1.0D+3
+    codes[(codes == ord('D')) | (codes == ord('d'))] = ord('E')
+
+    # 1.0+3; a sign that's not the first character and doesn't follow an E
+    is_sign = (codes == ord('+')) | (codes == ord('-'))
+    is_sign[:, 0] = False
+    is_sign[:, 1:] &= (codes[:, :-1] != ord('E')) & (codes[:, :-1] != ord('e'))
+    ishort = np.where(is_sign.any(axis=1))[0]
+    if len(ishort):
+        # insert an E before the sign
+        isign = is_sign[ishort].argmax(axis=1)
+        icol = np.arange(width)
+        icol_new = icol[np.newaxis, :] + (icol[np.newaxis, :] >= isign[:, np.newaxis])
+        short_codes = np.zeros((len(ishort), width + 1), dtype='uint32')
+        short_codes[np.arange(len(ishort))[:, np.newaxis], icol_new] = codes[ishort]
+        short_codes[np.arange(len(ishort)), isign] = ord('E')
+
+        codes2 = np.zeros((nvalues, width + 1), dtype='uint32')
+        codes2[:, :width] = codes
+        codes2[ishort] = short_codes
+        codes = codes2
+        width += 1
+    return codes.view('U%i' % width).ravel().astype('float64')
 
 def get_dmi_matrix(matrix: DMI,
                    is_sparse: bool=False,
@@ -2317,19 +2325,16 @@ def get_dmi_matrix(matrix: DMI,
     apply_symmetry: bool
         If the matrix is symmetric (matrix_form=6), returns a symmetric matrix.
         Supported as there are symmetric matrix routines.
-        TODO: unused...
 
     Returns
     -------
-    M : ndarray
+    M : ndarray or csc_matrix
         the matrix
     rows : None
         unused
     cols : None
         unused
 
-    .. warning:: is_sparse=True WILL fail
-
     """
     ifo = matrix.ifo
     GCj = array(matrix.GCj, dtype='int32') - 1
@@ -2341,32 +2346,17 @@ def get_dmi_matrix(matrix: DMI,
         data = matrix.Real + matrix.Complex * 1j
     else:
         data = matrix.Real
+    data = np.asarray(data)
 
-    if ifo == 2:
-        # rectangular
-        nrows = matrix.nrows
-        ncols = matrix.ncols
+    nrows = matrix.nrows
+    ncols = matrix.ncols
+    if ifo == 6:
+        nrows = max(nrows, ncols)
+        ncols = nrows
 
-        M = coo_matrix((data, (GCi, GCj)),
-                       shape=(nrows, ncols), dtype=dtype)
-    else:
-        nrows = matrix.nrows
-        ncols = matrix.ncols
-        if ifo == 6:
-            nrows = max(nrows, ncols)
-            ncols = nrows
-        M = coo_matrix((data, (GCi, GCj)),
-                       shape=(nrows, ncols), dtype=dtype)
-    if not is_sparse:
-        M = M.toarray()
-    #else:
-        #ifo : int
-        #    matrix shape
-        #    4=Lower Triangular
-        #    5=Upper Triangular
-        #    6=Symmetric
-        #    8=Identity (m=nRows, n=m)
-        #raise RuntimeError(matrix.get_stats())
+    is_symmetric = ifo == 6 and apply_symmetry
+    M = _assemble_matrix(GCi, GCj, data, (nrows, ncols), dtype,
+                         is_sparse, is_symmetric, sum_duplicates=True)
     return M, None, None
 
 def get_matrix(self: DMIG,
@@ -2385,50 +2375,43 @@ def get_matrix(self: DMIG,
     apply_symmetry: bool; default=False
         If the matrix is symmetric (matrix_form=6), returns a symmetric matrix.
         Supported as there are symmetric matrix routines.
-        TODO: unused...
 
     Returns
     -------
-    M : ndarray
+    M : ndarray or csc_matrix
         the matrix
     rows : Dict[(nid, nid)] = float
         dictionary of keys=rowID,    values=(Grid,Component) for the matrix
     cols : Dict[(int, int)] = float
         dictionary of keys=columnID, values=(Grid,Component) for the matrix
 
-    .. warning:: is_sparse=True WILL fail
-
     """
-    nrows, ncols, ndim, rows, cols, rows_reversed, cols_reversed = get_row_col_map(
-        self, self.GCi, self.GCj, self.matrix_form)
-    #print('rows = ', rows)
-    #print('cols = ', cols)
-    #print('i=%s j=%s' % (i, j))
-    #nrows = len(rows2)
-    #ncols = len(cols2)
-
-    #A = ss.lil_matrix((3,3), dtype='d') # double precision
-    #rows = []
-    #cols = []
-    #data = []
-    #for i in range(3):
-       #for j in range(3):
-           #k = float((i+1)*(j+1))
-           #rows.append(i)
-           #cols.append(j)
-           #data.append(k)
-           #A[i,j] = k
-
-    #is_sparse = False
-    if is_sparse:
-        M = _fill_sparse_matrix(self, nrows, ncols)
-        return M
+    GCi = np.asarray(self.GCi)
+    GCj = np.asarray(self.GCj)
+    irow, jcol, urows, ucols = _get_row_col_index(GCi, GCj, self.matrix_form)
+    nrows = len(urows)
+    ncols = len(ucols)
+    assert nrows > 0, 'nrows=%s' % nrows
+    assert ncols > 0, 'ncols=%s' % ncols
+
+    if GCi.ndim == 1:
+        rows_reversed = dict(enumerate(urows.tolist()))
+        cols_reversed = dict(enumerate(ucols.tolist()))
     else:
-        if ndim == 1:
-            M = _fill_dense_column_matrix(self, nrows, ncols, ndim, rows, cols, apply_symmetry)
-        else:
-            M = _fill_dense_rectangular_matrix(self, nrows, ncols, ndim, rows, cols, apply_symmetry)
-        return (M, rows_reversed, cols_reversed)
+        rows_reversed = dict(enumerate(tuple(key) for key in urows.tolist()))
+        cols_reversed = dict(enumerate(tuple(key) for key in ucols.tolist()))
+
+    if self.is_complex:
+        dtype = 'complex128'
+        data = np.asarray(self.Real) + 1j * np.asarray(self.Complex)
+    else:
+        dtype = 'float64'
+        data = np.asarray(self.Real, dtype=dtype)
+
+    is_symmetric = self.matrix_form == 6 and apply_symmetry
+    M = _assemble_matrix(irow, jcol, data, (nrows, ncols), dtype,
+                         is_sparse, is_symmetric)
+    return M, rows_reversed, cols_reversed
 
 
 def _export_dmig_to_hdf5(h5_file, model: BDF, dict_obj, encoding: str) -> None:
@@ -2705,7 +2705,12 @@ class DRESP2(OptConstraint):
             else:
                 raise NotImplementedError('  TODO: xref %s' % str(key))
         #op2_model.log.info('DRESP2 args = %s' % argsi)
-        out = self.func(*argsi)
+        is_vectorized = any(np.ndim(arg) > 0 for arg in argsi)
+        if is_vectorized and self.dequation_ref is not None:
+            # many design points/elements in one call
+            out = self.dequation_ref.evaluate_vectorized(*argsi)
+        else:
+            out = self.func(*argsi)
         op2_model.log.info('  deqatn out = %s' % out)
         return out
 
@@ -2794,13 +2799,14 @@ class DRESP2(OptConstraint):
         if hasattr(self, 'func'):
             del self.func
 
-        params = {}
-        for key, value_list in sorted(self.params_ref.items()):
-            unused_j, name = key
-            values_list2 = _get_dresp23_table_values(name, value_list)
-            params[key] = values_list2
-        self.params = params
-        self.params_ref = None
+        if self.params_ref is not None:
+            params = {}
+            for key, value_list in sorted(self.params_ref.items()):
+                unused_j, name = key
+                values_list2 = _get_dresp23_table_values(name, value_list)
+                params[key] = values_list2
+            self.params = params
+            self.params_ref = None
 
         self.dequation = self.DEquation()
         self.dequation_ref = None
@@ -3160,15 +3166,16 @@ class DRESP3(OptConstraint):
             del self.func
         self.dtable_ref = {}
 
-        params = {}
-        for key, value_list in sorted(self.params_ref.items()):
-            unused_iorder, name = key
-            #print(key)
-            #j, name = key
-            values_list2 = _get_dresp23_table_values(name, value_list)
-            params[key] = values_list2
-        self.params = params
-        self.params_ref = None
+        if self.params_ref is not None:
+            params = {}
+            for key, value_list in sorted(self.params_ref.items()):
+                unused_iorder, name = key
+                #print(key)
+                #j, name = key
+                values_list2 = _get_dresp23_table_values(name, value_list)
+                params[key] = values_list2
+            self.params = params
+            self.params_ref = None
 
         #self.dequation = self.DEquation()
         #if isinstance(self.dequation, integer_types):
@@ -4081,14 +4088,17 @@ class DVMREL1(DVXREL1):
     def update_model(self, model, desvar_values):
         """doesn't require cross-referencing"""
         value = get_dvxrel1_coeffs(self, model, desvar_values)
-        assert isinstance(self.mid, int), type(self.mid)
-        mat = model.materials[self.mid]
+        mat = self._get_material(model, self.mid)
         try:
             self._update_by_dvmrel(mat, value)
         except AttributeError:
             raise
             #raise NotImplementedError('mat_type=%r is not supported in update_model' % self.mat_type)
 
+    def _get_material(self, model, mid, msg=''):
+        assert isinstance(self.mid, int), type(self.mid)
+        return model.Material(mid, msg=msg)
+
     def _update_by_dvmrel(self, mat, value):
         try:
             mp_name_map = mat.mp_name_map
@@ -1,4 +1,5 @@
 import os
+import tempfile
 import unittest
 from io import StringIO
 
@@ -520,5 +521,67 @@ class TestDEQATN(unittest.TestCase):
             deqatn.cross_reference(model)
         #print(model.dequations[1000].func_str)
 
+    def test_deqatn_vectorized(self):
+        """evaluates a DEQATN on arrays and checks the on-disk code cache"""
+        from pyNastran.bdf.cards.deqatn import set_deqatn_cache_dir, _CODE_CACHE
+        model = BDF(debug=None)
+        eqs = [
+            'f(x,y,z) = max(x, y, z) + rss(x, y) - dim(x, z)',
+        ]
+        deqatn = model.add_deqatn(1000, eqs)
+        deqatn2 = model.add_deqatn(1001, ['g(x) = 1.'])
+
+        with tempfile.TemporaryDirectory() as dirname:
+            set_deqatn_cache_dir(dirname)
+            try:
+                _CODE_CACHE.clear()
+                model.cross_reference()
+                cache_dirname = os.path.join(dirname, 'deqatn')
+                cache_filenames = [os.path.join(cache_dirname, fname)
+                                   for fname in os.listdir(cache_dirname)]
+                assert len(cache_filenames) == 2, cache_filenames
+
+                # a new process would load the code from the disk
+                _CODE_CACHE.clear()
+                deqatn._setup_equation()
+
+                # a modified entry fails the hash check and is rebuilt
+                for cache_filename in cache_filenames:
+                    with open(cache_filename, 'rb') as cache_file:
+                        data = bytearray(cache_file.read())
+                    data[-1] ^= 0xff
+                    with open(cache_filename, 'wb') as cache_file:
+                        cache_file.write(data)
+                _CODE_CACHE.clear()
+                deqatn._setup_equation()
+                deqatn2._setup_equation()
+                assert deqatn2.func(2.) == 1.
+            finally:
+                set_deqatn_cache_dir(None)
+
+            # the cache directory must be private
+            if hasattr(os, 'getuid'):
+                os.chmod(cache_dirname, 0o777)
+                with self.assertRaises(PermissionError):
+                    set_deqatn_cache_dir(dirname)
+
+        x = np.linspace(-2., 2., num=11)
+        y = np.linspace(3., 1., num=11)
+        z = 0.5
+        out = deqatn.evaluate_vectorized(x, y, z)
+        expected = [deqatn.evaluate(xi, yi, z) for xi, yi in zip(x, y)]
+        assert np.allclose(out, expected), (out, expected)
+
+        out2 = deqatn2.evaluate_vectorized(x)
+        assert np.array_equal(out2, np.ones(11)), out2
+        with self.assertRaises(RuntimeError):
+            deqatn2.evaluate_vectorized(x, y)
+
+        # the equation is set up again after an uncross_reference
+        model.uncross_reference()
+        out3 = deqatn.evaluate_vectorized(x, y, z)
+        assert np.allclose(out3, expected), (out3, expected)
+
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -700,6 +700,57 @@ DMI         W2GJ       1       1 1.54685.1353939.1312423.0986108.0621382
         str(dmiax_imag)
         save_load_deck(model)
 
+    def test_dmig_sparse(self):
+        """tests the sparse DMIG assembly matches the dense assembly"""
+        model = BDF(debug=False)
+        bdf_name = os.path.join(TEST_PATH, 'dmig.bdf')
+        model.read_bdf(bdf_name, xref=False, punch=True)
+        for name in ['REALS', 'REAL', 'IMAG', 'IMAGS', 'POLE']:
+            dmig = model.dmigs[name]
+            for apply_symmetry in [False, True]:
+                dense, rows, cols = dmig.get_matrix(
+                    is_sparse=False, apply_symmetry=apply_symmetry)
+                sparse, rows2, cols2 = dmig.get_matrix(
+                    is_sparse=True, apply_symmetry=apply_symmetry)
+                assert sparse.format == 'csc', sparse.format
+                assert np.array_equal(dense, sparse.toarray()), name
+                assert rows == rows2
+                assert cols == cols2
+
+    def test_dmig_shorthand_floats(self):
+        """tests DMIG columns are parsed with Nastran style floats"""
+        cards = [
+            ['DMIG,KSHORT,0,6,1,0,,,'],
+            ['DMIG,KSHORT,1,1,,1,1,1.-3,,+',
+             '+,2,3,-2.5+2,,3,,4.0D-1'],
+            ['DMIG,KSHORT,2,3,,2,3,.5'],
+        ]
+        model = BDF(debug=False)
+        for card_lines in cards:
+            model.add_card(card_lines, 'DMIG', is_list=False)
+        fill_dmigs(model)
+        dmig = model.dmigs['KSHORT']
+        assert np.allclose(dmig.Real, [1e-3, -250., 0.4, 0.5]), dmig.Real
+        assert np.array_equal(dmig.GCi, [[1, 1], [2, 3], [3, 0], [2, 3]]), dmig.GCi
+        assert np.array_equal(dmig.GCj, [[1, 1], [1, 1], [1, 1], [2, 3]]), dmig.GCj
+
+        matrix, rows, unused_cols = dmig.get_matrix(is_sparse=True, apply_symmetry=True)
+        assert rows == {0: (1, 1), 1: (2, 3), 2: (3, 0)}, rows
+        expected = np.array([
+            [1e-3, -250., 0.4],
+            [-250., 0.5, 0.],
+            [0.4, 0., 0.],
+        ])
+        assert np.allclose(matrix.toarray(), expected)
+
+        # an integer value falls back to the field-by-field reader,
+        # which has the standard error message
+        model = BDF(debug=False)
+        model.add_card(['DMIG,KBAD,0,6,1,0,,,'], 'DMIG', is_list=False)
+        model.add_card(['DMIG,KBAD,1,1,,1,1,1'], 'DMIG', is_list=False)
+        with self.assertRaises(SyntaxError):
+            fill_dmigs(model)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -6,6 +6,7 @@ from cpylog import SimpleLogger
 from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.cards.test.utils import save_load_deck
 from pyNastran.bdf.mesh_utils.mass_properties import mass_properties_nsm
+from pyNastran.bdf.mesh_utils.mass_properties_array import mass_properties_array
 import pyNastran
 
 PKG_PATH = pyNastran.__path__[0]
@@ -176,11 +177,18 @@ class TestNsm(unittest.TestCase):
             if mass1_expected == -1.0:
                 with self.assertRaises(RuntimeError):
                     mass1, unused_cg, unused_I = mass_properties_nsm(model, nsm_id=nsm_id, debug=False)
+                with self.assertRaises(RuntimeError):
+                    mass_properties_array(model, nsm_id=nsm_id)
             else:
                 mass1, unused_cg, unused_I = mass_properties_nsm(model, nsm_id=nsm_id, debug=False)
                 if mass1 != mass1_expected:
                     unused_mass2 = mass_properties_nsm(model, nsm_id=nsm_id, debug=True)[0]
                     raise RuntimeError('nsm_id=%s mass != %s; mass1=%s' % (nsm_id, mass1_expected, mass1))
+                mass2, unused_cg, unused_I, pid_breakdown, unused_groups = mass_properties_array(
+                    model, nsm_id=nsm_id)
+                self.assertAlmostEqual(mass2, mass1_expected, msg='nsm_id=%s' % nsm_id)
+                self.assertAlmostEqual(sum(mass for mass, unused_cg, unused_I in pid_breakdown.values()),
+                                       mass1_expected, msg='nsm_id=%s' % nsm_id)
             #print('mass[%s] = %s' % (nsm_id, mass))
             #print('----------------------------------------------')
 
@@ -206,6 +214,8 @@ class TestNsm(unittest.TestCase):
         for nsm_id in sorted(model2.nsms):
             mass, unused_cg, unused_I = mass_properties_nsm(model2, nsm_id=nsm_id, debug=False)
             self.assertEqual(mass, 0.0)
+            mass = mass_properties_array(model2, nsm_id=nsm_id)[0]
+            self.assertEqual(mass, 0.0)
             #print('mass[%s] = %s' % (nsm_id, mass))
         #print('done with null')
 
@@ -269,6 +279,8 @@ class TestNsm(unittest.TestCase):
 
         mass, unused_cg, unused_I = mass_properties_nsm(model, nsm_id=5000)
         self.assertAlmostEqual(mass, 8.0)
+        mass = mass_properties_array(model, nsm_id=5000)[0]
+        self.assertAlmostEqual(mass, 8.0)
         model2 = save_load_deck(model)
         mass, unused_cg, unused_I = mass_properties_nsm(model2, nsm_id=5000)
 
@@ -154,6 +154,74 @@ class TestOpt(unittest.TestCase):
         assert model.Mass(eid_conm2).X[0] == x1_new, 'X1=%s x1_new=%s' % (model.Mass(eid_conm2).mass, x1_new)
         assert model.properties[pid_pcomp].thicknesses[0] == tpcomp_new, 't=%s tnew=%s' % (model.properties[pid_pcomp].thicknesses[0], tpcomp_new)
 
+    def test_desvar_map(self):
+        """tests applying many design vectors with the DesvarMap"""
+        from pyNastran.bdf.mesh_utils.dvxrel import DesvarMap
+        model = BDF(debug=False)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_grid(3, [1., 1., 0.], cp=1)
+        model.add_grid(4, [0., 1., 0.])
+        model.add_cord2c(1, [0., 0., 0.], [0., 0., 1.], [1., 0., 0.])
+        model.add_cquad4(1, 1, [1, 2, 3, 4])
+        model.add_pshell(1, mid1=1, t=0.1)
+        model.add_pshell(2, mid1=1, t=0.1)
+        model.add_mat1(1, 1.0, None, 0.3)
+        model.add_conm2(2, 1, 0.1)
+
+        model.add_desvar(1, 'T', 1.0)
+        model.add_desvar(2, 'E', 110.)
+        model.add_desvar(3, 'MASS', 12.)
+        model.add_desvar(4, 'DEP', 1.0, xlb=0., xub=10.)
+        model.add_dvprel1(1, 'PSHELL', 1, 'T', [1], [0.5], c0=0.1, validate=True)
+        model.add_dvmrel1(2, 'MAT1', 1, 'E', [2, 1], [0.5, 2.0], c0=100., validate=True)
+        model.add_dvcrel1(3, 'CONM2', 2, 'M', [3], [1.0], c0=0., validate=True)
+        model.add_dvprel2(4, 'PSHELL', 2, 'T', 100, dvids=[1, 4], labels=['A'])
+        model.add_deqatn(100, ['f(x,y,a) = x*y + a'])
+        model.add_dtable({'A': 3.0})
+        # DEP = 1 + 2 * T
+        model.add_dlink(5, 4, [1], [2.0], c0=1.)
+        # move node 3 radially in the cylindrical system
+        model.add_dvgrid(1, 3, [1., 0., 0.], cid=1, coeff=2.0)
+        model.cross_reference()
+
+        desvar_map = DesvarMap(model)
+        assert np.array_equal(desvar_map.desvar_ids, [1, 2, 3, 4])
+        x = np.array([
+            [1.0, 110., 12., 0.],
+            [2.0, 100., 10., 0.],
+            [6.0, 100., 10., 0.],
+        ])
+        values = desvar_map.get_dvxrel_values(x)
+        t = x[:, 0]
+        dep = np.minimum(1. + 2. * t, 10.)
+        expected = np.column_stack([
+            0.1 + 0.5 * t,
+            100. + 0.5 * x[:, 1] + 2. * t,
+            x[:, 2],
+            t * dep + 3.,
+        ])
+        assert np.allclose(values, expected), values
+
+        xyz = desvar_map.get_grid_xyz(x)
+        assert xyz.shape == (3, 1, 3), xyz.shape
+        xyz3 = model.nodes[3].get_position()
+        radial = xyz3 / np.linalg.norm(xyz3)
+        expected_xyz = xyz3 + 2. * (t - 1.)[:, np.newaxis] * radial
+        assert np.allclose(xyz[:, 0, :], expected_xyz), xyz
+
+        desvar_map.apply(x[1, :])
+        assert np.isclose(model.properties[1].t, 0.1 + 0.5 * 2.)
+        assert np.isclose(model.properties[2].t, 2. * 5. + 3.)
+        assert np.isclose(model.materials[1].e, 100. + 50. + 4.)
+        assert np.isclose(model.masses[2].mass, 10.)
+        assert np.allclose(model.nodes[3].get_position(), expected_xyz[1, :])
+
+        # the materials are found the same way for DVMREL1 & DVMREL2
+        model.add_dvmrel1(6, 'MAT1', 99, 'E', [2], [1.0])
+        with self.assertRaisesRegex(KeyError, 'DVMREL1 oid=6'):
+            DesvarMap(model)
+
     def test_ddval(self):
         """tests a DDVAL"""
         model = BDF(debug=False)
@@ -977,5 +1045,35 @@ class TestOpt(unittest.TestCase):
         str(dresp2)
         #print(dresp2)
 
+    def test_evaluate_design_responses(self):
+        """tests evaluating DRESP1/DRESP2s against an op2 in bulk"""
+        from pyNastran.bdf.mesh_utils.design_responses import evaluate_design_responses
+        log = get_logger(level='warning')
+        bdf_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        model = read_bdf(bdf_filename, log=log)
+        op2 = read_op2(op2_filename, log=log)
+
+        model.add_dresp1(1, 'DISP', 'DISP', None, None, 3, None, [15, 14], validate=True)
+        # von mises stress for Z2
+        model.add_dresp1(2, 'vm', 'STRESS', 'ELEM', None, 17, None, [6, 8], validate=True)
+        model.add_dresp1(3, 'axial', 'FORCE', 'PROD', None, 2, None, [3], validate=True)
+        model.add_dtable({'X': 2.0})
+        model.add_deqatn(100, ['f(a,b,c) = max(a,b) + c'])
+        model.add_dresp2(10, 'resp', 100, None, {(0, 'DRESP1'): [1], (1, 'DTABLE'): ['X']})
+        model.add_dresp2(11, 'sum', 'SUM', None, {(0, 'DRESP1'): [3], (1, 'DRESP2'): [10]})
+        response_ids, values = evaluate_design_responses(model, op2, [1])
+
+        expected_ids = [[1, 15], [1, 14], [2, 6], [2, 8], [3, 14], [3, 15], [10, 0], [11, 0]]
+        assert np.array_equal(response_ids, expected_ids), response_ids
+        assert values.shape == (8, 1), values.shape
+
+        disp = op2.displacements[1].data[0, [14, 13], 2]
+        stress = op2.cquad4_stress[1].data[0, 1, 7], op2.ctria3_stress[1].data[0, 1, 7]
+        axial = op2.crod_force[1].data[0, :, 0]
+        dresp10 = disp.max() + 2.0
+        expected = np.hstack([disp, stress, axial, dresp10, axial.sum() + dresp10])
+        assert np.allclose(values[:, 0], expected), values[:, 0]
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -8,10 +8,12 @@ from __future__ import annotations
 from io import StringIO
 from pathlib import PurePath
 from typing import Tuple, List, Dict, Optional, Any, TYPE_CHECKING
+import numpy as np
 
 from pyNastran.bdf.bdf import BDF, read_bdf
 from pyNastran.bdf.case_control_deck import CaseControlDeck
-from pyNastran.bdf.mesh_utils.bdf_renumber import bdf_renumber, get_renumber_starting_ids_from_model
+from pyNastran.bdf.mesh_utils.bdf_renumber import (
+    bdf_renumber, get_renumber_starting_ids_from_model, _id_map_to_arrays, _map_ids)
 if TYPE_CHECKING:  # pragma: no cover
     from cpylog import SimpleLogger
     MAPPER = Dict[str, Dict[int, int]]
@@ -259,15 +261,15 @@ def _assemble_mapper(mappers: List[MAPPER],
     if mapper_renumber is not None:
         mappers_all = [_renumber_mapper(mapper_0, mapper_renumber)]
 
+        # the sorted merged->renumbered ids are shared by all the mappers
+        renumber_arrays = {map_type : _id_map_to_arrays(mapper_renumber[map_type])
+                           for map_type in data_members}
         for mapper in mappers:
             mapper_temp = {}
             for map_type in data_members:
-            #for map_type, sub_mappper in mapper.items():
-                sub_mappper = mapper[map_type]
-                mapper_temp[map_type] = {}
-                for id_orig, id_merge in sub_mappper.items():
-                    # map from original to renumbered
-                    mapper_temp[map_type][id_orig] = mapper_renumber[map_type][id_merge]
+                # map from original to renumbered
+                mapper_temp[map_type] = _compose_id_maps(
+                    mapper[map_type], renumber_arrays[map_type])
             mappers_all.append(mapper_temp)
     else:
         # the first model nids are unchanged
@@ -426,12 +428,42 @@ def _renumber_mapper(mapper_0: MAPPER, mapper_renumber: MAPPER):
     mapper = mapper_0.copy()
     # apply any renumbering
     for map_type, sub_mapper in mapper.items():
-        for id_ in sub_mapper:
-            if sub_mapper[id_] == mapper_renumber[map_type][id_]:
-                continue
-            sub_mapper[id_] = mapper_renumber[map_type][id_]
+        if not sub_mapper:
+            continue
+        # the first model isn't renumbered before the merge, so its
+        # "merged" ids are the original ids
+        renumber_arrays = _id_map_to_arrays(mapper_renumber[map_type])
+        sub_mapper.update(_compose_id_maps(
+            {id_: id_ for id_ in sub_mapper}, renumber_arrays))
     return mapper
 
+def _compose_id_maps(id_map: Dict[int, int],
+                     renumber_arrays: Tuple[np.ndarray, np.ndarray]) -> Dict[int, int]:
+    """
+    Applies a renumbering to the new ids of an id map
+
+    Parameters
+    ----------
+    id_map : dict[id_orig] : id_merge
+        the original to merged ids
+    renumber_arrays : (ids_merge, ids_renumber)
+        the sorted merged to renumbered id arrays
+
+    Returns
+    -------
+    id_map2 : dict[id_orig] : id_renumber
+        the original to renumbered ids
+
+    """
+    if not id_map:
+        return {}
+    ids_orig = list(id_map.keys())
+    ids_merge = np.array(list(id_map.values()), dtype='int64')
+    ids_renumber, is_missing = _map_ids(*renumber_arrays, ids_merge)
+    if np.any(is_missing):
+        raise KeyError(ids_merge[is_missing].tolist())
+    return dict(zip(ids_orig, ids_renumber.tolist()))
+
 def _dict_key_to_key(dictionary) -> Dict[int, int]:
     """creates a dummy map from the nominal key to the nominal key"""
     return {key : key for key in dictionary.keys()}
@@ -8,9 +8,8 @@ defines:
                           log=None, debug=False)
 
 """
-from itertools import chain
 from io import StringIO, IOBase
-from typing import List, Dict, Optional, Union
+from typing import Any, List, Dict, Optional, Tuple, Union
 
 import numpy as np
 
@@ -375,6 +374,7 @@ def bdf_renumber(bdf_filename: Union[str, BDF, StringIO],
     _update_elements(
         model, starting_id_dict, eid,
         eid_map, mass_id_map, rigid_elements_map)
+    _update_element_references(model, nid_map, properties_map)
 
     _update_materials(
         model, starting_id_dict, mid,
@@ -822,53 +822,120 @@ def superelement_renumber(bdf_filename, bdf_filename_out=None, size=8, is_double
 
 def _create_nid_maps(model, starting_id_dict, nid):
     """builds the nid_maps"""
-    nid_map = {}
-    reverse_nid_map = {}
+    spoints = np.array(list(model.spoints.keys()), dtype='int64')
+    epoints = np.array(list(model.epoints.keys()), dtype='int64')
+    nids = np.array(list(model.nodes.keys()), dtype='int64')
+    nids.sort()
 
-    spoints = list(model.spoints.keys())
-    epoints = list(model.epoints.keys())
-    nids = model.nodes.keys()
-
-    nids_spoints_epoints = sorted(chain(nids, spoints, epoints))
-
-    #spoints_nids.sort()
-    i = 1
-    #nnodes = len(spoints_nids)
-
-    i = 1
-    #j = 1
-    #print(spoints_nids)
-    #k = 0
-    #model.log.debug(starting_id_dict)
     if 'nid' in starting_id_dict and nid is not None:
-        i = nid
-        #banned_nodes = spoints
-        for nidi in nids_spoints_epoints:
-            if nidi in spoints or nidi in epoints:
-                pass
-                #print('sid=%s -> %s' % (nid, i))
-                #i += 1
-            else:
-                while i in spoints or i in epoints:
-                    #print('*bump')
-                    i += 1
-                #print('nid=%s -> %s' % (nid, i))
-                nid_map[nidi] = i
-                reverse_nid_map[i] = nidi
-                i += 1
-        #for nid in sorted(nids):
-            #nid_map[nid] = i
-            #reverse_nid_map[i] = nid
-            #i += 1
-        #print(nid_map)
-        #print(reverse_nid_map)
+        # the SPOINTs/EPOINTs aren't renumbered, so the GRIDs skip over them
+        banned_ids = np.hstack([spoints, epoints])
+        nids_new = _get_renumbered_ids(nids, nid, banned_ids=banned_ids)
+        nid_map = dict(zip(nids.tolist(), nids_new.tolist()))
+        reverse_nid_map = dict(zip(nids_new.tolist(), nids.tolist()))
     else:
-        for nid in nids_spoints_epoints:
-            nid_map[nid] = nid
+        nids_spoints_epoints = np.unique(np.hstack([nids, spoints, epoints])).tolist()
+        nid_map = dict(zip(nids_spoints_epoints, nids_spoints_epoints))
         reverse_nid_map = nid_map
     return nid_map, reverse_nid_map
 
 
+def _get_renumbered_ids(ids_old: np.ndarray, id_start: int,
+                        banned_ids: Optional[np.ndarray]=None) -> np.ndarray:
+    """
+    Gets the new ids for a sorted set of old ids
+
+    Parameters
+    ----------
+    ids_old : (n, ) int ndarray
+        the sorted ids to renumber
+    id_start : int
+        the first new id
+    banned_ids : (nbanned, ) int ndarray; default=None
+        ids that may not be used (e.g., SPOINTs when renumbering GRIDs)
+
+    Returns
+    -------
+    ids_new : (n, ) int ndarray
+        the k-th new id is the k-th integer >= id_start that isn't banned
+
+    """
+    nids = len(ids_old)
+    k = id_start + np.arange(nids, dtype='int64')
+    ids_new = k
+    if banned_ids is None or len(banned_ids) == 0:
+        return ids_new
+
+    banned_ids = np.unique(banned_ids)
+    banned_ids = banned_ids[banned_ids >= id_start]
+
+    # shift each id by the number of banned ids below it until nothing moves
+    while True:
+        ids_new2 = k + np.searchsorted(banned_ids, ids_new, side='right')
+        if np.array_equal(ids_new, ids_new2):
+            break
+        ids_new = ids_new2
+    return ids_new
+
+
+def _id_map_to_arrays(id_map: Dict[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+    """converts an old->new id dictionary into sorted old/new id arrays"""
+    ids_old = np.array(list(id_map.keys()), dtype='int64')
+    ids_new = np.array(list(id_map.values()), dtype='int64')
+    isort = np.argsort(ids_old)
+    return ids_old[isort], ids_new[isort]
+
+
+def _map_ids(ids_old: np.ndarray, ids_new: np.ndarray,
+             ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Maps ids using the sorted old/new id arrays
+
+    Returns
+    -------
+    ids_mapped : (n, ) int ndarray
+        the new ids; the missing ids are unchanged
+    is_missing : (n, ) bool ndarray
+        the ids that aren't in ids_old
+
+    """
+    ids = np.asarray(ids, dtype='int64')
+    if len(ids_old) == 0:
+        return ids.copy(), np.ones(len(ids), dtype='bool')
+    i = np.searchsorted(ids_old, ids)
+    i[i == len(ids_old)] = 0
+    is_missing = ids_old[i] != ids
+    ids_mapped = np.where(is_missing, ids, ids_new[i])
+    return ids_mapped, is_missing
+
+
+def _renumber_dict(objects: Dict[int, Any], id_name: str, id_start: int,
+                   *id_maps: Dict[int, int]) -> int:
+    """
+    Renumbers the objects (or the lists of objects) of a BDF dictionary
+    in sorted order and updates the id maps
+
+    Returns
+    -------
+    id_start : int
+        the next id
+
+    """
+    ids_old = sorted(objects)
+    ids_new = range(id_start, id_start + len(ids_old))
+    for id_old, id_new in zip(ids_old, ids_new):
+        obj = objects[id_old]
+        if isinstance(obj, list):
+            for obji in obj:
+                assert hasattr(obji, id_name)
+                setattr(obji, id_name, id_new)
+        else:
+            setattr(obj, id_name, id_new)
+    for id_map in id_maps:
+        id_map.update(zip(ids_old, ids_new))
+    return id_start + len(ids_old)
+
+
 def _create_mid_map(model, mid):
     """builds the mid_map"""
     mid_map = {}
@@ -895,13 +962,9 @@ def _create_mid_map(model, mid):
         mids = []
         for materials in all_materials:
             mids += materials.keys()
-        mids = np.unique(mids)
-        mids.sort()
-        nmaterials = len(mids)
-
-        for i in range(nmaterials):
-            midi = mids[i]
-            mid_map[midi] = mid + i
+        mids = np.unique(np.array(mids, dtype='int64'))
+        mids_new = _get_renumbered_ids(mids, mid)
+        mid_map = dict(zip(mids.tolist(), mids_new.tolist()))
     return mid_map, all_materials
 
 
@@ -937,23 +1000,13 @@ def _update_properties(model, starting_id_dict, pid,
         #pid = _create_dict_mapper(model.properties_mass, properties_mass_map, 'pid', pid)
         #pid = _update(model.convection_properties, properties_mass_map, pid)
 
-        for pidi, prop in sorted(model.properties.items()):
-            prop.pid = pid
-            properties_map[pidi] = pid
-            pid += 1
-        for pidi, prop in sorted(model.properties_mass.items()):
-            # PMASS
-            prop.pid = pid
-            properties_mass_map[pidi] = pid
-            pid += 1
-        for pidi, prop in sorted(model.convection_properties.items()):
-            # PCONV
-            prop.pid = pid
-            pid += 1
-        for pidi, prop in sorted(model.phbdys.items()):
-            # PHBDY
-            prop.pid = pid
-            pid += 1
+        pid = _renumber_dict(model.properties, 'pid', pid, properties_map)
+        # PMASS
+        pid = _renumber_dict(model.properties_mass, 'pid', pid, properties_mass_map)
+        # PCONV
+        pid = _renumber_dict(model.convection_properties, 'pid', pid)
+        # PHBDY
+        pid = _renumber_dict(model.phbdys, 'pid', pid)
 
 
 def _update_elements(model, starting_id_dict, eid,
@@ -963,35 +1016,70 @@ def _update_elements(model, starting_id_dict, eid,
         # elements
         #eid = _create_dict_mapper(model.elements, eid_map, 'eid', eid)
 
-        for eidi, element in sorted(model.elements.items()):
-            element.eid = eid
-            eid_map[eidi] = eid
-            eid += 1
-        for eidi, element in sorted(model.masses.items()):
-            # CONM1, CONM2, CMASSx
-            element.eid = eid
-            eid_map[eidi] = eid
-            mass_id_map[eidi] = eid
-            eid += 1
-        for eidi, elem in sorted(model.rigid_elements.items()):
-            # RBAR/RBAR1/RBE1/RBE2/RBE3/RSPLINE/RSSCON
-            elem.eid = eid
-            eid_map[eidi] = eid
-            rigid_elements_map[eidi] = eid
-            eid += 1
+        eid = _renumber_dict(model.elements, 'eid', eid, eid_map)
+        # CONM1, CONM2, CMASSx
+        eid = _renumber_dict(model.masses, 'eid', eid, eid_map, mass_id_map)
+        # RBAR/RBAR1/RBE1/RBE2/RBE3/RSPLINE/RSSCON
+        eid = _renumber_dict(model.rigid_elements, 'eid', eid, eid_map, rigid_elements_map)
         #for eidi, elem in model.caeros.items():
             #pass
 
 
+def _update_element_references(model, nid_map, properties_map):
+    """
+    Remaps the node/property id fields of the elements with a single
+    searchsorted per id class, so the raw ids agree with the renumbered
+    (cross-referenced) nodes/properties
+
+    Elements with a read-only ``nodes``/``pid`` (e.g., CGAP, CBEAM3) and
+    elements without a property reference are skipped; they're written
+    through their cross-referenced objects.
+    """
+    elements = list(model.elements.values())
+    if nid_map:
+        nids_old, nids_new = _id_map_to_arrays(nid_map)
+        elems = [elem for elem in elements
+                 if isinstance(getattr(elem, 'nodes', None), list) and
+                 _is_writable(elem, 'nodes')]
+        nnodes = np.array([len(elem.nodes) for elem in elems], dtype='int64')
+        if nnodes.sum():
+            # mid-side/optional nodes are None
+            nids = np.array([nid if nid is not None else 0
+                             for elem in elems for nid in elem.nodes], dtype='int64')
+            nids_mapped = _map_ids(nids_old, nids_new, nids)[0].tolist()
+            ioffsets = np.cumsum(nnodes) - nnodes
+            for elem, ioffset, nnodesi in zip(elems, ioffsets.tolist(), nnodes.tolist()):
+                elem.nodes = [nid_mapped if nid is not None else None
+                              for nid, nid_mapped in zip(
+                                  elem.nodes, nids_mapped[ioffset:ioffset+nnodesi])]
+
+    if properties_map:
+        pids_old, pids_new = _id_map_to_arrays(properties_map)
+        elems = [elem for elem in elements
+                 if hasattr(elem, 'pid_ref') and
+                 isinstance(getattr(elem, 'pid', None), integer_types) and
+                 _is_writable(elem, 'pid')]
+        pids = np.array([elem.pid for elem in elems], dtype='int64')
+        pids_mapped, is_missing = _map_ids(pids_old, pids_new, pids)
+        for elem, pid, is_missingi in zip(elems, pids_mapped.tolist(), is_missing.tolist()):
+            if not is_missingi:
+                elem.pid = pid
+
+
+def _is_writable(obj: Any, name: str) -> bool:
+    """is the attribute a plain attribute or a property with a setter"""
+    attr = getattr(type(obj), name, None)
+    return not isinstance(attr, property) or attr.fset is not None
+
+
 def _update_materials(unused_model, starting_id_dict, mid,
                       mid_map, all_materials):
     if 'mid' in starting_id_dict and mid is not None:
         #mid = 1
         for materials in all_materials:
             for midi, material in materials.items():
-                mid = mid_map[midi]
                 assert hasattr(material, 'mid')
-                material.mid = mid
+                material.mid = mid_map[midi]
 
 
 def _update_spcs(model, starting_id_dict, spc_id,
@@ -999,19 +1087,8 @@ def _update_spcs(model, starting_id_dict, spc_id,
     """updates the spcs"""
     if 'spc_id' in starting_id_dict and spc_id is not None:
         # spc
-        for spc_idi, spc_group in sorted(model.spcadds.items()):
-            for unused_i, spc in enumerate(spc_group):
-                assert hasattr(spc, 'conid')
-                spc.conid = spc_id
-            spc_map[spc_idi] = spc_id
-            spc_id += 1
-
-        for spc_idi, spc_group in sorted(model.spcs.items()):
-            for unused_i, spc in enumerate(spc_group):
-                assert hasattr(spc, 'conid')
-                spc.conid = spc_id
-            spc_map[spc_idi] = spc_id
-            spc_id += 1
+        spc_id = _renumber_dict(model.spcadds, 'conid', spc_id, spc_map)
+        spc_id = _renumber_dict(model.spcs, 'conid', spc_id, spc_map)
     else:
         # TODO: why are we doing this?
         for spc_id in model.spcadds:
@@ -1025,19 +1102,8 @@ def _update_mpcs(model, starting_id_dict, mpc_id,
     """updates the mpcs"""
     if 'mpc_id' in starting_id_dict and mpc_id is not None:
         # mpc
-        for mpc_idi, mpc_group in sorted(model.mpcadds.items()):
-            for unused_i, mpc in enumerate(mpc_group):
-                assert hasattr(mpc, 'conid')
-                mpc.conid = mpc_id
-            mpc_map[mpc_idi] = mpc_id
-            mpc_id += 1
-
-        for mpc_idi, mpc_group in sorted(model.mpcs.items()):
-            for unused_i, mpc in enumerate(mpc_group):
-                assert hasattr(mpc, 'conid')
-                mpc.conid = mpc_id
-            mpc_map[mpc_idi] = mpc_id
-            mpc_id += 1
+        mpc_id = _renumber_dict(model.mpcadds, 'conid', mpc_id, mpc_map)
+        mpc_id = _renumber_dict(model.mpcs, 'conid', mpc_id, mpc_map)
     else:
         # TODO: why are we doing this?
         for mpc_id in model.mpcadds:
@@ -1051,13 +1117,10 @@ def _update_coords(model, starting_id_dict, cid,
     """updates the coords"""
     if 'cid' in starting_id_dict and cid is not None:
         # coords
-        for cidi, coord in sorted(model.coords.items()):
-            if cidi == 0:
-                cid_map[0] = 0
-                continue
-            coord.cid = cid
-            cid_map[cidi] = cid
-            cid += 1
+        if 0 in model.coords:
+            cid_map[0] = 0
+        coords = {cidi: coord for cidi, coord in model.coords.items() if cidi != 0}
+        _renumber_dict(coords, 'cid', cid, cid_map)
 
 
 def _update_case_control(model, mapper):
@@ -1097,8 +1160,9 @@ def _update_case_control(model, mapper):
         'OUTRCV', 'TEMPERATURE(INITIAL)',
     ]
 
-    nid_map = mapper['nodes']
-    eid_map = mapper['elements']
+    # the sorted old/new ids are built once and shared by all the SETs
+    nid_map = _id_map_to_arrays(mapper['nodes'])
+    eid_map = _id_map_to_arrays(mapper['elements'])
     skip_keys = [
         'TITLE', 'ECHO', 'ANALYSIS', 'SUBTITLE', 'LABEL', 'SUBSEQ', 'OUTPUT',
         'TCURVE', 'XTITLE', 'YTITLE', 'AECONFIG', 'AESYMXZ', 'MAXLINES', 'PARAM', 'CONTOUR',
@@ -1244,28 +1308,25 @@ def _update_case_control(model, mapper):
 
 def _update_case_key(key, elemental_quantities, seti2, eid_map, nid_map):
     """Updates a Case Control SET card.  A set may have an elemental result
-    or a nodal result."""
-    values2 = []
+    or a nodal result.
+
+    eid_map/nid_map are the sorted (old, new) id arrays"""
     eids_missing = []
     nids_missing = []
     if key in elemental_quantities:
         # renumber eids
-        for eid in seti2:
-            if eid not in eid_map:
-                eids_missing.append(eid)
-                continue
-            eid_new = eid_map[eid]
-            values2.append(eid_new)
+        ids_old, ids_new = eid_map
+        missing = eids_missing
         #print('updating element SET %r' % options)
     else:
         # renumber nids
-        for nid in seti2:
-            if nid not in nid_map:
-                nids_missing.append(nid)
-                continue
-            nid_new = nid_map[nid]
-            values2.append(nid_new)
+        ids_old, ids_new = nid_map
+        missing = nids_missing
         #print('updating node SET %r' % options)
+
+    values2, is_missing = _map_ids(ids_old, ids_new, seti2)
+    missing.extend(np.asarray(seti2)[is_missing].tolist())
+    values2 = values2[~is_missing].tolist()
     return eids_missing, nids_missing, values2
 
 #def _create_dict_mapper(properties, properties_map, pid_name, pid):
@@ -11,6 +11,7 @@ from typing import List
 import numpy as np
 from cpylog import SimpleLogger
 from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.mesh_utils.element_quality import tri_quality_array, quad_quality_array
 
 SIDE_MAP = {}
 SIDE_MAP['CHEXA'] = {
@@ -109,229 +110,90 @@ def get_bad_shells(model: BDF, xyz_cid0, nid_map,
 
     """
     log = model.log
-    min_theta_quad = min_theta
-    min_theta_tri = min_theta
-    min_theta_quad = np.radians(min_theta_quad)
-    min_theta_tri = np.radians(min_theta_tri)
+    min_theta = np.radians(min_theta)
     max_theta = np.radians(max_theta)
     max_skew = np.radians(max_skew)
-    eids_failed = []
+
+    quad_eids = []
+    quad_inids = []
+    tri_eids = []
+    tri_inids = []
     for eid, element in sorted(model.elements.items()):
         if element.type == 'CQUAD4':
-            node_ids = element.node_ids
-            #pid = element.Pid()
-            #for nid in node_ids:
-                #if nid is not None:
-                    #nid_to_pid_map[nid].append(pid)
-            #self.eid_to_nid_map[eid] = node_ids
-
-            n1, n2, n3, n4 = [nid_map[nid] for nid in node_ids]
-            p1 = xyz_cid0[n1, :]
-            p2 = xyz_cid0[n2, :]
-            p3 = xyz_cid0[n3, :]
-            p4 = xyz_cid0[n4, :]
-            v21 = p2 - p1
-            v32 = p3 - p2
-            v43 = p4 - p3
-            v14 = p1 - p4
-
-            #aspect_ratio = max(p12, p23, p34, p14) / max(p12, p23, p34, p14)
-            lengths = np.linalg.norm([v21, v32, v43, v14], axis=1)
-            #assert len(lengths) == 3, lengths
-            length_min = lengths.min()
-            if length_min == 0.0:
-                eids_failed.append(eid)
-                model.log.debug('eid=%s failed length_min check; length_min=%s' % (eid, length_min))
-                continue
-
-            aspect_ratio = lengths.max() / length_min
-            if aspect_ratio > max_aspect_ratio:
-                eids_failed.append(eid)
-                model.log.debug('eid=%s failed aspect_ratio check; AR=%.2f' % (eid, aspect_ratio))
-                continue
-
-            p12 = (p1 + p2) / 2.
-            p23 = (p2 + p3) / 2.
-            p34 = (p3 + p4) / 2.
-            p14 = (p4 + p1) / 2.
-            normal = np.cross(p3 - p1, p4 - p2)  # v42 x v31
-            #    e3
-            # 4-------3
-            # |       |
-            # |e4     |  e2
-            # 1-------2
-            #     e1
-            e13 = p34 - p12
-            e42 = p23 - p14
-
-            cos_skew1 = (e13 @ e42) / (np.linalg.norm(e13) * np.linalg.norm(e42))
-            cos_skew2 = (e13 @ -e42) / (np.linalg.norm(e13) * np.linalg.norm(e42))
-            skew = np.pi / 2. - np.abs(np.arccos(np.clip([cos_skew1, cos_skew2], -1., 1.))).min()
-            if skew > max_skew:
-                eids_failed.append(eid)
-                model.log.debug('eid=%s failed max_skew check; skew=%.2f' % (eid, np.degrees(skew)))
-                continue
-
-            area1 = 0.5 * np.linalg.norm(np.cross(-v14, v21)) # v41 x v21
-            area2 = 0.5 * np.linalg.norm(np.cross(-v21, v32)) # v12 x v32
-            area3 = 0.5 * np.linalg.norm(np.cross(v43, v32)) # v43 x v32
-            area4 = 0.5 * np.linalg.norm(np.cross(v14, -v43)) # v14 x v34
-            aavg = (area1 + area2 + area3 + area4) / 4.
-            taper_ratioi = (abs(area1 - aavg) + abs(area2 - aavg) +
-                            abs(area3 - aavg) + abs(area4 - aavg)) / aavg
-            if taper_ratioi > max_taper_ratio:
-                eids_failed.append(eid)
-                model.log.debug('eid=%s failed taper_ratio check; taper=%.2f' % (eid, taper_ratioi))
-                continue
-
-            #if 0:
-                #areai = 0.5 * np.linalg.norm(normal)
-                ## still kind of in development
-                ##
-                ## the ratio of the ideal area to the actual area
-                ## this is an hourglass check
-                #areas = [
-                    #np.linalg.norm(np.cross(-v14, v21)), # v41 x v21
-                    #np.linalg.norm(np.cross(v32, -v21)), # v32 x v12
-                    #np.linalg.norm(np.cross(v43, -v32)), # v43 x v23
-                    #np.linalg.norm(np.cross(v14, v43)),  # v14 x v43
-                #]
-                #area_ratioi1 = areai / min(areas)
-                #area_ratioi2 = max(areas) / areai
-                #area_ratioi = max(area_ratioi1, area_ratioi2)
-
-            # ixj = k
-            # dot the local normal with the normal vector
-            # then take the norm of that to determine the angle relative to the normal
-            # then take the sign of that to see if we're pointing roughly towards the normal
-
-            # np.sign(np.linalg.norm(np.dot(
-            # a x b = ab sin(theta)
-            # a x b / ab = sin(theta)
-            # sin(theta) < 0. -> normal is flipped
-            n2 = np.sign(np.cross(v21, v32) @ normal)
-            n3 = np.sign(np.cross(v32, v43) @ normal)
-            n4 = np.sign(np.cross(v43, v14) @ normal)
-            n1 = np.sign(np.cross(v14, v21) @ normal)
-            n = np.array([n1, n2, n3, n4])
-
-            theta_additional = np.where(n < 0, 2*np.pi, 0.)
-
-            cos_theta1 = (v21 @ -v14) / (np.linalg.norm(v21) * np.linalg.norm(v14))
-            cos_theta2 = (v32 @ -v21) / (np.linalg.norm(v32) * np.linalg.norm(v21))
-            cos_theta3 = (v43 @ -v32) / (np.linalg.norm(v43) * np.linalg.norm(v32))
-            cos_theta4 = (v14 @ -v43) / (np.linalg.norm(v14) * np.linalg.norm(v43))
-            interior_angle = np.arccos(np.clip(
-                [cos_theta1, cos_theta2, cos_theta3, cos_theta4], -1., 1.))
-            theta = n * interior_angle + theta_additional
-
-            theta_mini = theta.min()
-            theta_maxi = theta.max()
-
-            if theta_mini < min_theta_quad:
-                eids_failed.append(eid)
-                model.log.debug('eid=%s failed min_theta check; theta=%.2f' % (
-                    eid, np.degrees(theta_mini)))
-                continue
-            if theta_maxi > max_theta:
-                eids_failed.append(eid)
-                model.log.debug('eid=%s failed max_theta check; theta=%.2f' % (
-                    eid, np.degrees(theta_maxi)))
-                continue
-            #print('eid=%s theta_min=%-5.2f theta_max=%-5.2f '
-                  #'skew=%-5.2f AR=%-5.2f taper_ratioi=%.2f' % (
-                      #eid,
-                      #np.degrees(theta_mini), np.degrees(theta_maxi),
-                      #np.degrees(skew), aspect_ratio, taper_ratioi))
-
+            quad_eids.append(eid)
+            quad_inids.append([nid_map[nid] for nid in element.node_ids])
         elif element.type == 'CTRIA3':
-            node_ids = element.node_ids
-            #pid = element.Pid()
-            #self.eid_to_nid_map[eid] = node_ids
-            #for nid in node_ids:
-                #if nid is not None:
-                    #nid_to_pid_map[nid].append(pid)
-
-            n1, n2, n3 = [nid_map[nid] for nid in node_ids]
-            p1 = xyz_cid0[n1, :]
-            p2 = xyz_cid0[n2, :]
-            p3 = xyz_cid0[n3, :]
-
-            v21 = p2 - p1
-            v32 = p3 - p2
-            v13 = p1 - p3
-            lengths = np.linalg.norm([v21, v32, v13], axis=1)
-            length_min = lengths.min()
-            if length_min == 0.0:
-                eids_failed.append(eid)
-                model.log.debug('eid=%s failed length_min check; length_min=%s' % (
-                    eid, length_min))
-                continue
-
-            #assert len(lengths) == 3, lengths
-            aspect_ratio = lengths.max() / length_min
-            if aspect_ratio > max_aspect_ratio:
-                eids_failed.append(eid)
-                model.log.debug('eid=%s failed aspect_ratio check; AR=%s' % (eid, aspect_ratio))
-                continue
-
-            cos_theta1 = (v21 @ -v13) / (np.linalg.norm(v21) * np.linalg.norm(v13))
-            cos_theta2 = (v32 @ -v21) / (np.linalg.norm(v32) * np.linalg.norm(v21))
-            cos_theta3 = (v13 @ -v32) / (np.linalg.norm(v13) * np.linalg.norm(v32))
-
-            theta = np.arccos(np.clip(
-                [cos_theta1, cos_theta2, cos_theta3], -1., 1.))
-            theta_mini = theta.min()
-            theta_maxi = theta.max()
-
-            if theta_mini < min_theta_tri:
-                eids_failed.append(eid)
-                model.log.debug('eid=%s failed min_theta check; theta=%s' % (
-                    eid, np.degrees(theta_mini)))
-                continue
-            if theta_maxi > max_theta:
-                eids_failed.append(eid)
-                model.log.debug('eid=%s failed max_theta check; theta=%s' % (
-                    eid, np.degrees(theta_maxi)))
-                continue
-
-            #     3
-            #    / \
-            # e3/   \ e2
-            #  /    /\
-            # /    /  \
-            # 1---/----2
-            #    e1
-            e1 = (p1 + p2) / 2.
-            e2 = (p2 + p3) / 2.
-            e3 = (p3 + p1) / 2.
-
-            e21 = e2 - e1
-            e31 = e3 - e1
-            e32 = e3 - e2
-
-            e3_p2 = e3 - p2
-            e2_p1 = e2 - p1
-            e1_p3 = e1 - p3
-            cos_skew1 = (e2_p1 @ e31) / (np.linalg.norm(e2_p1) * np.linalg.norm(e31))
-            cos_skew2 = (e2_p1 @ -e31) / (np.linalg.norm(e2_p1) * np.linalg.norm(e31))
-            cos_skew3 = (e3_p2 @ e21) / (np.linalg.norm(e3_p2) * np.linalg.norm(e21))
-            cos_skew4 = (e3_p2 @ -e21) / (np.linalg.norm(e3_p2) * np.linalg.norm(e21))
-            cos_skew5 = (e1_p3 @ e32) / (np.linalg.norm(e1_p3) * np.linalg.norm(e32))
-            cos_skew6 = (e1_p3 @ -e32) / (np.linalg.norm(e1_p3) * np.linalg.norm(e32))
-            skew = np.pi / 2. - np.abs(np.arccos(
-                np.clip([cos_skew1, cos_skew2, cos_skew3,
-                         cos_skew4, cos_skew5, cos_skew6], -1., 1.)
-            )).min()
-            if skew > max_skew:
-                eids_failed.append(eid)
-                model.log.debug('eid=%s failed max_skew check; skew=%s' % (eid, np.degrees(skew)))
-                continue
-
-            #print('eid=%s theta_min=%-5.2f theta_max=%-5.2f skew=%-5.2f AR=%-5.2f' % (
-                #eid,
-                #np.degrees(theta_mini), np.degrees(theta_maxi),
-                #np.degrees(skew), aspect_ratio))
+            tri_eids.append(eid)
+            tri_inids.append([nid_map[nid] for nid in element.node_ids])
+
+    eids_failed = []
+    if quad_eids:
+        inids = np.array(quad_inids, dtype='int32')
+        out = quad_quality_array(*[xyz_cid0[inids[:, i], :] for i in range(4)])
+        (unused_area, taper_ratio, unused_area_ratio, skew, aspect_ratio,
+         theta_min, theta_max, unused_dideal_theta, length_min, unused_max_warp) = out
+        checks = [
+            ('length_min', 'length_min=%s', length_min == 0.0, length_min),
+            ('aspect_ratio', 'AR=%.2f', aspect_ratio > max_aspect_ratio, aspect_ratio),
+            ('max_skew', 'skew=%.2f', skew > max_skew, np.degrees(skew)),
+            ('taper_ratio', 'taper=%.2f', taper_ratio > max_taper_ratio, taper_ratio),
+            ('min_theta', 'theta=%.2f', theta_min < min_theta, np.degrees(theta_min)),
+            ('max_theta', 'theta=%.2f', theta_max > max_theta, np.degrees(theta_max)),
+        ]
+        eids_failed.extend(_get_failed_eids(log, quad_eids, checks))
+
+    if tri_eids:
+        inids = np.array(tri_inids, dtype='int32')
+        out = tri_quality_array(*[xyz_cid0[inids[:, i], :] for i in range(3)])
+        (unused_area, skew, aspect_ratio,
+         theta_min, theta_max, unused_dideal_theta, length_min) = out
+        checks = [
+            ('length_min', 'length_min=%s', length_min == 0.0, length_min),
+            ('aspect_ratio', 'AR=%s', aspect_ratio > max_aspect_ratio, aspect_ratio),
+            ('min_theta', 'theta=%s', theta_min < min_theta, np.degrees(theta_min)),
+            ('max_theta', 'theta=%s', theta_max > max_theta, np.degrees(theta_max)),
+            ('max_skew', 'skew=%s', skew > max_skew, np.degrees(skew)),
+        ]
+        eids_failed.extend(_get_failed_eids(log, tri_eids, checks))
+    eids_failed.sort()
+    return eids_failed
+
+def _get_failed_eids(log: SimpleLogger, eids: List[int], checks) -> List[int]:
+    """
+    Applies a series of checks to a set of elements.  An element is reported
+    for the first check it fails.
+
+    Parameters
+    ----------
+    log : SimpleLogger
+        the logger
+    eids : List[int]
+        the element ids
+    checks : List[(name, fmt, is_failed, value)]
+        name : str
+            the name of the check
+        fmt : str
+            the format for the value
+        is_failed : (neids, ) bool ndarray
+            is the check failed
+        value : (neids, ) float ndarray
+            the value to log
+
+    Returns
+    -------
+    eids_failed : List[int]
+        element ids that fail the criteria
+
+    """
+    eids = np.asarray(eids)
+    is_active = np.ones(len(eids), dtype='bool')
+    eids_failed = []
+    for name, fmt, is_failed, value in checks:
+        ifailed = np.where(is_active & is_failed)[0]
+        is_active[ifailed] = False
+        for eid, valuei in zip(eids[ifailed], value[ifailed]):
+            log.debug(('eid=%s failed %s check; ' + fmt) % (eid, name, valuei))
+        eids_failed.extend(eids[ifailed].tolist())
     return eids_failed
 
 def element_quality(model, nids=None, xyz_cid0=None, nid_map=None):
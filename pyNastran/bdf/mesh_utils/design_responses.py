@@ -0,0 +1,372 @@
+"""
+Defines:
+ - evaluate_design_responses(model, op2_model, subcase_ids,
+                             desvar_values=None, itime=0)
+
+Evaluates the DRESP1/DRESP2 design responses of a SOL 200 deck against
+an OP2 in bulk, which is much faster than calling ``DRESP1.calculate``
+once per card and per subcase.
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import List, Dict, Tuple, Optional, Any, TYPE_CHECKING
+import numpy as np
+
+from pyNastran.utils.numpy_utils import integer_types
+from pyNastran.bdf.cards.deqatn import _vsum, _vavg, _vssq, _vrss, _vmax, _vmin
+from pyNastran.bdf.cards.optimization import (
+    _get_dresp23_table_values, get_dvxrel1_coeffs, get_deqatn_value)
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+    from pyNastran.op2.op2 import OP2
+
+# DRESP1 response type -> nodal result
+NODAL_RESPONSES = {
+    'DISP': 'displacements',
+    'SPCFORCE': 'spc_forces',
+}
+# DRESP1 response type -> element result family
+ELEMENT_RESPONSES = {
+    'STRESS': 'stress',
+    'STRAIN': 'strain',
+    'FORCE': 'force',
+}
+# these have 2 layers (Z1/Z2) of 8 items for the stress/strain item codes
+PLATE_ELEMENTS = {'CQUAD4', 'CTRIA3', 'CQUAD8', 'CTRIA6', 'CQUADR', 'CTRIAR'}
+
+# the item codes are contiguous columns of the result
+#   - rods : 2=axial, 3=MS axial, 4=torsion, 5=MS torsion
+#   - bars : 2-5=end A, 6=axial, ...
+#   - plate force : 2=mx, ..., 9=ty
+#   - plate stress/strain : 2-9=Z1, 10-17=Z2
+ELEMENT_RESULT_TYPES = {
+    'CROD', 'CONROD', 'CTUBE', 'CBAR', 'CSHEAR',
+    'CELAS1', 'CELAS2', 'CELAS3', 'CELAS4',
+} | PLATE_ELEMENTS
+
+# the DRESP2 functions that may be used instead of a DEQATN
+DRESP2_FUNCTIONS = {
+    'SUM': _vsum, 'AVG': _vavg, 'SSQ': _vssq,
+    'RSS': _vrss, 'MAX': _vmax, 'MIN': _vmin,
+}
+
+
+def evaluate_design_responses(model: BDF, op2_model: OP2,
+                              subcase_ids: List[Any],
+                              desvar_values: Optional[Dict[int, float]]=None,
+                              itime: int=0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Evaluates all the DRESP1/DRESP2 responses for multiple subcases
+
+    The DRESP1s are grouped by result table (e.g., displacements,
+    cquad4_stress), so each group requires one fancy-indexing operation
+    per subcase.  The DRESP2s are evaluated in dependency order and
+    DRESP2s that share a DEQATN are evaluated in a single call.
+
+    Parameters
+    ----------
+    model : BDF
+        the model with DRESP1/DRESP2 cards
+    op2_model : OP2
+        the results
+    subcase_ids : List[int/tuple]
+        the keys of the results (e.g., op2_model.displacements.keys())
+    desvar_values : Dict[int, float]; default=None
+        the DESVAR values used by DRESP2s that reference DESVARs
+        and DVxRELx cards; None -> use the DESVAR xinit
+    itime : int; default=0
+        the time/mode/frequency index
+
+    Returns
+    -------
+    response_ids : (nresponses, 2) int ndarray
+        [dresp_id, id] where id is the node/element id for a DRESP1
+        and 0 for a DRESP2; a DRESP1 with multiple nodes/elements
+        creates multiple responses
+    values : (nresponses, nsubcases) float ndarray
+        the response values
+
+    """
+    if desvar_values is None:
+        desvar_values = {desvar_id: desvar.value
+                         for desvar_id, desvar in model.desvars.items()}
+
+    dresp1s = {}
+    dresp2s = {}
+    for dresp_id, dresp in sorted(model.dresps.items()):
+        if dresp.type == 'DRESP1':
+            dresp1s[dresp_id] = dresp
+        elif dresp.type == 'DRESP2':
+            dresp2s[dresp_id] = dresp
+        else:
+            model.log.warning(f'skipping {dresp.type} {dresp_id}')
+
+    response_ids = []
+    # dresp_id -> response rows
+    irows = {}
+    groups = _group_dresp1s(model, dresp1s, response_ids, irows)
+    nresponses1 = len(response_ids)
+    for dresp_id in dresp2s:
+        irows[dresp_id] = np.array([len(response_ids)])
+        response_ids.append((dresp_id, 0))
+
+    nsubcases = len(subcase_ids)
+    values = np.full((len(response_ids), nsubcases), np.nan, dtype='float64')
+    for (result_name, family), (irow, ids, ilayer, icol, is_nodal) in groups.items():
+        _fill_dresp1_group(op2_model, result_name, family, subcase_ids, itime,
+                           irow, ids, ilayer, icol, is_nodal, values)
+    is_nan = np.isnan(values[:nresponses1, :]).any(axis=1)
+    if is_nan.any():
+        missing_ids = np.unique(np.array(response_ids[:nresponses1])[is_nan, 0])
+        raise RuntimeError(f'DRESP1 ids={missing_ids.tolist()} were not filled')
+
+    _fill_dresp2s(model, dresp2s, irows, desvar_values, values)
+    return np.array(response_ids, dtype='int32').reshape(len(response_ids), 2), values
+
+
+def _group_dresp1s(model: BDF, dresp1s, response_ids: List[Tuple[int, int]],
+                   irows: Dict[int, np.ndarray]):
+    """
+    Groups the DRESP1s by result table, so they can be extracted together
+
+    Returns
+    -------
+    groups : dict[(result_name, family)] = (irow, ids, ilayer, icol, is_nodal)
+        irow : (n, ) int ndarray
+            the output response row
+        ids : (n, ) int ndarray
+            the node/element id
+        ilayer : (n, ) int ndarray
+            the row offset from the first row of the element (e.g., Z2)
+        icol : (n, ) int ndarray
+            the result column
+        is_nodal : bool
+            is this a nodal result
+
+    """
+    eids_by_pid = None
+    groups = defaultdict(list)
+    for dresp_id, dresp in dresp1s.items():
+        response_type = dresp.response_type
+        property_type = dresp.property_type
+        atti = [_get_id(att) for att in dresp.atti]
+        irow0 = len(response_ids)
+        if response_type in NODAL_RESPONSES:
+            if property_type is not None:
+                raise NotImplementedError(str(dresp))
+            # validation turns the component into a string
+            comp = str(dresp.atta)
+            if comp not in {'1', '2', '3', '4', '5', '6'}:
+                raise NotImplementedError(f'component={comp!r} must be 1-6\n{dresp}')
+            comp = int(comp)
+            key = (NODAL_RESPONSES[response_type], '')
+            for nid in atti:
+                groups[key].append((len(response_ids), nid, 0, comp - 1))
+                response_ids.append((dresp_id, nid))
+        elif response_type in ELEMENT_RESPONSES:
+            family = ELEMENT_RESPONSES[response_type]
+            if property_type == 'ELEM':
+                eids = sorted(atti)
+            else:
+                if eids_by_pid is None:
+                    eids_by_pid = _get_eids_by_pid(model)
+                for pid in atti:
+                    prop = model.properties[pid]
+                    if prop.type != property_type:
+                        raise RuntimeError(f'property_type={property_type!r} does not '
+                                           f'match {prop.type} pid={pid}\n{dresp}')
+                eids = sorted(eid for pid in atti
+                              for eid in eids_by_pid[pid])
+
+            item_code = dresp.atta
+            for eid in eids:
+                element_type = model.elements[eid].type
+                if element_type not in ELEMENT_RESULT_TYPES:
+                    raise NotImplementedError(
+                        f'element_type={element_type!r} is not supported\n{dresp}')
+                ilayer = 0
+                icol = item_code - 2
+                if element_type in PLATE_ELEMENTS and family != 'force':
+                    ilayer, icol = divmod(icol, 8)
+                if icol < 0 or ilayer > 1:
+                    raise NotImplementedError(
+                        f'item_code={item_code!r} is not supported\n{dresp}')
+                result_name = f'{element_type.lower()}_{family}'
+                groups[(result_name, family)].append(
+                    (len(response_ids), eid, ilayer, icol))
+                response_ids.append((dresp_id, eid))
+        else:
+            msg = (f'response_type={response_type!r} '
+                   f'property_type={property_type!r} is not supported\n{dresp}')
+            raise NotImplementedError(msg)
+        irows[dresp_id] = np.arange(irow0, len(response_ids))
+
+    groups2 = {}
+    for key, rows in groups.items():
+        irow, ids, ilayer, icol = np.array(rows, dtype='int32').T
+        is_nodal = key[1] == ''
+        groups2[key] = (irow, ids, ilayer, icol, is_nodal)
+    return groups2
+
+
+def _fill_dresp1_group(op2_model: OP2, result_name: str, family: str,
+                       subcase_ids: List[Any], itime: int,
+                       irow: np.ndarray, ids: np.ndarray,
+                       ilayer: np.ndarray, icol: np.ndarray,
+                       is_nodal: bool, values: np.ndarray) -> None:
+    """extracts the values for one result table for all the subcases"""
+    if is_nodal:
+        results = op2_model.get_result(result_name)
+    else:
+        try:
+            results = op2_model.get_result(f'{family}.{result_name}')
+        except AttributeError:
+            results = op2_model.get_result(result_name)
+
+    for isubcase, subcase_id in enumerate(subcase_ids):
+        try:
+            case = results[subcase_id]
+        except KeyError:
+            raise KeyError(f'{result_name}[{subcase_id!r}] does not exist; '
+                           f'subcases={list(results.keys())}')
+        if is_nodal:
+            row_ids = case.node_gridtype[:, 0]
+        else:
+            element = getattr(case, 'element', None)
+            row_ids = element if element is not None else case.element_node[:, 0]
+
+        # the first row of each node/element
+        irow_result = np.searchsorted(row_ids, ids)
+        is_missing = (irow_result == len(row_ids))
+        is_missing[~is_missing] = row_ids[irow_result[~is_missing]] != ids[~is_missing]
+        if is_missing.any():
+            raise KeyError(f'ids={ids[is_missing].tolist()} were not found in '
+                           f'{result_name}[{subcase_id!r}]')
+        data = case.data[itime, irow_result + ilayer, icol]
+        if np.iscomplexobj(data):
+            data = np.abs(data)
+        values[irow, isubcase] = data
+
+
+def _fill_dresp2s(model: BDF, dresp2s, irows: Dict[int, np.ndarray],
+                  desvar_values: Dict[int, float],
+                  values: np.ndarray) -> None:
+    """
+    Evaluates the DRESP2s in dependency order.  DRESP2s at the same level
+    that use the same equation & number of arguments are evaluated at once.
+    """
+    levels = {}
+    for dresp_id in dresp2s:
+        _get_dresp2_level(dresp_id, dresp2s, levels, set())
+
+    nsubcases = values.shape[1]
+    for level in sorted(set(levels.values())):
+        groups = defaultdict(list)
+        for dresp_id, dresp in dresp2s.items():
+            if levels[dresp_id] != level:
+                continue
+            args = _get_dresp2_args(model, dresp, irows, desvar_values, values)
+            groups[(dresp.DEquation(), len(args))].append((dresp_id, args))
+
+        for (equation, nargs), dresps_args in groups.items():
+            # arg_array[iarg] : (ndresp2, nsubcases)
+            arg_arrays = [
+                np.array([np.broadcast_to(args[iarg], nsubcases)
+                          for unused_dresp_id, args in dresps_args])
+                for iarg in range(nargs)]
+
+            if isinstance(equation, integer_types):
+                deqatn = model.dequations[equation]
+                out = deqatn.evaluate_vectorized(*arg_arrays)
+            else:
+                func = DRESP2_FUNCTIONS[equation.strip().upper()]
+                out = func(*arg_arrays)
+
+            dresp_ids = [dresp_id for dresp_id, unused_args in dresps_args]
+            irow = np.hstack([irows[dresp_id] for dresp_id in dresp_ids])
+            values[irow, :] = out
+
+
+def _get_dresp2_level(dresp_id: int, dresp2s, levels: Dict[int, int],
+                      active: set) -> int:
+    """gets the number of DRESP2s a DRESP2 depends on"""
+    if dresp_id not in dresp2s:
+        # DRESP1
+        return 0
+    if dresp_id in levels:
+        return levels[dresp_id]
+    if dresp_id in active:
+        raise RuntimeError(f'DRESP2={dresp_id} has a circular reference')
+    active.add(dresp_id)
+
+    level = 1
+    for (unused_j, name), vals in sorted(dresp2s[dresp_id].params.items()):
+        if name in ['DRESP1', 'DRESP2']:
+            for dresp_idi in _get_dresp23_table_values(name, vals):
+                level = max(level, _get_dresp2_level(dresp_idi, dresp2s, levels, active) + 1)
+    active.remove(dresp_id)
+    levels[dresp_id] = level
+    return level
+
+
+def _get_dresp2_args(model: BDF, dresp2, irows: Dict[int, np.ndarray],
+                     desvar_values: Dict[int, float],
+                     values: np.ndarray) -> List[Any]:
+    """
+    Gets the arguments for a DRESP2 in the same order as ``DRESP2.calculate``
+
+    Responses are (nsubcases, ) arrays; everything else is a float.
+    """
+    args = []
+    for key, vals in sorted(dresp2.params.items()):
+        unused_j, name = key
+        ids = _get_dresp23_table_values(name, vals)
+        if name in ['DRESP1', 'DRESP2']:
+            for dresp_id in ids:
+                args.extend(values[irows[dresp_id], :])
+        elif name == 'DESVAR':
+            args.extend(desvar_values[desvar_id] for desvar_id in ids)
+        elif name == 'DTABLE':
+            args.extend(model.dtable[label] for label in ids)
+        elif name in ['DVPREL1', 'DVPREL2', 'DVMREL1', 'DVMREL2', 'DVCREL1', 'DVCREL2']:
+            if name.startswith('DVP'):
+                dvxrels = model.dvprels
+            elif name.startswith('DVM'):
+                dvxrels = model.dvmrels
+            else:
+                dvxrels = model.dvcrels
+            for dvxrel_id in ids:
+                dvxrel = dvxrels[dvxrel_id]
+                if dvxrel.type.endswith('1'):
+                    args.append(get_dvxrel1_coeffs(dvxrel, model, desvar_values))
+                else:
+                    args.append(get_deqatn_value(dvxrel, model, desvar_values))
+        elif name == 'DNODE':
+            nids, components = ids
+            for nid, component in zip(nids, components):
+                xyz = model.nodes[nid].get_position()
+                args.append(xyz[component - 1])
+        else:
+            raise NotImplementedError(f'{name} is not supported\n{dresp2}')
+    return args
+
+
+def _get_eids_by_pid(model: BDF) -> Dict[int, List[int]]:
+    """gets the elements associated with each property"""
+    eids_by_pid = defaultdict(list)
+    for eid, elem in model.elements.items():
+        if hasattr(elem, 'pid'):
+            eids_by_pid[elem.Pid()].append(eid)
+    return eids_by_pid
+
+
+def _get_id(att: Any) -> int:
+    """gets the node/element/property id"""
+    if isinstance(att, integer_types):
+        return att
+    if hasattr(att, 'nid'):
+        return att.nid
+    if hasattr(att, 'eid'):
+        return att.eid
+    return att.pid
@@ -1,6 +1,7 @@
 from __future__ import annotations
-from typing import Dict, Any, TYPE_CHECKING
+from typing import Dict, Union, Any, TYPE_CHECKING
 import numpy as np
+import scipy.sparse as sp
 from pyNastran.bdf.cards.optimization import get_dvprel_key
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -99,3 +100,280 @@ def get_dvprel_ndarrays(model: BDF, nelements: int, pids: np.ndarray,
 
     #dvprel_dict['PSHELL']['T']  = dvprel_t_init, dvprel_t_min, dvprel_t_max
     return dvprel_dict
+
+
+class DesvarMap:
+    """
+    Maps DESVAR values to property, material, element and grid fields.
+
+    The DVPREL1/DVMREL1/DVCREL1 and DVGRID relations are linear, so they
+    are stored as sparse matrices that are built once.  The DVxREL2 cards
+    are evaluated with the vectorized DEQATN.  Many design vectors may be
+    evaluated at once, so an optimizer doesn't need to update the model
+    to get the new values.
+
+    >>> desvar_map = DesvarMap(model)
+    >>> x = np.array([[1., 2.], [1.1, 2.2]])  # (ndesigns, ndesvars)
+    >>> values = desvar_map.get_dvxrel_values(x)  # (ndesigns, ndvxrels)
+    >>> xyz = desvar_map.get_grid_xyz(x)  # (ndesigns, ngrids, 3)
+    >>> desvar_map.apply(x[1, :])  # updates the model
+
+    """
+    def __init__(self, model: BDF):
+        """
+        Creates the map
+
+        Parameters
+        ----------
+        model : BDF
+            the model; the current grid locations correspond to the
+            initial DESVAR values (xinit)
+
+        """
+        self.model = model
+        self.desvar_ids = np.array(sorted(model.desvars), dtype='int32')
+        ndesvars = len(self.desvar_ids)
+        idesvar = {desvar_id: i for i, desvar_id in enumerate(self.desvar_ids)}
+        self._idesvar = idesvar
+
+        desvars = [model.desvars[desvar_id] for desvar_id in self.desvar_ids]
+        self.xinit = np.array([desvar.value for desvar in desvars], dtype='float64')
+        self.xlb = np.array([desvar.xlb for desvar in desvars], dtype='float64')
+        self.xub = np.array([desvar.xub for desvar in desvars], dtype='float64')
+
+        # DLINK: x_dependent = c0 + cmult * sum(ci * x_independent_i)
+        self._dlinks = []
+        for unused_dlink_id, dlink in sorted(model.dlinks.items()):
+            iindependent = [idesvar[desvar_id] for desvar_id in dlink.independent_desvars]
+            self._dlinks.append((
+                idesvar[dlink.dependent_desvar], dlink.c0,
+                dlink.cmult * np.array(dlink.coeffs, dtype='float64'),
+                np.array(iindependent, dtype='int32')))
+
+        # DVxREL1: value = c0 + A @ x
+        # DVxREL2: value = DEQATN(x[idesvars], dtable_values)
+        self.dvxrels = []
+        self._targets = []
+        dvxrel2s = []
+        rows = []
+        cols = []
+        coeffs = []
+        c0 = []
+        for dvxrels in (model.dvprels, model.dvmrels, model.dvcrels):
+            for unused_oid, dvxrel in sorted(dvxrels.items()):
+                if dvxrel.type.endswith('2'):
+                    dvxrel2s.append(dvxrel)
+                    continue
+                irow = len(self.dvxrels)
+                for desvar_id, coeff in zip(dvxrel.desvar_ids, dvxrel.coeffs):
+                    rows.append(irow)
+                    cols.append(idesvar[desvar_id])
+                    coeffs.append(coeff)
+                c0.append(dvxrel.c0)
+                self.dvxrels.append(dvxrel)
+                self._targets.append(_get_dvxrel_target(model, dvxrel))
+
+        nlinear = len(self.dvxrels)
+        self._c0 = np.array(c0, dtype='float64')
+        self._linear = sp.csr_matrix(
+            (np.array(coeffs, dtype='float64'), (rows, cols)),
+            shape=(nlinear, ndesvars))
+
+        self._nonlinear = []
+        for dvxrel in dvxrel2s:
+            deqatn = model.DEQATN(dvxrel.DEquation())
+            iargs = np.array([idesvar[desvar_id] for desvar_id in dvxrel.dvids],
+                             dtype='int32')
+            dtable_values = [model.dtable[label] for label in dvxrel.labels]
+            self._nonlinear.append((deqatn, iargs, dtable_values))
+            self.dvxrels.append(dvxrel)
+            self._targets.append(_get_dvxrel_target(model, dvxrel))
+
+        self._setup_dvgrids()
+
+    def _setup_dvgrids(self) -> None:
+        """
+        Builds the DVGRID map
+
+        {g}_i - {g}_i0 = sum(coeff_j * (x_j - x0_j) * {N}_j)
+
+        where {N} is defined in the CID system at the grid location and
+        the perturbation is stored in the basic frame.
+        """
+        model = self.model
+        nids = sorted({dvgrid.nid for dvgrids in model.dvgrids.values()
+                       for dvgrid in dvgrids})
+        self.grid_ids = np.array(nids, dtype='int32')
+        igrid = {nid: i for i, nid in enumerate(nids)}
+        self.xyz0 = np.array([model.nodes[nid].get_position() for nid in nids],
+                             dtype='float64').reshape(len(nids), 3)
+
+        rows = []
+        cols = []
+        values = []
+        for dvid, dvgrids in sorted(model.dvgrids.items()):
+            idesvari = self._idesvar[dvid]
+            for dvgrid in dvgrids:
+                i = igrid[dvgrid.nid]
+                coord = model.coords[dvgrid.cid]
+                basis = _get_local_basis(coord, self.xyz0[i, :])
+                dxyz = dvgrid.coeff * (np.asarray(dvgrid.dxyz, dtype='float64') @ basis)
+                rows.extend([3 * i, 3 * i + 1, 3 * i + 2])
+                cols.extend([idesvari] * 3)
+                values.extend(dxyz)
+        # duplicate entries (multiple DVGRIDs for a grid) are summed
+        self._dvgrid = sp.csr_matrix(
+            (np.array(values, dtype='float64'), (rows, cols)),
+            shape=(3 * len(nids), len(self.desvar_ids)))
+
+    def _get_desvar_array(self, desvar_values: Union[np.ndarray, Dict[int, float]]) -> np.ndarray:
+        """gets the (ndesigns, ndesvars) design vectors with the DLINKs applied"""
+        if isinstance(desvar_values, dict):
+            x = np.array([desvar_values[desvar_id] for desvar_id in self.desvar_ids],
+                         dtype='float64')
+        else:
+            x = np.array(desvar_values, dtype='float64')
+        x = np.atleast_2d(x)
+        if x.shape[1] != len(self.desvar_ids):
+            raise ValueError(f'desvar_values.shape={x.shape}; '
+                             f'expected (ndesigns, {len(self.desvar_ids)})')
+
+        for idependent, c0, coeffs, iindependent in self._dlinks:
+            value = c0 + x[:, iindependent] @ coeffs
+            x[:, idependent] = np.clip(value, self.xlb[idependent], self.xub[idependent])
+        return x
+
+    def get_dvxrel_values(self, desvar_values: Union[np.ndarray, Dict[int, float]]) -> np.ndarray:
+        """
+        Gets the new values of the DVPRELx/DVMRELx/DVCRELx fields
+
+        Parameters
+        ----------
+        desvar_values : (ndesvars, ) or (ndesigns, ndesvars) float ndarray; dict
+            the design vector(s) in the order of self.desvar_ids
+
+        Returns
+        -------
+        values : (ndesigns, ndvxrels) float ndarray
+            the field values in the order of self.dvxrels
+
+        """
+        x = self._get_desvar_array(desvar_values)
+        values = np.zeros((x.shape[0], len(self.dvxrels)), dtype='float64')
+        nlinear = len(self._c0)
+        if nlinear:
+            values[:, :nlinear] = (self._linear @ x.T).T + self._c0
+
+        for i, (deqatn, iargs, dtable_values) in enumerate(self._nonlinear):
+            args = [x[:, iarg] for iarg in iargs] + dtable_values
+            values[:, nlinear + i] = deqatn.evaluate_vectorized(*args)
+        return values
+
+    def get_grid_xyz(self, desvar_values: Union[np.ndarray, Dict[int, float]]) -> np.ndarray:
+        """
+        Gets the locations of the DVGRID nodes in the basic frame
+
+        Parameters
+        ----------
+        desvar_values : (ndesvars, ) or (ndesigns, ndesvars) float ndarray; dict
+            the design vector(s) in the order of self.desvar_ids
+
+        Returns
+        -------
+        xyz : (ndesigns, ngrids, 3) float ndarray
+            the node locations in the order of self.grid_ids
+
+        """
+        x = self._get_desvar_array(desvar_values)
+        dxyz = (self._dvgrid @ (x - self.xinit).T).T
+        return self.xyz0 + dxyz.reshape(x.shape[0], len(self.grid_ids), 3)
+
+    def apply(self, desvar_values: Union[np.ndarray, Dict[int, float]]) -> None:
+        """
+        Updates the model for a single design vector
+
+        Parameters
+        ----------
+        desvar_values : (ndesvars, ) float ndarray; dict
+            the design vector in the order of self.desvar_ids
+
+        """
+        values = self.get_dvxrel_values(desvar_values)
+        if values.shape[0] != 1:
+            raise ValueError('only a single design vector may be applied')
+        for dvxrel, target, value in zip(self.dvxrels, self._targets, values[0, :]):
+            _update_dvxrel_target(dvxrel, target, value)
+
+        if len(self.grid_ids) == 0:
+            return
+        xyz = self.get_grid_xyz(desvar_values)[0, :, :]
+        model = self.model
+        for nid, xyzi in zip(self.grid_ids, xyz):
+            node = model.nodes[nid]
+            if node.cp == 0:
+                node.xyz = xyzi
+            else:
+                node.xyz = model.coords[node.cp].transform_node_to_local(xyzi)
+
+
+def _get_dvxrel_target(model: BDF, dvxrel) -> Any:
+    """gets the property/material/element that the DVxRELx updates"""
+    if dvxrel.type == 'DVPREL1':
+        return dvxrel._get_property(model, dvxrel.pid)
+    elif dvxrel.type == 'DVPREL2':
+        return dvxrel._get_property(model, dvxrel.pid)
+    elif dvxrel.type in ['DVMREL1', 'DVMREL2']:
+        msg = ', which is required by %s oid=%r' % (dvxrel.type, dvxrel.oid)
+        return dvxrel._get_material(model, dvxrel.mid, msg=msg)
+    elif dvxrel.type == 'DVCREL1':
+        return dvxrel._get_element(model)
+    elif dvxrel.type == 'DVCREL2':
+        return dvxrel._get_element(model, dvxrel.eid)
+    raise NotImplementedError(dvxrel.type)
+
+
+def _update_dvxrel_target(dvxrel, target: Any, value: float) -> None:
+    """sets a property/material/element field"""
+    if dvxrel.type.startswith('DVP'):
+        dvxrel._update_by_dvprel(target, value)
+    elif dvxrel.type.startswith('DVM'):
+        dvxrel._update_by_dvmrel(target, value)
+    else:
+        dvxrel._update_by_dvcrel(target, value)
+
+
+def _get_local_basis(coord, xyz: np.ndarray) -> np.ndarray:
+    """
+    Gets the unit vectors of a coordinate system at a point in the
+    basic frame.  For cylindrical/spherical systems, the vectors are
+    (r, theta, z) and (r, theta, phi).
+    """
+    beta = coord.beta()
+    if coord.Type == 'R':
+        return beta
+    xyz_local = (xyz - coord.origin) @ beta.T
+    x, y, z = xyz_local
+    theta = np.arctan2(y, x)
+    ct = np.cos(theta)
+    st = np.sin(theta)
+    if coord.Type == 'C':
+        basis = np.array([
+            [ct, st, 0.],
+            [-st, ct, 0.],
+            [0., 0., 1.],
+        ])
+    else:
+        assert coord.Type == 'S', coord.Type
+        # theta is measured from the z-axis; phi is about the z-axis
+        phi = theta
+        cp = ct
+        sp_ = st
+        theta = np.arctan2(np.hypot(x, y), z)
+        ct = np.cos(theta)
+        st = np.sin(theta)
+        basis = np.array([
+            [st * cp, st * sp_, ct],
+            [ct * cp, ct * sp_, -st],
+            [-sp_, cp, 0.],
+        ])
+    return basis @ beta
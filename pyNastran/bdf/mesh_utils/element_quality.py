@@ -0,0 +1,494 @@
+# pylint: disable=C0103
+"""
+Vectorized element quality kernels
+
+defines:
+ - out = tri_quality_array(p1, p2, p3)
+ - out = quad_quality_array(p1, p2, p3, p4)
+ - out = solid_quality_array(faces, xyz)
+ - quality = element_quality_array(model, nids=None, xyz_cid0=None,
+                                   element_ids=None, chunk_size=100000,
+                                   num_cpus=1)
+
+The scalar versions (``tri_quality``, ``quad_quality``, ``get_min_max_theta``)
+in ``delete_bad_elements.py`` work on a single element.  These work on
+(nelements, 3) float arrays, so an entire element type is processed at once.
+
+"""
+from __future__ import annotations
+import multiprocessing as mp
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+PIOVER2 = np.pi / 2.
+PIOVER3 = np.pi / 3.
+
+# these normals point inwards (see element_quality)
+CTETRA_FACES = (
+    (0, 1, 2), # (1, 2, 3),
+    (0, 3, 1), # (1, 4, 2),
+    (0, 3, 2), # (1, 3, 4),
+    (1, 3, 2), # (2, 4, 3),
+)
+CPYRAM_FACES = (
+    (0, 1, 2, 3), # (1, 2, 3, 4),
+    (1, 4, 2), # (2, 5, 3),
+    (2, 4, 3), # (3, 5, 4),
+    (0, 3, 4), # (1, 4, 5),
+    (0, 4, 1), # (1, 5, 2),
+)
+CPENTA_FACES = (
+    (0, 2, 1), # (1, 3, 2),
+    (3, 4, 5), # (4, 5, 6),
+    (0, 1, 4, 3), # (1, 2, 5, 4), # bottom
+    (1, 2, 5, 4), # (2, 3, 6, 5), # right
+    (0, 3, 5, 2), # (1, 4, 6, 3), # left
+)
+CHEXA_FACES = (
+    (4, 5, 6, 7), # (5, 6, 7, 8),
+    (0, 3, 2, 1), # (1, 4, 3, 2),
+    (1, 2, 6, 5), # (2, 3, 7, 6),
+    (2, 3, 7, 6), # (3, 4, 8, 7),
+    (0, 4, 7, 3), # (1, 5, 8, 4),
+    (0, 1, 5, 4), # (1, 2, 6, 5),
+)
+SOLID_FACES = {
+    'CTETRA': CTETRA_FACES,
+    'CPYRAM': CPYRAM_FACES,
+    'CPENTA': CPENTA_FACES,
+    'CHEXA': CHEXA_FACES,
+}
+
+TRI_TYPES = {'CTRIA3', 'CTRIAR', 'CTRAX3', 'CPLSTN3', 'CTRIA6'}
+QUAD_TYPES = {'CQUAD4', 'CQUADR', 'CPLSTN4', 'CQUADX4', 'CQUAD8', 'CSHEAR'}
+LINE_TYPES = {'CBAR', 'CBEAM', 'CROD', 'CTUBE', 'CONROD'}
+# kernel -> number of corner nodes
+NCORNER_NODES = {
+    'tri': 3,
+    'quad': 4,
+    'line': 2,
+    'CTETRA': 4,
+    'CPYRAM': 5,
+    'CPENTA': 6,
+    'CHEXA': 8,
+}
+QUALITY_NAMES = [
+    'area', 'min_interior_angle', 'max_interior_angle', 'dideal_theta',
+    'max_skew_angle', 'max_warp_angle', 'max_aspect_ratio',
+    'area_ratio', 'taper_ratio', 'min_edge_length',
+]
+
+
+def _norm(vectors: np.ndarray) -> np.ndarray:
+    """row-wise vector norm"""
+    return np.linalg.norm(vectors, axis=1)
+
+def _dot(v1: np.ndarray, v2: np.ndarray) -> np.ndarray:
+    """row-wise dot product"""
+    return np.einsum('ij,ij->i', v1, v2)
+
+def _arccos(cos_theta: np.ndarray) -> np.ndarray:
+    return np.arccos(np.clip(cos_theta, -1., 1.))
+
+
+def tri_quality_array(p1: np.ndarray, p2: np.ndarray, p3: np.ndarray,
+                      ) -> Tuple[np.ndarray, ...]:
+    """
+    Gets the quality metrics for a series of tris
+
+    Parameters
+    ----------
+    p1, p2, p3 : (ntri, 3) float ndarray
+        the corner points
+
+    Returns
+    -------
+    area, max_skew, aspect_ratio, min_theta, max_theta, dideal_theta, min_edge_length
+        (ntri, ) float ndarray; angles are in radians
+
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        #     3
+        #    / \
+        # e3/   \ e2
+        #  /    /\
+        # /    /  \
+        # 1---/----2
+        #    e1
+        e1 = (p1 + p2) / 2.
+        e2 = (p2 + p3) / 2.
+        e3 = (p3 + p1) / 2.
+        e21 = e2 - e1
+        e31 = e3 - e1
+        e32 = e3 - e2
+        e3_p2 = e3 - p2
+        e2_p1 = e2 - p1
+        e1_p3 = e1 - p3
+
+        v21 = p2 - p1
+        v32 = p3 - p2
+        v13 = p1 - p3
+        length21 = _norm(v21)
+        length32 = _norm(v32)
+        length13 = _norm(v13)
+        lengths = np.column_stack([length21, length32, length13])
+        min_edge_length = lengths.min(axis=1)
+        area = 0.5 * _norm(np.cross(v21, v13))
+
+        # the +/- skew angles have the same magnitude, so only 1 of each is needed
+        cos_skew = np.column_stack([
+            _dot(e2_p1, e31) / (_norm(e2_p1) * _norm(e31)),
+            _dot(e3_p2, e21) / (_norm(e3_p2) * _norm(e21)),
+            _dot(e1_p3, e32) / (_norm(e1_p3) * _norm(e32)),
+        ])
+        skew = _arccos(cos_skew)
+        skew = np.minimum(skew, np.pi - skew)
+        max_skew = PIOVER2 - skew.min(axis=1)
+
+        cos_theta = np.column_stack([
+            _dot(v21, -v13) / (length21 * length13),
+            _dot(v32, -v21) / (length32 * length21),
+            _dot(v13, -v32) / (length13 * length32),
+        ])
+        thetas = _arccos(cos_theta)
+        min_theta = thetas.min(axis=1)
+        max_theta = thetas.max(axis=1)
+        dideal_theta = np.maximum(max_theta - PIOVER3, PIOVER3 - min_theta)
+        aspect_ratio = lengths.max(axis=1) / min_edge_length
+
+    # degenerate tris don't have angles
+    is_degenerate = (min_edge_length == 0.0)
+    aspect_ratio[is_degenerate] = np.nan
+    min_theta[is_degenerate] = np.nan
+    max_theta[is_degenerate] = np.nan
+    dideal_theta[is_degenerate] = np.nan
+    return area, max_skew, aspect_ratio, min_theta, max_theta, dideal_theta, min_edge_length
+
+
+def quad_quality_array(p1: np.ndarray, p2: np.ndarray,
+                       p3: np.ndarray, p4: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Gets the quality metrics for a series of quads
+
+    Parameters
+    ----------
+    p1, p2, p3, p4 : (nquad, 3) float ndarray
+        the corner points
+
+    Returns
+    -------
+    area, taper_ratio, area_ratio, max_skew, aspect_ratio,
+    min_theta, max_theta, dideal_theta, min_edge_length, max_warp
+        (nquad, ) float ndarray; angles are in radians
+
+    """
+    with np.errstate(divide='ignore', invalid='ignore'):
+        v21 = p2 - p1
+        v32 = p3 - p2
+        v43 = p4 - p3
+        v14 = p1 - p4
+        v41 = -v14
+        v31 = p3 - p1
+        v42 = p4 - p2
+        length21 = _norm(v21)
+        length32 = _norm(v32)
+        length43 = _norm(v43)
+        length14 = _norm(v14)
+        lengths = np.column_stack([length21, length32, length43, length14])
+        min_edge_length = lengths.min(axis=1)
+        aspect_ratio = lengths.max(axis=1) / min_edge_length
+
+        normal = np.cross(v31, v42)
+        area = 0.5 * _norm(normal)
+
+        # the ratio of the ideal area to the actual area
+        # this is an hourglass check
+        areas = np.column_stack([
+            _norm(np.cross(v41, v21)),  # v41 x v21
+            _norm(np.cross(v32, -v21)), # v32 x v12
+            _norm(np.cross(v43, -v32)), # v43 x v23
+            _norm(np.cross(v14, v43)),  # v14 x v43
+        ])
+        min_area = areas.min(axis=1)
+        area_ratio = np.maximum(area / min_area, areas.max(axis=1) / area)
+        area_ratio[min_area == 0.] = np.nan
+
+        corner_areas = 0.5 * areas
+        aavg = corner_areas.mean(axis=1)
+        taper_ratio = np.abs(corner_areas - aavg[:, np.newaxis]).sum(axis=1) / aavg
+
+        #    e3
+        # 4-------3
+        # |       |
+        # |e4     |  e2
+        # 1-------2
+        #     e1
+        e13 = (p3 + p4) / 2. - (p1 + p2) / 2.
+        e42 = (p2 + p3) / 2. - (p4 + p1) / 2.
+        skew = _arccos(_dot(e13, e42) / (_norm(e13) * _norm(e42)))
+        max_skew = PIOVER2 - np.minimum(skew, np.pi - skew)
+
+        cos_theta = np.column_stack([
+            _dot(v21, -v14) / (length21 * length14),
+            _dot(v32, -v21) / (length32 * length21),
+            _dot(v43, -v32) / (length43 * length32),
+            _dot(v14, -v43) / (length14 * length43),
+        ])
+
+        # a x b / ab = sin(theta)
+        # sin(theta) < 0. -> normal is flipped
+        n = np.sign(np.column_stack([
+            _dot(np.cross(v14, v21), normal),
+            _dot(np.cross(v21, v32), normal),
+            _dot(np.cross(v32, v43), normal),
+            _dot(np.cross(v43, v14), normal),
+        ]))
+        theta_additional = np.where(n < 0, 2*np.pi, 0.)
+        theta = n * _arccos(cos_theta) + theta_additional
+        min_theta = theta.min(axis=1)
+        max_theta = theta.max(axis=1)
+        dideal_theta = np.maximum(max_theta - PIOVER2, PIOVER2 - min_theta)
+
+        # warp angle; take the max of the two ways to split the quad
+        # 4---3    4---3
+        # | / |    | \ |
+        # |/  |    |  \|
+        # 1---2    1---2
+        n123 = np.cross(v21, v31)
+        n134 = np.cross(v31, v41)
+        n124 = np.cross(v21, v41)
+        n234 = np.cross(v32, v42)
+        cos_warp1 = _dot(n123, n134) / (_norm(n123) * _norm(n134))
+        cos_warp2 = _dot(n124, n234) / (_norm(n124) * _norm(n234))
+        max_warp = np.maximum(_arccos(cos_warp1), _arccos(cos_warp2))
+
+    out = (area, taper_ratio, area_ratio, max_skew, aspect_ratio,
+           min_theta, max_theta, dideal_theta, min_edge_length, max_warp)
+    return out
+
+
+def solid_quality_array(faces: Tuple[Tuple[int, ...], ...],
+                        xyz: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """
+    Gets the min/max interior face angles for a series of solid elements
+    of the same type (e.g., CTETRA, CPENTA, CHEXA, CPYRAM)
+
+    Parameters
+    ----------
+    faces : Tuple[Tuple[int, ...]]
+        the 0-based corner node indices of each face (e.g., ``CHEXA_FACES``)
+    xyz : (nelements, nnodes, 3) float ndarray
+        the corner points of each element
+
+    Returns
+    -------
+    min_theta, max_theta, dideal_theta, min_edge_length : (nelements, ) float ndarray
+        angles are in radians
+
+    """
+    nelements = xyz.shape[0]
+    thetas = []
+    ideal_thetas = []
+    min_edge_length = np.full(nelements, np.inf, dtype=xyz.dtype)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for face in faces:
+            nface = len(face)
+            if nface == 3:
+                ideal_theta = PIOVER3
+            elif nface == 4:
+                ideal_theta = PIOVER2
+            else:  # pragma: no cover
+                raise NotImplementedError(face)
+            points = xyz[:, face, :]
+            # vectors pointing from node i to node i+1; (nelements, nface, 3)
+            edges = np.roll(points, -1, axis=1) - points
+            lengths = np.linalg.norm(edges, axis=2)
+            min_edge_length = np.minimum(min_edge_length, lengths.min(axis=1))
+
+            # the angle at node i is between (i-1 -> i) and (i -> i+1)
+            edges_prev = np.roll(edges, 1, axis=1)
+            lengths_prev = np.roll(lengths, 1, axis=1)
+            cos_theta = np.einsum('ijk,ijk->ij', edges, -edges_prev) / (lengths * lengths_prev)
+            thetas.append(_arccos(cos_theta))
+            ideal_thetas.append(np.full(nface, ideal_theta))
+
+    theta = np.hstack(thetas)
+    ideal_theta = np.hstack(ideal_thetas)
+    min_theta = theta.min(axis=1)
+    max_theta = theta.max(axis=1)
+    dideal_theta = np.abs(theta - ideal_theta).max(axis=1)
+    return min_theta, max_theta, dideal_theta, min_edge_length
+
+
+def _quality_kernel(kernel: str, xyz: np.ndarray) -> np.ndarray:
+    """
+    Evaluates a single chunk of elements
+
+    Parameters
+    ----------
+    kernel : str
+        'tri', 'quad', 'line', 'CTETRA', 'CPENTA', 'CHEXA', 'CPYRAM'
+    xyz : (nelements, nnodes, 3) float ndarray
+        the corner points of each element
+
+    Returns
+    -------
+    quality : (nelements, nquality) float ndarray
+        the columns are ordered by ``QUALITY_NAMES``
+
+    """
+    nelements = xyz.shape[0]
+    quality = np.full((nelements, len(QUALITY_NAMES)), np.nan, dtype='float64')
+    if kernel == 'tri':
+        (area, max_skew, aspect_ratio, min_theta, max_theta, dideal_theta,
+         min_edge_length) = tri_quality_array(xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :])
+        quality[:, 0] = area
+        quality[:, 4] = max_skew
+        quality[:, 6] = aspect_ratio
+    elif kernel == 'quad':
+        (area, taper_ratio, area_ratio, max_skew, aspect_ratio,
+         min_theta, max_theta, dideal_theta, min_edge_length, max_warp) = quad_quality_array(
+             xyz[:, 0, :], xyz[:, 1, :], xyz[:, 2, :], xyz[:, 3, :])
+        quality[:, 0] = area
+        quality[:, 4] = max_skew
+        quality[:, 5] = max_warp
+        quality[:, 6] = aspect_ratio
+        quality[:, 7] = area_ratio
+        quality[:, 8] = taper_ratio
+    elif kernel == 'line':
+        quality[:, 9] = np.linalg.norm(xyz[:, 1, :] - xyz[:, 0, :], axis=1)
+        return quality
+    else:
+        min_theta, max_theta, dideal_theta, min_edge_length = solid_quality_array(
+            SOLID_FACES[kernel], xyz)
+    quality[:, 1] = min_theta
+    quality[:, 2] = max_theta
+    quality[:, 3] = dideal_theta
+    quality[:, 9] = min_edge_length
+    return quality
+
+def _quality_kernel_star(args: Tuple[str, np.ndarray]) -> np.ndarray:
+    """multiprocessing helper for ``_quality_kernel``"""
+    return _quality_kernel(*args)
+
+
+def _get_element_kernel(etype: str) -> Optional[str]:
+    """gets the quality kernel name for an element type"""
+    if etype in TRI_TYPES:
+        kernel = 'tri'
+    elif etype in QUAD_TYPES:
+        kernel = 'quad'
+    elif etype in LINE_TYPES:
+        kernel = 'line'
+    elif etype in SOLID_FACES:
+        kernel = etype
+    else:
+        kernel = None
+    return kernel
+
+
+def element_quality_array(model: BDF, nids=None, xyz_cid0=None,
+                          element_ids: Optional[List[int]]=None,
+                          chunk_size: int=100_000,
+                          num_cpus: int=1) -> Dict[str, np.ndarray]:
+    """
+    Gets various measures of element quality using vectorized kernels
+
+    Parameters
+    ----------
+    model : BDF()
+        a model with GRIDs and elements
+    nids : (nnodes, ) int ndarray; default=None
+        the nodes of the model in sorted order
+    xyz_cid0 : (nnodes, 3) float ndarray; default=None
+        the associated global xyz locations
+    element_ids : List[int]; default=None -> all elements
+        the elements to consider
+    chunk_size : int; default=100000
+        the number of elements to process at once;
+        limits the memory use and sets the work size of each process
+    num_cpus : int; default=1
+        the number of processes to use;
+        1 runs everything in the current process
+
+    Returns
+    -------
+    quality : Dict[name] : (nelements, ) ndarray
+        Various quality metrics
+        names : element_id, area, min_interior_angle, max_interior_angle,
+                dideal_theta, max_skew_angle, max_warp_angle, max_aspect_ratio,
+                area_ratio, taper_ratio, min_edge_length
+        values : Angles are in radians.  The result is ``np.nan`` if the
+                 element type does not define the parameter.  For example,
+                 CTETRAs don't have an aspect ratio.
+        Elements without a quality definition (e.g., CELAS1, CONM2) are skipped.
+
+    """
+    if nids is None or xyz_cid0 is None:
+        out = model.get_displacement_index_xyz_cp_cd(
+            fdtype='float64', idtype='int32', sort_ids=True)
+        unused_icd_transform, icp_transform, xyz_cp, nid_cp_cd = out
+        nids = nid_cp_cd[:, 0]
+        xyz_cid0 = model.transform_xyzcp_to_xyz_cid(
+            xyz_cp, nids, icp_transform, cid=0,
+            in_place=False)
+
+    if element_ids is None:
+        element_ids = model.elements.keys()
+
+    # group the corner nodes by kernel
+    kernel_eids = defaultdict(list)
+    kernel_nids = defaultdict(list)
+    for eid in sorted(element_ids):
+        elem = model.elements[eid]
+        kernel = _get_element_kernel(elem.type)
+        if kernel is None:
+            continue
+        ncorner = NCORNER_NODES[kernel]
+        kernel_eids[kernel].append(eid)
+        kernel_nids[kernel].append(elem.node_ids[:ncorner])
+
+    # split the work into chunks
+    tasks = []
+    task_eids = []
+    for kernel, eids in kernel_eids.items():
+        node_ids = np.array(kernel_nids[kernel], dtype=nids.dtype)
+        inids = np.searchsorted(nids, node_ids)
+        inids[inids == len(nids)] = 0
+        is_missing = nids[inids] != node_ids
+        if np.any(is_missing):
+            ieids = np.unique(np.nonzero(is_missing)[0])
+            raise KeyError('missing node_ids=%s for %s element_ids=%s' % (
+                np.unique(node_ids[is_missing]).tolist(), kernel,
+                np.array(eids)[ieids].tolist()))
+        xyz = xyz_cid0[inids, :]
+        neids = len(eids)
+        for i0 in range(0, neids, chunk_size):
+            i1 = i0 + chunk_size
+            tasks.append((kernel, xyz[i0:i1, :, :]))
+            task_eids.append(eids[i0:i1])
+
+    if num_cpus > 1 and len(tasks) > 1:
+        with mp.Pool(min(num_cpus, len(tasks))) as pool:
+            results = list(pool.imap(_quality_kernel_star, tasks))
+    else:
+        results = [_quality_kernel(*task) for task in tasks]
+
+    if results:
+        eids = np.hstack(task_eids)
+        quality_array = np.vstack(results)
+        isort = np.argsort(eids)
+        eids = eids[isort]
+        quality_array = quality_array[isort, :]
+    else:
+        eids = np.zeros(0, dtype='int32')
+        quality_array = np.zeros((0, len(QUALITY_NAMES)), dtype='float64')
+
+    quality = {'element_id': eids}
+    for i, name in enumerate(QUALITY_NAMES):
+        quality[name] = quality_array[:, i]
+    return quality
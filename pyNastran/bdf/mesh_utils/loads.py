@@ -4,10 +4,15 @@ Defines:
       find the net force/moment on the model
   - sum_forces_moments_elements
       find the net force/moment on the model for a subset of elements
+  - sum_forces_moments_array
+      find the net force/moment on the model for many load cases
+  - get_static_force_matrix
+      get the sparse load vectors for many subcases
 
 """
 from __future__ import annotations
-from typing import Tuple, List, Dict, Optional, TYPE_CHECKING
+from collections import defaultdict
+from typing import Any, Tuple, List, Dict, Optional, TYPE_CHECKING
 from math import radians, sin, cos
 import numpy as np
 from numpy import array, cross, allclose, mean
@@ -595,6 +600,316 @@ def sum_forces_moments_elements(model: BDF, p0: int, loadcase_id: int,
     return F, M
 
 
+def sum_forces_moments_array(model: BDF, p0, loadcase_ids: List[int],
+                             include_grav: bool=False,
+                             xyz_cid0: Optional[Dict[int, NDArray3float]]=None) -> np.ndarray:
+    """
+    Sums applied forces & moments about a reference point p0 for many
+    load cases at once.
+
+    Each load card is evaluated once (at unit scale about the origin)
+    using the precomputed node locations, so the load cases are a
+    scaled sum of the card resultants.  The card resultants are only
+    reused within a call, so edits to the model between calls are
+    always picked up.
+
+    Considers:
+      - FORCE, FORCE1, FORCE2
+      - MOMENT, MOMENT1, MOMENT2
+      - PLOAD, PLOAD1, PLOAD2, PLOAD4
+      - GRAV
+      - LOAD
+
+    Parameters
+    ----------
+    model : BDF()
+        a BDF object
+    p0 : NUMPY.NDARRAY shape=(3,) or integer (node ID)
+        the reference point
+    loadcase_ids : List[int]
+        the LOAD=IDs to analyze
+    include_grav : bool; default=False
+        includes gravity in the summation
+    xyz_cid0 : None / Dict[int] = (3, ) ndarray
+        the nodes in the global coordinate system
+
+    Returns
+    -------
+    forces_moments : (nloads, 6) float ndarray
+        the [Fx, Fy, Fz, Mx, My, Mz] for each load case
+
+    .. seealso:: sum_forces_moments
+
+    """
+    p = _get_load_summation_point(model, p0, cid=0)
+    cache = {}
+    cache['nids'], cache['xyz_cid0'] = _get_node_arrays(model, xyz_cid0)
+
+    # the row of each unique card (by id) in the resultants
+    index = {}
+    cards = []
+    case_ids = []
+    card_ids = []
+    scales = []
+    for i, loadcase_id in enumerate(loadcase_ids):
+        if not isinstance(loadcase_id, integer_types):
+            raise RuntimeError('loadcase_id must be an integer; loadcase_id=%r' % loadcase_id)
+        loads, scale_factors, unused_is_grav = model.get_reduced_loads(
+            loadcase_id, skip_scale_factor0=True)
+        for load, scale in zip(loads, scale_factors):
+            if load.type == 'GRAV' and not include_grav:
+                continue
+            key = id(load)
+            if key not in index:
+                index[key] = len(cards)
+                cards.append(load)
+            case_ids.append(i)
+            card_ids.append(index[key])
+            scales.append(scale)
+
+    forces_moments = np.zeros((len(loadcase_ids), 6), dtype='float64')
+    if case_ids:
+        resultants = _get_load_resultants(model, cards, cache)
+        irows = np.array(card_ids, dtype='int32')
+        scaled = resultants[irows, :] * np.array(scales)[:, np.newaxis]
+        np.add.at(forces_moments, np.array(case_ids, dtype='int32'), scaled)
+
+    # the resultants are about the origin
+    #   M = sum((r - p) x f) = sum(r x f) - p x sum(f)
+    forces_moments[:, 3:] -= np.cross(p, forces_moments[:, :3])
+    return forces_moments
+
+
+def _get_node_arrays(model: BDF, xyz_cid0) -> Tuple[np.ndarray, np.ndarray]:
+    """gets the sorted node ids and the (nnodes, 3) locations in the global frame"""
+    if xyz_cid0 is None:
+        out = model.get_xyz_in_coord_array(cid=0, fdtype='float64', idtype='int32')
+        nid_cp_cd, xyz = out[:2]
+        nids = nid_cp_cd[:, 0]
+    else:
+        nids = np.array(sorted(xyz_cid0), dtype='int32')
+        xyz = np.array([xyz_cid0[nid] for nid in nids.tolist()], dtype='float64').reshape(len(nids), 3)
+    return nids, xyz
+
+
+def _get_load_resultants(model: BDF, loads, cache: Dict[str, Any]) -> np.ndarray:
+    """
+    Gets the unit scale [F, M] of each load card about the origin
+
+    The load cards are grouped by type, so the geometry is evaluated
+    on arrays.  PLOAD1 and the solid/line PLOAD4 loads use the
+    ``sum_forces_moments`` helpers.
+
+    """
+    nids = cache['nids']
+    xyz = cache['xyz_cid0']
+    resultants = np.zeros((len(loads), 6), dtype='float64')
+    loads_by_type = defaultdict(list)
+    for i, load in enumerate(loads):
+        loads_by_type[load.type].append(i)
+
+    unsupported_types = set()
+    for load_type, iloads in loads_by_type.items():
+        loads_type = [loads[i] for i in iloads]
+        iloads = np.array(iloads, dtype='int32')
+        if load_type in ['FORCE', 'FORCE1', 'FORCE2', 'MOMENT', 'MOMENT1', 'MOMENT2']:
+            vector = np.array([load.mag * load.xyz for load in loads_type], dtype='float64')
+            if load_type in ['FORCE', 'MOMENT']:
+                # the FORCE1/2 and MOMENT1/2 vectors are already in the global frame
+                cids = np.array([load.Cid() for load in loads_type], dtype='int32')
+                for cid in np.unique(cids[cids != 0]).tolist():
+                    icid = np.where(cids == cid)[0]
+                    coord = model.coords[cid]
+                    vector[icid, :] = coord.transform_vector_to_global_array(vector[icid, :])
+
+            if load_type.startswith('FORCE'):
+                node_ids = np.array([load.node_id for load in loads_type], dtype='int32')
+                r = xyz[np.searchsorted(nids, node_ids), :]
+                resultants[iloads, :3] = vector
+                resultants[iloads, 3:] = np.cross(r, vector)
+            else:
+                resultants[iloads, 3:] = vector
+
+        elif load_type == 'PLOAD':
+            node_ids = [load.node_ids for load in loads_type]
+            for nnodes in [3, 4]:
+                inode = np.array([len(nodes) == nnodes for nodes in node_ids])
+                if not np.any(inode):
+                    continue
+                pressure = np.array([load.pressure for load in loads_type])[inode]
+                node_idsi = np.array([nodes for nodes in node_ids if len(nodes) == nnodes],
+                                     dtype='int32')
+                xyzi = xyz[np.searchsorted(nids, node_idsi), :]
+                force, centroid = _get_pressure_force_centroid(
+                    xyzi, pressure, node_idsi)
+                resultants[iloads[inode], :3] = force
+                resultants[iloads[inode], 3:] = np.cross(centroid, force)
+            nnodes_bad = [len(nodes) for nodes in node_ids if len(nodes) not in [3, 4]]
+            if nnodes_bad:
+                msg = 'invalid number of nodes on PLOAD card; nnodes=%s' % str(nnodes_bad)
+                raise RuntimeError(msg)
+
+        elif load_type == 'PLOAD2':
+            _pload2_resultants(model, loads_type, iloads, nids, xyz, resultants)
+        elif load_type == 'PLOAD4':
+            _pload4_resultants(model, loads_type, iloads, nids, xyz, resultants)
+        elif load_type == 'PLOAD1':
+            p = np.zeros(3, dtype='float64')
+            for iload, load in zip(iloads, loads_type):
+                # _pload1_bar_beam updates the node positions in place
+                xyz_dict = {nid: xyz[np.searchsorted(nids, nid), :].copy()
+                            for nid in load.eid_ref.node_ids}
+                F = np.zeros(3, dtype='float64')
+                M = np.zeros(3, dtype='float64')
+                _pload1_total(model, load.sid, load, 1.0, xyz_dict, F, M, p)
+                resultants[iload, :3] = F
+                resultants[iload, 3:] = M
+        elif load_type == 'GRAV':
+            if 'grav' not in cache:
+                cache['grav'] = _get_element_mass_moment(model)
+            mass, mass_cg = cache['grav']
+            gravity = np.array([load.GravityVector() for load in loads_type], dtype='float64')
+            resultants[iloads, :3] = mass * gravity
+            resultants[iloads, 3:] = np.cross(mass_cg, gravity)
+        else:
+            # we collect them so we only get one print
+            unsupported_types.add(load_type)
+
+    for load_type in sorted(unsupported_types):
+        model.log.warning('loadtype=%r not supported' % load_type)
+    return resultants
+
+
+def _get_pressure_force_centroid(xyz: np.ndarray, pressure: np.ndarray,
+                                 node_ids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the force and centroid of a series of pressurized tri/quad faces
+
+    Parameters
+    ----------
+    xyz : (nfaces, nnodes, 3) float ndarray
+        the face nodes, where nnodes=3/4
+    pressure : (nfaces, ) float ndarray
+        the pressure in the normal direction
+
+    Returns
+    -------
+    force : (nfaces, 3) float ndarray
+        force = pressure * area * normal
+    centroid : (nfaces, 3) float ndarray
+        the face centroid
+
+    """
+    nnodes = xyz.shape[1]
+    if nnodes == 3:
+        axb = np.cross(xyz[:, 0, :] - xyz[:, 1, :], xyz[:, 0, :] - xyz[:, 2, :])
+    else:
+        axb = np.cross(xyz[:, 0, :] - xyz[:, 2, :], xyz[:, 1, :] - xyz[:, 3, :])
+    nunit = norm(axb, axis=1)
+    ibad = np.where(nunit == 0.)[0]
+    if len(ibad):
+        msg = 'zero area faces; nodes=%s' % node_ids[ibad, :].tolist()
+        raise FloatingPointError(msg)
+
+    # area * normal = 0.5 * axb
+    force = 0.5 * pressure[:, np.newaxis] * axb
+    centroid = xyz.mean(axis=1)
+    return force, centroid
+
+
+def _pload2_resultants(model: BDF, loads, iloads: np.ndarray,
+                       nids: np.ndarray, xyz: np.ndarray, resultants: np.ndarray) -> None:
+    """helper method for ``_get_load_resultants``"""
+    rows = {3: [], 4: []}
+    for iload, load in zip(iloads, loads):
+        for eid in load.element_ids:
+            elem = model.elements[eid]
+            if elem.type in ['CTRIA3', 'CTRIAR']:
+                rows[3].append((iload, load.pressure, elem.node_ids[:3]))
+            elif elem.type in ['CQUAD4', 'CSHEAR', 'CQUADR']:
+                rows[4].append((iload, load.pressure, elem.node_ids[:4]))
+            else:
+                model.log.warning('case=%s etype=%r loadtype=%r not supported' % (
+                    load.sid, elem.type, load.type))
+    _add_face_resultants(rows, nids, xyz, resultants)
+
+
+def _pload4_resultants(model: BDF, loads, iloads: np.ndarray,
+                       nids: np.ndarray, xyz: np.ndarray, resultants: np.ndarray) -> None:
+    """
+    helper method for ``_get_load_resultants``
+
+    Surface loads on shells in the normal direction (or a global nvector)
+    are vectorized.  Everything else uses ``_pload4_helper``.
+    """
+    tri_types = {'CTRIA3', 'CTRIA6', 'CTRIAR'}
+    quad_types = {'CQUAD4', 'CQUAD8', 'CQUAD', 'CQUADR', 'CSHEAR'}
+    rows = {3: [], 4: []}
+    xyz_dict = None
+    p = np.zeros(3, dtype='float64')
+    for iload, load in zip(iloads, loads):
+        assert load.line_load_dir == 'NORM', 'line_load_dir = %s' % (load.line_load_dir)
+        is_normal = np.abs(load.nvector).max() == 0.
+        is_vectorized = load.surf_or_line == 'SURF' and (is_normal or load.Cid() in [0, None])
+        for elem in load.eids_ref:
+            nnodes = 3 if elem.type in tri_types else 4 if elem.type in quad_types else 0
+            if is_vectorized and nnodes:
+                pressure = _mean_pressure_on_pload4(load.pressures[:nnodes], load, elem)
+                if is_normal:
+                    rows[nnodes].append((iload, pressure, elem.node_ids[:nnodes]))
+                else:
+                    rows[nnodes].append((iload, pressure, elem.node_ids[:nnodes], load.nvector))
+                continue
+
+            if xyz_dict is None:
+                xyz_dict = {nid: xyzi for nid, xyzi in zip(nids.tolist(), xyz)}
+            fi, mi = _pload4_helper(load.sid, load, 1.0, elem, xyz_dict, p)
+            resultants[iload, :3] += fi
+            resultants[iload, 3:] += mi
+    _add_face_resultants(rows, nids, xyz, resultants)
+
+
+def _add_face_resultants(rows, nids: np.ndarray, xyz: np.ndarray,
+                         resultants: np.ndarray) -> None:
+    """
+    Sums the face pressure loads into the card resultants
+
+    Parameters
+    ----------
+    rows : Dict[nnodes] = List[row]
+        row : (iload, pressure, node_ids) or (iload, pressure, node_ids, nvector)
+            a face pressure with a load in the normal direction or along nvector
+
+    """
+    for nnodes, rowsi in rows.items():
+        if not rowsi:
+            continue
+        iload = np.array([row[0] for row in rowsi], dtype='int32')
+        pressure = np.array([row[1] for row in rowsi], dtype='float64')
+        node_ids = np.array([row[2] for row in rowsi], dtype='int32')
+        xyzi = xyz[np.searchsorted(nids, node_ids), :]
+        force, centroid = _get_pressure_force_centroid(xyzi, pressure, node_ids)
+
+        # the load is along the nvector instead of the normal
+        idir = np.array([len(row) == 4 for row in rowsi])
+        if np.any(idir):
+            nvector = np.array([row[3] for row in rowsi if len(row) == 4], dtype='float64')
+            nvector /= norm(nvector, axis=1)[:, np.newaxis]
+            area_pressure = norm(force[idir, :], axis=1) * np.sign(pressure[idir])
+            force[idir, :] = area_pressure[:, np.newaxis] * nvector
+
+        np.add.at(resultants, iload, np.hstack([force, np.cross(centroid, force)]))
+
+
+def _get_element_mass_moment(model: BDF) -> Tuple[float, np.ndarray]:
+    """gets the element mass and first mass moment about the origin for GRAV"""
+    from pyNastran.bdf.mesh_utils.mass_properties_array import mass_properties_array
+    mass, cg = mass_properties_array(
+        model, element_ids=list(model.elements), mass_ids=[],
+        sym_axis='no', scale=1.0, inertia_reference='ref')[:2]
+    return mass, mass * cg
+
+
 def _bar_eq_pload1(load, elem, xyz, Ldir,
                    n1, n2,
                    x1, x2,
@@ -1167,3 +1482,207 @@ def _add_force(Fg: np.ndarray, dof_map: Dict[Tuple[int, int], int], model: BDF,
     for dof in range(3):
         irow = dof_map[(nid, dof+offset)]
         Fg[irow] += fglobal[dof]
+
+
+def get_static_force_matrix(model: BDF, subcase_ids: Optional[List[int]]=None,
+                            fdtype: str='float64') -> Tuple[Any, np.ndarray, List[int]]:
+    """
+    Assembles the sparse structural load vectors for many subcases:
+      [K]{x} = {F}
+
+    Each load card is assembled once into a sparse (ndof, ncards) matrix,
+    so the subcases are a sparse product with the LOAD scale factors.
+
+    Considers:
+      - FORCE, FORCE1, FORCE2
+      - MOMENT, MOMENT1, MOMENT2
+      - SLOAD
+      - LOAD
+
+    Parameters
+    ----------
+    model : BDF()
+        a cross-referenced BDF object
+    subcase_ids : List[int]; default=None -> all subcases
+        the subcases to assemble
+    fdtype : str; default='float64'
+        the type of the load matrix
+
+    Returns
+    -------
+    Fg : (ndof, nsubcases) scipy.sparse.csc_matrix
+        the load vector for each subcase
+    dofs : (ndof, 2) int ndarray
+        the [node_id, component] for each row; the GRIDs are first and
+        sorted, followed by the sorted SPOINTs with a component of 0
+    subcase_ids : List[int]
+        the subcase for each column
+
+    .. seealso:: get_static_force_vector_from_subcase_id
+
+    """
+    from scipy.sparse import coo_matrix
+    if subcase_ids is None:
+        subcase_ids = [subcase_id for subcase_id in sorted(model.subcases)
+                       if subcase_id > 0]
+    dofs = _get_dof_array(model)
+    ndof = dofs.shape[0]
+
+    # the scale factor for each (load card, subcase)
+    index = {}
+    cards = []
+    card_ids = []
+    case_ids = []
+    scales = []
+    for icase, subcase_id in enumerate(subcase_ids):
+        subcase = model.subcases[subcase_id]
+        if 'LOAD' not in subcase:
+            continue
+        load_id = subcase['LOAD'][0]
+        loads, scale_factors, unused_is_grav = model.get_reduced_loads(
+            load_id, skip_scale_factor0=True)
+        for load, scale in zip(loads, scale_factors):
+            key = id(load)
+            if key not in index:
+                index[key] = len(cards)
+                cards.append(load)
+            card_ids.append(index[key])
+            case_ids.append(icase)
+            scales.append(scale)
+
+    ncards = len(cards)
+    irows, icards, values = _get_load_card_dofs(model, cards, dofs, fdtype)
+    card_loads = coo_matrix((values, (irows, icards)), shape=(ndof, ncards)).tocsc()
+    card_scales = coo_matrix((np.array(scales, dtype=fdtype), (card_ids, case_ids)),
+                             shape=(ncards, len(subcase_ids))).tocsc()
+    Fg = (card_loads @ card_scales).tocsc()
+    return Fg, dofs, subcase_ids
+
+def _get_dof_array(model: BDF) -> np.ndarray:
+    """
+    helper method for ``get_static_force_matrix``
+
+    Returns
+    -------
+    dofs : (ndof, 2) int ndarray
+        the [node_id, component] for each row
+
+    """
+    grids = np.array([nid for nid, node_ref in model.nodes.items()
+                      if node_ref.type == 'GRID'], dtype='int32')
+    grids.sort()
+    spoints = np.array(sorted(model.spoints), dtype='int32')
+    ngrid = len(grids)
+    nspoint = len(spoints)
+
+    dofs = np.zeros((ngrid * 6 + nspoint, 2), dtype='int32')
+    dofs[:ngrid*6, 0] = np.repeat(grids, 6)
+    dofs[:ngrid*6, 1] = np.tile(np.arange(1, 7, dtype='int32'), ngrid)
+    dofs[ngrid*6:, 0] = spoints
+    if len(dofs) == 0:
+        raise RuntimeError('the model has no GRIDs or SPOINTs, so there are no degrees of freedom')
+    return dofs
+
+def _get_dof_index(dofs: np.ndarray, nids: np.ndarray, components: np.ndarray) -> np.ndarray:
+    """finds the rows of the (nid, component) pairs using a sorted search"""
+    keys = dofs[:, 0].astype('int64') * 10 + dofs[:, 1]
+    isort = np.argsort(keys)
+    keys_sorted = keys[isort]
+    keys_find = nids.astype('int64') * 10 + components
+    i = np.searchsorted(keys_sorted, keys_find)
+    i[i == len(keys_sorted)] = 0
+    is_missing = keys_sorted[i] != keys_find
+    if np.any(is_missing):
+        raise KeyError('missing (nid, component)=%s' % np.column_stack([
+            nids[is_missing], components[is_missing]]).tolist())
+    return isort[i]
+
+def _get_load_card_dofs(model: BDF, loads, dofs: np.ndarray,
+                        fdtype: str='float64') -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the (irow, icard, value) sparse entries of the unit scale load cards
+
+    helper method for ``get_static_force_matrix``; see ``_Fg_vector_from_loads``
+    """
+    loads_by_type = defaultdict(list)
+    for i, load in enumerate(loads):
+        loads_by_type[load.type].append(i)
+
+    irows = [np.zeros(0, dtype='int32')]
+    icards = [np.zeros(0, dtype='int32')]
+    values = [np.zeros(0, dtype=fdtype)]
+    skipped_load_types = set()
+    for load_type, iloads in loads_by_type.items():
+        loads_type = [loads[i] for i in iloads]
+        iloads = np.array(iloads, dtype='int32')
+        if load_type in ['FORCE', 'MOMENT', 'FORCE1', 'MOMENT1', 'FORCE2', 'MOMENT2']:
+            offset = 1 if load_type[0] == 'F' else 4
+            nids = np.array([load.node for load in loads_type], dtype='int32')
+            nodes_ref = [load.node_ref for load in loads_type]
+            for node_ref in nodes_ref:
+                assert node_ref.type == 'GRID', f'GRID must have 6 DOF for structural analysis\n{node_ref}'
+
+            if load_type in ['FORCE', 'MOMENT']:
+                cids = np.array([load.Cid() for load in loads_type], dtype='int32')
+            else:
+                cids = np.zeros(len(iloads), dtype='int32')
+            cds = np.array([node_ref.Cd() for node_ref in nodes_ref], dtype='int32')
+            fglobal = _get_force_in_cd_frame(model, loads_type, cids, cds)
+
+            irow = _get_dof_index(
+                dofs, np.repeat(nids, 3),
+                np.tile(np.arange(offset, offset + 3, dtype='int32'), len(nids)))
+            irows.append(irow)
+            icards.append(np.repeat(iloads, 3))
+            values.append(fglobal.ravel())
+
+        elif load_type == 'SLOAD':
+            nids = np.hstack([load.nodes for load in loads_type]).astype('int32')
+            mags = np.hstack([load.mags for load in loads_type])
+            nnodes = [len(load.nodes) for load in loads_type]
+            irows.append(_get_dof_index(dofs, nids, np.zeros(len(nids), dtype='int32')))
+            icards.append(np.repeat(iloads, nnodes))
+            values.append(mags)
+        else:
+            skipped_load_types.add(load_type)
+
+    if skipped_load_types:
+        skipped_load_types = list(skipped_load_types)
+        skipped_load_types.sort()
+        model.log.warning(f'skipping {skipped_load_types} in Fg')
+    irows = np.hstack(irows)
+    icards = np.hstack(icards)
+    values = np.hstack(values).astype(fdtype)
+    return irows, icards, values
+
+def _get_force_in_cd_frame(model: BDF, loads, cids: np.ndarray, cds: np.ndarray) -> np.ndarray:
+    """
+    Gets the FORCE/MOMENT vectors in the output (cd) frame of the node
+
+    helper method for ``_get_load_card_dofs``; see ``_add_force``
+    """
+    fglobal = np.array([load.mag * load.xyz for load in loads], dtype='float64')
+    is_transformed = cds != cids
+    if not np.any(is_transformed):
+        return fglobal
+
+    model.log.warning('differing cid & cd is not supported; cid=%s cd=%s' % (
+        np.unique(cids[is_transformed]).tolist(), np.unique(cds[is_transformed]).tolist()))
+
+    # local (cid) -> basic; FORCE1/FORCE2 are already in the basic frame
+    for cid in np.unique(cids[is_transformed]).tolist():
+        if cid == 0:
+            continue
+        icid = np.where(is_transformed & (cids == cid))[0]
+        coord = model.coords[cid]
+        fglobal[icid, :] = coord.transform_vector_to_global_array(fglobal[icid, :])
+
+    # basic -> output (cd)
+    for cd in np.unique(cds[is_transformed]).tolist():
+        if cd == 0:
+            continue
+        icd = np.where(is_transformed & (cds == cd))[0]
+        coord = model.coords[cd]
+        xyz_coord = fglobal[icd, :] @ coord.beta().T
+        fglobal[icd, :] = coord.xyz_to_coord_array(xyz_coord)
+    return fglobal
@@ -0,0 +1,692 @@
+# coding: utf-8
+# pylint: disable=C0103
+"""
+Defines:
+  - mass, cg, inertia, pid_breakdown, group_breakdown = mass_properties_array(
+        model, element_ids=None, mass_ids=None, nsm_id=None,
+        reference_point=None, sym_axis=None, scale=None,
+        inertia_reference='cg', groups=None)
+      get the mass & moment of inertia of the model using element type arrays
+
+Unlike ``mass_properties_nsm``, the element geometry and the NSM distribution
+are calculated on arrays.  Properties and materials are only evaluated once
+per unique id.
+
+"""
+from __future__ import annotations
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+
+from pyNastran.utils.mathematics import integrate_positive_unit_line
+from pyNastran.bdf.mesh_utils.mass_properties import (
+    NO_MASS, transform_inertia, _update_reference_point, _get_sym_axis)
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+TRI_TYPES = {'CTRIA3', 'CTRIA6', 'CTRIAR'}
+QUAD_TYPES = {'CQUAD4', 'CQUAD8', 'CQUADR', 'CQUAD'}
+SOLID_TYPES = {'CTETRA', 'CPENTA', 'CHEXA', 'CPYRAM'}
+SKIP_TYPES = {'CQUADX', 'CSUPER', 'CSUPEXT'}
+
+# the NSM/NSML type -> the NSM class of the element
+NSM_TYPE_MAP = {
+    'PSHELL' : 'PSHELL',
+    'PCOMP' : 'PSHELL',
+    'PCOMPG' : 'PSHELL',
+
+    'PBAR' : 'PBAR',
+    'PBARL' : 'PBAR',
+
+    'PBEAM' : 'PBEAM',
+    'PBEAML' : 'PBEAM',
+    'PBCOMP' : 'PBEAM',
+
+    'PROD' : 'PROD',
+    'PBEND' : 'PBEND',
+    'PSHEAR' : 'PSHEAR',
+    'PTUBE' : 'PTUBE',
+    'PCONEAX' : 'PCONEAX',
+    'PRAC2D' : 'PRAC2D',
+    'CONROD' : 'CONROD',
+    'ELEMENT' : 'ELEMENT',
+}
+
+
+def mass_properties_array(model: BDF,
+                          element_ids=None, mass_ids=None, nsm_id: Optional[int]=None,
+                          reference_point=None,
+                          sym_axis=None, scale=None, inertia_reference: str='cg',
+                          groups: Optional[Dict[Any, List[int]]]=None):
+    """
+    Calculates mass properties in the global system about the
+    reference point using element type arrays.  Considers NSM, NSM1,
+    NSML, NSML1, CONM2 offsets, and WTMASS.
+
+    Parameters
+    ----------
+    model : BDF()
+        a cross-referenced BDF object
+    element_ids : list[int]; (n, ) ndarray, optional
+        An array of element ids.
+    mass_ids : list[int]; (n, ) ndarray, optional
+        An array of mass ids.
+    nsm_id : int
+        the NSM id to consider
+    reference_point : ndarray/int, optional
+        type : ndarray
+            An array that defines the origin of the frame.
+            default = <0,0,0>.
+        type : int
+            the node id
+    sym_axis : str, optional
+        The axis to which the model is symmetric.
+        If AERO cards are used, this can be left blank.
+        allowed_values = 'no', x', 'y', 'z', 'xy', 'yz', 'xz', 'xyz'
+    scale : float, optional
+        The WTMASS scaling value.
+        default=None -> PARAM, WTMASS is used
+        float > 0.0
+    inertia_reference : str; default='cg'
+        'cg' : inertia is taken about the cg
+        'ref' : inertia is about the reference point
+    groups : Dict[name] = ids; default=None
+        name : varies
+            the name of the group
+        ids : List[int]
+            the element/mass ids in the group
+
+    Returns
+    -------
+    mass : float
+        The mass of the model; wtmass is considered
+    cg : (3,) float ndarray
+        The cg of the model
+    inertia : (6,) float ndarray
+        Moment of inertia array([Ixx, Iyy, Izz, Ixy, Ixz, Iyz]); wtmass is considered
+    pid_breakdown : Dict[pid] = (mass, cg, inertia)
+        the mass properties of each property;
+        mass elements and CONRODs use pid=0
+    group_breakdown : Dict[name] = (mass, cg, inertia)
+        the mass properties of each group
+
+    .. note::
+       Like ``mass_properties_nsm``, this doesn't use the mass matrix
+       formulation.  Each element is lumped at its centroid and NSM
+       is lumped at the NSM centroid (e.g., the PBEAM NSM offset).
+
+    .. seealso:: mass_properties_nsm
+
+    """
+    reference_point, is_cg = _update_reference_point(
+        model, reference_point, inertia_reference)
+
+    out = model.get_xyz_in_coord_array(cid=0, fdtype='float64', idtype='int32')
+    nid_cp_cd, xyz_cid0 = out[:2]
+    all_nids = nid_cp_cd[:, 0]
+
+    # element_id, property_id, is_mass_element,
+    # (structural mass, centroid), (nsm, nsm_centroid)
+    blocks = defaultdict(list)
+
+    # area/length for NSM distribution
+    nsm_blocks = defaultdict(list)
+
+    for etype, eids in sorted(model._type_to_id_map.items()):
+        if etype in NO_MASS or etype in SKIP_TYPES or len(eids) == 0:
+            continue
+        if etype in TRI_TYPES or etype in QUAD_TYPES:
+            _shell_mass(model, etype, eids, all_nids, xyz_cid0, blocks, nsm_blocks)
+        elif etype == 'CSHEAR':
+            _cshear_mass(model, eids, all_nids, xyz_cid0, blocks, nsm_blocks)
+        elif etype in ['CROD', 'CTUBE', 'CBAR', 'CONROD']:
+            _line_mass(model, etype, eids, all_nids, xyz_cid0, blocks, nsm_blocks)
+        elif etype == 'CBEAM':
+            _cbeam_mass(model, eids, all_nids, xyz_cid0, blocks, nsm_blocks)
+        elif etype in SOLID_TYPES:
+            _solid_mass(model, etype, eids, all_nids, xyz_cid0, blocks)
+        elif etype == 'CONM2':
+            _conm2_mass(model, eids, all_nids, xyz_cid0, blocks)
+        elif etype in ['CONM1', 'CMASS1', 'CMASS2', 'CMASS3', 'CMASS4']:
+            _catch_all_mass(model, etype, eids, model.masses, blocks, is_mass=True)
+        elif etype.startswith('C'):
+            eids = [eid for eid in eids if eid in model.elements]
+            if len(eids):
+                _catch_all_mass(model, etype, eids, model.elements, blocks, is_mass=False)
+
+    if len(blocks['eid']) == 0:
+        pid_breakdown = {}
+        group_breakdown = {} if groups is None else {
+            name: (0., np.zeros(3), np.zeros(6)) for name in groups}
+        return 0., np.zeros(3), np.zeros(6), pid_breakdown, group_breakdown
+
+    eids = np.hstack(blocks['eid'])
+    pids = np.hstack(blocks['pid'])
+    is_mass = np.hstack(blocks['is_mass'])
+    mass = np.hstack(blocks['mass'])
+    centroid = np.vstack(blocks['centroid'])
+    nsm = np.hstack(blocks['nsm'])
+    nsm_centroid = np.vstack(blocks['nsm_centroid'])
+
+    isort = np.argsort(eids, kind='stable')
+    eids = eids[isort]
+    pids = pids[isort]
+    is_mass = is_mass[isort]
+    mass = mass[isort]
+    centroid = centroid[isort, :]
+    nsm = nsm[isort]
+    nsm_centroid = nsm_centroid[isort, :]
+
+    if nsm_id:
+        nsm = nsm + _get_nsm_array(model, nsm_id, eids, nsm_blocks)
+
+    # filter the elements/masses
+    is_active = _get_active_rows(eids, is_mass, element_ids, mass_ids)
+    eids = eids[is_active]
+    pids = pids[is_active]
+    mass = mass[is_active]
+    centroid = centroid[is_active, :]
+    nsm = nsm[is_active]
+    nsm_centroid = nsm_centroid[is_active, :]
+
+    # (nelements, 10): [mass, mass*x, mass*y, mass*z, Ixx, Iyy, Izz, Ixy, Ixz, Iyz]
+    moments = _point_moments(mass, centroid, reference_point)
+    moments += _point_moments(nsm, nsm_centroid, reference_point)
+
+    sym_axes = _get_sym_axis(model, sym_axis)
+    if sym_axes:
+        model.log.debug('Mass/MOI sym_axis = %r' % sym_axes)
+    if scale is None:
+        scale = model.wtmass
+        if scale != 1.0:
+            model.log.info('WTMASS scale = %r' % scale)
+
+    total = moments.sum(axis=0)[np.newaxis, :]
+    massi, cgi, inertiai = _moments_to_mass_properties(
+        total, reference_point, is_cg, sym_axes, scale)
+
+    upids, ipids = np.unique(pids, return_inverse=True)
+    pid_moments = np.zeros((len(upids), moments.shape[1]), dtype='float64')
+    np.add.at(pid_moments, ipids, moments)
+    pid_mass, pid_cg, pid_inertia = _moments_to_mass_properties(
+        pid_moments, reference_point, is_cg, sym_axes, scale)
+    pid_breakdown = {
+        pid: (pid_massi, pid_cgi, pid_inertiai)
+        for pid, pid_massi, pid_cgi, pid_inertiai in zip(
+            upids.tolist(), pid_mass, pid_cg, pid_inertia)}
+
+    group_breakdown = {}
+    if groups is not None:
+        for name, ids in groups.items():
+            is_group = np.isin(eids, np.asarray(ids, dtype=eids.dtype))
+            group_moments = moments[is_group, :].sum(axis=0)[np.newaxis, :]
+            group_mass, group_cg, group_inertia = _moments_to_mass_properties(
+                group_moments, reference_point, is_cg, sym_axes, scale)
+            group_breakdown[name] = (group_mass[0], group_cg[0], group_inertia[0])
+    return massi[0], cgi[0], inertiai[0], pid_breakdown, group_breakdown
+
+
+def _get_active_rows(eids: np.ndarray, is_mass: np.ndarray,
+                     element_ids, mass_ids) -> np.ndarray:
+    """filters the elements/masses (see ``_mass_properties_elements_init``)"""
+    if isinstance(element_ids, int):
+        element_ids = [element_ids]
+    if isinstance(mass_ids, int):
+        mass_ids = [mass_ids]
+    if element_ids is None and mass_ids is None:
+        return np.ones(len(eids), dtype='bool')
+
+    is_active = np.zeros(len(eids), dtype='bool')
+    if element_ids is not None:
+        is_active |= ~is_mass & np.isin(eids, np.asarray(element_ids, dtype=eids.dtype))
+    if mass_ids is not None:
+        is_active |= is_mass & np.isin(eids, np.asarray(mass_ids, dtype=eids.dtype))
+    return is_active
+
+
+def _point_moments(mass: np.ndarray, centroid: np.ndarray,
+                   reference_point: np.ndarray) -> np.ndarray:
+    """
+    Gets the mass moments of a series of point masses
+
+    Returns
+    -------
+    moments : (n, 10) float ndarray
+        [mass, mass*x, mass*y, mass*z, Ixx, Iyy, Izz, Ixy, Ixz, Iyz]
+        where the inertias are about the reference point
+
+    """
+    x, y, z = (centroid - reference_point).T
+    x2 = x * x
+    y2 = y * y
+    z2 = z * z
+    moments = np.column_stack([
+        mass,
+        mass * centroid[:, 0],
+        mass * centroid[:, 1],
+        mass * centroid[:, 2],
+        mass * (y2 + z2),  # Ixx
+        mass * (x2 + z2),  # Iyy
+        mass * (x2 + y2),  # Izz
+        mass * x * y,      # Ixy
+        mass * x * z,      # Ixz
+        mass * y * z,      # Iyz
+    ])
+    return moments
+
+
+def _moments_to_mass_properties(moments: np.ndarray, reference_point: np.ndarray,
+                                is_cg: bool, sym_axes: List[str], scale: float,
+                                ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Converts summed mass moments into mass, cg, and inertia
+    and applies symmetry and WTMASS
+
+    Parameters
+    ----------
+    moments : (n, 10) float ndarray
+        see ``_point_moments``
+
+    Returns
+    -------
+    mass : (n, ) float ndarray
+    cg : (n, 3) float ndarray
+    inertia : (n, 6) float ndarray
+
+    """
+    mass = moments[:, 0].copy()
+    cg = np.zeros((len(mass), 3), dtype='float64')
+    inertia = moments[:, 4:].copy()
+    is_mass = mass != 0.
+    cg[is_mass, :] = moments[is_mass, 1:4] / mass[is_mass, np.newaxis]
+
+    # only transform if we're calculating the inertia about the cg
+    if is_cg:
+        inertia = transform_inertia(mass, cg.T, reference_point, cg.T, inertia.T).T
+
+    for sym_axisi in sym_axes:
+        # (cg index, inertias that are 0, inertia indices that are doubled)
+        if sym_axisi == 'xz':
+            # y inertias are 0
+            icg, izero = 1, [3, 5]
+        elif sym_axisi == 'xy':
+            # z inertias are 0
+            icg, izero = 2, [4, 5]
+        elif sym_axisi == 'yz':
+            # x inertias are 0
+            icg, izero = 0, [3, 4]
+        else:
+            continue
+        cg[:, icg] = 0.0
+        mass *= 2.0
+        inertia *= 2.0
+        inertia[:, izero] = 0.0
+    mass *= scale
+    inertia *= scale
+    return mass, cg, inertia
+
+
+def _append_block(blocks, eids, pids, mass, centroid,
+                  nsm=None, nsm_centroid=None, is_mass: bool=False) -> None:
+    """stores the mass data for an element type"""
+    neids = len(eids)
+    blocks['eid'].append(np.asarray(eids))
+    blocks['pid'].append(np.asarray(pids))
+    blocks['is_mass'].append(np.full(neids, is_mass, dtype='bool'))
+    blocks['mass'].append(np.asarray(mass, dtype='float64'))
+    blocks['centroid'].append(np.asarray(centroid, dtype='float64').reshape(neids, 3))
+    if nsm is None:
+        nsm = np.zeros(neids, dtype='float64')
+        nsm_centroid = centroid
+    blocks['nsm'].append(np.asarray(nsm, dtype='float64'))
+    blocks['nsm_centroid'].append(np.asarray(nsm_centroid, dtype='float64').reshape(neids, 3))
+
+def _append_nsm_block(nsm_blocks, nsm_class: str, is_area: bool,
+                      eids, pids, area_length, nsm_centroid) -> None:
+    """stores the area/length data used for NSM distribution"""
+    neids = len(eids)
+    nsm_blocks['eid'].append(np.asarray(eids))
+    nsm_blocks['pid'].append(np.asarray(pids))
+    nsm_blocks['class'].append(np.full(neids, nsm_class, dtype='|U8'))
+    nsm_blocks['is_area'].append(np.full(neids, is_area, dtype='bool'))
+    nsm_blocks['area_length'].append(area_length)
+    nsm_blocks['nsm_centroid'].append(nsm_centroid)
+
+
+def _property_values(pids: np.ndarray, func, dtype='float64') -> np.ndarray:
+    """
+    Evaluates a property function once per unique property id
+    and maps the result back to the elements
+    """
+    upids, ipids = np.unique(pids, return_inverse=True)
+    values = np.array([func(pid) for pid in upids.tolist()], dtype=dtype)
+    return values[ipids]
+
+
+def _get_xyz(all_nids: np.ndarray, xyz_cid0: np.ndarray, nids: np.ndarray) -> np.ndarray:
+    """gets the (nelements, nnodes, 3) locations of the element nodes"""
+    inids = np.searchsorted(all_nids, nids)
+    return xyz_cid0[inids, :]
+
+
+def _shell_mass(model: BDF, etype: str, eids: List[int],
+                all_nids, xyz_cid0, blocks, nsm_blocks) -> None:
+    """CTRIA3, CTRIA6, CTRIAR, CQUAD4, CQUAD8, CQUADR, CQUAD"""
+    nnodes = 3 if etype in TRI_TYPES else 4
+    elems = [model.elements[eid] for eid in eids]
+    eids = np.array(eids, dtype=all_nids.dtype)
+    pids = np.array([elem.pid for elem in elems], dtype=all_nids.dtype)
+    nids = np.array([elem.nodes[:nnodes] for elem in elems], dtype=all_nids.dtype)
+    tflag = np.array([getattr(elem, 'tflag', 0) for elem in elems], dtype='int32')
+    thicknesses = np.array([
+        [getattr(elem, 'T%i' % i, None) for i in range(1, nnodes+1)]
+        for elem in elems], dtype='float64')  # None -> nan
+
+    xyz = _get_xyz(all_nids, xyz_cid0, nids)
+    centroid = xyz.mean(axis=1)
+    if nnodes == 3:
+        area = 0.5 * np.linalg.norm(np.cross(xyz[:, 0, :] - xyz[:, 1, :],
+                                             xyz[:, 0, :] - xyz[:, 2, :]), axis=1)
+    else:
+        area = 0.5 * np.linalg.norm(np.cross(xyz[:, 2, :] - xyz[:, 0, :],
+                                             xyz[:, 3, :] - xyz[:, 1, :]), axis=1)
+
+    def _shell_props(pid: int) -> Tuple[float, float, float, bool]:
+        """(mass/area without thickness, rho, thickness, has_mass)"""
+        prop = model.properties[pid]
+        if prop.type == 'PSHELL':
+            return prop.nsm, prop.Rho(), prop.Thickness(), True
+        elif prop.type in ['PCOMP', 'PCOMPG']:
+            # PCOMPs don't support differential thickness
+            return prop.get_mass_per_area(), 0., 0., True
+        elif prop.type in ['PLPLANE', 'PPLANE']:
+            return 0., 0., 0., False
+        raise NotImplementedError(prop.type)
+
+    props = _property_values(pids, _shell_props)
+    mpa0 = props[:, 0]
+    rho = props[:, 1]
+    tprop = props[:, 2]
+    has_mass = props[:, 3].astype('bool')
+
+    # tflag=0: absolute; tflag=1: relative
+    tflag2d = tflag[:, np.newaxis]
+    tprop2d = tprop[:, np.newaxis]
+    thickness = np.where(np.isnan(thicknesses), tprop2d,
+                         np.where(tflag2d == 1, thicknesses * tprop2d, thicknesses))
+    if np.any(tflag > 1):
+        raise RuntimeError('tflag=%s' % np.unique(tflag).tolist())
+    mass_per_area = mpa0 + rho * thickness.mean(axis=1)
+
+    mass = area * mass_per_area
+    _append_block(blocks, eids[has_mass], pids[has_mass],
+                  mass[has_mass], centroid[has_mass])
+    if etype != 'CQUAD':
+        _append_nsm_block(nsm_blocks, 'PSHELL', True,
+                          eids[has_mass], pids[has_mass], area[has_mass], centroid[has_mass])
+
+def _cshear_mass(model: BDF, eids: List[int],
+                 all_nids, xyz_cid0, blocks, nsm_blocks) -> None:
+    """CSHEAR"""
+    elems = [model.elements[eid] for eid in eids]
+    eids = np.array(eids, dtype=all_nids.dtype)
+    pids = np.array([elem.pid for elem in elems], dtype=all_nids.dtype)
+    nids = np.array([elem.nodes for elem in elems], dtype=all_nids.dtype)
+    xyz = _get_xyz(all_nids, xyz_cid0, nids)
+    centroid = xyz.mean(axis=1)
+    area = 0.5 * np.linalg.norm(np.cross(xyz[:, 2, :] - xyz[:, 0, :],
+                                         xyz[:, 3, :] - xyz[:, 1, :]), axis=1)
+    mass_per_area = _property_values(pids, lambda pid: model.properties[pid].MassPerArea())
+    _append_block(blocks, eids, pids, area * mass_per_area, centroid)
+    _append_nsm_block(nsm_blocks, 'PSHEAR', True, eids, pids, area, centroid)
+
+def _line_mass(model: BDF, etype: str, eids: List[int],
+               all_nids, xyz_cid0, blocks, nsm_blocks) -> None:
+    """CROD, CTUBE, CBAR, CONROD"""
+    elems = [model.elements[eid] for eid in eids]
+    eids = np.array(eids, dtype=all_nids.dtype)
+    nids = np.array([elem.nodes[:2] for elem in elems], dtype=all_nids.dtype)
+    xyz = _get_xyz(all_nids, xyz_cid0, nids)
+    centroid = xyz.mean(axis=1)
+    length = np.linalg.norm(xyz[:, 1, :] - xyz[:, 0, :], axis=1)
+    if etype == 'CONROD':
+        pids = np.zeros(len(eids), dtype=all_nids.dtype)
+        mids = np.array([elem.mid for elem in elems], dtype=all_nids.dtype)
+        area = np.array([elem.A for elem in elems], dtype='float64')
+        nsm = np.array([elem.nsm for elem in elems], dtype='float64')
+        rho = _property_values(mids, lambda mid: model.materials[mid].rho)
+        mass_per_length = rho * area + nsm
+        nsm_class = 'CONROD'
+    else:
+        pids = np.array([elem.pid for elem in elems], dtype=all_nids.dtype)
+        mass_per_length = _property_values(
+            pids, lambda pid: model.properties[pid].MassPerLength())
+        nsm_class = {'CROD': 'PROD', 'CTUBE': 'PTUBE', 'CBAR': 'PBAR'}[etype]
+    _append_block(blocks, eids, pids, mass_per_length * length, centroid)
+    _append_nsm_block(nsm_blocks, nsm_class, False, eids, pids, length, centroid)
+
+def _cbeam_mass(model: BDF, eids: List[int],
+                all_nids, xyz_cid0, blocks, nsm_blocks) -> None:
+    """
+    CBEAM
+
+    The structural mass is lumped at the node centroid, while the NSM is
+    lumped at the offset NSM centroid (see ``_get_cbeam_mass``).
+    """
+    elems = [model.elements[eid] for eid in eids]
+    eids = np.array(eids, dtype=all_nids.dtype)
+    pids = np.array([elem.pid for elem in elems], dtype=all_nids.dtype)
+    nids = np.array([elem.nodes[:2] for elem in elems], dtype=all_nids.dtype)
+    xyz = _get_xyz(all_nids, xyz_cid0, nids)
+    centroid = xyz.mean(axis=1)
+    length = np.linalg.norm(xyz[:, 1, :] - xyz[:, 0, :], axis=1)
+
+    def _beam_props(pid: int) -> Tuple[float, float, float, float, float, float, bool]:
+        """(mass/length, nsm/length, m1a, m2a, m1b, m2b, has_mass)"""
+        prop = model.properties[pid]
+        if prop.type == 'PBEAM':
+            rho = prop.Rho()
+            mass_per_lengths = [area * rho for area in prop.A]
+            mass_per_length = integrate_positive_unit_line(prop.xxb, mass_per_lengths)
+            nsm_per_length = integrate_positive_unit_line(prop.xxb, prop.nsm)
+            return (mass_per_length, nsm_per_length,
+                    prop.m1a, prop.m2a, prop.m1b, prop.m2b, True)
+        elif prop.type == 'PBEAML':
+            # mass_per_length already includes nsm
+            mass_per_length = integrate_positive_unit_line(
+                prop.xxb, prop.get_mass_per_lengths())
+            return mass_per_length, 0., 0., 0., 0., 0., True
+        elif prop.type == 'PBCOMP':
+            return (prop.MassPerLength(), prop.nsm,
+                    prop.m1, prop.m2, prop.m1, prop.m2, True)
+        elif prop.type == 'PBMSECT':
+            return 0., 0., 0., 0., 0., 0., False
+        raise NotImplementedError(prop.type)
+
+    props = _property_values(pids, _beam_props)
+    mass_per_length = props[:, 0]
+    nsm_per_length = props[:, 1]
+    nsm_offsets = props[:, 2:6]
+    has_mass = props[:, 6].astype('bool')
+
+    # only the offset beams need the element axes
+    wa = np.array([elem.wa for elem in elems], dtype='float64')
+    wb = np.array([elem.wb for elem in elems], dtype='float64')
+    nsm_centroid = centroid.copy()
+    is_offset = has_mass & (np.abs(wa).max(axis=1) + np.abs(wb).max(axis=1) +
+                            np.abs(nsm_offsets).max(axis=1) > 0.)
+    for i in np.where(is_offset)[0]:
+        is_failed, out = elems[i].get_axes(model)
+        if is_failed:
+            model.log.error(str(out))
+            raise RuntimeError(out)
+        wai, wbi, unused_ihat, jhat, khat = out
+        m1a, m2a, m1b, m2b = nsm_offsets[i, :]
+        nsm_n1 = xyz[i, 0, :] + wai + jhat * m1a + khat * m2a
+        nsm_n2 = xyz[i, 1, :] + wbi + jhat * m1b + khat * m2b
+        nsm_centroid[i, :] = (nsm_n1 + nsm_n2) / 2.
+
+    eids = eids[has_mass]
+    pids = pids[has_mass]
+    length = length[has_mass]
+    centroid = centroid[has_mass]
+    nsm_centroid = nsm_centroid[has_mass]
+    _append_block(blocks, eids, pids,
+                  mass_per_length[has_mass] * length, centroid,
+                  nsm=nsm_per_length[has_mass] * length, nsm_centroid=nsm_centroid)
+    _append_nsm_block(nsm_blocks, 'PBEAM', False, eids, pids, length, nsm_centroid)
+
+def _solid_mass(model: BDF, etype: str, eids: List[int],
+                all_nids, xyz_cid0, blocks) -> None:
+    """CTETRA, CPENTA, CHEXA, CPYRAM"""
+    ncorners = {'CTETRA': 4, 'CPYRAM': 5, 'CPENTA': 6, 'CHEXA': 8}[etype]
+    elems = [model.elements[eid] for eid in eids]
+    eids = np.array(eids, dtype=all_nids.dtype)
+    pids = np.array([elem.pid for elem in elems], dtype=all_nids.dtype)
+    nids = np.array([elem.nodes[:ncorners] for elem in elems], dtype=all_nids.dtype)
+    xyz = _get_xyz(all_nids, xyz_cid0, nids)
+    p = [xyz[:, i, :] for i in range(ncorners)]
+    if etype == 'CTETRA':
+        centroid = xyz.mean(axis=1)
+        volume = -np.einsum('ij,ij->i', p[0] - p[3],
+                            np.cross(p[1] - p[3], p[2] - p[3])) / 6.
+    elif etype == 'CPYRAM':
+        centroid1 = xyz[:, :4, :].mean(axis=1)
+        area1 = 0.5 * np.linalg.norm(np.cross(p[2] - p[0], p[3] - p[1]), axis=1)
+        centroid5 = p[4]
+        centroid = (centroid1 + centroid5) / 2.
+        volume = area1 / 3. * np.linalg.norm(centroid1 - centroid5, axis=1)
+    elif etype == 'CPENTA':
+        area1 = 0.5 * np.linalg.norm(np.cross(p[2] - p[0], p[1] - p[0]), axis=1)
+        area2 = 0.5 * np.linalg.norm(np.cross(p[5] - p[3], p[4] - p[3]), axis=1)
+        centroid1 = xyz[:, :3, :].mean(axis=1)
+        centroid2 = xyz[:, 3:, :].mean(axis=1)
+        centroid = (centroid1 + centroid2) / 2.
+        volume = (area1 + area2) / 2. * np.linalg.norm(centroid1 - centroid2, axis=1)
+    else:
+        centroid1 = xyz[:, :4, :].mean(axis=1)
+        area1 = 0.5 * np.linalg.norm(np.cross(p[2] - p[0], p[3] - p[1]), axis=1)
+        centroid2 = xyz[:, 4:, :].mean(axis=1)
+        area2 = 0.5 * np.linalg.norm(np.cross(p[6] - p[4], p[7] - p[5]), axis=1)
+        centroid = (centroid1 + centroid2) / 2.
+        volume = (area1 + area2) / 2. * np.linalg.norm(centroid1 - centroid2, axis=1)
+    rho = _property_values(pids, lambda pid: model.properties[pid].Rho())
+    _append_block(blocks, eids, pids, rho * volume, centroid)
+
+def _conm2_mass(model: BDF, eids: List[int], all_nids, xyz_cid0, blocks) -> None:
+    """CONM2 with offsets (see ``CONM2.Centroid``)"""
+    elems = [model.masses[eid] for eid in eids]
+    eids = np.array(eids, dtype=all_nids.dtype)
+    nids = np.array([elem.nid for elem in elems], dtype=all_nids.dtype)
+    cids = np.array([elem.cid for elem in elems], dtype='int32')
+    mass = np.array([elem.mass for elem in elems], dtype='float64')
+    offset = np.array([elem.X for elem in elems], dtype='float64')
+
+    inids = np.searchsorted(all_nids, nids)
+    centroid = xyz_cid0[inids, :] + offset
+
+    # X is the location in the basic frame
+    is_basic = cids == -1
+    centroid[is_basic, :] = offset[is_basic, :]
+
+    # X is an offset in the local frame
+    for cid in np.unique(cids[cids > 0]).tolist():
+        icid = np.where(cids == cid)[0]
+        coord = model.coords[cid]
+        dx = coord.transform_vector_to_global_array(offset[icid, :])
+        centroid[icid, :] = xyz_cid0[inids[icid], :] + dx
+    pids = np.zeros(len(eids), dtype=all_nids.dtype)
+    _append_block(blocks, eids, pids, mass, centroid, is_mass=True)
+
+def _catch_all_mass(model: BDF, etype: str, eids: List[int], elements: Dict[int, Any],
+                    blocks, is_mass: bool) -> None:
+    """uses the element's Mass/Centroid methods (e.g., CONM1, CMASSx, CBEND, CTRIAX)"""
+    masses = []
+    centroids = []
+    pids = []
+    for eid in eids:
+        elem = elements[eid]
+        try:
+            mass = elem.Mass()
+        except Exception:
+            model.log.error('etype = %r' % etype)
+            model.log.error(elem)
+            raise
+        masses.append(mass)
+        centroids.append(elem.Centroid() if mass != 0. else np.zeros(3))
+        pids.append(0 if is_mass else getattr(elem, 'pid', 0))
+    if is_mass is False and not any(masses):
+        return
+    _append_block(blocks, np.array(eids), np.array(pids), masses, centroids,
+                  is_mass=is_mass)
+
+
+def _get_nsm_array(model: BDF, nsm_id: int, eids: np.ndarray, nsm_blocks) -> np.ndarray:
+    """
+    Distributes the NSM/NSM1/NSML/NSML1 cards to the elements
+
+    Parameters
+    ----------
+    eids : (nelements, ) int ndarray
+        the sorted element/mass ids
+    nsm_blocks : Dict[name] = List[ndarray]
+        the area/length data from ``_append_nsm_block``
+
+    Returns
+    -------
+    nsm_mass : (nelements, ) float ndarray
+        the non-structural mass from the NSM cards;
+        lumped at the NSM centroid
+
+    per MSC QRG 2018.0.1: Undefined property/element IDs are ignored.
+
+    """
+    nsm_mass = np.zeros(len(eids), dtype='float64')
+    nsms = model.get_reduced_nsms(nsm_id, consider_nsmadd=True, stop_on_failure=True)
+    if len(nsms) == 0:
+        model.log.warning('no nsm...')
+        return nsm_mass
+    if len(nsm_blocks['eid']) == 0:
+        model.log.debug('  skipping NSM=%s calc because there are no elements\n' % nsm_id)
+        return nsm_mass
+
+    nsm_eids = np.hstack(nsm_blocks['eid'])
+    nsm_pids = np.hstack(nsm_blocks['pid'])
+    nsm_class = np.hstack(nsm_blocks['class'])
+    is_area = np.hstack(nsm_blocks['is_area'])
+    area_length = np.hstack(nsm_blocks['area_length'])
+    ieids = np.searchsorted(eids, nsm_eids)
+
+    for nsm in nsms:
+        nsm_type = NSM_TYPE_MAP[nsm.nsm_type]
+        is_all = len(nsm.ids) == 1 and nsm.ids[0] == 'ALL'
+        if nsm_type in ['ELEMENT', 'CONROD']:
+            if is_all:
+                is_nsm = np.ones(len(nsm_eids), dtype='bool')
+            else:
+                is_nsm = np.isin(nsm_eids, np.array(nsm.ids, dtype=nsm_eids.dtype))
+            if nsm_type == 'CONROD':
+                is_nsm &= (nsm_class == 'CONROD')
+            if len(np.unique(is_area[is_nsm])) > 1:
+                msg = 'Mixed Line/Area element types for:\n%s' % str(nsm)
+                for eid in nsm_eids[is_nsm]:
+                    msg += str(model.elements[eid])
+                raise RuntimeError(msg)
+        else:
+            is_nsm = nsm_class == nsm_type
+            if not is_all:
+                assert 'ALL' not in nsm.ids, str(nsm)
+                is_nsm &= np.isin(nsm_pids, np.array(nsm.ids, dtype=nsm_pids.dtype))
+
+        if not np.any(is_nsm):
+            model.log.warning('  *skipping because there are no elements '
+                              'associated with:\n%s' % str(nsm))
+            continue
+
+        area_lengthi = area_length[is_nsm]
+        if nsm.type in ['NSML1', 'NSML']:
+            # a lumped mass that's distributed by area/length
+            area_lengthi = area_lengthi / area_lengthi.sum()
+        nsm_mass[ieids[is_nsm]] += nsm.value * area_lengthi
+    return nsm_mass
@@ -3,11 +3,14 @@ import unittest
 import os
 import numpy as np
 import pyNastran
-from pyNastran.bdf.bdf import BDF
+from pyNastran.bdf.bdf import BDF, read_bdf
+from pyNastran.bdf.mesh_utils.mass_properties import mass_properties_nsm
+from pyNastran.bdf.mesh_utils.mass_properties_array import mass_properties_array
 from pyNastran.utils import object_methods
 
 PKG_PATH = pyNastran.__path__[0]
 mesh_utils_path = os.path.join(PKG_PATH, 'bdf', 'mesh_utils', 'test')
+MODEL_PATH = os.path.join(PKG_PATH, '..', 'models')
 
 
 class TestMass(unittest.TestCase):
@@ -162,5 +165,40 @@ class TestMass(unittest.TestCase):
         assert np.allclose(mass, 0.005311658333), 'mass=%s' % mass
         assert np.allclose(mass2, 2.050833333), 'mass2=%s' % mass2
 
+    def test_mass_properties_array(self):
+        """compares the array-based mass properties to mass_properties_nsm"""
+        bdf_filename = os.path.join(MODEL_PATH, 'elements', 'static_elements.bdf')
+        model = read_bdf(bdf_filename, xref=False, debug=None)
+        model.add_conm2(100001, 1, 2.0, cid=-1, X=[1., 2., 3.])
+        model.add_conm2(100002, 2, 3.0, cid=0, X=[0.1, 0.2, 0.3])
+        model.add_conm2(100003, 3, 4.0, cid=1, X=[0.3, 0.2, 0.1])
+        model.cross_reference()
+        element_ids = list(model.elements)
+        for sym_axis in [None, 'xz']:
+            for inertia_reference in ['cg', 'ref']:
+                mass1, cg1, inertia1 = mass_properties_nsm(
+                    model, sym_axis=sym_axis, inertia_reference=inertia_reference)
+                mass2, cg2, inertia2, pid_breakdown, unused_groups = mass_properties_array(
+                    model, sym_axis=sym_axis, inertia_reference=inertia_reference)
+                self.assertAlmostEqual(mass1, mass2)
+                assert np.allclose(cg1, cg2), 'cg1=%s cg2=%s' % (cg1, cg2)
+                assert np.allclose(inertia1, inertia2), 'I1=%s I2=%s' % (inertia1, inertia2)
+
+                pid_mass = sum(mass for mass, unused_cg, unused_inertia in pid_breakdown.values())
+                self.assertAlmostEqual(pid_mass, mass2)
+
+        mass1, cg1, inertia1 = mass_properties_nsm(model, element_ids=element_ids, mass_ids=[])
+        groups = {
+            'elements': element_ids,
+            'masses': list(model.masses),
+        }
+        mass2, cg2, inertia2, pid_breakdown, groups = mass_properties_array(
+            model, element_ids=element_ids, mass_ids=[], groups=groups)
+        self.assertAlmostEqual(mass1, mass2)
+        assert np.allclose(cg1, cg2), 'cg1=%s cg2=%s' % (cg1, cg2)
+        assert np.allclose(inertia1, inertia2), 'I1=%s I2=%s' % (inertia1, inertia2)
+        self.assertAlmostEqual(groups['elements'][0], mass1)
+        self.assertEqual(groups['masses'][0], 0.0)
+
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -11,7 +11,9 @@ from cpylog import SimpleLogger
 import pyNastran
 from pyNastran.bdf.bdf import read_bdf
 from pyNastran.bdf.mesh_utils.collapse_bad_quads import convert_bad_quads_to_tris
-from pyNastran.bdf.mesh_utils.delete_bad_elements import delete_bad_shells, get_bad_shells
+from pyNastran.bdf.mesh_utils.delete_bad_elements import (
+    delete_bad_shells, get_bad_shells, tri_quality, quad_quality, get_min_max_theta)
+from pyNastran.bdf.mesh_utils.element_quality import element_quality_array, SOLID_FACES
 
 PKG_PATH = pyNastran.__path__[0]
 MODEL_PATH = os.path.abspath(os.path.join(PKG_PATH, '..', 'models'))
@@ -361,6 +363,73 @@ class TestMeshQuality(unittest.TestCase):
         assert model.card_count['CTRIA3'] == 1, model.card_count
         os.remove(bdf_filename)
 
+    def test_element_quality_array(self):
+        """compares the vectorized quality kernels to the scalar versions"""
+        log = SimpleLogger(level='error')
+        bdf_filename = os.path.join(MODEL_PATH, 'elements', 'static_elements.bdf')
+        model = read_bdf(bdf_filename, log=log)
+        nids = np.array(sorted(model.nodes), dtype='int32')
+        xyz_cid0 = np.array([model.nodes[nid].get_position() for nid in nids])
+        nid_map = {nid: i for i, nid in enumerate(nids)}
+
+        quality = element_quality_array(model, nids=nids, xyz_cid0=xyz_cid0)
+        eids = quality['element_id']
+        assert len(eids) > 0
+        assert np.array_equal(eids, np.unique(eids))
+
+        ncheck = 0
+        for i, eid in enumerate(eids):
+            elem = model.elements[eid]
+            inids = [nid_map[nid] for nid in elem.node_ids if nid is not None]
+            if elem.type in ['CTRIA3', 'CTRIAR']:
+                (area, max_skew, aspect_ratio, min_theta, max_theta,
+                 unused_dideal_theta, min_edge_length) = tri_quality(*xyz_cid0[inids, :])
+                assert np.allclose(quality['area'][i], area)
+                assert np.allclose(quality['max_skew_angle'][i], max_skew)
+                assert np.allclose(quality['max_aspect_ratio'][i], aspect_ratio)
+            elif elem.type in ['CQUAD4', 'CQUADR', 'CSHEAR']:
+                (area, taper_ratio, area_ratio, max_skew, aspect_ratio,
+                 min_theta, max_theta, unused_dideal_theta, min_edge_length,
+                 max_warp) = quad_quality(elem, *xyz_cid0[inids, :])
+                assert np.allclose(quality['area'][i], area)
+                assert np.allclose(quality['taper_ratio'][i], taper_ratio)
+                assert np.allclose(quality['area_ratio'][i], area_ratio)
+                assert np.allclose(quality['max_skew_angle'][i], max_skew)
+                assert np.allclose(quality['max_warp_angle'][i], max_warp)
+                assert np.allclose(quality['max_aspect_ratio'][i], aspect_ratio)
+            elif elem.type in SOLID_FACES:
+                faces = SOLID_FACES[elem.type]
+                min_theta, max_theta, unused_dideal_theta, unused_min_edge_length = get_min_max_theta(
+                    faces, elem.node_ids, nid_map, xyz_cid0)
+
+                # the faces must be bounded by the element edges
+                edges = set(elem.get_edge_ids())
+                face_edges = {tuple(sorted([elem.node_ids[face[j-1]], elem.node_ids[face[j]]]))
+                              for face in faces for j in range(len(face))}
+                assert face_edges == edges, (elem.type, face_edges, edges)
+                min_edge_length = min(
+                    np.linalg.norm(xyz_cid0[nid_map[nid1]] - xyz_cid0[nid_map[nid2]])
+                    for nid1, nid2 in edges)
+            else:
+                continue
+            assert np.allclose(quality['min_interior_angle'][i], min_theta)
+            assert np.allclose(quality['max_interior_angle'][i], max_theta)
+            assert np.allclose(quality['min_edge_length'][i], min_edge_length)
+            ncheck += 1
+        assert ncheck > 0
+
+        # chunked in parallel
+        quality2 = element_quality_array(model, nids=nids, xyz_cid0=xyz_cid0,
+                                         chunk_size=2, num_cpus=2)
+        for name, values in quality.items():
+            assert np.allclose(values, quality2[name], equal_nan=True), name
+
+        # a node isn't in nids
+        nid = model.elements[eids[0]].node_ids[0]
+        ikeep = nids != nid
+        with self.assertRaises(KeyError):
+            element_quality_array(model, nids=nids[ikeep], xyz_cid0=xyz_cid0[ikeep, :])
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
@@ -3,7 +3,9 @@ import os
 import unittest
 from cpylog import SimpleLogger
 from pyNastran.bdf.bdf import BDF, read_bdf
-from pyNastran.bdf.mesh_utils.bdf_renumber import bdf_renumber
+import numpy as np
+from pyNastran.bdf.mesh_utils.bdf_renumber import (
+    bdf_renumber, _get_renumbered_ids, _id_map_to_arrays, _map_ids)
 
 import pyNastran
 PKG_PATH = pyNastran.__path__[0]
@@ -123,6 +125,69 @@ class TestRenumber(unittest.TestCase):
         read_bdf(bdf_filename_out2, log=log)
         read_bdf(bdf_filename_out3, log=log)
 
+    def test_renumber_id_arrays(self):
+        """tests the id renumbering arrays"""
+        ids_old = np.array([10, 20, 30, 40, 50])
+        ids_new = _get_renumbered_ids(ids_old, 1)
+        assert np.array_equal(ids_new, [1, 2, 3, 4, 5]), ids_new
+
+        # skip over the SPOINTs/EPOINTs
+        ids_new = _get_renumbered_ids(ids_old, 1, banned_ids=np.array([2, 3, 5, 100, 0]))
+        assert np.array_equal(ids_new, [1, 4, 6, 7, 8]), ids_new
+
+        id_map = {30: 3, 10: 1, 20: 2}
+        ids_old, ids_new = _id_map_to_arrays(id_map)
+        ids, is_missing = _map_ids(ids_old, ids_new, [20, 15, 30])
+        assert np.array_equal(ids, [2, 15, 3]), ids
+        assert np.array_equal(is_missing, [False, True, False]), is_missing
+
+    def test_renumber_spoints(self):
+        """the GRIDs are renumbered around the SPOINTs"""
+        model = BDF(debug=False)
+        model.add_grid(10, [0., 0., 0.])
+        model.add_grid(20, [1., 0., 0.])
+        model.add_grid(30, [2., 0., 0.])
+        model.add_spoint([2, 4])
+        model.add_conrod(100, 1, [10, 20], A=1.0)
+        model.add_conrod(101, 1, [20, 30], A=1.0)
+        model.add_crod(102, 7, [10, 30])
+        model.add_prod(7, 1, A=1.0)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.cross_reference()
+        model, mapper = bdf_renumber(model, None)
+        assert mapper['nodes'] == {10: 1, 20: 3, 30: 5}, mapper['nodes']
+        assert mapper['elements'] == {100: 1, 101: 2, 102: 3}, mapper['elements']
+        assert sorted(model.nodes) == [10, 20, 30]
+        assert model.elements[100].node_ids == [1, 3], model.elements[100].node_ids
+
+        # the raw id fields are remapped too
+        assert model.elements[100].nodes == [1, 3], model.elements[100].nodes
+        assert model.elements[102].nodes == [1, 5], model.elements[102].nodes
+        assert model.elements[102].pid == 1, model.elements[102].pid
+
+    def test_renumber_read_only_nodes(self):
+        """CGAP/CBEAM3 have a read-only nodes property"""
+        model = BDF(debug=False)
+        model.add_grid(10, [0., 0., 0.])
+        model.add_grid(20, [1., 0., 0.])
+        model.add_grid(30, [2., 0., 0.])
+        model.add_cgap(200, 9, [10, 20], [0., 1., 0.], None)
+        model.add_pgap(9)
+        model.add_cbeam3(201, 8, [10, 30, 20], [0., 1., 0.], None,
+                         wa=None, wb=None, wc=None, tw=None, s=None)
+        model.add_pbeam3(8, 1, 1.0, 1.0, 1.0)
+        model.add_mat1(1, 3.0e7, None, 0.3)
+        model.cross_reference()
+        model, mapper = bdf_renumber(model, None)
+        assert mapper['nodes'] == {10: 1, 20: 2, 30: 3}, mapper['nodes']
+        assert mapper['elements'] == {200: 1, 201: 2}, mapper['elements']
+        cgap = model.elements[200]
+        cbeam3 = model.elements[201]
+        assert cgap.node_ids == [1, 2], cgap.node_ids
+        assert cbeam3.node_ids == [1, 3, 2], cbeam3.node_ids
+        assert cgap.Pid() == mapper['properties'][9], cgap.Pid()
+        assert cbeam3.Pid() == mapper['properties'][8], cbeam3.Pid()
+
     #def test_renumber_06(self):
         #dirname = os.path.join(UNIT_PATH, 'obscure')
         #bdf_filenames = get_files_of_type(dirname, extension='.bdf')
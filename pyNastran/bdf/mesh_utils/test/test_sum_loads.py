@@ -7,7 +7,9 @@ import numpy as np
 import pyNastran
 from pyNastran.bdf.bdf import BDF
 from pyNastran.bdf.bdf import GRID
-from pyNastran.bdf.mesh_utils.loads import sum_forces_moments, sum_forces_moments_elements
+from pyNastran.bdf.mesh_utils.loads import (
+    sum_forces_moments, sum_forces_moments_elements, sum_forces_moments_array,
+    get_static_force_matrix, get_static_force_vector_from_subcase_id, _get_dof_map)
 model_path = os.path.join(pyNastran.__path__[0], '..', 'models')
 
 
@@ -478,6 +480,93 @@ class TestLoadSum(unittest.TestCase):
         self.assertTrue(allclose(F2_expected, F1), 'loadcase_id=%s F_expected=%s F1=%s' % (loadcase_id, F2_expected, F1))
         self.assertTrue(allclose(M2_expected, M1), 'loadcase_id=%s M_expected=%s M1=%s' % (loadcase_id, M2_expected, M1))
 
+    def test_loads_sum_array(self):
+        """tests the multi-load case summation against sum_forces_moments"""
+        bdf_filenames = [
+            os.path.join(model_path, 'real', 'loads', 'loads.bdf'),
+            os.path.join(model_path, 'sol_101_elements', 'static_solid_shell_bar_pload1.bdf'),
+            os.path.join(model_path, 'unit', 'pload4', 'cpenta.bdf'),
+            os.path.join(model_path, 'elements', 'static_elements.bdf'),
+        ]
+        p0 = array([1., 2., 3.])
+        for bdf_filename in bdf_filenames:
+            model = BDF(log=log, debug=None)
+            model.read_bdf(bdf_filename)
+            loadcase_ids = sorted(set(model.loads) | set(model.load_combinations))
+            for include_grav in [False, True]:
+                forces_moments = sum_forces_moments_array(
+                    model, p0, loadcase_ids, include_grav=include_grav)
+                assert forces_moments.shape == (len(loadcase_ids), 6), forces_moments.shape
+                for loadcase_id, forces_momentsi in zip(loadcase_ids, forces_moments):
+                    F1, M1 = sum_forces_moments(model, p0, loadcase_id, include_grav=include_grav)
+                    assert np.allclose(F1, forces_momentsi[:3]), 'F1=%s F2=%s' % (F1, forces_momentsi[:3])
+                    assert np.allclose(M1, forces_momentsi[3:]), 'M1=%s M2=%s' % (M1, forces_momentsi[3:])
+
+                forces_moments2 = sum_forces_moments_array(
+                    model, p0, loadcase_ids[::-1], include_grav=include_grav)
+                assert np.allclose(forces_moments[::-1, :], forces_moments2)
+
+        # the card resultants aren't reused across calls, so a modified
+        # card is picked up
+        model = BDF(log=log, debug=None)
+        model.add_grid(1, [0., 0., 0.])
+        force = model.add_force(10, 1, 1.0, [1., 0., 0.])
+        forces_moments = sum_forces_moments_array(model, p0, [10])
+        assert np.allclose(forces_moments[0, :3], [1., 0., 0.]), forces_moments
+        force.mag = 2.0
+        forces_moments = sum_forces_moments_array(model, p0, [10])
+        assert np.allclose(forces_moments[0, :3], [2., 0., 0.]), forces_moments
+
+    def test_static_force_matrix(self):
+        """tests the sparse load vectors against the dense Fg vectors"""
+        bdf_filenames = [
+            os.path.join(model_path, 'real', 'loads', 'loads.bdf'),
+            os.path.join(model_path, 'sol_101_elements', 'static_solid_shell_bar_radial.bdf'),
+            os.path.join(model_path, 'plate', 'plate.bdf'),
+        ]
+        for bdf_filename in bdf_filenames:
+            model = BDF(log=log, debug=None)
+            model.read_bdf(bdf_filename)
+            Fg, dofs, subcase_ids = get_static_force_matrix(model)
+            assert Fg.shape == (len(dofs), len(subcase_ids)), Fg.shape
+
+            dof_map = _get_dof_map(model)[0]
+            irows = [dof_map[(nid, component)] for nid, component in dofs.tolist()]
+            Fg_dense = Fg.toarray()
+            for j, subcase_id in enumerate(subcase_ids):
+                Fg_expected = get_static_force_vector_from_subcase_id(model, subcase_id)
+                assert np.allclose(Fg_dense[:, j], Fg_expected[irows])
+
+    def test_static_force_matrix_sload(self):
+        """tests the sparse load vectors with LOAD combinations and SPOINTs"""
+        model = BDF(log=log, debug=False)
+        model.add_grid(1, [0., 0., 0.])
+        model.add_grid(2, [1., 0., 0.])
+        model.add_spoint([10, 11])
+        model.add_force(100, 2, 2.0, [0., 1., 0.])
+        model.add_moment(100, 1, 3.0, [0., 0., 1.])
+        model.add_sload(200, [10, 11], [4., 5.])
+        model.add_load(300, 2.0, [1.0, 3.0], [100, 200])
+        model.create_subcases([1, 2, 3])
+        model.subcases[1].add('LOAD', 100, [], 'STRESS-type')
+        model.subcases[2].add('LOAD', 300, [], 'STRESS-type')
+        model.cross_reference()
+
+        Fg, dofs, subcase_ids = get_static_force_matrix(model)
+        assert subcase_ids == [1, 2, 3], subcase_ids
+        assert dofs.shape == (14, 2), dofs.shape
+        assert np.array_equal(dofs[12:, :], [[10, 0], [11, 0]]), dofs
+
+        Fg_expected = np.zeros((14, 3))
+        Fg_expected[[7, 5], 0] = [2., 3.]
+        Fg_expected[[7, 5, 12, 13], 1] = [4., 6., 24., 30.]
+        assert np.allclose(Fg.toarray(), Fg_expected)
+
+        # there are no degrees of freedom
+        model = BDF(log=log, debug=None)
+        with self.assertRaises(RuntimeError):
+            get_static_force_matrix(model)
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
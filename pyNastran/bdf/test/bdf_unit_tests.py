@@ -1,5 +1,6 @@
 import os
 import unittest
+import tempfile
 from io import StringIO
 from numpy import allclose, array
 from cpylog import SimpleLogger
@@ -9,6 +10,8 @@ from pyNastran.utils import object_attributes, object_methods
 #from pyNastran.bdf.cards.collpase_card import collapse_thru_by
 from pyNastran.bdf.bdf import BDF, read_bdf, CrossReferenceError
 from pyNastran.bdf.write_path import write_include, _split_path
+from pyNastran.bdf.bdf_interface.snapshot import (
+    save_bdf_snapshot, load_bdf_snapshot, load_bdf_snapshot_arrays)
 from pyNastran.bdf.mesh_utils.mass_properties import mass_properties
 from pyNastran.bdf.test.test_bdf import run_bdf, compare, run_lots_of_files, main as test_bdf
 
@@ -168,6 +171,84 @@ class TestBDF(Tester):
         assert _etype_to_eids_pids_nids is None, _etype_to_eids_pids_nids
         assert len(etype_pid_to_eids_nids) == 1, list(etype_pid_to_eids_nids.keys())
 
+    def test_bdf_snapshot(self):
+        """round trips static_solid_shell_bar.bdf through a snapshot"""
+        log = SimpleLogger(level='warning')
+        bdf_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.bdf')
+        model = read_bdf(bdf_filename, log=log)
+        with tempfile.TemporaryDirectory() as dirname:
+            snapshot_filename = os.path.join(dirname, 'static_solid_shell_bar.snap')
+            save_bdf_snapshot(model, snapshot_filename)
+
+            model2 = load_bdf_snapshot(snapshot_filename, log=log)
+            assert model.card_count == model2.card_count, (model.card_count, model2.card_count)
+            bdf_file1 = StringIO()
+            bdf_file2 = StringIO()
+            model.write_bdf(bdf_file1, size=16, is_double=True, close=False)
+            model2.write_bdf(bdf_file2, size=16, is_double=True, close=False)
+            lines1 = bdf_file1.getvalue().splitlines()
+            lines2 = bdf_file2.getvalue().splitlines()
+            assert sorted(lines1) == sorted(lines2)
+            assert model2.spcadds[2][0].spc_ids == model.spcadds[2][0].spc_ids
+
+            arrays, unused_strings = load_bdf_snapshot_arrays(snapshot_filename)
+            grids = arrays['nodes/GRID']
+            assert sorted(grids['nid'].tolist()) == sorted(model.nodes)
+            xyz = array([model.nodes[nid].xyz for nid in grids['nid']])
+            assert allclose(grids['xyz'], xyz)
+
+            # the element ids/property ids are typed columns
+            cquad4s = arrays['elements/CQUAD4']
+            assert cquad4s['field1'].dtype == 'int64', cquad4s['field1'].dtype
+            eids = cquad4s['field1'].tolist()
+            assert sorted(eids) == sorted(model._type_to_id_map['CQUAD4'])
+            pids = [model.elements[eid].pid for eid in eids]
+            assert cquad4s['field2'].tolist() == pids
+            del arrays, grids, cquad4s
+
+    def test_bdf_snapshot_resave(self):
+        """the comments/card counts don't change when a snapshot is resaved"""
+        log = SimpleLogger(level='warning')
+        lines = [
+            '$ node comment',
+            '$$ double dollar',
+            'GRID,1,,0.,0.,0.',
+            'GRID,2,,1.,0.,0.',
+            'GRID,3,,1.,1.,0.',
+            'GRID,4,,0.,1.,0.',
+            '$ element comment',
+            'CQUAD4,10,1,1,2,3,4',
+            '$pshell',
+            'PSHELL,1,1,0.1',
+            'MAT1,1,3.0e7,,0.3',
+            '$ two viscs',
+            'PVISC,5,1.0,2.0,,6,3.0,4.0',
+            'CVISC,20,5,1,2',
+            'CVISC,21,6,3,4',
+        ]
+        model = BDF(log=log)
+        model.read_bdf(StringIO('\n'.join(lines)), punch=True)
+        bdf_file = StringIO()
+        model.write_bdf(bdf_file, close=False)
+        expected = bdf_file.getvalue()
+        card_count = dict(model.card_count)
+        node_comment = model.nodes[1].comment
+        elem_comment = model.elements[10].comment
+        assert model.card_count['PVISC'] == 1, model.card_count
+        assert 'element comment' in elem_comment, elem_comment
+
+        with tempfile.TemporaryDirectory() as dirname:
+            for i in range(2):
+                snapshot_filename = os.path.join(dirname, f'model_{i}.snap')
+                save_bdf_snapshot(model, snapshot_filename)
+                model = load_bdf_snapshot(snapshot_filename, log=log)
+                assert model.card_count == card_count, model.card_count
+                assert model.nodes[1].comment == node_comment, model.nodes[1].comment
+                assert model.elements[10].comment == elem_comment, model.elements[10].comment
+                bdf_file = StringIO()
+                model.write_bdf(bdf_file, close=False)
+                assert bdf_file.getvalue() == expected
+
     def test_bdf_02(self):
         """checks plate_py.dat"""
         log = SimpleLogger(level='warning', encoding='utf-8')
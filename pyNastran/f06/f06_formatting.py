@@ -1,4 +1,4 @@
-from typing import List
+from typing import List, Any
 import numpy as np
 from pyNastran.utils import object_attributes
 
@@ -97,6 +97,127 @@ def write_imag_floats_13e(vals: List[float], is_mag_phase: bool) -> List[str]:
     return vals2
 
 
+# the ASCII codes for '000' to '999'
+_DIGITS3 = np.array([[ord(char) for char in '%03i' % i] for i in range(1000)], dtype='<u4')
+
+
+def _is_near_tie(scaled: np.ndarray) -> np.ndarray:
+    """is the value close enough to x.5 that float error could change the rounding?"""
+    return np.abs(scaled - np.floor(scaled) - 0.5) < 1e-4
+
+
+def write_floats_13e_array(vals: np.ndarray) -> np.ndarray:
+    """
+    Vectorized version of ``write_floats_13e``
+
+    The digits are built directly in a character buffer.  Values that
+    are within rounding noise of a tie, have a 3 digit exponent or
+    aren't finite are formatted with '%13.6E' instead, so the result
+    always matches ``write_floats_13e``.
+
+    Parameters
+    ----------
+    vals : (...) float ndarray
+        the values to write
+
+    Returns
+    -------
+    vals2 : (...) str ndarray
+        the Nastran formatted 13.6 floats with the same shape as vals
+
+    """
+    vals = np.asarray(vals)
+    flat = vals.ravel().astype('float64')
+    nvals = len(flat)
+    if nvals == 0:
+        return np.zeros(vals.shape, dtype='<U13')
+
+    abs_vals = np.abs(flat)
+    is_zero = (flat == 0.)
+    # 3 digit exponents (including subnormals) are left to the formatter,
+    # so the scaling below can't overflow
+    is_valid = np.isfinite(flat) & (abs_vals >= 1e-99) & (abs_vals < 1e100)
+    abs_valid = np.where(is_valid, abs_vals, 1.)
+
+    # 7 significant digits: d.dddddd
+    exponent = np.floor(np.log10(abs_valid))
+    scaled = abs_valid / 10. ** exponent * 1e6
+    is_tie = _is_near_tie(scaled)
+    mantissa = np.rint(scaled)
+    is_high = mantissa >= 1e7
+    exponent[is_high] += 1.
+    scaled[is_high] /= 10.
+    is_low = mantissa < 1e6
+    exponent[is_low] -= 1.
+    scaled[is_low] *= 10.
+    mantissa = np.rint(scaled)
+
+    # round-half-even ties, 3 digit exponents & non-finite values are
+    # left to the formatter
+    is_tie |= _is_near_tie(scaled)
+    is_slow = ~is_zero & (~is_valid | ~np.isfinite(mantissa) | is_tie |
+                          (np.abs(exponent) >= 100) |
+                          (mantissa < 1e6) | (mantissa >= 1e7))
+
+    # the slow values are overwritten, so use a dummy value that's safe to cast
+    mantissa = np.where(is_slow, 1e6, mantissa).astype('int64')
+    exponent = np.where(is_slow, 0., exponent).astype('int64')
+    abs_exponent = np.abs(exponent) % 100
+
+    # UCS4 code points, so the buffer can be viewed as a str array;
+    # the 14th character is padding for '-1.000000E-100'
+    chars = np.zeros((nvals, 14), dtype='<u4')
+    chars[:, 0] = np.where(flat < 0., ord('-'), ord(' '))
+    chars[:, 1] = ord('0') + mantissa // 1000000
+    chars[:, 2] = ord('.')
+    chars[:, 3:6] = _DIGITS3[(mantissa // 1000) % 1000]
+    chars[:, 6:9] = _DIGITS3[mantissa % 1000]
+    chars[:, 9] = ord('E')
+    chars[:, 10] = np.where(exponent < 0, ord('-'), ord('+'))
+    chars[:, 11:13] = _DIGITS3[abs_exponent, 1:]
+    vals2 = chars.view('<U14').ravel()
+
+    islow = np.where(is_slow)[0]
+    if len(islow):
+        vals2[islow] = (('%13.6E\n' * len(islow)) % tuple(flat[islow].tolist())).split('\n')[:-1]
+    vals2[is_zero] = ' 0.0'
+    return vals2.reshape(vals.shape)
+
+
+def write_f06_lines(f06_file, fmt, columns: List[Any], nrows_chunk: int=10000) -> None:
+    """
+    Writes a series of lines using a single format call per chunk of
+    rows, rather than one call per row.
+
+    Parameters
+    ----------
+    f06_file : file
+        the file to write to
+    fmt : str / (nrows, ) str ndarray
+        str : the format for every row (e.g., '%8i %-13s\\n')
+        ndarray : the format for each row; each format must use all
+        ncolumns values (use '%.0s' to drop a value)
+    columns : List[array-like]
+        the ncolumns values for each row; each column has nrows values
+    nrows_chunk : int; default=10000
+        the number of rows to format at once
+
+    """
+    nrows = len(columns[0])
+    values = np.empty((nrows, len(columns)), dtype='object')
+    for icol, column in enumerate(columns):
+        values[:, icol] = np.asarray(column).tolist()
+
+    is_fmt_str = isinstance(fmt, str)
+    for irow in range(0, nrows, nrows_chunk):
+        jrow = min(irow + nrows_chunk, nrows)
+        if is_fmt_str:
+            fmti = fmt * (jrow - irow)
+        else:
+            fmti = ''.join(fmt[irow:jrow])
+        f06_file.write(fmti % tuple(values[irow:jrow, :].ravel().tolist()))
+
+
 def write_floats_8p4f(vals: List[float]) -> List[str]:
     """writes an 8.4F formatted number"""
     vals2 = []
@@ -4,19 +4,55 @@ defines the F06Writer class and:
 """
 #pylint: disable=W0201,C0301,C0111
 import os
+import re
 import sys
 import copy
 import getpass
 from datetime import date
+from io import StringIO
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from traceback import print_exc
-from typing import Optional, List, Dict, Union
+from typing import Optional, List, Dict, Union, Tuple
+
+import numpy as np
 
 import pyNastran
 from pyNastran.op2.op2_interface.op2_f06_common import OP2_F06_Common
 from pyNastran.op2.op2_interface.result_set import ResultSet
 
 
+PAGE_SENTINEL = '\x00PAGE %i\x00'
+PAGE_SENTINEL_REGEX = re.compile('\x00PAGE (-?[0-9]+)\x00')
+
+
+def _render_f06_result(job) -> Tuple[str, int]:
+    """
+    Renders a single result to F06 text in a worker process
+
+    Returns
+    -------
+    text : str
+        the F06 text; the page stamps are PAGE_SENTINELs with page
+        numbers relative to the start of the result
+    npages : int
+        the relative page number returned by ``write_f06``
+
+    """
+    result, header, is_mag_phase, is_sort1 = job
+
+    # pickling creates a new nan, which breaks the
+    # ``nonlinear_factor not in (None, np.nan)`` checks
+    nonlinear_factor = getattr(result, 'nonlinear_factor', None)
+    if isinstance(nonlinear_factor, float) and np.isnan(nonlinear_factor):
+        result.nonlinear_factor = np.nan
+
+    f06_file = StringIO()
+    npages = result.write_f06(f06_file, header, PAGE_SENTINEL, page_num=0,
+                              is_mag_phase=is_mag_phase, is_sort1=is_sort1)
+    return f06_file.getvalue(), npages
+
+
 def make_stamp(title: Optional[str],
                today: Optional[date]=None,
                build: Optional[str]=None) -> str:
@@ -372,7 +408,7 @@ class F06Writer(OP2_F06_Common):
                   is_mag_phase: bool=False, is_sort1: bool=True,
                   delete_objects: bool=True, end_flag: bool=False,
                   quiet: bool=True, repr_check: bool=False,
-                  close: bool=True) -> None:
+                  close: bool=True, nprocesses: int=1) -> None:
         """
         Writes an F06 file based on the data we have stored in the object
 
@@ -400,6 +436,9 @@ class F06Writer(OP2_F06_Common):
             calls the object repr as a validation test (prints nothing)
         close : bool; default=True
             close the f06 file
+        nprocesses : int; default=1
+            the number of processes used to render the results;
+            results are still written in order with the same page numbers
         """
         if not quiet:
             print("F06:")
@@ -444,7 +483,8 @@ class F06Writer(OP2_F06_Common):
         # writes all results for
         self._write_f06_subcase_based(f06, page_stamp, delete_objects=delete_objects,
                                       is_mag_phase=is_mag_phase, is_sort1=is_sort1,
-                                      quiet=quiet, repr_check=repr_check)
+                                      quiet=quiet, repr_check=repr_check,
+                                      nprocesses=nprocesses)
 
         self.op2_results.psds.write_f06(f06)
 
@@ -481,7 +521,8 @@ class F06Writer(OP2_F06_Common):
                                  is_mag_phase=False,
                                  is_sort1=True,
                                  quiet=False,
-                                 repr_check=False):
+                                 repr_check=False,
+                                 nprocesses: int=1):
         """
         Helper function for ``write_f06`` that does the real work
 
@@ -506,10 +547,14 @@ class F06Writer(OP2_F06_Common):
             suppress print messages
         repr_check: bool; default=False
             calls the object repr as a validation test (prints nothing)
+        nprocesses : int; default=1
+            the number of processes used to render the eigenvectors and
+            the other result tables
 
         """
         log = self.log
         is_failed = False
+        jobs = []
         header = ['     DEFAULT                                                                                                                        \n',
                   '\n', '']
 
@@ -568,12 +613,17 @@ class F06Writer(OP2_F06_Common):
                 else:
                     print(res_format % (class_name, isubcase))
 
+                if nprocesses > 1:
+                    jobs.append((result, copy.copy(header), is_mag_phase, True))
+                    continue
                 self.page_num = result.write_f06(f06, header, page_stamp,
                                                  self.page_num, is_mag_phase=is_mag_phase, is_sort1=True)
                 assert isinstance(self.page_num, int), f'page_num={self.page_num!r}'
                 if delete_objects:
                     del result
                 self.page_num += 1
+        self._write_f06_jobs(f06, page_stamp, jobs, nprocesses,
+                             delete_objects=delete_objects)
 
         # finally, we writte all the other tables
         # nastran puts the tables in order of the Case Control deck,
@@ -640,6 +690,9 @@ class F06Writer(OP2_F06_Common):
                         result.is_complex
                         result.is_real
 
+                        if nprocesses > 1:
+                            jobs.append((result, header, is_mag_phase, is_sort1))
+                            continue
                         try:
                             self.page_num = result.write_f06(
                                 f06, header, page_stamp, page_num=self.page_num,
@@ -657,3 +710,52 @@ class F06Writer(OP2_F06_Common):
                     if delete_objects:
                         del result
                     self.page_num += 1
+        self._write_f06_jobs(f06, page_stamp, jobs, nprocesses,
+                             delete_objects=delete_objects)
+
+    def _write_f06_jobs(self, f06, page_stamp: str, jobs: list, nprocesses: int,
+                        delete_objects: bool=True) -> None:
+        """
+        Renders the results in a process pool and writes them in order
+
+        Each result is rendered with a placeholder page stamp starting at
+        page 0, so the real page numbers can be filled in once the
+        previous results are written.
+
+        Parameters
+        ----------
+        f06 : file
+            the opened file object
+        page_stamp : str
+            the format string stamp is the ending to every F06 page
+        jobs : List[(result, header, is_mag_phase, is_sort1)]
+            the results to write; cleared when done
+        nprocesses : int
+            the number of processes to use
+        delete_objects : bool; default=True
+            should the jobs be released after they're written to reduce memory
+
+        """
+        if len(jobs) == 0:
+            return
+        def _page_stamp(match):
+            return page_stamp % (self.page_num + int(match.group(1)))
+
+        with ProcessPoolExecutor(max_workers=nprocesses) as executor:
+            texts = executor.map(_render_f06_result, jobs)
+            for ijob in range(len(jobs)):
+                result = jobs[ijob][0]
+                try:
+                    text, npages = next(texts)
+                except Exception:
+                    print_exc(file=sys.stdout)
+                    print(''.join(result.get_stats()))
+                    raise
+                f06.write(PAGE_SENTINEL_REGEX.sub(_page_stamp, text))
+                self.page_num += npages
+                assert isinstance(self.page_num, int), f'result={result} page_num={self.page_num!r}'
+                if delete_objects:
+                    jobs[ijob] = None
+                    del result
+                self.page_num += 1
+        jobs.clear()
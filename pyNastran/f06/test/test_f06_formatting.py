@@ -1,8 +1,11 @@
 import unittest
+import warnings
+from io import StringIO
+import numpy as np
 from pyNastran.f06.f06_formatting import (
     write_floats_8p4f, write_floats_8p1e,
-    write_floats_10e, write_floats_12e,
-    write_imag_floats_13e)
+    write_floats_10e, write_floats_12e, write_floats_13e,
+    write_imag_floats_13e, write_floats_13e_array, write_f06_lines)
 from pyNastran.f06.f06_writer import (
     make_end, sorted_bulk_data_header, make_f06_header, make_stamp)
 
@@ -165,6 +168,44 @@ class TestF06Formatting(unittest.TestCase):
                          msg='\nimag %s+%sj:\nactual  =%r len(actual)=%i\nexpected=%r len(expected)=%i' % (
             val.real, val.imag, actual_imag, len(actual_imag), actual_imag, len(expected_imag)))
 
+    def test_write_floats_13e_array(self):
+        """the vectorized 13e formatting matches write_floats_13e"""
+        vals = np.array([
+            [0., -0., 1., -1.5e-20, 3.4e38],
+            [np.nan, 1e-300, -2.5e200, 7., -1e-45],
+        ])
+        actual = write_floats_13e_array(vals)
+        assert actual.shape == (2, 5)
+        assert actual.tolist() == [write_floats_13e(row) for row in vals]
+
+        # non-finite values and subnormals
+        vals = np.array([np.inf, -np.inf, np.nan, 5e-324, -1e-310, 2.2e-308])
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            actual = write_floats_13e_array(vals)
+        assert actual.tolist() == write_floats_13e(vals), actual
+
+        vals32 = np.random.randn(10, 6).astype('float32')
+        actual = write_floats_13e_array(vals32)
+        assert actual.tolist() == [write_floats_13e(row) for row in vals32]
+        assert write_floats_13e_array(np.zeros((0, 6))).shape == (0, 6)
+
+    def test_write_f06_lines(self):
+        """write_f06_lines matches per-line formatting"""
+        nids = np.array([1, 2, 3])
+        vals = write_floats_13e_array(np.array([0., 1., -2.]))
+        fmt = '%8i %-13s|\n'
+        f06_file = StringIO()
+        write_f06_lines(f06_file, fmt, [nids, vals], nrows_chunk=2)
+        expected = ''.join(fmt % (nid, val) for nid, val in zip(nids.tolist(), vals))
+        assert f06_file.getvalue() == expected
+
+        # a format per row; '%.0s' drops a value
+        fmts = np.array(['%8i %s\n', '%8i%.0s\n', '%8i %s\n'])
+        f06_file = StringIO()
+        write_f06_lines(f06_file, fmts, [nids, vals])
+        assert f06_file.getvalue() == '       1  0.0\n       2\n       3 -2.000000E+00\n'
+
     def test_make_end(self):
         """miscellaneous F06 tester"""
         make_end(end_flag=True, options=None)
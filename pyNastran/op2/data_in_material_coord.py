@@ -1,11 +1,12 @@
 """
 Defines:
- - data_in_material_coord(bdf, op2, in_place=False)
+ - eids, thetarad, pids = get_material_angles(bdf)
+ - data_in_material_coord(bdf, op2, in_place=False, material_angles=None)
 
 """
 from __future__ import annotations
 import copy
-from typing import Tuple, Dict, Union, TYPE_CHECKING
+from typing import List, Tuple, Dict, Optional, Any, TYPE_CHECKING
 
 import numpy as np
 from numpy import cos, sin, cross
@@ -24,6 +25,11 @@ stress_vectors = ['cquad4_stress', 'cquad8_stress', 'cquadr_stress',
                   'ctria3_stress', 'ctria6_stress', 'ctriar_stress']
 strain_vectors = ['cquad4_strain', 'cquad8_strain', 'cquadr_strain',
                   'ctria3_strain', 'ctria6_strain', 'ctriar_strain']
+composite_vectors = [
+    'cquad4_composite_stress', 'cquad8_composite_stress', 'cquadr_composite_stress',
+    'ctria3_composite_stress', 'ctria6_composite_stress', 'ctriar_composite_stress',
+    'cquad4_composite_strain', 'cquad8_composite_strain', 'cquadr_composite_strain',
+    'ctria3_composite_strain', 'ctria6_composite_strain', 'ctriar_composite_strain']
 
 def transf_Mohr(Sxx: np.ndarray,
                 Syy: np.ndarray,
@@ -163,9 +169,221 @@ def calc_imat(normals: np.ndarray, csysi: np.ndarray) -> np.ndarray:
     return imat
 
 
+def get_material_angles(bdf: BDF) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Gets the angle from the element to the material coordinate system
+    for every shell element with a THETA/MCID
+
+    The element data is gathered in a single pass and the angles are
+    then calculated for all the elements of a given type at once.
+
+    Parameters
+    ----------
+    bdf : :class:`.BDF` object
+        the model; the nodes are used in the basic frame
+
+    Returns
+    -------
+    eids : (nelements, ) int ndarray
+        the sorted element ids
+    thetarad : (nelements, ) float ndarray
+        the material angle in radians
+    pids : (nelements, ) int ndarray
+        the property id for each element
+
+    """
+    eids_list = []
+    pids_list = []
+    etypes_list = []
+    theta_list = []
+    mcid_list = []
+    nodes_list = []
+    for eid, elem in sorted(bdf.elements.items()):
+        theta_mcid = getattr(elem, 'theta_mcid', None)
+        if theta_mcid is None:
+            continue
+        node_ids = [nid if nid is not None else 0 for nid in elem.node_ids[:4]]
+        eids_list.append(eid)
+        pids_list.append(elem.Pid())
+        etypes_list.append(elem.type)
+        if isinstance(theta_mcid, integer_types):
+            theta_list.append(0.)
+            mcid_list.append(theta_mcid)
+        else:
+            theta_list.append(theta_mcid)
+            mcid_list.append(-1)
+        nodes_list.append(node_ids + [0] * (4 - len(node_ids)))
+
+    eids = np.array(eids_list, dtype='int32')
+    pids = np.array(pids_list, dtype='int32')
+    thetarad = np.deg2rad(np.array(theta_list, dtype='float64'))
+    if len(eids) == 0:
+        return eids, thetarad, pids
+
+    etypes = np.array(etypes_list)
+    mcids = np.array(mcid_list, dtype='int32')
+    nodes = np.array(nodes_list, dtype='int32')
+    mcid = mcids >= 0
+
+    quad_types = ['CQUAD4', 'CQUAD8', 'CQUADR']
+    tria_types = ['CTRIA3', 'CTRIA6', 'CTRIAR']
+    is_quad = np.in1d(etypes, quad_types)
+    is_tria = np.in1d(etypes, tria_types)
+    is_used = is_quad | (is_tria & mcid)
+    if not is_used.any():
+        return eids, thetarad, pids
+
+    unid = np.unique(nodes[is_used, :])
+    unid = unid[unid > 0]
+    xyz = np.array([bdf.nodes[nid].get_position() for nid in unid])
+
+    def get_corners(ielem: np.ndarray, ncorners: int) -> List[np.ndarray]:
+        inode = np.searchsorted(unid, nodes[ielem, :ncorners])
+        return [xyz[inode[:, i], :] for i in range(ncorners)]
+
+    def get_csysi(ielem: np.ndarray) -> np.ndarray:
+        umcid, imcid = np.unique(mcids[ielem], return_inverse=True)
+        i_axes = np.array([bdf.coords[cid].i for cid in umcid])
+        return i_axes[imcid, :]
+
+    def get_mcid_theta(g1, g2, normals, csysi):
+        imat = calc_imat(normals, csysi)
+        theta = angle2vec(g2 - g1, imat)
+        # getting sign of THETA
+        check_normal = cross(g2 - g1, imat)
+        theta *= np.sign((check_normal * normals).sum(axis=1))
+        return theta
+
+    # elems with THETA/MCID; corner correction for the quads
+    ielem_theta = np.where(is_quad & ~mcid)[0]
+    ielem_mcid = np.where(is_quad & mcid)[0]
+    if len(ielem_theta) or len(ielem_mcid):
+        for ielem in (ielem_theta, ielem_mcid):
+            if len(ielem) == 0:
+                continue
+            g1, g2, g3, g4 = get_corners(ielem, 4)
+            if ielem is ielem_mcid:
+                normals = cross(g1 - g3, g2 - g4)
+                normals /= norm(normals, axis=1)[:, np.newaxis]
+                theta = get_mcid_theta(g1, g2, normals, get_csysi(ielem))
+            else:
+                theta = thetarad[ielem]
+            betarad = angle2vec(g3 - g1, g2 - g1)
+            gammarad = angle2vec(g4 - g2, g1 - g2)
+            alpharad = (betarad + gammarad) / 2.
+            theta -= betarad
+            theta += alpharad
+            thetarad[ielem] = theta
+
+    ielem = np.where(is_tria & mcid)[0]
+    if len(ielem):
+        g1, g2, g3 = get_corners(ielem, 3)
+        normals = cross(g1 - g2, g1 - g3)
+        normals /= norm(normals, axis=1)[:, np.newaxis]
+        thetarad[ielem] = get_mcid_theta(g1, g2, normals, get_csysi(ielem))
+    return eids, thetarad, pids
+
+
+def _get_element_values(eids: np.ndarray, values: np.ndarray,
+                        veceids: np.ndarray, default: Any=0.0) -> np.ndarray:
+    """
+    Looks up the values for a set of elements
+
+    Elements that aren't in eids get the default value (e.g., elements
+    that exist in the op2, but not in the supplied bdf file)
+    """
+    ieid = np.searchsorted(eids, veceids)
+    ieid[ieid == len(eids)] = 0
+    is_found = (eids[ieid] == veceids) if len(eids) else np.zeros(len(veceids), dtype='bool')
+    out = np.full(len(veceids), default, dtype=values.dtype)
+    out[is_found] = values[ieid[is_found]]
+    return out
+
+
+def _get_ply_thetarad(bdf: BDF, eids: np.ndarray, pids: np.ndarray,
+                      element_layer: np.ndarray,
+                      ply_thetas: Dict[int, Tuple[np.ndarray, np.ndarray]]) -> np.ndarray:
+    """
+    Gets the ply angle (in radians) for each (element, layer) of a
+    composite result
+
+    PCOMP layers are numbered from 1 (including the symmetric plies),
+    while PCOMPG layers are the global ply ids.
+    """
+    veceids = element_layer[:, 0]
+    layers = element_layer[:, 1]
+    vecpids = _get_element_values(eids, pids, veceids, default=0)
+    thetarad = np.zeros(len(veceids), dtype='float64')
+    for pid in np.unique(vecpids):
+        if pid not in ply_thetas:
+            prop = bdf.properties.get(pid)
+            if prop is None or prop.type not in ['PCOMP', 'PCOMPG']:
+                ply_thetas[pid] = None
+                continue
+            thetas = prop.get_thetas(include_symmetry=True)
+            if prop.type == 'PCOMPG':
+                ply_ids = np.asarray(prop.global_ply_ids)
+            else:
+                ply_ids = np.arange(1, len(thetas) + 1)
+            isort = np.argsort(ply_ids)
+            ply_thetas[pid] = (ply_ids[isort], np.deg2rad(thetas[isort]))
+
+        ply_theta = ply_thetas[pid]
+        if ply_theta is None:
+            continue
+        irow = np.where(vecpids == pid)[0]
+        ply_ids, thetas = ply_theta
+        thetarad[irow] = _get_element_values(ply_ids, thetas, layers[irow])
+    return thetarad
+
+
+def _transf_Mohr_data(Sxx: np.ndarray, Syy: np.ndarray, Sxy: np.ndarray,
+                      theta_rad: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """``transf_Mohr``, which also handles complex data"""
+    if np.iscomplexobj(Sxx):
+        Sxx_real, Syy_real, Sxy_real = transf_Mohr(Sxx.real, Syy.real, Sxy.real, theta_rad)
+        Sxx_imag, Syy_imag, Sxy_imag = transf_Mohr(Sxx.imag, Syy.imag, Sxy.imag, theta_rad)
+        return (Sxx_real + 1j * Sxx_imag, Syy_real + 1j * Syy_imag,
+                Sxy_real + 1j * Sxy_imag)
+    return transf_Mohr(Sxx, Syy, Sxy, theta_rad)
+
+
+def _rotate_vector_data(Qx: np.ndarray, Qy: np.ndarray,
+                        theta_rad: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """rotates the transverse terms"""
+    cos_theta = cos(theta_rad)
+    sin_theta = sin(theta_rad)
+    Qx_new = cos_theta*Qx + sin_theta*Qy
+    Qy_new = -sin_theta*Qx + cos_theta*Qy
+    return Qx_new, Qy_new
+
+
+def _copy_results(op2: OP2, vecnames: List[str]) -> OP2:
+    """
+    Creates a shallow copy of the OP2, where only the results in
+    vecnames are copied
+    """
+    op2_new = copy.copy(op2)
+    if getattr(op2_new, 'h5_file', None) is not None:
+        # don't let the copy close the original's file
+        op2_new.h5_file = None
+    op2_new.op2_results = copy.copy(op2.op2_results)
+    op2_new.op2_results.force = copy.copy(op2.op2_results.force)
+    for vecname in vecnames:
+        new_vectors = {}
+        for subcase, vector in getattr(op2, vecname).items():
+            new_vector = copy.copy(vector)
+            new_vector.data = vector.data.copy()
+            new_vectors[subcase] = new_vector
+        setattr(op2_new, vecname, new_vectors)
+    return op2_new
+
+
 def data_in_material_coord(bdf: BDF, op2: OP2,
                            in_place: bool=False,
-                           debug: bool=False) -> OP2:
+                           debug: bool=False,
+                           material_angles: Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]=None,
+                           ) -> OP2:
     """Convert OP2 2D element outputs to material coordinates
 
     Nastran allows the use of 'PARAM,OMID,YES' to print 2D element forces,
@@ -177,6 +395,10 @@ def data_in_material_coord(bdf: BDF, op2: OP2,
     similarly to most of the post-processing tools (Patran, Femap, HyperView,
     etc). It handles both 2D elements with MCID or THETA.
 
+    Composite ply stresses/strains are output in the ply (fiber)
+    direction, so they're rotated by the PCOMP/PCOMPG ply angle into the
+    same material coordinate system.
+
     Parameters
     ----------
     bdf : :class:`.BDF` object
@@ -185,98 +407,30 @@ def data_in_material_coord(bdf: BDF, op2: OP2,
         A :class:`.OP2` object that corresponds to the 'bdf'.
     in_place : bool; default=False
         If true the original op2 object is modified, otherwise a new one
-        is created.
+        is created.  Only the converted results are copied; the other
+        results are shared with the original op2.
+    material_angles : (eids, thetarad, pids); default=None -> calculate
+        the output of ``get_material_angles(bdf)``, which may be reused
+        to convert multiple op2s for the same model
 
     Returns
     -------
     op2_new : :class:`.OP2` object
         A :class:`.OP2` object with the abovementioned changes.
 
-    .. warning ::  doesn't handle composite stresses/strains/forces
     .. warning ::  doesn't handle solid stresses/strains/forces (e.g. MAT11)
     .. warning ::  zeros out data for CQUAD8s
 
     """
+    vecnames = force_vectors + stress_vectors + strain_vectors + composite_vectors
     if in_place:
         op2_new = op2
     else:
-        op2_new = copy.deepcopy(op2)
-
-    eids = np.array(list(bdf.elements.keys()))
-    elems = np.array(list(bdf.elements.values()))
-    mcid = np.array([is_mcid(e) for e in elems])
-    elemsmcid = elems[mcid]
-    elemstheta = elems[~mcid]
-
-    thetadeg = np.zeros(elems.shape)
-    thetadeg[~mcid] = np.array([check_theta(e) for e in elemstheta])
-    thetarad = np.deg2rad(thetadeg)
-
-    #NOTE separating quad types to get vectorizable "corner"
-    quad_types = ['CQUAD4', 'CQUAD8', 'CQUADR']
-    for quad_type in quad_types:
-        # elems with THETA
-        thisquad = np.array([quad_type in e.type for e in elemstheta])
-        if np.any(thisquad):
-            quadelems = elemstheta[thisquad]
-            corner = np.array([e.get_node_positions() for e in quadelems])
-            g1 = corner[:, 0, :]
-            g2 = corner[:, 1, :]
-            g3 = corner[:, 2, :]
-            g4 = corner[:, 3, :]
-            betarad = angle2vec(g3 - g1, g2 - g1)
-            gammarad = angle2vec(g4 - g2, g1 - g2)
-            alpharad = (betarad + gammarad) / 2.
-            tmp = thetarad[~mcid]
-            tmp[thisquad] -= betarad
-            tmp[thisquad] += alpharad
-            thetarad[~mcid] = tmp
-
-        # elems with MCID
-        thisquad = np.array([quad_type in e.type for e in elemsmcid])
-        if np.any(thisquad):
-            quadelems = elemsmcid[thisquad]
-            corner = np.array([e.get_node_positions() for e in quadelems])
-            g1 = corner[:, 0, :]
-            g2 = corner[:, 1, :]
-            g3 = corner[:, 2, :]
-            g4 = corner[:, 3, :]
-            normals = np.array([e.Normal() for e in quadelems])
-            csysi = np.array([bdf.coords[e.theta_mcid].i for e in quadelems])
-            imat = calc_imat(normals, csysi)
-            tmp = thetarad[mcid]
-            tmp[thisquad] = angle2vec(g2 - g1, imat)
-            # getting sign of THETA
-            check_normal = cross(g2 - g1, imat)
-            tmp[thisquad] *= np.sign((check_normal * normals).sum(axis=1))
-            betarad = angle2vec(g3 - g1, g2 - g1)
-            gammarad = angle2vec(g4 - g2, g1 - g2)
-            alpharad = (betarad + gammarad) / 2.
-            tmp[thisquad] -= betarad
-            tmp[thisquad] += alpharad
-            thetarad[mcid] = tmp
+        op2_new = _copy_results(op2, vecnames)
 
-    tria_types = ['CTRIA3', 'CTRIA6', 'CTRIAR']
-    for tria_type in tria_types:
-        # elems with MCID
-        thistria = np.array([tria_type in e.type for e in elemsmcid])
-        if np.any(thistria):
-            triaelems = elemsmcid[thistria]
-            corner = np.array([e.get_node_positions() for e in triaelems])
-            g1 = corner[:, 0, :]
-            g2 = corner[:, 1, :]
-            g3 = corner[:, 2, :]
-            normals = np.array([e.Normal() for e in triaelems])
-            csysi = np.array([bdf.coords[e.theta_mcid].i for e in triaelems])
-            imat = calc_imat(normals, csysi)
-            tmp = thetarad[mcid]
-            tmp[thistria] = angle2vec(g2 - g1, imat)
-            # getting sign of THETA
-            check_normal = cross(g2 - g1, imat)
-            tmp[thistria] *= np.sign((check_normal * normals).sum(axis=1))
-            thetarad[mcid] = tmp
-
-    thetarad = dict([[eid, theta] for eid, theta in zip(eids, thetarad)])
+    if material_angles is None:
+        material_angles = get_material_angles(bdf)
+    eids, thetarad, pids = material_angles
 
     for vecname in force_vectors:
         op2_vectors = getattr(op2, vecname)
@@ -286,78 +440,25 @@ def data_in_material_coord(bdf: BDF, op2: OP2,
             veceids = get_eids_from_op2_vector(vector)
             #NOTE assuming thetarad=0 for elements that exist in the op2 but
             #     not in the supplied bdf file
-            vecthetarad = np.array([thetarad.get(eid, 0.0) for eid in veceids])
+            vecthetarad = _get_element_values(eids, thetarad, veceids)
 
             if veceids.shape[0] == vector.data.shape[1] // 5:
-                steps = [5, 5, 5, 5, 5]
-            else: # assuming  always that veceids.shape[0] == vector.data.shape[1]
-                steps = [1]
-
-            for start, step in enumerate(steps):
-                slicei = slice(start, vector.data.shape[1], step)
-                # membrane terms
-                Sxx = vector.data[:, slicei, 0]
-                Syy = vector.data[:, slicei, 1]
-                Sxy = vector.data[:, slicei, 2]
-                if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                    Sxx_theta_real, Syy_theta_real, Sxy_theta_real = transf_Mohr(
-                        Sxx.real, Syy.real, Sxy.real, vecthetarad)
-                    new_vector.data[:, slicei, 0].real = Sxx_theta_real
-                    new_vector.data[:, slicei, 1].real = Syy_theta_real
-                    new_vector.data[:, slicei, 2].real = Sxy_theta_real
-                    Sxx_theta_imag, Syy_theta_imag, Sxy_theta_imag = transf_Mohr(
-                        Sxx.imag, Syy.imag, Sxy.imag, vecthetarad)
-                    new_vector.data[:, slicei, 0].imag = Sxx_theta_imag
-                    new_vector.data[:, slicei, 1].imag = Syy_theta_imag
-                    new_vector.data[:, slicei, 2].imag = Sxy_theta_imag
-                else:
-                    Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(Sxx, Syy, Sxy, vecthetarad)
-                    new_vector.data[:, slicei, 0] = Sxx_theta
-                    new_vector.data[:, slicei, 1] = Syy_theta
-                    new_vector.data[:, slicei, 2] = Sxy_theta
-
-                # bending terms
-                Sxx = vector.data[:, slicei, 3]
-                Syy = vector.data[:, slicei, 4]
-                Sxy = vector.data[:, slicei, 5]
-                if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                    Sxx_theta_real, Syy_theta_real, Sxy_theta_real = transf_Mohr(
-                        Sxx.real, Syy.real, Sxy.real, vecthetarad)
-                    new_vector.data[:, slicei, 3].real = Sxx_theta_real
-                    new_vector.data[:, slicei, 4].real = Syy_theta_real
-                    new_vector.data[:, slicei, 5].real = Sxy_theta_real
-                    Sxx_theta_imag, Syy_theta_imag, Sxy_theta_imag = transf_Mohr(
-                        Sxx.imag, Syy.imag, Sxy.imag, vecthetarad)
-                    new_vector.data[:, slicei, 3].imag = Sxx_theta_imag
-                    new_vector.data[:, slicei, 4].imag = Syy_theta_imag
-                    new_vector.data[:, slicei, 5].imag = Sxy_theta_imag
-
-                else:
-                    Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(Sxx, Syy, Sxy, vecthetarad)
-                    new_vector.data[:, slicei, 3] = Sxx_theta
-                    new_vector.data[:, slicei, 4] = Syy_theta
-                    new_vector.data[:, slicei, 5] = Sxy_theta
-
-                # transverse terms
-                Qx = vector.data[:, slicei, 6]
-                Qy = vector.data[:, slicei, 7]
-                cos_theta = cos(vecthetarad)
-                sin_theta = sin(vecthetarad)
-                if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                    Qx_new_real = cos_theta*Qx.real + sin_theta*Qy.real
-                    Qy_new_real = -sin_theta*Qx.real + cos_theta*Qy.real
-                    new_vector.data[:, slicei, 6].real = Qx_new_real
-                    new_vector.data[:, slicei, 7].real = Qy_new_real
-
-                    Qx_new_imag = cos_theta*Qx.imag + sin_theta*Qy.imag
-                    Qy_new_imag = -sin_theta*Qx.imag + cos_theta*Qy.imag
-                    new_vector.data[:, slicei, 6].imag = Qx_new_imag
-                    new_vector.data[:, slicei, 7].imag = Qy_new_imag
-                else:
-                    Qx_new = cos_theta*Qx + sin_theta*Qy
-                    Qy_new = -sin_theta*Qx + cos_theta*Qy
-                    new_vector.data[:, slicei, 6] = Qx_new
-                    new_vector.data[:, slicei, 7] = Qy_new
+                # the centroid and 4 corner nodes use the element's angle
+                vecthetarad = np.repeat(vecthetarad, 5)
+
+            data = vector.data
+            for icol in [0, 3]:
+                # membrane terms, bending terms
+                Sxx_theta, Syy_theta, Sxy_theta = _transf_Mohr_data(
+                    data[:, :, icol], data[:, :, icol+1], data[:, :, icol+2], vecthetarad)
+                new_vector.data[:, :, icol] = Sxx_theta
+                new_vector.data[:, :, icol+1] = Syy_theta
+                new_vector.data[:, :, icol+2] = Sxy_theta
+
+            # transverse terms
+            Qx_new, Qy_new = _rotate_vector_data(data[:, :, 6], data[:, :, 7], vecthetarad)
+            new_vector.data[:, :, 6] = Qx_new
+            new_vector.data[:, :, 7] = Qy_new
 
             #TODO implement transformation for corner nodes
             #     for now we just zero the wrong values
@@ -365,7 +466,8 @@ def data_in_material_coord(bdf: BDF, op2: OP2,
                 for j in [1, 2, 3, 4]:
                     new_vector.data[:, j, :] = 0
 
-    for vecname in stress_vectors:
+    for vecname in stress_vectors + strain_vectors:
+        is_strain = vecname in strain_vectors
         op2_vectors = getattr(op2, vecname)
         new_vectors = getattr(op2_new, vecname)
         for subcase, vector in op2_vectors.items():
@@ -375,37 +477,25 @@ def data_in_material_coord(bdf: BDF, op2: OP2,
             veceids = veceids[check]
             #NOTE assuming thetarad=0 for elements that exist in the op2 but
             #     not in the supplied bdf file
-            vecthetarad = np.array([thetarad.get(eid, 0.0) for eid in veceids])
-
-            # bottom and top in-plane stresses
-            if vector.data.shape[2] > 3:
-                Sxx = vector.data[:, :, 1][:, check]
-                Syy = vector.data[:, :, 2][:, check]
-                Sxy = vector.data[:, :, 3][:, check]
-            else:
-                Sxx = vector.data[:, :, 0][:, check]
-                Syy = vector.data[:, :, 1][:, check]
-                Sxy = vector.data[:, :, 2][:, check]
-            if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                Sxx_theta_real, Syy_theta_real, Sxy_theta_real = transf_Mohr(Sxx.real, Syy.real, Sxy.real, vecthetarad)
-                Sxx_theta_imag, Syy_theta_imag, Sxy_theta_imag = transf_Mohr(Sxx.imag, Syy.imag, Sxy.imag, vecthetarad)
-                tmp = np.zeros_like(new_vector.data[:, :, 0][:, check])
-                tmp.real = Sxx_theta_real
-                tmp.imag = Sxx_theta_imag
-                new_vector.data[:, :, 0][:, check] = tmp
-                tmp.real = Syy_theta_real
-                tmp.imag = Syy_theta_imag
-                new_vector.data[:, :, 1][:, check] = tmp
-                tmp.real = Sxy_theta_real
-                tmp.imag = Sxy_theta_imag
-                new_vector.data[:, :, 2][:, check] = tmp
-            else:
-                Sxx_theta, Syy_theta, Sxy_theta = transf_Mohr(Sxx, Syy, Sxy, vecthetarad)
-                new_vector.data[:, :, 1][:, check] = Sxx_theta
-                new_vector.data[:, :, 2][:, check] = Syy_theta
-                new_vector.data[:, :, 3][:, check] = Sxy_theta
+            vecthetarad = _get_element_values(eids, thetarad, veceids)
+
+            # bottom and top in-plane stresses/strains
+            # the real data has the fiber distance in the first column
+            icol = 1 if vector.data.shape[2] > 3 else 0
+            Sxx = vector.data[:, check, icol]
+            Syy = vector.data[:, check, icol+1]
+            Sxy = vector.data[:, check, icol+2]
+            if is_strain:
+                Sxy = Sxy / 2.
+            Sxx_theta, Syy_theta, Sxy_theta = _transf_Mohr_data(Sxx, Syy, Sxy, vecthetarad)
+            if not np.iscomplexobj(Sxx):
                 thetadeg_new = thetadeg_to_principal(Sxx_theta, Syy_theta, Sxy_theta)
-                new_vector.data[:, :, 4][:, check] = thetadeg_new
+                new_vector.data[:, check, icol+3] = thetadeg_new
+            if is_strain:
+                Sxy_theta *= 2.
+            new_vector.data[:, check, icol] = Sxx_theta
+            new_vector.data[:, check, icol+1] = Syy_theta
+            new_vector.data[:, check, icol+2] = Sxy_theta
 
             #TODO implement transformation for corner nodes
             #     for now we just zero the wrong values
@@ -413,51 +503,35 @@ def data_in_material_coord(bdf: BDF, op2: OP2,
                 for i in [2, 3, 4, 5, 6, 7, 8, 9]:
                     new_vector.data[:, i, :] = 0
 
-    for vecname in strain_vectors:
+    ply_thetas = {}
+    for vecname in composite_vectors:
+        is_strain = 'strain' in vecname
         op2_vectors = getattr(op2, vecname)
         new_vectors = getattr(op2_new, vecname)
         for subcase, vector in op2_vectors.items():
             new_vector = new_vectors[subcase]
-            veceids = get_eids_from_op2_vector(vector)
-            check = veceids != 0
-            veceids = veceids[check]
-            #NOTE assuming thetarad=0 for elements that exist in the op2 but
-            #     not in the supplied bdf file
-            vecthetarad = np.array([thetarad.get(eid, 0.0) for eid in veceids])
-
-            # bottom and top in-plane strains
-            if vector.data.shape[2] > 3:
-                exx = vector.data[:, :, 1][:, check]
-                eyy = vector.data[:, :, 2][:, check]
-                exy = vector.data[:, :, 3][:, check] / 2.
-            else:
-                exx = vector.data[:, :, 0][:, check]
-                eyy = vector.data[:, :, 1][:, check]
-                exy = vector.data[:, :, 2][:, check] / 2.
-            if vector.data.dtype == np.complex64 or vector.data.dtype == np.complex128:
-                exx_theta_real, eyy_theta_real, exy_theta_real = transf_Mohr(exx.real, eyy.real, exy.real, vecthetarad)
-                exx_theta_imag, eyy_theta_imag, exy_theta_imag = transf_Mohr(exx.imag, eyy.imag, exy.imag, vecthetarad)
-                tmp = np.zeros_like(new_vector.data[:, :, 0][:, check])
-                tmp.real = exx_theta_real
-                tmp.imag = exx_theta_imag
-                new_vector.data[:, :, 0][:, check] = tmp
-                tmp.real = eyy_theta_real
-                tmp.imag = eyy_theta_imag
-                new_vector.data[:, :, 1][:, check] = tmp
-                tmp.real = exy_theta_real * 2.
-                tmp.imag = exy_theta_imag * 2.
-                new_vector.data[:, :, 2][:, check] = tmp
-            else:
-                exx_theta, eyy_theta, exy_theta = transf_Mohr(exx, eyy, exy, vecthetarad)
-                thetadeg_new = thetadeg_to_principal(exx_theta, eyy_theta, exy_theta)
-                new_vector.data[:, :, 1][:, check] = exx_theta
-                new_vector.data[:, :, 2][:, check] = eyy_theta
-                new_vector.data[:, :, 3][:, check] = exy_theta * 2.
-                new_vector.data[:, :, 4][:, check] = thetadeg_new
-
-            #TODO implement transformation for corner nodes
-            #     for now we just zero the wrong values
-            if 'quad8' in vecname:
-                for i in [2, 3, 4, 5, 6, 7, 8, 9]:
-                    new_vector.data[:, i, :] = 0
+            # ply -> material is a rotation by -theta_ply
+            vecthetarad = -_get_ply_thetarad(bdf, eids, pids, vector.element_layer, ply_thetas)
+
+            # in-plane terms: o11, o22, t12
+            Sxx = vector.data[:, :, 0]
+            Syy = vector.data[:, :, 1]
+            Sxy = vector.data[:, :, 2]
+            if is_strain:
+                Sxy = Sxy / 2.
+            Sxx_theta, Syy_theta, Sxy_theta = _transf_Mohr_data(Sxx, Syy, Sxy, vecthetarad)
+            if not np.iscomplexobj(Sxx):
+                thetadeg_new = thetadeg_to_principal(Sxx_theta, Syy_theta, Sxy_theta)
+                new_vector.data[:, :, 5] = thetadeg_new
+            if is_strain:
+                Sxy_theta *= 2.
+            new_vector.data[:, :, 0] = Sxx_theta
+            new_vector.data[:, :, 1] = Syy_theta
+            new_vector.data[:, :, 2] = Sxy_theta
+
+            # transverse shear terms: t1z, t2z
+            Qx_new, Qy_new = _rotate_vector_data(
+                vector.data[:, :, 3], vector.data[:, :, 4], vecthetarad)
+            new_vector.data[:, :, 3] = Qx_new
+            new_vector.data[:, :, 4] = Qy_new
     return op2_new
@@ -0,0 +1,153 @@
+r"""
+Defines modal superposition recovery of SOL 103 results:
+ - ModalRecovery(result, ids=None, columns=None, imodes=None)
+
+The physical response is the product of the modal coordinates and the
+mode shapes (eigenvectors, modal stresses/forces):
+
+.. math:: u(t) = \sum_i q_i(t) \phi_i
+
+The recovery is done for a block of time steps at a time, so long time
+histories don't require the full (ntimes, nrows, ncolumns) array.
+
+"""
+from __future__ import annotations
+from typing import List, Optional, Union, Iterator, Tuple
+
+import numpy as np
+
+from pyNastran.op2.vector_utils import get_result_ids
+
+#: the number of time steps to recover at once
+NTIMES_CHUNK = 1000
+
+#: columns that are not linear in the modal coordinates
+#: (e.g., principal/von Mises stresses and margins)
+NONLINEAR_HEADERS = {
+    'fiber_distance', 'fiber_curvature', 'angle',
+    'omax', 'omid', 'omin', 'emax', 'emid', 'emin', 'major', 'minor',
+    'von_mises', 'max_shear', 'ovm', 'oms',
+    'smax', 'smin', 'smaxa', 'smina', 'smaxb', 'sminb',
+    'emaxa', 'emina', 'emaxb', 'eminb',
+    'MS', 'MS_tension', 'MS_compression', 'SMa', 'SMt', 'margin',
+}
+
+
+class ModalRecovery:
+    """
+    Recovers the physical response of a modal result for a modal
+    coordinate history
+
+    Attributes
+    ----------
+    ids : (nrows, ) int ndarray
+        the node/element id for each recovered row
+    headers : List[str]
+        the recovered columns
+    phi : (nmodes, nrows * ncolumns) float ndarray
+        the mode shapes of the recovered rows/columns
+
+    Examples
+    --------
+    >>> model = read_op2('modes.op2', include_results=['eigenvectors', 'cquad4_stress'])
+    >>> recovery = ModalRecovery(model.cquad4_stress[1], ids=[10, 11])
+    >>> for itime, stress in recovery.recover(modal_coordinates):
+    ...     oxx = stress[:, :, recovery.headers.index('oxx')]
+
+    """
+    def __init__(self, result, ids: Optional[List[int]]=None,
+                 columns: Optional[List[Union[str, int]]]=None,
+                 imodes: Optional[List[int]]=None):
+        """
+        Creates a ModalRecovery object
+
+        Parameters
+        ----------
+        result : RealEigenvectorArray, RealPlateStressArray, RealCBarForceArray, ...
+            the SOL 103 result with a mode shape for each "time"
+        ids : List[int]; default=None -> all
+            the node/element ids to recover
+        columns : List[str/int]; default=None -> the linear columns
+            the headers/column indices to recover
+            von Mises, principal stresses, etc. aren't linear in the modal
+            coordinates, so they must be calculated from the recovered
+            components
+        imodes : List[int]; default=None -> all
+            the mode indices (0-based) that the modal coordinates are for
+
+        """
+        if not result.is_sort1:
+            raise NotImplementedError(f'SORT2 is not supported for {result.class_name}')
+        result_headers = result.get_headers()
+        if columns is None:
+            columns = [header for header in result_headers
+                       if header not in NONLINEAR_HEADERS]
+        icolumns = [column if isinstance(column, (int, np.integer))
+                    else result_headers.index(column) for column in columns]
+        self.headers = [result_headers[icolumn] for icolumn in icolumns]
+
+        row_ids = get_result_ids(result)
+        if ids is None:
+            irows = np.arange(len(row_ids))
+        else:
+            irows = np.where(np.isin(row_ids, ids))[0]
+        self.ids = row_ids[irows]
+
+        data = result.data
+        if imodes is not None:
+            data = data[imodes, :, :]
+        phi = data[:, irows, :][:, :, icolumns]
+        self.nmodes = phi.shape[0]
+        self.shape = phi.shape[1:]
+        self.phi = np.ascontiguousarray(phi.reshape(self.nmodes, -1), dtype='float64')
+
+    def recover(self, modal_coordinates: np.ndarray,
+                ntimes_chunk: int=NTIMES_CHUNK) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Recovers the physical response a block of time steps at a time
+
+        Parameters
+        ----------
+        modal_coordinates : (nmodes, ntimes) float/complex ndarray
+            the modal coordinate history
+        ntimes_chunk : int; default=NTIMES_CHUNK
+            the number of time steps to recover at once
+
+        Yields
+        ------
+        itime : int
+            the index of the first time step in the block
+        data : (ntimes_chunk, nrows, ncolumns) float/complex ndarray
+            the physical response
+
+        """
+        modal_coordinates = np.asarray(modal_coordinates)
+        if modal_coordinates.ndim == 1:
+            modal_coordinates = modal_coordinates.reshape(self.nmodes, 1)
+        nmodes, ntimes = modal_coordinates.shape
+        if nmodes != self.nmodes:
+            raise RuntimeError(f'modal_coordinates has {nmodes} modes; expected {self.nmodes}')
+
+        for itime in range(0, ntimes, ntimes_chunk):
+            jtime = min(itime + ntimes_chunk, ntimes)
+            data = modal_coordinates[:, itime:jtime].T @ self.phi
+            yield itime, data.reshape((jtime - itime, ) + self.shape)
+
+    def recover_all(self, modal_coordinates: np.ndarray,
+                    ntimes_chunk: int=NTIMES_CHUNK) -> np.ndarray:
+        """
+        Recovers the physical response for all the time steps
+
+        Returns
+        -------
+        data : (ntimes, nrows, ncolumns) float/complex ndarray
+            the physical response
+
+        """
+        modal_coordinates = np.asarray(modal_coordinates)
+        ntimes = modal_coordinates.shape[1] if modal_coordinates.ndim == 2 else 1
+        dtype = np.result_type(modal_coordinates.dtype, self.phi.dtype)
+        data = np.zeros((ntimes, ) + self.shape, dtype=dtype)
+        for itime, datai in self.recover(modal_coordinates, ntimes_chunk=ntimes_chunk):
+            data[itime:itime+len(datai)] = datai
+        return data
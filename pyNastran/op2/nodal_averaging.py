@@ -0,0 +1,266 @@
+"""
+Defines element to node result mapping:
+ - NodalAverager(nids, matrix)
+ - get_nodal_averager(model, eids)
+ - von_mises_2d(oxx, oyy, txy)
+ - von_mises_3d(oxx, oyy, ozz, txy, tyz, txz)
+ - principal_2d(oxx, oyy, txy)
+
+The element-node incidence is stored as a sparse matrix, so the nodal
+mean of all the time steps is a single sparse matrix-dense product.
+
+"""
+from __future__ import annotations
+import weakref
+from typing import Tuple, Optional, TYPE_CHECKING
+
+import numpy as np
+import scipy.sparse as sp
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+# the averagers for a model; key=id(model), value=(weakref(model), {connectivity_key: NodalAverager})
+# the models aren't hashable, so a WeakKeyDictionary can't be used
+_AVERAGER_CACHE = {}
+
+
+class NodalAverager:
+    """
+    Maps the rows of an element result (e.g., centroidal values or
+    corner values) to the nodes
+
+    Attributes
+    ----------
+    nids : (nnodes, ) int ndarray
+        the sorted node ids that have at least one row
+    matrix : (nnodes, nrows) csr_matrix
+        the incidence matrix; 1.0 if the row touches the node
+    counts : (nnodes, ) float ndarray
+        the number of rows that touch each node
+
+    Examples
+    --------
+    >>> stress = model.cquad4_stress[1]
+    >>> averager = NodalAverager.from_element_node(stress.element_node[::2, :])
+    >>> oxx = averager.mean(stress.data[:, ::2, 1])  # bottom fiber
+
+    """
+    def __init__(self, nids: np.ndarray, matrix: sp.csr_matrix):
+        self.nids = nids
+        self.matrix = matrix.tocsr()
+        self.matrix.sort_indices()
+        self.counts = np.diff(self.matrix.indptr).astype('float64')
+
+    @classmethod
+    def from_element_node(cls, element_node: np.ndarray) -> NodalAverager:
+        """
+        Creates the incidence from the (eid, nid) rows of a corner result
+
+        Centroidal rows (nid=0) are skipped.
+        """
+        row_nids = np.asarray(element_node)[:, 1]
+        irows = np.where(row_nids > 0)[0]
+        return cls._from_row_nids(irows, row_nids[irows], len(row_nids))
+
+    @classmethod
+    def from_bdf(cls, model: BDF, eids: np.ndarray) -> NodalAverager:
+        """
+        Creates the incidence from the element connectivity
+
+        Parameters
+        ----------
+        model : BDF
+            the model with the elements
+        eids : (nrows, ) int ndarray
+            the element id of each row of the result
+            (e.g., the centroidal rows of the result)
+
+        """
+        eids = np.asarray(eids)
+        ueids, ieids = np.unique(eids, return_inverse=True)
+        nnodes, all_nids = _get_connectivity(model, ueids)
+        return cls._from_connectivity(eids, ieids, nnodes, all_nids)
+
+    @classmethod
+    def _from_connectivity(cls, eids: np.ndarray, ieids: np.ndarray,
+                           nnodes: np.ndarray, all_nids: np.ndarray) -> NodalAverager:
+        """builds the matrix from the unique element connectivity"""
+        # expand the unique element connectivity to the rows
+        offsets = np.hstack([0, np.cumsum(nnodes)])
+        nnodes_rows = nnodes[ieids]
+        irows = np.repeat(np.arange(len(eids)), nnodes_rows)
+        ifirst = np.repeat(offsets[ieids], nnodes_rows)
+        inode = np.arange(len(irows)) - np.repeat(np.cumsum(nnodes_rows) - nnodes_rows, nnodes_rows)
+        row_nids = all_nids[ifirst + inode]
+        return cls._from_row_nids(irows, row_nids, len(eids))
+
+    @classmethod
+    def _from_row_nids(cls, irows: np.ndarray, row_nids: np.ndarray,
+                       nrows: int) -> NodalAverager:
+        """builds the (nnodes, nrows) matrix from the row/node pairs"""
+        nids, inodes = np.unique(row_nids, return_inverse=True)
+        values = np.ones(len(irows), dtype='float64')
+        matrix = sp.csr_matrix((values, (inodes, irows)), shape=(len(nids), nrows))
+        # a node used twice by the same row is only counted once
+        matrix.data[:] = 1.
+        return cls(nids, matrix)
+
+    @property
+    def nnodes(self) -> int:
+        return len(self.nids)
+
+    def mean(self, values: np.ndarray) -> np.ndarray:
+        """
+        Averages the rows at each node
+
+        Parameters
+        ----------
+        values : (nrows, ...) or (ntimes, nrows, ...) float ndarray
+            the values for each row; the time axis is first (like
+            result.data) if there are more than 1 dimensions
+
+        Returns
+        -------
+        nodal_values : (nnodes, ...) or (ntimes, nnodes, ...) float ndarray
+            the nodal averaged values
+
+        """
+        values, shape = self._to_rows(values)
+        nodal_values = self.matrix @ values / self.counts[:, np.newaxis]
+        return self._from_rows(nodal_values, shape)
+
+    def max(self, values: np.ndarray) -> np.ndarray:
+        """Gets the max of the rows at each node"""
+        return self._reduce(np.maximum, values)
+
+    def min(self, values: np.ndarray) -> np.ndarray:
+        """Gets the min of the rows at each node"""
+        return self._reduce(np.minimum, values)
+
+    def abs_max(self, values: np.ndarray) -> np.ndarray:
+        """Gets the signed value with the largest magnitude at each node"""
+        max_values = self.max(values)
+        min_values = self.min(values)
+        return np.where(np.abs(max_values) >= np.abs(min_values), max_values, min_values)
+
+    def _reduce(self, ufunc, values: np.ndarray) -> np.ndarray:
+        """applies a ufunc to the rows at each node"""
+        values, shape = self._to_rows(values)
+        nodal_values = ufunc.reduceat(values[self.matrix.indices, :],
+                                      self.matrix.indptr[:-1], axis=0)
+        return self._from_rows(nodal_values, shape)
+
+    def _to_rows(self, values: np.ndarray) -> Tuple[np.ndarray, Optional[tuple]]:
+        """reshapes (ntimes, nrows, ...) values to (nrows, ntimes*...)"""
+        values = np.asarray(values)
+        nrows = self.matrix.shape[1]
+        if values.ndim == 1:
+            assert len(values) == nrows, f'nrows={len(values)}; expected {nrows}'
+            return values.reshape(nrows, 1), None
+        assert values.shape[1] == nrows, f'nrows={values.shape[1]}; expected {nrows}'
+        shape = values.shape
+        values2 = np.moveaxis(values, 1, 0).reshape(nrows, -1)
+        return values2, shape
+
+    def _from_rows(self, nodal_values: np.ndarray, shape: Optional[tuple]) -> np.ndarray:
+        """reshapes (nnodes, ntimes*...) values to (ntimes, nnodes, ...)"""
+        if shape is None:
+            return nodal_values[:, 0]
+        shape2 = (self.nnodes, shape[0]) + shape[2:]
+        return np.moveaxis(nodal_values.reshape(shape2), 0, 1)
+
+
+def get_nodal_averager(model: BDF, eids: np.ndarray) -> NodalAverager:
+    """
+    Gets the NodalAverager for a set of element rows, which is cached
+    by model, so multiple results/subcases can reuse it
+
+    The cache is keyed on the element connectivity, so modifying the
+    elements of the model creates a new averager.
+
+    Parameters
+    ----------
+    model : BDF
+        the model with the elements
+    eids : (nrows, ) int ndarray
+        the element id of each row of the result
+
+    """
+    eids = np.asarray(eids)
+    ueids, ieids = np.unique(eids, return_inverse=True)
+    nnodes, all_nids = _get_connectivity(model, ueids)
+    key = (eids.tobytes(), nnodes.tobytes(), all_nids.tobytes())
+
+    model_id = id(model)
+    model_ref, averagers = _AVERAGER_CACHE.get(model_id, (None, None))
+    if model_ref is None or model_ref() is not model:
+        # a new model (or a dead model that reused the id)
+        averagers = {}
+        _AVERAGER_CACHE[model_id] = (weakref.ref(model), averagers)
+        weakref.finalize(model, _pop_averagers, model_id, averagers)
+
+    try:
+        averager = averagers[key]
+    except KeyError:
+        averager = NodalAverager._from_connectivity(eids, ieids, nnodes, all_nids)
+        averagers[key] = averager
+    return averager
+
+
+def _pop_averagers(model_id: int, averagers: dict) -> None:
+    """removes the averagers of a deleted model, but not a newer model with the same id"""
+    model_averagers = _AVERAGER_CACHE.get(model_id, (None, None))[1]
+    if model_averagers is averagers:
+        del _AVERAGER_CACHE[model_id]
+
+
+def _get_connectivity(model: BDF, ueids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gets the connectivity of the unique elements
+
+    Returns
+    -------
+    nnodes : (nelements, ) int ndarray
+        the number of nodes of each element
+    all_nids : (sum(nnodes), ) int ndarray
+        the nodes of the elements
+
+    """
+    elements = model.elements
+    nids_list = []
+    nnodes = np.zeros(len(ueids), dtype='int64')
+    for i, eid in enumerate(ueids):
+        # mid-side nodes may be None
+        nids = [nid for nid in elements[eid].node_ids if nid]
+        nids_list.extend(nids)
+        nnodes[i] = len(nids)
+    return nnodes, np.array(nids_list, dtype='int64')
+
+
+def von_mises_2d(oxx, oyy, txy):
+    """calculates the plane stress von Mises stress"""
+    return np.sqrt(oxx ** 2 + oyy ** 2 - oxx * oyy + 3. * txy ** 2)
+
+
+def von_mises_3d(oxx, oyy, ozz, txy, tyz, txz):
+    """calculates the von Mises stress"""
+    return np.sqrt(0.5 * ((oxx - oyy) ** 2 + (oyy - ozz) ** 2 + (ozz - oxx) ** 2) +
+                   3. * (txy ** 2 + tyz ** 2 + txz ** 2))
+
+
+def principal_2d(oxx, oyy, txy):
+    """
+    Calculates the plane stress principal stresses
+
+    Returns
+    -------
+    angle : float ndarray
+        the angle to the max principal stress (degrees)
+    omax / omin : float ndarray
+        the max/min principal stress
+
+    """
+    center = (oxx + oyy) / 2.
+    radius = np.sqrt(((oxx - oyy) / 2.) ** 2 + txy ** 2)
+    angle = np.degrees(np.arctan2(2. * txy, oxx - oyy)) / 2.
+    return angle, center + radius, center - radius
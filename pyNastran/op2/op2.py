@@ -43,7 +43,8 @@ from pyNastran.op2.writer.op2_writer import OP2Writer
 #from pyNastran.op2.op2_interface.op2_f06_common import Op2F06Attributes
 from pyNastran.op2.op2_interface.op2_scalar import OP2_Scalar
 from pyNastran.op2.op2_interface.transforms import (
-    transform_displacement_to_global, transform_gpforce_to_globali)
+    transform_displacement_to_global, transform_gpforce_to_globali,
+    get_cd_transform_stack)
 from pyNastran.utils import check_path
 if TYPE_CHECKING:  # pragma: no cover
     from h5py import File as H5File
@@ -86,6 +87,9 @@ class OP2(OP2_Scalar, OP2Writer):
         self.post = None
         self.table_count = defaultdict(int)
 
+        # (icd_transform, coords, xyz_cid0, transform_stack)
+        self._cd_transform_cache = None
+
     def __del__(self) -> None:
         if hasattr(self, 'h5_file') and self.h5_file is not None:
             self.h5_file.close()
@@ -396,6 +400,7 @@ class OP2(OP2_Scalar, OP2Writer):
         state = self.__dict__.copy()
         # Remove the unpicklable entries.
         del state['log']
+        state['_cd_transform_cache'] = None
         if hasattr(self, 'results') and hasattr(self._results, 'log'):
             del state['_results'].log
         #if hasattr(self, '_card_parser_b'):
@@ -462,6 +467,8 @@ class OP2(OP2_Scalar, OP2Writer):
             'is_vectorized',
             'isubcase',
             'log',
+            'matrix_output_dirname',
+            'matrix_output_format',
             'matrix_tables',
             'mode',
             'n',
@@ -585,12 +592,12 @@ class OP2(OP2_Scalar, OP2Writer):
 
         """
         #assert len(self._frequencies) > 0, self._frequencies
-        if 'MP3F' in self.matrices:
+        if 'MP3F' in self.matrices and self.matrices['MP3F'].data is not None:
             self.monitor3 = MONPNT3(self._frequencies, self.matrices['MP3F'])
 
         # these are totally wrong...it doesn't go by component;
         # it goes by inertial, external, flexibility, etc.
-        if 'PERF' in self.matrices:
+        if 'PERF' in self.matrices and self.matrices['PERF'].data is not None:
             #self.monitor1 = MONPNT1(
                 #self._frequencies, self.matrices, [
                 # :)       ?       :)      :)      ?       ?
@@ -1177,6 +1184,7 @@ class OP2(OP2_Scalar, OP2Writer):
             self.applied_loads,
             self.load_vectors,
         ]
+        transform_stack = self._get_cd_transform_stack(icd_transform, coords, xyz_cid0)
         for disp_like_dict in disp_like_dicts:
             if not disp_like_dict:
                 continue
@@ -1186,7 +1194,25 @@ class OP2(OP2_Scalar, OP2Writer):
                     continue
                 self.log.debug("transforming %s" % result.table_name)
                 transform_displacement_to_global(subcase, result, icd_transform, coords, xyz_cid0,
-                                                 self.log, debug=debug)
+                                                 self.log, debug=debug,
+                                                 transform_stack=transform_stack)
+
+    def _get_cd_transform_stack(self, icd_transform, coords, xyz_cid0):
+        """
+        Gets the per-node output coordinate system transforms, which are
+        only rebuilt when a different icd_transform/coords/xyz_cid0 is
+        passed in.
+
+        .. warning:: the inputs are compared by identity, so don't
+                     modify them inplace between calls
+        """
+        cache = self._cd_transform_cache
+        if (cache is not None and cache[0] is icd_transform and
+                cache[1] is coords and cache[2] is xyz_cid0):
+            return cache[3]
+        transform_stack = get_cd_transform_stack(icd_transform, coords, xyz_cid0)
+        self._cd_transform_cache = (icd_transform, coords, xyz_cid0, transform_stack)
+        return transform_stack
 
     def transform_gpforce_to_global(self, nids_all, nids_transform, icd_transform, coords, xyz_cid0=None):
         """
@@ -3590,154 +3590,124 @@ class OP2Reader:
             raise RuntimeError(self.size)
 
         itable = -3
-        unused_j = None
-
         niter = 0
         niter_max = 100000000
 
-        GCi = []
-        GCj = []
-        reals = []
-        jj = 1
-        while niter < niter_max:
-            # nvalues = self.get_marker1(rewind=True)
-            self.read_markers([itable, 1])
-            one = self.get_marker1(rewind=False)
-
-            if one:  # if keep going
-                nvalues = self.get_marker1(rewind=True)
+        # each string is [irow, values...]; decode it straight into
+        # preallocated CSC arrays instead of building GCi/GCj/reals lists
+        int_dtype = op2.idtype8
+        if tout in [1, 3] and self.size == 4:
+            float_dtype = op2.fdtype
+        else:
+            float_dtype = op2.double_dtype
+        if tout in [3, 4]:
+            value_dtype = np.dtype(
+                op2._uendian + ("c8" if float_dtype.itemsize == 4 else "c16")
+            )
+        else:
+            value_dtype = float_dtype
+
+        filename = self._get_matrix_output_filename(utable_name)
+        is_dense = table_name in DENSE_MATRICES
+        h5_file = None
+        if dtype == "???":
+            # the values are still read, so the table can be skipped
+            filename = None
+        if filename is not None and filename.endswith(".h5") and not is_dense:
+            import h5py
+
+            h5_file = h5py.File(filename, "w")
+        buffer_dtype = value_dtype if dtype == "???" else dtype
+        columns = _CscColumnBuffer(mrows, ncols, buffer_dtype, h5_file=h5_file)
+
+        jj = 0
+        try:
+            while niter < niter_max:
+                self.read_markers([itable, 1])
+                one = self.get_marker1(rewind=False)
 
-                while nvalues >= 0:
-                    nvalues = self.get_marker1(rewind=False)
-                    (
-                        fmt,
-                        unused_nfloats,
-                        nterms,
-                    ) = self._get_matrix_row_fmt_nterms_nfloats(nvalues, tout)
-                    GCjj = [jj] * nterms
-                    GCj += GCjj
-
-                    # -----------
-                    data = self.read_block()
-                    if self.size == 8:
-                        # self.log.warning('skipping matrix')
-                        # self.show_data(data, types='ifqd')
-                        fmt = mapfmt(fmt, self.size)
-                        # self.log.warning(fmt)
-                        # print('***itable=%s nvalues=%s fmt=%r' % (itable, nvalues, fmt))
-                        # continue
-                    out = unpack(fmt, data)
-                    # print(out)
-                    ii = out[0]
-                    values = out[1:]
-
-                    # list(range(2, 10))
-                    # [2, 3, 4, 5, 6, 7, 8, 9]
-                    GCii = list(range(ii, ii + nterms))
-                    GCi += GCii
-                    reals += values
+                if one:  # if keep going
                     nvalues = self.get_marker1(rewind=True)
-                    if self.debug_file:
-                        self.binary_debug.write("  GCi = %s\n" % GCii)
-                        self.binary_debug.write("  GCj = %s\n" % GCjj)
-                        self.binary_debug.write("  reals/imags = %s\n" % str(values))
-                assert len(GCi) == len(GCj), "nGCi=%s nGCj=%s" % (len(GCi), len(GCj))
-                if self.size == 4:
-                    if tout in [1, 2]:
-                        assert len(GCi) == len(reals), "tout=%s nGCi=%s nreals=%s" % (
-                            tout,
-                            len(GCi),
-                            len(reals),
-                        )
-                    else:
-                        assert len(GCi) * 2 == len(
-                            reals
-                        ), "tout=%s nGCi=%s nreals=%s" % (
-                            tout,
-                            len(GCi) * 2,
-                            len(reals),
-                        )
-                jj += 1
-            else:
-                nvalues = self.get_marker1(rewind=False)
-                assert nvalues == 0, nvalues
 
-                matrix = self._cast_matrix_mat(
-                    GCi, GCj, mrows, ncols, reals, tout, dtype
-                )
-                if table_name in DENSE_MATRICES:
-                    matrix = matrix.toarray()
-                m.data = matrix
-                if matrix is not None:
-                    op2.matrices[table_name.decode("utf-8")] = m
-                # nvalues = self.get_marker1(rewind=True)
-                return
-            itable -= 1
-            niter += 1
+                    while nvalues >= 0:
+                        nvalues = self.get_marker1(rewind=False)
+                        data = self.read_block()
+                        # we subtract 1 to the indices to account for Fortran
+                        irow = int(np.frombuffer(data, dtype=int_dtype, count=1)[0]) - 1
+                        values = np.frombuffer(data, dtype=value_dtype, offset=self.size)
+                        columns.add(jj, irow, values)
+                        nvalues = self.get_marker1(rewind=True)
+                        if self.debug_file:
+                            self.binary_debug.write(
+                                "  icol=%s irow=%s nterms=%s\n" % (jj, irow, len(values))
+                            )
+                            self.binary_debug.write("  reals/imags = %s\n" % str(values))
+                    jj += 1
+                else:
+                    nvalues = self.get_marker1(rewind=False)
+                    assert nvalues == 0, nvalues
+
+                    if h5_file is not None:
+                        columns.close(form=form)
+                        m.filename = filename
+                        return
+
+                    matrix = self._cast_matrix_mat(columns, mrows, ncols, dtype)
+                    if matrix is None:
+                        return
+                    if is_dense:
+                        matrix = matrix.toarray()
+                    elif filename is not None:
+                        _save_sparse_matrix(filename, matrix, form)
+                        m.filename = filename
+                        return
+                    if scipy.sparse.issparse(matrix):
+                        matrix = matrix.tocoo()
+                    m.data = matrix
+                    return
+                itable -= 1
+                niter += 1
+        finally:
+            if h5_file is not None:
+                h5_file.close()
         raise RuntimeError("MaxIteration: this should never happen; n=%s" % niter_max)
 
-    def _cast_matrix_mat(self, GCi, GCj, mrows, ncols, reals, tout, dtype):
+    def _cast_matrix_mat(self, columns, mrows, ncols, dtype):
         """helper method for _read_matrix_mat"""
         op2 = self.op2
-        # assert max(GCi) <= mrows, 'GCi=%s GCj=%s mrows=%s' % (GCi, GCj, mrows)
-        # assert max(GCj) <= ncols, 'GCi=%s GCj=%s ncols=%s' % (GCi, GCj, ncols)
-
-        # we subtract 1 to the indicides to account for Fortran
-        GCi = np.array(GCi, dtype="int32") - 1
-        GCj = np.array(GCj, dtype="int32") - 1
+        if dtype == "???":
+            self.log.warning("what is the dtype?")
+            return None
         try:
-            if dtype == "???":
-                matrix = None
-                self.log.warning("what is the dtype?")
-            elif tout in [1, 2]:
-                # real
-                real_array = np.array(reals, dtype=dtype)
-                matrix = scipy.sparse.coo_matrix(
-                    (real_array, (GCi, GCj)), shape=(mrows, ncols), dtype=dtype
-                )
-                # self.log.info('created %s (real)' % self.table_name)
-            elif tout in [3, 4]:
-                # complex
-                real_array = np.array(reals, dtype=dtype)
-                nvalues_matrix = real_array.shape[0] // 2
-                real_complex = real_array.reshape((nvalues_matrix, 2))
-                real_imag = real_complex[:, 0] + real_complex[:, 1] * 1j
-                if self.binary_debug:
-                    # self.binary_debug.write('reals = %s' % real_complex[:, 0])
-                    # self.binary_debug.write('imags = %s' % real_complex[:, 1])
-                    self.binary_debug.write("real_imag = %s" % real_imag)
-                matrix = scipy.sparse.coo_matrix(
-                    (real_imag, (GCi, GCj)), shape=(mrows, ncols), dtype=dtype
-                )
-                # msg = 'created %s (complex)' % self.table_name
-                # self.log.debug(msg)
-                # raise RuntimeError(msg)
-            else:
-                raise RuntimeError("this should never happen")
+            matrix = columns.to_csc()
         except ValueError:
             self.log.warning("shape=(%s, %s)" % (mrows, ncols))
-            self.log.warning("cant make a coo/sparse matrix...trying dense")
-
-            if dtype == "???":
-                matrix = None
-                self.log.warning("what is the dtype?")
+            self.log.warning("cant make a sparse matrix...trying dense")
+            real_array = columns.data[: columns.n]
+            self.log.debug(
+                "shape=%s mrows=%s ncols=%s" % (str(real_array.shape), mrows, ncols)
+            )
+            if len(real_array) == mrows * ncols:
+                real_array = real_array.reshape(mrows, ncols)
+                self.log.info("created %s" % op2.table_name)
             else:
-                real_array = np.array(reals, dtype=dtype)
-                self.log.debug(
-                    "shape=%s mrows=%s ncols=%s" % (str(real_array.shape), mrows, ncols)
+                self.log.warning(
+                    "cant reshape because invalid sizes : created %s" % op2.table_name
                 )
-                if len(reals) == mrows * ncols:
-                    real_array = real_array.reshape(mrows, ncols)
-                    self.log.info("created %s" % op2.table_name)
-                else:
-                    self.log.warning(
-                        "cant reshape because invalid sizes : created %s"
-                        % op2.table_name
-                    )
-
-                matrix = real_array
+            matrix = real_array
         return matrix
 
+    def _get_matrix_output_filename(self, table_name: str) -> Optional[str]:
+        """
+        Gets the filename a MATRIX/MATPOOL table is written to
+        (see ``OP2.set_matrix_output``) or None if it's held in memory
+        """
+        op2 = self.op2
+        dirname = getattr(op2, "matrix_output_dirname", None)
+        if dirname is None:
+            return None
+        return os.path.join(dirname, "%s.%s" % (table_name, op2.matrix_output_format))
+
     def _skip_matrix_mat(self):
         """
         Reads a matrix in "standard" form.
@@ -3934,11 +3904,9 @@ class OP2Reader:
         # matrix_name, junk1, matrix_shape, tin, tout,
         # is_phase, junk2, ncols_gset))
 
-        is_complex = False
         if tin > 2 or tout > 2:
-            is_complex = True
             assert is_phase == 0, "is_phase=%s" % is_phase
-            imags = []
+        is_complex = tout in [3, 4]
 
         if tout == 1:
             dtype = "float32"
@@ -3974,14 +3942,7 @@ class OP2Reader:
         is_symmetric = matrix_shape == 6
         # is_phase_flag = is_phase > 0
 
-        if tout in [1, 3]:
-            # works for float32, complex64
-            ints = np.frombuffer(data[48:], dtype=op2.idtype).copy()
-            floats = np.frombuffer(data[48:], dtype=op2.fdtype).copy()
-            temp_ints = ints
-        else:
-            # works for float64, complex128
-            temp_ints = np.frombuffer(data[48:], dtype=op2.idtype).copy()
+        temp_ints = np.frombuffer(data[48:], dtype=op2.idtype)
 
         # find the first index with ()-1,-1)
         iminus1 = np.where(temp_ints[:-1] == -1)[0]
@@ -4000,106 +3961,71 @@ class OP2Reader:
         col_dofs_short = temp_ints[istart + 1]
         # nj2 = len(istart)  ## TODO: why is this wrong???
 
-        row_nids = []
-        row_dofs = []
-        col_nids = []
-        col_dofs = []
-        reals = []
-        imags = []
-        for col_nidi, col_dofi, istarti, istopi in zip(
-            col_nids_short, col_dofs_short, istart + 2, istop
-        ):
-            ## TODO: preallocate arrays
-            imag = None
-            # The float32/complex64 blocks are really simple
-            # because we can just use the data is from the temp_ints block.
-            # We calculate istart/istop and directly access the float data.
-            #
-            # The float64/complex128 blocks are more complicated.
-            # It's easier to just use istart/istop to calculate datai
-            # case that, and then slice it.
-            #
-            # In all cases, we use istart/istop to calculate row/col nid/dof
-            # because they are always int32.  Only the real/imag types change.
-            if dtype == "float32":
-                irow = np.arange(istarti, istopi - 1, step=3, dtype="int32")
-                real = floats[irow + 2]
-            elif dtype == "complex64":
-                irow = np.arange(istarti, istopi - 1, step=4, dtype="int32")
-                real = floats[irow + 2]
-                imag = floats[irow + 3]
-
-            elif dtype == "float64":
-                datai = data[48 + (istarti * 4) : 48 + (istopi * 4)]
-                irow = np.arange(istarti, istopi - 1, step=4, dtype="int32")
-                assert len(datai) % 8 == 0, len(datai) / 8
-                real = np.frombuffer(datai, dtype=fdtype)[1::2].copy()
-
-            elif dtype == "complex128":
-                datai = data[48 + (istarti * 4) : 48 + (istopi * 4)]
-
-                # iword
-                # -----
-                #   0    1    3     5   <---- iword
-                #   1    1    2     2   <---- nwords
-                # (nid, dof, real, imag)
-                irow = np.arange(istarti, istopi - 1, step=6, dtype="int32")
-                assert len(datai) % 8 == 0, len(datai) / 8
-                floats = np.frombuffer(datai, dtype=fdtype).copy()
-
-                # ndoubles
-                # --------
-                #  <---0--->   1     2    <----- iword
-                #      1       1     1    <----- nwords
-                # (nid, dof, real, imag)
-                real = floats[1::3]
-                imag = floats[2::3]
-            else:
-                msg = "%s is not supported" % dtype
-                self.log.error(msg)
-                raise RuntimeError(msg)
-
-            if len(irow) != len(real):
-                msg = "nrow=%s nreal=%s nimag=%s" % (len(irow), len(real), len(imag))
-                raise RuntimeError(msg)
+        # A column is a run of (nid, dof, real[, imag]) terms from
+        # istart+2 to istop.  The number of words per term depends on
+        # the precision:
+        #   float32=3, complex64=4, float64=4, complex128=6
+        #
+        # We find the word index of every term in all the columns at
+        # once and gather the nid/dof/values with a single fancy index.
+        # The values are gathered as raw bytes, so a float64 doesn't
+        # need to be aligned on an 8-byte boundary.
+        nwords_per_term = {
+            "float32": 3,
+            "complex64": 4,
+            "float64": 4,
+            "complex128": 6,
+        }[dtype]
+        word_start = istart + 2
+        nterms = np.maximum(
+            (istop - 1 - word_start + nwords_per_term - 1) // nwords_per_term, 0
+        )
+        nterms_total = nterms.sum()
+        iterm0 = np.repeat(np.cumsum(nterms) - nterms, nterms)
+        irow = (
+            np.repeat(word_start, nterms)
+            + (np.arange(nterms_total) - iterm0) * nwords_per_term
+        )
 
-            # the row index; [1, 2, ..., 43]
-            row_nid = temp_ints[irow]
-
-            # the dof; [0, 0, ..., 0.]
-            row_dof = temp_ints[irow + 1]
-            urow_dof = np.unique(row_dof)
-            for udofi in urow_dof:
-                if udofi not in [0, 1, 2, 3, 4, 5, 6]:
-                    msg = (
-                        "udofi=%s is invalid; must be in [0, 1, 2, 3, 4, 5, 6]; dofs=%s"
-                        % (udofi, np.asarray(urow_dof, dtype="int32").tolist())
-                    )
-                    raise ValueError(msg)
+        words = np.frombuffer(data, dtype="uint8", offset=48)
+        words = words[: len(temp_ints) * temp_ints.itemsize].reshape(
+            len(temp_ints), temp_ints.itemsize
+        )
+        if dtype in ["float32", "complex64"]:
+            real = words[irow + 2].view(fdtype).ravel()
+            imag = words[irow + 3].view(fdtype).ravel() if is_complex else None
+        else:
+            real = np.hstack([words[irow + 2], words[irow + 3]]).view(fdtype).ravel()
+            imag = (
+                np.hstack([words[irow + 4], words[irow + 5]]).view(fdtype).ravel()
+                if is_complex
+                else None
+            )
 
-            ni = len(irow)
-            col_nid = np.ones(ni, dtype="int32") * col_nidi
-            col_dof = np.ones(ni, dtype="int32") * col_dofi
+        if len(irow) != len(real):
+            msg = "nrow=%s nreal=%s" % (len(irow), len(real))
+            raise RuntimeError(msg)
 
-            row_nids.append(row_nid)
-            row_dofs.append(row_dof)
-            col_nids.append(col_nid)
-            col_dofs.append(col_dof)
-            reals.append(real)
-            imags.append(imag)
+        # the row index; [1, 2, ..., 43]
+        row_nids_array = temp_ints[irow]
 
-        row_nids_array = np.hstack(row_nids)
-        row_dofs_array = np.hstack(row_dofs)
+        # the dof; [0, 0, ..., 0.]
+        row_dofs_array = temp_ints[irow + 1]
+        urow_dof = np.unique(row_dofs_array)
+        for udofi in urow_dof:
+            if udofi not in [0, 1, 2, 3, 4, 5, 6]:
+                msg = (
+                    "udofi=%s is invalid; must be in [0, 1, 2, 3, 4, 5, 6]; dofs=%s"
+                    % (udofi, np.asarray(urow_dof, dtype="int32").tolist())
+                )
+                raise ValueError(msg)
 
-        col_nids_array = np.hstack(col_nids)
-        col_dofs_array = np.hstack(col_dofs)
-        real_array = np.hstack(reals)
+        col_nids_array = np.repeat(col_nids_short, nterms)
+        col_dofs_array = np.repeat(col_dofs_short, nterms)
         if is_complex:
-            complex_array = np.hstack(imags)
-            assert len(real_array) == len(complex_array)
-            real_imag_array = real_array + 1.0j * complex_array
+            real_imag_array = real + 1.0j * imag
         else:
-            real_imag_array = real_array
+            real_imag_array = real
 
         self._cast_matrix_matpool(
             utable_name,
@@ -4172,7 +4098,7 @@ class OP2Reader:
             mrows = nj2
 
         try:
-            matrix = scipy.sparse.coo_matrix(
+            matrix = scipy.sparse.csc_matrix(
                 (real_imag_array, (j2, j1)), shape=(mrows, ncols), dtype=dtype
             )
         except ValueError:
@@ -4236,7 +4162,12 @@ class OP2Reader:
             matrix_shape = "rectangular"
 
         m = Matrix(table_name, is_matpool=True, form=matrix_shape)
-        m.data = matrix
+        filename = self._get_matrix_output_filename(table_name)
+        if filename is None:
+            m.data = matrix.tocoo()
+        else:
+            _save_sparse_matrix(filename, matrix, matrix_shape)
+            m.filename = filename
         m.col_nid = col_nids_array
         m.col_dof = col_dofs_array
         m.row_nid = row_nids_array
@@ -5904,74 +5835,154 @@ def grids_comp_array_to_index(
     grids1, comps1, grids2, comps2, make_matrix_symmetric: bool
 ) -> Tuple[Any, Any, int, int, int]:
     """
-    Maps the dofs
+    Maps the (grid, component) pairs of the columns and rows to indices
+
+    The indices are numbered in order of first appearance; the column
+    pairs are numbered first, followed by any new row pairs.
 
     Returns
     -------
-    ja : ???
-        ???
-    jb : ???
-        ???
-    nja : ???
-        ???
-    njb : ???
-        ???
-    nj : ???
-        ???
+    ja : (n, ) int array
+        the column index of each term
+    jb : (n, ) int array
+        the row index of each term
+    nja : int
+        the number of unique column pairs
+    njb : int
+        the number of unique row pairs
+    nj : int
+        the number of unique pairs
     """
-    # from pyNastran.femutils.utils import unique2d
-    ai = np.vstack([grids1, comps1]).T
-    bi = np.vstack([grids2, comps2]).T
-    # print('grids2 =', grids2)
-    # print('comps2 =', comps2)
-    # c = np.vstack([a, b])
-    # assert c.shape[1] == 2, c.shape
-    # urows = unique2d(c)
-    # urows = c
-
-    nid_comp_to_dof_index = {}
-    j = 0
-    a_keys = set()
-    for nid_dof in ai:
-        # nid_dof = (int(nid), int(dof))
-        nid_dof = tuple(nid_dof)
-        if nid_dof not in a_keys:
-            a_keys.add(nid_dof)
-            if nid_dof not in nid_comp_to_dof_index:
-                nid_comp_to_dof_index[nid_dof] = j
-                j += 1
-    nja = len(a_keys)
-    del a_keys
-
-    b_keys = set()
-    for nid_dof in bi:
-        nid_dof = tuple(nid_dof)
-        if nid_dof not in b_keys:
-            b_keys.add(nid_dof)
-        if nid_dof not in nid_comp_to_dof_index:
-            nid_comp_to_dof_index[nid_dof] = j
-            j += 1
-    njb = len(b_keys)
-    del b_keys
-
-    nj = len(nid_comp_to_dof_index)
+    ai = np.column_stack([grids1, comps1])
+    bi = np.column_stack([grids2, comps2])
+    nja = len(np.unique(ai, axis=0))
+    njb = len(np.unique(bi, axis=0))
+
+    abi = np.vstack([ai, bi])
+    unused_unique, ifirst, inverse = np.unique(
+        abi, axis=0, return_index=True, return_inverse=True
+    )
+    # renumber the sorted unique pairs by their first appearance
+    rank = np.empty(len(ifirst), dtype="int32")
+    rank[np.argsort(ifirst, kind="stable")] = np.arange(len(ifirst), dtype="int32")
+    j = rank[inverse.ravel()]
+    nj = len(ifirst)
+
+    na = len(ai)
+    ja = j[:na]
+    jb = j[na:]
     if make_matrix_symmetric:
-        ja = np.zeros(nj, dtype="int32")
-        for i, nid_dof in zip(count(), ai):
-            j[i] = nid_comp_to_dof_index[tuple(nid_dof)]
-        for i, nid_dof in zip(count(), bi):
-            j[i] = nid_comp_to_dof_index[tuple(nid_dof)]
-        return j, j, nj, nj, nj
-    else:
-        ja = np.zeros(grids1.shape, dtype="int32")
-        for i, nid_dof in zip(count(), ai.tolist()):
-            ja[i] = nid_comp_to_dof_index[tuple(nid_dof)]
+        return ja, jb, nj, nj, nj
+    return ja, jb, nja, njb, nj
+
+
+class _CscColumnBuffer:
+    """
+    Accumulates a MATRIX table column-by-column into CSC arrays
 
-        jb = np.zeros(grids2.shape, dtype="int32")
-        for i, nid_dof in zip(count(), bi.tolist()):
-            jb[i] = nid_comp_to_dof_index[tuple(nid_dof)]
+    The data/indices arrays are preallocated and grow geometrically, so
+    a term costs 12-20 bytes instead of a few Python objects.  When
+    ``h5_file`` is given, the arrays are a fixed size block that is
+    streamed to resizable HDF5 datasets whenever it fills up.
+
+    """
+    def __init__(self, nrows: int, ncols: int, dtype: str,
+                 h5_file=None, nvalues_chunk: int = 1_000_000):
+        self.nrows = nrows
+        self.ncols = ncols
+        self.counts = np.zeros(ncols, dtype="int64")
+        self.h5_file = h5_file
+
+        nvalues = 1024 if h5_file is None else nvalues_chunk
+        self.data = np.empty(nvalues, dtype=dtype)
+        self.indices = np.empty(nvalues, dtype="int32")
+        self.n = 0
+        self.nflushed = 0
+        if h5_file is not None:
+            h5_file.create_dataset(
+                "data", shape=(0,), maxshape=(None,), dtype=self.data.dtype,
+                chunks=(min(nvalues, 65536),))
+            h5_file.create_dataset(
+                "indices", shape=(0,), maxshape=(None,), dtype="int32",
+                chunks=(min(nvalues, 65536),))
+
+    def add(self, icol: int, irow: int, values: np.ndarray) -> None:
+        """adds a string of values starting at (irow, icol)"""
+        nvalues = len(values)
+        if icol >= len(self.counts):
+            self.counts = np.hstack([
+                self.counts, np.zeros(icol + 1 - len(self.counts), dtype="int64")])
+        if self.n + nvalues > len(self.data):
+            self._make_room(nvalues)
+        n0 = self.n
+        n1 = n0 + nvalues
+        self.data[n0:n1] = values
+        self.indices[n0:n1] = np.arange(irow, irow + nvalues)
+        self.counts[icol] += nvalues
+        self.n = n1
+
+    def _make_room(self, nvalues: int) -> None:
+        """flushes the block to the HDF5 file or grows the arrays"""
+        if self.h5_file is not None:
+            self._flush()
+            if nvalues <= len(self.data):
+                return
+        nvalues_new = max(2 * len(self.data), self.n + nvalues)
+        data = np.empty(nvalues_new, dtype=self.data.dtype)
+        indices = np.empty(nvalues_new, dtype="int32")
+        data[:self.n] = self.data[:self.n]
+        indices[:self.n] = self.indices[:self.n]
+        self.data = data
+        self.indices = indices
+
+    def _flush(self) -> None:
+        """writes the block to the HDF5 datasets"""
+        n0 = self.nflushed
+        n1 = n0 + self.n
+        for name, values in [("data", self.data), ("indices", self.indices)]:
+            dataset = self.h5_file[name]
+            dataset.resize((n1,))
+            dataset[n0:n1] = values[:self.n]
+        self.nflushed = n1
+        self.n = 0
+
+    def _indptr(self) -> np.ndarray:
+        indptr = np.zeros(len(self.counts) + 1, dtype="int64")
+        np.cumsum(self.counts, out=indptr[1:])
+        return indptr
+
+    def to_csc(self) -> scipy.sparse.csc_matrix:
+        """builds the in-memory sparse matrix"""
+        shape = (self.nrows, max(self.ncols, len(self.counts)))
+        return scipy.sparse.csc_matrix(
+            (self.data[:self.n], self.indices[:self.n], self._indptr()),
+            shape=shape)
+
+    def close(self, form: int) -> None:
+        """writes the remaining block, the column pointers and the shape"""
+        self._flush()
+        h5_file = self.h5_file
+        h5_file.create_dataset("indptr", data=self._indptr())
+        h5_file.attrs["shape"] = (self.nrows, max(self.ncols, len(self.counts)))
+        h5_file.attrs["format"] = "csc"
+        h5_file.attrs["form"] = form
+
+
+def _save_sparse_matrix(filename: str, matrix, form) -> None:
+    """writes a sparse matrix to an .npz or .h5 file"""
+    matrix = matrix.tocsc()
+    if filename.endswith(".npz"):
+        scipy.sparse.save_npz(filename, matrix, compressed=False)
+        return
 
-        return ja, jb, nja, njb, nj
+    import h5py
+    with h5py.File(filename, "w") as h5_file:
+        h5_file.create_dataset("data", data=matrix.data)
+        h5_file.create_dataset("indices", data=matrix.indices)
+        h5_file.create_dataset("indptr", data=matrix.indptr)
+        h5_file.attrs["shape"] = matrix.shape
+        h5_file.attrs["format"] = "csc"
+        h5_file.attrs["form"] = form
 
 
 def eqexin_to_nid_dof_doftype(eqexin1, eqexin2) -> Tuple[Any, Any, Any]:
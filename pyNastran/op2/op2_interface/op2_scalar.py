@@ -559,6 +559,11 @@ class OP2_Scalar(LAMA, ONR, OGPF,
         #: it takes double the RAM, but is easier to use
         self.apply_symmetry = True
 
+        #: write MATRIX/MATPOOL tables to this directory instead of
+        #: holding them in memory (see set_matrix_output)
+        self.matrix_output_dirname = None
+        self.matrix_output_format = 'npz'
+
         LAMA.__init__(self)
         ONR.__init__(self)
         OGPF.__init__(self)
@@ -1753,7 +1758,7 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             'element_name', 'sort_bits', 'code', 'n', 'use_vector', 'ask',
             'stress_bits', 'expected_times', 'table_code', 'sort_code',
             'is_all_subcases', 'num_wide', '_table_mapper', 'label',
-            'apply_symmetry',
+            'apply_symmetry', 'matrix_output_dirname', 'matrix_output_format',
             'words', 'device_code', 'table_name', '_count', 'additional_matrices',
             # 350
             'data_names', '_close_op2',
@@ -2041,6 +2046,41 @@ class OP2_Scalar(LAMA, ONR, OGPF,
             else:
                 self.additional_matrices[matrix_name.encode('latin1')] = matrix
 
+    def set_matrix_output(self, dirname: Optional[str], file_format: str='npz') -> None:
+        """
+        Writes the MATRIX/MATPOOL tables (e.g., KGG, MGG, PHG) to disk
+        as they're read, so the OP2 doesn't hold all of them in memory.
+        Each matrix is stored in CSC form as
+        ``<dirname>/<name>.<file_format>``.  ``op2.matrices[name].data``
+        is None and the filename is stored on
+        ``op2.matrices[name].filename``; use
+        ``op2.matrices[name].load()`` to get the matrix.
+
+        Parameters
+        ----------
+        dirname : str; None
+            the directory to write the matrices to
+            None : hold the matrices in memory
+        file_format : str; default='npz'
+            npz : scipy.sparse.save_npz format
+            h5 : HDF5 file with data/indices/indptr datasets
+
+        .. note:: only the columns of an h5 MATRIX table are streamed to
+                  the file in blocks.  A MATPOOL table (and any npz
+                  matrix) is built in memory, written and then released,
+                  so the peak memory is one matrix.
+
+        .. note:: the dense element matrices (e.g., KELM, MELM) are
+                  always held in memory
+
+        """
+        if file_format not in ['npz', 'h5']:
+            raise ValueError(f'file_format={file_format!r} and must be [npz, h5]')
+        if dirname is not None and not os.path.isdir(dirname):
+            raise NotADirectoryError(f'dirname={dirname!r} is not a directory')
+        self.matrix_output_dirname = dirname
+        self.matrix_output_format = file_format
+
     def _finish(self):
         """
         Clears out the data members contained within the self.words variable.
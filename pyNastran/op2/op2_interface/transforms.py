@@ -1,173 +1,192 @@
 """
 Defines:
+ - inode, cids, transforms, spherical_cids = get_cd_transform_stack(
+       icd_transform, coords, xyz_cid0=None)
+ - apply_cd_transform_stack(data, inode, transforms)
  - transform_displacement_to_global(subcase, result, icd_transform, coords, xyz_cid0,
-                                    log, debug=False)
+                                    log, debug=False, transform_stack=None)
  - transform_gpforce_to_globali(subcase, result,
                                  nids_all, nids_transform,
                                  i_transform, coords, xyz_cid0, log)
 
 """
-import sys
+from typing import List, Dict, Tuple, Optional, Any
 import numpy as np
 
 from pyNastran.femutils.coord_transforms import cylindrical_rotation_matrix
-from pyNastran.femutils.matrix3d import (
-    dot_n33_33,
-    #dot_n33_n33,
-    #dot_33_n33,
-    dot_n33_n3)
 
 
-def transform_displacement_to_global(subcase, result, icd_transform, coords, xyz_cid0,
-                                     log, debug=False):
+# the number of (time, node, 3) values to transform at once
+NVALUES_CHUNK = 3_000_000
+
+def get_cd_transform_stack(icd_transform: Dict[int, np.ndarray],
+                           coords: Dict[int, Any],
+                           xyz_cid0: Optional[np.ndarray]=None,
+                           ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[int]]:
     """
-    Performs an inplace operation to transform the DISPLACMENT, VELOCITY,
-    ACCELERATION result into the global (cid=0) frame
+    Builds the per-node 3x3 transforms for all the rectangular and
+    cylindrical output (CD) coordinate systems at once, so they can be
+    applied to any number of results with ``apply_cd_transform_stack``.
+
+    Parameters
+    ----------
+    icd_transform : dict{int cd : (n,) int ndarray}
+        Dictionary from coordinate id to index of the nodes in
+        ``BDF.point_ids`` that their output (`CD`) in that
+        coordinate system.
+    coords : dict{int cid :Coord()}
+        Dictionary of coordinate id to the coordinate object
+    xyz_cid0 : (nnodes+nspoints, 3) float ndarray; default=None
+        the nodes in the global frame
+        required if CD is cylindrical or spherical
+
+    Returns
+    -------
+    inode : (n, ) int ndarray
+        the sorted indices of the nodes to transform
+    cids : (n, ) int ndarray
+        the output coordinate system of each node
+    transforms : (n, 3, 3) float ndarray
+        the transformation matrix for each node, such that
+        ``vector_global = transforms[i] @ vector_cd``
+    spherical_cids : List[int]
+        the spherical output coordinate systems, which aren't included
+        in the stack
 
     """
-    #print('result.name = ', result.class_name)
-    data = result.data
-    nnodesi = data.shape[1]
-    for cid, inode in icd_transform.items():
-        if cid in [-1, 0]:
+    inodes = []
+    cids = []
+    transforms = []
+    spherical_cids = []
+    for cid, inode in sorted(icd_transform.items()):
+        if cid in [-1, 0] or len(inode) == 0:
             continue
         coord = coords[cid]
         coord_type = coord.type
         cid_transform = coord.beta()
 
         # a global coordinate system has 1.0 along the main diagonal
-        is_global_cid = False
-        if np.array_equal([1., 1., 1.], np.diagonal(cid_transform)):
-            is_global_cid = True
-
-        if not is_global_cid and debug:
-            log.debug('coord\n%s' % coord)
-            log.debug(cid_transform)
-            log.debug('inode = [%s]' % ', '.join([str(val).rstrip('L') for val in inode.tolist()]))
-            log.debug('data.shape = %s' % str(data.shape))
-            log.debug('len(inode) = %s' % len(inode))
-            assert np.array_equal(inode, np.unique(inode))
+        is_global_cid = np.array_equal([1., 1., 1.], np.diagonal(cid_transform))
 
         if coord_type in ['CORD2R', 'CORD1R']:
             if is_global_cid:
-                #self.log.debug('is_global_cid')
-                continue
-            #self.log.debug('rectangular')
-
-
-            # isat_tran.op2
-            #  - nspoint = 4
-            #  - ngrid = 5379
-            #
-            #  - ntotal = 5383
-            #  data.shape = (101, 8, 6)
-            try:
-                translation = data[:, inode, :3]
-                rotation = data[:, inode, 3:]
-            except IndexError:
-                log.warning('shape of inode is incorrect')
-                translation = np.full(inode.shape, np.nan, dtype=data.dtype)
-                rotation = np.full(inode.shape, np.nan, dtype=data.dtype)
-                print(data.shape, inode.shape, nnodesi)
-                print(inode[:nnodesi].shape)
                 continue
-                translation = data[:, inode[:nnodesi], :3]
-                rotation = data[:, inode[:nnodesi], 3:]
-            data[:, inode, :3] = translation @ cid_transform
-            data[:, inode, 3:] = rotation @ cid_transform
+            # vector @ cid_transform
+            xforms = np.broadcast_to(cid_transform.T, (len(inode), 3, 3))
 
         elif coord_type in ['CORD2C', 'CORD1C']:
-            #self.log.debug('cylindrical')
             if xyz_cid0 is None:
                 msg = 'xyz_cid0 is required for cylindrical coordinate transforms'
                 raise RuntimeError(msg)
-            _transform_cylindrical_displacement(inode, data, coord, xyz_cid0, cid_transform,
-                                                is_global_cid)
+            xyzi = xyz_cid0[inode, :]
+            rtz_cid = coord.xyz_to_coord_array(xyzi)
+            thetar = np.radians(rtz_cid[:, 1])
+            xforms = cylindrical_rotation_matrix(thetar, dtype='float64')
+            if not is_global_cid:
+                xforms = xforms @ cid_transform
 
         elif coord_type in ['CORD2S', 'CORD1S']:
-            #print('spherical')
             if xyz_cid0 is None:
                 msg = ('xyz_cid is required for spherical '
                        'coordinate transforms')
                 raise RuntimeError(msg)
-            _transform_spherical_displacement(inode, data, coord, xyz_cid0, cid_transform,
-                                              is_global_cid)
+            spherical_cids.append(cid)
+            continue
         else:
             raise RuntimeError(coord)
+        inodes.append(inode)
+        cids.append(np.full(len(inode), cid, dtype='int32'))
+        transforms.append(xforms)
 
+    if len(inodes) == 0:
+        return (np.zeros(0, dtype='int32'), np.zeros(0, dtype='int32'),
+                np.zeros((0, 3, 3), dtype='float64'), spherical_cids)
 
-def _transform_cylindrical_displacement(inode, data, coord, xyz_cid0, cid_transform, is_global_cid):
-    """helper method for transform_displacement_to_global"""
-    xyzi = xyz_cid0[inode, :]
-    rtz_cid = coord.xyz_to_coord_array(xyzi)
+    inode = np.hstack(inodes)
+    isort = np.argsort(inode, kind='stable')
+    inode = inode[isort]
+    cids = np.hstack(cids)[isort]
+    transforms = np.vstack(transforms)[isort, :, :]
+    return inode, cids, transforms, spherical_cids
 
-    #print('rtz_cid:')
-    #print(rtz_cid)
-    thetad = rtz_cid[:, 1]
-    thetar = np.radians(thetad)
-    #print('thetad[cid=%s] = %s' % (coord.cid, thetad))
-    #print('thetar = ', thetar)
-    #self.log.debug('thetad = %s' % list(thetad))
 
-    #np.set_printoptions(precision=None, threshold=None, edgeitems=None, linewidth=None, suppress=True,
-                        #nanstr=None, infstr=None, formatter=None, sign=None, floatmode=None)
-    xforms = cylindrical_rotation_matrix(thetar, dtype='float64')
-    #print('xforms.shape = %s' % str(xforms.shape))
+def apply_cd_transform_stack(data: np.ndarray, inode: np.ndarray,
+                             transforms: np.ndarray) -> None:
+    """
+    Performs an inplace transformation of the translational and
+    rotational components of a (ntimes, nnodes, 6) result
 
-    for itime in range(data.shape[0]):
-        translation = data[itime, inode, :3]
-        rotation = data[itime, inode, 3:]
-        #theta_max1 = translation[:, 1].max()
-        #theta_max2 = rotation[:, 1].max()
-        #print('theta_max = ', max(theta_max1, theta_max2))
+    The time steps are processed in chunks to limit the temporary
+    memory.
+
+    Parameters
+    ----------
+    data : (ntimes, nnodes, 6) float/complex ndarray
+        the result to transform
+    inode : (n, ) int ndarray
+        the indices of the nodes to transform
+    transforms : (n, 3, 3) float ndarray
+        the transformation matrix for each node
+
+    """
+    nnodes = len(inode)
+    if nnodes == 0:
+        return
+    ntimes = data.shape[0]
+    ntimes_chunk = max(1, NVALUES_CHUNK // (3 * nnodes))
+    for itime0 in range(0, ntimes, ntimes_chunk):
+        itime1 = min(itime0 + ntimes_chunk, ntimes)
+        datai = data[itime0:itime1, inode, :]
+        data[itime0:itime1, inode, :3] = np.einsum('nij,tnj->tni', transforms, datai[:, :, :3])
+        data[itime0:itime1, inode, 3:] = np.einsum('nij,tnj->tni', transforms, datai[:, :, 3:])
+
+
+def transform_displacement_to_global(subcase, result, icd_transform, coords, xyz_cid0,
+                                     log, debug=False, transform_stack=None):
+    """
+    Performs an inplace operation to transform the DISPLACMENT, VELOCITY,
+    ACCELERATION result into the global (cid=0) frame
+
+    Parameters
+    ----------
+    transform_stack : tuple; default=None -> build it
+        the output of ``get_cd_transform_stack``, which may be reused
+        across results
+
+    """
+    #print('result.name = ', result.class_name)
+    data = result.data
+    nnodesi = data.shape[1]
+    if transform_stack is None:
+        transform_stack = get_cd_transform_stack(icd_transform, coords, xyz_cid0)
+    inode, cids, transforms, spherical_cids = transform_stack
+
+    if debug:
+        for cid in np.unique(cids):
+            log.debug('coord\n%s' % coords[cid])
+            log.debug(coords[cid].beta())
+            inodei = inode[cids == cid]
+            log.debug('inode = [%s]' % ', '.join([str(val) for val in inodei.tolist()]))
+            log.debug('data.shape = %s' % str(data.shape))
+            log.debug('len(inode) = %s' % len(inodei))
+
+    if len(inode) and inode[-1] >= nnodesi:
+        # skip the coordinate systems with nodes that aren't in the result
+        bad_cids = np.unique(cids[inode >= nnodesi])
+        log.warning('shape of inode is incorrect; skipping cids=%s' % bad_cids.tolist())
+        is_valid = ~np.in1d(cids, bad_cids)
+        inode = inode[is_valid]
+        transforms = transforms[is_valid, :, :]
+
+    apply_cd_transform_stack(data, inode, transforms)
+
+    for cid in spherical_cids:
+        coord = coords[cid]
+        cid_transform = coord.beta()
+        is_global_cid = np.array_equal([1., 1., 1.], np.diagonal(cid_transform))
+        _transform_spherical_displacement(icd_transform[cid], data, coord, xyz_cid0,
+                                          cid_transform, is_global_cid)
 
-        if is_global_cid:
-            translation2 = dot_n33_n3(xforms, translation)
-            rotation2 = dot_n33_n3(xforms, rotation)
-        else:
-            #print('cid_transform[cid=%s]:\n%s' % (coord.cid, cid_transform))
-            #print('xforms:\n%s' % (xforms))
-            #xforms2 = dot_33_n33(xforms, cid_transform)  # wrong shape
-            #xforms2a = dot_33_n33(cid_transform, xforms)
-            #xforms2b = dot_n33_33(xforms, cid_transform)
-            #xforms2b = xforms
-            # triple products
-            #xforms2c = dot_33_n33(cid_transform.T, dot_n33_33(xforms, cid_transform))
-            #xforms2d = dot_33_n33(cid_transform, dot_n33_33(xforms, cid_transform.T))
-
-            #print('xform A:\n%s'  % xforms2a)
-            #print('xform B:\n%s'  % xforms2b)
-            #translation2 = dot_n33_n3(xforms2a, translation)
-            #xforms2 = xforms2b
-            if 1:
-                xforms2b = dot_n33_33(xforms, cid_transform)
-                translation2 = dot_n33_n3(xforms2b, translation)
-                rotation2 = dot_n33_n3(xforms2b, rotation)
-            elif 0:  ## pragma: no cover
-                xforms2b = dot_n33_33(xforms, cid_transform)
-                translation2a = dot_n33_n3(xforms2b, translation)
-                rotation2a = dot_n33_n3(xforms2b, rotation)
-                print('translation2a.shape =', translation2a.shape)
-                assert translation.shape == translation2a.shape
-
-                translation2 = translation2a @ cid_transform
-                rotation2 = rotation2a @ cid_transform
-
-            elif 0:  ## pragma: no cover
-                # bad shape
-                translation2a = dot_n33_n3(xforms, translation)
-                rotation2a = dot_n33_n3(xforms, rotation)
-                print('translation2a.shape =', translation2a.shape)
-                assert translation.shape == translation2a.shape
-
-                translation2 = cid_transform @ translation2a @ cid_transform
-                rotation2 = cid_transform @ rotation2a @ cid_transform
-            else:  ## pragma: no cover
-                raise NotImplementedError('pick an option...')
-        #print('translation.shape', translation.shape)
-        #print('translation2.shape', translation2.shape)
-        data[itime, inode, :3] = translation2
-        data[itime, inode, 3:] = rotation2
 
 def _transform_spherical_displacement(inode, data, coord, xyz_cid0, cid_transform, is_global_cid):
     """helper method for transform_displacement_to_global"""
@@ -200,13 +219,28 @@ def transform_gpforce_to_globali(subcase, result,
     Performs an inplace operation to transform the GPFORCE result
     into the global (cid=0) frame
 
+    The cylindrical/spherical (R, theta, z/phi) directions depend on
+    the position of the node, so each grid point force row gets its own
+    transform and all the output systems are applied in one pass.
+
     """
     log.debug('result.name = %s' % result.class_name)
     data = result.data
 
+    if not result.is_unique: # TODO: doesn't support preload
+        raise NotImplementedError(result)
+
+    #self.node_element = zeros((self.ntimes, self.ntotal, 2), dtype='int32')
+    nids_all_gp = result.node_element[0, :, 0]
+    nids_all = np.asarray(nids_all)
+
+    # the transformed grid point force rows and their transforms
+    igps = []
+    transforms = []
+
     # inode_xyz :
     #    the indices of the nodes in the model grid point list
-    for cid, inode_xyz in i_transform.items():
+    for cid, unused_inode_xyz in sorted(i_transform.items()):
         log.debug('cid = %s' % cid)
         if cid in [-1, 0]:
             continue
@@ -215,169 +249,83 @@ def transform_gpforce_to_globali(subcase, result,
         cid_transform = coord.beta()
 
         # a global coordinate system has 1s along the main diagonal
-        is_global_cid = False
-        if np.array_equal([1., 1., 1.], np.diagonal(cid_transform)):
-            is_global_cid = True
-        nids = np.array(nids_transform[cid])
-
-        #from pyNastran.op2.tables.ogf_gridPointForces.ogf_objects import RealGridPointForcesArray
-        #result = RealGridPointForcesArray()
-        if result.is_unique: # TODO: doesn't support preload
-            #self.node_element = zeros((self.ntimes, self.ntotal, 2), dtype='int32')
-            nids_all_gp = result.node_element[0, :, 0]
-
-            log.debug('nids_all_gp = %s' % list(nids_all_gp))
-            log.debug('nids = %s' % list(nids))
-
-            # the indices of the grid points that we're transforming
-            inode_gp = np.where(np.in1d(nids_all_gp, nids))[0]
-            log.debug('inode_gp = %s' % list(inode_gp))
-            nids_gp = nids_all_gp[inode_gp]
-            log.debug('nids_gp = %s' % list(nids_gp))
-            if not np.array_equal(np.unique(nids_gp), np.unique(nids)):
-                msg = 'nids_gp=%s nids=%s' % (nids_gp, nids)
-                raise RuntimeError(msg)
+        is_global_cid = np.array_equal([1., 1., 1.], np.diagonal(cid_transform))
+        nids = np.asarray(nids_transform[cid])
 
-            log.debug('---------')
-            # the transformation index to go from xyz to the grid point forces
-            inode_gp_xyz = np.searchsorted(nids_all, nids_all_gp)
-            log.debug('nids_all = %s' % list(nids_all))
-            log.debug('nids_all_gp = %s' % list(nids_all_gp))
-            log.debug('inode_xyz = %s' % list(inode_xyz))
-            log.debug('inode_gp_xyz = %s' % list(inode_gp_xyz))
-            sys.stdout.flush()
-            assert len(inode_gp_xyz) == len(nids_all_gp), len(nids_all_gp)
-        else:
-            raise NotImplementedError(result)
+        # every node must have grid point forces
+        is_missing = ~np.in1d(nids, nids_all_gp)
+        if is_missing.any():
+            msg = 'nids=%s are missing from the grid point forces' % nids[is_missing]
+            raise RuntimeError(msg)
 
+        # the indices of the grid points that we're transforming
+        inode_gp = np.where(np.in1d(nids_all_gp, nids))[0]
         if coord_type in ['CORD2R', 'CORD1R']:
             if is_global_cid:
                 continue
-            #print('coord\n', coord)
-            #print(cid_transform)
-            #print('inode = %s' % inode)
-            #print('rectangular')
-            translation = data[:, inode_gp, :3]
-            rotation = data[:, inode_gp, 3:]
-            data[:, inode_gp, :3] = translation @ cid_transform
-            data[:, inode_gp, 3:] = rotation @ cid_transform
-        elif coord_type in ['CORD2C', 'CORD1C']:
-            #print('cylindrical')
+            # vector @ cid_transform
+            xforms = np.broadcast_to(cid_transform.T, (len(inode_gp), 3, 3))
+        elif coord_type in ['CORD2C', 'CORD1C', 'CORD2S', 'CORD1S']:
             if xyz_cid0 is None:
-                msg = ('xyz_cid is required for cylindrical '
+                msg = ('xyz_cid is required for cylindrical/spherical '
                        'coordinate transforms')
                 raise RuntimeError(msg)
-            #_transform_cylindrical_displacement(inode, data, coord, xyz_cid0, cid_transform)
-            _transform_cylindrical_gpforce(inode_xyz, inode_gp, data, cid_transform, coord,
-                                           xyz_cid0, log)
 
-        elif coord_type in ['CORD2S', 'CORD1S']:
-            log.debug('spherical')
-            if xyz_cid0 is None:
-                msg = ('xyz_cid is required for spherical '
-                       'coordinate transforms')
-                raise RuntimeError(msg)
-
-            _transform_spherical_gpforce(inode_xyz, inode_gp, data, cid_transform, coord,
-                                         xyz_cid0, log)
+            # the position of each grid point force row in the local
+            # rectangular frame of the coordinate system
+            isort = np.argsort(nids_all)
+            inode_xyz = isort[np.searchsorted(nids_all, nids_all_gp[inode_gp], sorter=isort)]
+            xyz_local = (xyz_cid0[inode_xyz, :] - coord.origin) @ cid_transform.T
+            if coord_type in ['CORD2C', 'CORD1C']:
+                xforms = _cylindrical_axes(xyz_local)
+            else:
+                xforms = _spherical_axes(xyz_local)
+
+            # vector_global = beta.T @ [e1, e2, e3] @ vector_cd
+            xforms = cid_transform.T @ xforms
         else:
             raise RuntimeError(coord)
-    return
-
-def _transform_cylindrical_gpforce(unused_inode_xyz, inode_gp, data, cid_transform, coord,
-                                   xyz_cid0, log):
-    """helper method for transform_gpforce_to_globali"""
-    #xyzi = xyz_cid0[inode_xyz, :]s
-    #rtz_cid = coord.xyz_to_coord_array(xyzi)
-    #theta_xyz = rtz_cid[inode_xyz, 1]
-    #theta = rtz_cid[inode_gp_xyz, 1]
-    log.debug('coord\n%s' % coord)
-    log.debug(cid_transform)
-    #print('theta_xyz = %s' % list(theta_xyz))
-    #print('theta     = %s' % list(theta))
+        igps.append(inode_gp)
+        transforms.append(xforms)
 
-    for itime in range(data.shape[0]):
-        #inode = np.where(np.in1d(nids_all, 2))[0]
-        #print('start', data[itime, inode_gp, :3])
-        translation = data[itime, inode_gp, :3]
-        rotation = data[itime, inode_gp, 3:]
-        if 0:
-            # horrible
-            translation = coord.coord_to_xyz_array(data[itime, inode_gp, :3])
-            rotation = coord.coord_to_xyz_array(data[itime, inode_gp, 3:])
-            data[itime, inode_gp, :3] = translation @ cid_transform
-            data[itime, inode_gp, 3:] = rotation @ cid_transform
-        #elif 0:
-            ## expectedly horrible
-            #translation[:, 1] += theta
-            #rotation[:, 1] += theta
-            #translation = coord.coord_to_xyz_array(data[itime, inode_gp, :3])
-            #rotation = coord.coord_to_xyz_array(data[itime, inode_gp, 3:])
-            #data[itime, inode_gp, :3] = translation.dot(cid_transform)
-            #data[itime, inode_gp, 3:] = rotation.dot(cid_transform)
-        #elif 0:
-            ## actually not bad...
-            #translation = coord.xyz_to_coord_array(translation)
-            #rotation = coord.xyz_to_coord_array(rotation)
-            #translation[:, 1] += theta
-            #rotation[:, 1] += theta
-            #translation = coord.coord_to_xyz_array(translation)
-            #rotation = coord.coord_to_xyz_array(rotation)
-            #data[itime, inode_gp, :3] = translation.dot(cid_transform)
-            #data[itime, inode_gp, 3:] = rotation.dot(cid_transform)
-        #elif 0:
-            ## not that bad, worse than previous
-            #translation = coord.xyz_to_coord_array(translation)
-            #rotation = coord.xyz_to_coord_array(rotation)
-            #translation[:, 1] += theta
-            #rotation[:, 1] += theta
-            #translation = coord.coord_to_xyz_array(translation)
-            #rotation = coord.coord_to_xyz_array(rotation)
-            #data[itime, inode_gp, :3] = translation.dot(cid_transform.T)
-            #data[itime, inode_gp, 3:] = rotation.dot(cid_transform.T)
-        elif 1:
-            # doesn't work...actually pretty close
-            data[itime, inode_gp, :3] = translation.dot(cid_transform)
-            data[itime, inode_gp, 3:] = rotation.dot(cid_transform)
-        #elif 0:
-            ## very, very close
-            #data[itime, inode_gp, :3] = translation.dot(cid_transform.T)
-            #data[itime, inode_gp, 3:] = rotation.dot(cid_transform.T)
-        #elif 0:
-            ## is this just the same as one of the previous?
-            #data[itime, inode_gp, :3] = cid_transform.T.dot(translation.T).T
-            #data[itime, inode_gp, 3:] = cid_transform.T.dot(rotation.T).T
-        else:
-            raise RuntimeError('no option selected...')
-
-        #if is_global_cid:
-            #data[itime, inode, :3] = translation
-            #data[itime, inode, 3:] = rotation
-            #continue
-        #data[itime, inode_gp, :3] = translation.dot(cid_transform)
-        #data[itime, inode_gp, 3:] = rotation.dot(cid_transform)
-        #print('end', data[itime, inode_gp, :3])
-
-def _transform_spherical_gpforce(inode_xyz, unused_inode_gp, data, cid_transform, coord,
-                                 unused_xyz_cid0, unused_log):
-    """helper method for transform_gpforce_to_globali"""
-    #xyzi = xyz_cid0[inode_xyz, :]
-    #rtp_cid = coord.xyz_to_coord_array(xyzi)
-    #theta = rtp_cid[:, 1]
-    #phi = rtp_cid[:, 2]
-    for itime in range(data.shape[0]):
-        translation = data[itime, inode_xyz, :3]
-        rotation = data[itime, inode_xyz, 3:]
-        #if 0:
-            #translation[:, 1] += theta
-            #translation[:, 2] += phi
-            #rotation[:, 1] += theta
-            #rotation[:, 2] += phi
-        translation = coord.coord_to_xyz_array(data[itime, inode_xyz, :3])
-        rotation = coord.coord_to_xyz_array(data[itime, inode_xyz, 3:])
-        #if is_global_cid:
-            #data[itime, inode_xyz, :3] = translation
-            #data[itime, inode_xyz, 3:] = rotation
-            #continue
-        data[itime, inode_xyz, :3] = translation.dot(cid_transform)
-        data[itime, inode_xyz, 3:] = rotation.dot(cid_transform)
+    if igps:
+        inode_gp = np.hstack(igps)
+        isort = np.argsort(inode_gp, kind='stable')
+        apply_cd_transform_stack(data, inode_gp[isort], np.vstack(transforms)[isort, :, :])
+
+def _cylindrical_axes(xyz_local: np.ndarray) -> np.ndarray:
+    """
+    Gets the (R, theta, z) unit vectors in the local rectangular frame
+    as the columns of a (n, 3, 3) stack
+    """
+    thetar = np.arctan2(xyz_local[:, 1], xyz_local[:, 0])
+    return cylindrical_rotation_matrix(thetar, dtype='float64')
+
+def _spherical_axes(xyz_local: np.ndarray) -> np.ndarray:
+    """
+    Gets the (R, theta, phi) unit vectors in the local rectangular frame
+    as the columns of a (n, 3, 3) stack
+    """
+    x = xyz_local[:, 0]
+    y = xyz_local[:, 1]
+    z = xyz_local[:, 2]
+    thetar = np.arctan2(np.sqrt(x * x + y * y), z)
+    phir = np.arctan2(y, x)
+    sin_theta = np.sin(thetar)
+    cos_theta = np.cos(thetar)
+    sin_phi = np.sin(phir)
+    cos_phi = np.cos(phir)
+
+    axes = np.zeros((len(x), 3, 3), dtype='float64')
+    # R
+    axes[:, 0, 0] = sin_theta * cos_phi
+    axes[:, 1, 0] = sin_theta * sin_phi
+    axes[:, 2, 0] = cos_theta
+    # theta
+    axes[:, 0, 1] = cos_theta * cos_phi
+    axes[:, 1, 1] = cos_theta * sin_phi
+    axes[:, 2, 1] = -sin_theta
+    # phi
+    axes[:, 0, 2] = -sin_phi
+    axes[:, 1, 2] = cos_phi
+    return axes
@@ -17,6 +17,40 @@ IS_NEW_SCIPY = (SCIPY_VERSION >= [1, 8])
 IS_OLD_SCIPY = not IS_NEW_SCIPY
 
 
+class TrashWriter:
+    """a file-like object that throws away the op2 debug (ascii) output"""
+    def __init__(self, *args, **kwargs):
+        pass
+    def write(self, data):
+        pass
+    def close(self):
+        pass
+
+
+def is_ascii_requested(fascii) -> bool:
+    """should the op2 debug (ascii) output be formatted?"""
+    return not isinstance(fascii, TrashWriter)
+
+
+def to_endian_bytes(data_out: np.ndarray, endian: bytes) -> bytes:
+    """
+    Gets the bytes for a table 4 record, so it may be written in a
+    single call
+
+    Parameters
+    ----------
+    data_out : (nrows, nwide) ndarray
+        the native float32 record; integer/string columns are views
+    endian : bytes
+        the byte order (e.g., b'<' or b'>')
+
+    """
+    if isinstance(endian, bytes):
+        endian = endian.decode('latin1')
+    dtype = data_out.dtype.newbyteorder(endian)
+    return data_out.astype(dtype, copy=False).tobytes()
+
+
 def set_table3_field(str_fields, ifield, value):
     """
     ifield is 1 based
@@ -146,12 +180,12 @@ def export_to_hdf5(self, group, log):
             continue
         #elif isinstance(value, (integer_float_types, str, bytes, np.ndarray, list, h5py._hl.dataset.Dataset)):
             #pass
-        elif ((IS_NEW_SCIPY and isinstance(value, sp._coo.coo_matrix)) or
-              (IS_OLD_SCIPY and isinstance(value, sp.coo.coo_matrix))):
+        elif sp.issparse(value):
             # F:\work\pyNastran\pyNastran\master2\pyNastran\bdf\test\nx_spike\out_bsh111svd2.op2
             #
             # https://stackoverflow.com/questions/43390038/storing-scipy-sparse-matrix-as-hdf5
             #g = group.create_group('Mcoo')
+            value = value.tocoo()
             group.create_dataset('data', data=value.data)
             group.create_dataset('row', data=value.row)
             group.create_dataset('col', data=value.col)
@@ -0,0 +1,202 @@
+"""
+Defines random response post-processing of frequency response results:
+ - psd_inputs_from_randps(model, sid, freqs)
+ - compute_random_response(results, psd_inputs, return_psd=True,
+                           nvalues_chunk=NVALUES_CHUNK, nprocesses=1)
+ - miles_rms(fn, q, asd)
+
+This allows a SOL 108/111 run to be reused for multiple input spectra
+without rerunning Nastran.
+
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Tuple, Any, TYPE_CHECKING
+
+import numpy as np
+if TYPE_CHECKING:  # pragma: no cover
+    from pyNastran.bdf.bdf import BDF
+
+#: the max number of complex values (nfreqs * nrows * ncolumns) to process at once
+NVALUES_CHUNK = 10_000_000
+
+
+def psd_inputs_from_randps(model: BDF, sid: int, freqs: np.ndarray) -> Dict[Tuple[int, int], np.ndarray]:
+    r"""
+    Evaluates the RANDPS cards for a RANDOM set at the output frequencies
+
+    .. math:: S_{jk}(F) = (X+iY)G(F)
+
+    Parameters
+    ----------
+    model : BDF
+        a cross-referenced model with the RANDPS and TABRND1 cards
+    sid : int
+        the RANDOM set id
+    freqs : (nfreqs, ) float ndarray
+        the output frequencies
+
+    Returns
+    -------
+    psd_inputs : dict[(j, k)] = (nfreqs, ) complex ndarray
+        the input spectra for each (excited, applied) subcase pair
+
+    """
+    freqs = np.asarray(freqs, dtype='float64')
+    psd_inputs = {}
+    for randps in model.dload_entries[sid]:
+        if randps.type != 'RANDPS':
+            continue
+        scale = complex(randps.x, randps.y)
+        tid = randps.Tid()
+        if tid:
+            table = model.RandomTable(tid, msg=f', which is required by RANDPS sid={sid}')
+            if table.type != 'TABRND1':
+                raise NotImplementedError(f'RANDPS sid={sid} references a {table.type}')
+            psd = scale * table.interpolate(freqs)
+        else:
+            psd = np.full(len(freqs), scale, dtype='complex128')
+
+        key = (randps.j, randps.k)
+        if key in psd_inputs:
+            psd_inputs[key] = psd_inputs[key] + psd
+        else:
+            psd_inputs[key] = psd
+    return psd_inputs
+
+
+def compute_random_response(results: Dict[int, Any],
+                            psd_inputs: Dict[Tuple[int, int], np.ndarray],
+                            return_psd: bool=True,
+                            nvalues_chunk: int=NVALUES_CHUNK,
+                            nprocesses: int=1):
+    r"""
+    Calculates the output PSD, RMS and zero crossing rate of a
+    frequency response result for all nodes/elements at once
+
+    .. math:: S_u(F) = \sum_j \sum_k H_j(F) S_{jk}(F) H_k^*(F)
+
+    Only the k >= j half of the input spectra is defined (per RANDPS),
+    so the j != k terms are counted as :math:`2 Re(H_j S_{jk} H_k^*)`.
+
+    Parameters
+    ----------
+    results : dict[subcase] = ComplexDisplacementArray, ComplexPlateStressArray, ...
+        the SORT1 frequency responses of the same result type for each
+        subcase that's referenced by psd_inputs
+    psd_inputs : dict[(j, k)] = (nfreqs, ) complex ndarray
+        the input spectra at the frequencies of the results
+        see ``psd_inputs_from_randps``
+    return_psd : bool; default=True
+        the output PSD is the same size as the results, so it can be
+        skipped if only the RMS/crossings are required
+    nvalues_chunk : int; default=NVALUES_CHUNK
+        the max number of complex values per subcase to process at once
+    nprocesses : int; default=1
+        the number of processes to use
+
+    Returns
+    -------
+    freqs : (nfreqs, ) float ndarray
+        the frequencies
+    psd : (nfreqs, nrows, ncolumns) float ndarray; None if return_psd=False
+        the output PSD
+    rms : (nrows, ncolumns) float ndarray
+        the RMS (the square root of the area under the PSD)
+    crossings : (nrows, ncolumns) float ndarray
+        the rate of positive slope zero crossings (Hz); 0.0 if the PSD is 0.0
+
+    """
+    subcases = sorted({subcase for key in psd_inputs for subcase in key})
+    result0 = results[subcases[0]]
+    freqs = np.asarray(result0._times, dtype='float64')
+    nfreqs, nrows, ncolumns = result0.data.shape
+    for subcase in subcases:
+        result = results[subcase]
+        if not result.is_sort1:
+            raise NotImplementedError(f'SORT2 is not supported for {result.class_name}')
+        if result.data.shape != result0.data.shape or not np.allclose(result._times, freqs):
+            raise RuntimeError(
+                f'subcase={subcase} does not match subcase={subcases[0]}; '
+                f'shape={result.data.shape} expected={result0.data.shape}')
+    for key, psd_input in psd_inputs.items():
+        if len(psd_input) != nfreqs:
+            raise RuntimeError(f'psd_input[{key}] has {len(psd_input)} frequencies; '
+                               f'expected {nfreqs}')
+
+    nrows_chunk = max(1, nvalues_chunk // (nfreqs * ncolumns))
+    jobs = []
+    for irow in range(0, nrows, nrows_chunk):
+        jrow = min(irow + nrows_chunk, nrows)
+        data = {subcase: results[subcase].data[:, irow:jrow, :] for subcase in subcases}
+        jobs.append((data, psd_inputs, freqs, return_psd))
+
+    if nprocesses > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=nprocesses) as executor:
+            outputs = list(executor.map(_random_response_chunk, jobs))
+    else:
+        outputs = [_random_response_chunk(job) for job in jobs]
+
+    psd = np.concatenate([out[0] for out in outputs], axis=1) if return_psd else None
+    rms = np.concatenate([out[1] for out in outputs], axis=0)
+    crossings = np.concatenate([out[2] for out in outputs], axis=0)
+    return freqs, psd, rms, crossings
+
+
+def _random_response_chunk(job):
+    """calculates the PSD/RMS/crossings for a block of rows (in a worker process)"""
+    data, psd_inputs, freqs, return_psd = job
+    subcase0 = next(iter(data))
+    psd = np.zeros(data[subcase0].shape, dtype='float64')
+    psd_input_shape = (len(freqs), 1, 1)
+    for (j, k), psd_input in psd_inputs.items():
+        psd_input = np.asarray(psd_input).reshape(psd_input_shape)
+        hj = data[j]
+        if j == k:
+            psd += (hj.real ** 2 + hj.imag ** 2) * psd_input.real
+        else:
+            psd += 2. * (hj * data[k].conj() * psd_input).real
+
+    # If you want the RMS value, this is computed as RMS = SQRT(SUM(PSD*DF))
+    psd_f = _integrate(psd, freqs)
+    f2_psd_f = _integrate(freqs[:, np.newaxis, np.newaxis] ** 2 * psd, freqs)
+    rms = np.sqrt(psd_f)
+
+    # really this is nan, but that's Nastran for you
+    crossings = np.zeros(psd_f.shape, dtype='float64')
+    is_psd = psd_f > 0.
+    crossings[is_psd] = np.sqrt(f2_psd_f[is_psd] / psd_f[is_psd])
+    if not return_psd:
+        psd = None
+    return psd, rms, crossings
+
+
+def _integrate(y: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """trapezoidal integration along the first axis"""
+    dx = np.diff(x)
+    return np.tensordot(dx, y[1:] + y[:-1], axes=(0, 0)) * 0.5
+
+
+def miles_rms(fn, q, asd):
+    r"""
+    Calculates the RMS response of a single degree of freedom system
+    to a flat input spectrum using Miles' equation
+
+    .. math:: G_{rms} = \sqrt{\frac{\pi}{2} f_n Q \, ASD(f_n)}
+
+    Parameters
+    ----------
+    fn : float / (n, ) float ndarray
+        the natural frequency (Hz)
+    q : float / (n, ) float ndarray
+        the amplification factor, 1/(2*zeta)
+    asd : float / (n, ) float ndarray
+        the input acceleration spectral density at fn (g^2/Hz)
+
+    Returns
+    -------
+    grms : float / (n, ) float ndarray
+        the RMS response
+
+    """
+    return np.sqrt(np.pi / 2. * np.asarray(fn) * np.asarray(q) * np.asarray(asd))
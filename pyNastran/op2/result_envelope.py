@@ -0,0 +1,355 @@
+"""
+Defines the max/min/abs-max envelope of a result across many OP2s:
+ - ResultEnvelope(result_names, column)
+ - envelope_op2_files(op2_filenames, result_names, column,
+                      subcases=None, nprocesses=1, mode=None, log=None)
+
+Each entity (node/element) keeps the controlling OP2, subcase and time
+step for its max/min value, so the envelope can be built one OP2 at a
+time without keeping the results in memory.
+
+"""
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Tuple, Union, Optional, Any
+
+import numpy as np
+from cpylog import SimpleLogger
+
+from pyNastran.op2.op2 import read_op2
+from pyNastran.op2.vector_utils import get_result_ids
+
+
+class ResultEnvelope:
+    """
+    Streaming max/min envelope of a single result column
+
+    Attributes
+    ----------
+    result_names : List[str]
+        the results to envelope (e.g., ['ctria3_stress', 'cquad4_stress'])
+    column : str / int
+        the header (e.g., 'von_mises', 'axial', 't1') or column index
+    cases : List[(op2_filename, subcase), ...]
+        the cases that have been added
+    ids : (nids, ) int ndarray
+        the sorted node/element ids
+    max_value / min_value : (nids, ) float ndarray
+        the max/min value for each id
+    max_icase / min_icase : (nids, ) int ndarray
+        the index into cases that controls the max/min
+    max_itime / min_itime : (nids, ) int ndarray
+        the time step index that controls the max/min
+    max_time / min_time : (nids, ) float ndarray
+        the time/freq/mode that controls the max/min
+
+    Examples
+    --------
+    >>> envelope = ResultEnvelope(['ctria3_stress', 'cquad4_stress'], 'von_mises')
+    >>> for op2_filename in op2_filenames:
+    ...     model = read_op2(op2_filename, include_results=envelope.result_names)
+    ...     envelope.add_op2(model, op2_filename)
+    >>> abs_max, icase, itime, time = envelope.get_abs_max()
+
+    """
+    def __init__(self, result_names: Union[str, List[str]],
+                 column: Union[str, int]):
+        if isinstance(result_names, str):
+            result_names = [result_names]
+        self.result_names = list(result_names)
+        self.column = column
+        self.cases = []  # type: List[Tuple[str, Any]]
+
+        self.ids = np.zeros(0, dtype='int64')
+        self.max_value = np.zeros(0, dtype='float64')
+        self.max_icase = np.zeros(0, dtype='int64')
+        self.max_itime = np.zeros(0, dtype='int64')
+        self.max_time = np.zeros(0, dtype='float64')
+        self.min_value = np.zeros(0, dtype='float64')
+        self.min_icase = np.zeros(0, dtype='int64')
+        self.min_itime = np.zeros(0, dtype='int64')
+        self.min_time = np.zeros(0, dtype='float64')
+
+    @property
+    def nids(self) -> int:
+        return len(self.ids)
+
+    @property
+    def ncases(self) -> int:
+        return len(self.cases)
+
+    def add_op2(self, model, op2_filename: str='') -> None:
+        """
+        Adds every subcase of the results in a loaded OP2
+
+        Parameters
+        ----------
+        model : OP2
+            the model with the results
+        op2_filename : str; default=''
+            the name to store for the controlling case
+
+        """
+        for result_name in self.result_names:
+            results = model.get_result(result_name)
+            for key, result in results.items():
+                self.add_result(result, op2_filename=op2_filename, subcase=key)
+
+    def add_result(self, result, op2_filename: str='', subcase: Any=None) -> None:
+        """
+        Adds all the time steps of a single result object
+
+        Parameters
+        ----------
+        result : RealTableArray, RealPlateStressArray, ...
+            the result to add
+        op2_filename : str; default=''
+            the name to store for the controlling case
+        subcase : int / tuple; default=None -> result.isubcase
+            the key to store for the controlling case
+
+        """
+        if not result.is_sort1:
+            raise NotImplementedError(f'SORT2 is not supported for {result.class_name}')
+        if subcase is None:
+            subcase = result.isubcase
+
+        row_ids = get_result_ids(result)
+        if len(row_ids) == 0:
+            return
+        icolumn = _get_column_index(result, self.column)
+        values = result.data[:, :, icolumn]
+        if np.iscomplexobj(values):
+            values = np.abs(values)
+
+        # the rows for an id (e.g., the nodes/fibers of a plate) are reduced together
+        ids, igroup, values = _group_rows(row_ids, values)
+        max_values = np.maximum.reduceat(values, igroup, axis=1)
+        min_values = np.minimum.reduceat(values, igroup, axis=1)
+
+        times = _get_times(result)
+        iids = np.arange(len(ids))
+        max_itime = max_values.argmax(axis=0)
+        min_itime = min_values.argmin(axis=0)
+
+        icase = np.full(len(ids), len(self.cases), dtype='int64')
+        self.cases.append((op2_filename, subcase))
+        self._merge(ids,
+                    max_values[max_itime, iids], icase, max_itime, times[max_itime],
+                    min_values[min_itime, iids], icase, min_itime, times[min_itime])
+
+    def merge(self, envelope: ResultEnvelope) -> None:
+        """
+        Merges another envelope into this one
+
+        The cases of the other envelope are appended, so merging the
+        envelopes of the OP2s in order gives the same controlling cases
+        as adding the OP2s one at a time.
+
+        """
+        offset = len(self.cases)
+        self.cases.extend(envelope.cases)
+        self._merge(envelope.ids,
+                    envelope.max_value, envelope.max_icase + offset,
+                    envelope.max_itime, envelope.max_time,
+                    envelope.min_value, envelope.min_icase + offset,
+                    envelope.min_itime, envelope.min_time)
+
+    def _merge(self, ids, max_value, max_icase, max_itime, max_time,
+               min_value, min_icase, min_itime, min_time) -> None:
+        """updates the envelope with the sorted ids; ties keep the earlier case"""
+        if not np.array_equal(ids, self.ids):
+            self._expand_ids(ids)
+        ipos = np.searchsorted(self.ids, ids)
+
+        is_max = max_value > self.max_value[ipos]
+        imax = ipos[is_max]
+        self.max_value[imax] = max_value[is_max]
+        self.max_icase[imax] = max_icase[is_max]
+        self.max_itime[imax] = max_itime[is_max]
+        self.max_time[imax] = max_time[is_max]
+
+        is_min = min_value < self.min_value[ipos]
+        imin = ipos[is_min]
+        self.min_value[imin] = min_value[is_min]
+        self.min_icase[imin] = min_icase[is_min]
+        self.min_itime[imin] = min_itime[is_min]
+        self.min_time[imin] = min_time[is_min]
+
+    def _expand_ids(self, ids) -> None:
+        """adds the new ids to the envelope with empty values"""
+        all_ids = np.union1d(self.ids, ids)
+        nids = len(all_ids)
+        ipos = np.searchsorted(all_ids, self.ids)
+
+        def _expand(array, fill_value):
+            array2 = np.full(nids, fill_value, dtype=array.dtype)
+            array2[ipos] = array
+            return array2
+
+        self.ids = all_ids
+        self.max_value = _expand(self.max_value, -np.inf)
+        self.max_icase = _expand(self.max_icase, -1)
+        self.max_itime = _expand(self.max_itime, -1)
+        self.max_time = _expand(self.max_time, np.nan)
+        self.min_value = _expand(self.min_value, np.inf)
+        self.min_icase = _expand(self.min_icase, -1)
+        self.min_itime = _expand(self.min_itime, -1)
+        self.min_time = _expand(self.min_time, np.nan)
+
+    def get_abs_max(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gets the signed value with the largest magnitude
+
+        Returns
+        -------
+        abs_max_value : (nids, ) float ndarray
+            the max/min value with the largest magnitude
+        abs_max_icase : (nids, ) int ndarray
+            the index into cases that controls the value
+        abs_max_itime : (nids, ) int ndarray
+            the time step index that controls the value
+        abs_max_time : (nids, ) float ndarray
+            the time/freq/mode that controls the value
+
+        """
+        is_max = np.abs(self.max_value) >= np.abs(self.min_value)
+        abs_max_value = np.where(is_max, self.max_value, self.min_value)
+        abs_max_icase = np.where(is_max, self.max_icase, self.min_icase)
+        abs_max_itime = np.where(is_max, self.max_itime, self.min_itime)
+        abs_max_time = np.where(is_max, self.max_time, self.min_time)
+        return abs_max_value, abs_max_icase, abs_max_itime, abs_max_time
+
+    def get_cases(self, icase: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Gets the controlling OP2 filenames and subcases for a set of case indices
+
+        Returns
+        -------
+        op2_filenames : (n, ) object ndarray
+            the OP2 filenames
+        subcases : (n, ) object ndarray
+            the subcase keys
+
+        """
+        cases = np.empty((len(self.cases), 2), dtype='object')
+        cases[:, :] = self.cases
+        return cases[icase, 0], cases[icase, 1]
+
+    def __repr__(self) -> str:
+        msg = (f'ResultEnvelope(result_names={self.result_names}, column={self.column!r})\n'
+               f'  nids   = {self.nids}\n'
+               f'  ncases = {self.ncases}\n')
+        return msg
+
+
+def envelope_op2_files(op2_filenames: List[str],
+                       result_names: Union[str, List[str]],
+                       column: Union[str, int],
+                       subcases: Optional[List[int]]=None,
+                       nprocesses: int=1,
+                       mode: Optional[str]=None,
+                       log: Optional[SimpleLogger]=None) -> ResultEnvelope:
+    """
+    Envelopes a result across a series of OP2s
+
+    Only the requested results/subcases are read and each OP2 is
+    reduced to its envelope before it's merged, so the results of the
+    OP2s are never in memory at the same time.
+
+    Parameters
+    ----------
+    op2_filenames : List[str]
+        the OP2s to read
+    result_names : str / List[str]
+        the results to envelope (e.g., 'cquad4_stress', 'force.cbar_force',
+        'spc_forces')
+    column : str / int
+        the header (e.g., 'von_mises', 'axial', 't1') or column index
+    subcases : List[int]; default=None -> all
+        the subcases to read
+    nprocesses : int; default=1
+        the number of processes used to read the OP2s
+    mode : str; default=None -> 'msc'
+        the version of the Nastran you're using
+    log : SimpleLogger; default=None
+        the logger
+
+    Returns
+    -------
+    envelope : ResultEnvelope
+        the envelope
+
+    """
+    if log is None:
+        log = SimpleLogger(level='warning')
+    envelope = ResultEnvelope(result_names, column)
+    jobs = [(op2_filename, envelope.result_names, column, subcases, mode, log.level)
+            for op2_filename in op2_filenames]
+
+    if nprocesses > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=nprocesses) as executor:
+            for envelopei in executor.map(_envelope_op2_file, jobs):
+                envelope.merge(envelopei)
+    else:
+        for job in jobs:
+            envelope.merge(_envelope_op2_file(job))
+    log.info(f'enveloped {envelope.ncases} cases with {envelope.nids} ids')
+    return envelope
+
+
+def _envelope_op2_file(job) -> ResultEnvelope:
+    """Reads a single OP2 and envelopes it (in a worker process)"""
+    op2_filename, result_names, column, subcases, mode, level = job
+    log = SimpleLogger(level=level)
+    model = read_op2(op2_filename, subcases=subcases, include_results=result_names,
+                     log=log, debug=False, mode=mode)
+    envelope = ResultEnvelope(result_names, column)
+    envelope.add_op2(model, op2_filename=op2_filename)
+    return envelope
+
+
+def _get_column_index(result, column: Union[str, int]) -> int:
+    """gets the column index of the data array"""
+    if isinstance(column, (int, np.integer)):
+        return column
+    headers = result.get_headers()
+    if column not in headers:
+        raise RuntimeError(f'column={column!r} is not in {result.class_name}; '
+                           f'headers={headers}')
+    return headers.index(column)
+
+
+def _get_times(result) -> np.ndarray:
+    """gets the time/freq/mode for each time step; nan if there isn't one"""
+    ntimes = result.data.shape[0]
+    times = getattr(result, '_times', None)
+    nonlinear_factor = result.nonlinear_factor
+    is_static = nonlinear_factor is None or (
+        isinstance(nonlinear_factor, float) and np.isnan(nonlinear_factor))
+    if is_static or times is None or len(times) != ntimes:
+        return np.full(ntimes, np.nan)
+    return np.real(np.asarray(times)).astype('float64')
+
+
+def _group_rows(row_ids: np.ndarray, values: np.ndarray):
+    """
+    Sorts the rows by id and gets the start of each id
+
+    Returns
+    -------
+    ids : (nids, ) int ndarray
+        the unique ids
+    igroup : (nids, ) int ndarray
+        the start row of each id in values
+    values : (ntimes, nrows) float ndarray
+        the values sorted by id
+
+    """
+    row_ids = np.asarray(row_ids, dtype='int64')
+    if len(row_ids) > 1 and (np.diff(row_ids) < 0).any():
+        isort = np.argsort(row_ids, kind='stable')
+        row_ids = row_ids[isort]
+        values = values[:, isort]
+    igroup = np.flatnonzero(np.hstack([True, row_ids[1:] != row_ids[:-1]]))
+    return row_ids[igroup], igroup, values.astype('float64')
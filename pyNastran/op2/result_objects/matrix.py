@@ -1,5 +1,5 @@
 """Defines the Matrix class"""
-from scipy.sparse import coo_matrix  # type: ignore
+from scipy.sparse import coo_matrix, csc_matrix, issparse, load_npz  # type: ignore
 import numpy as np
 from pyNastran.op2.op2_interface.write_utils import export_to_hdf5
 from pyNastran.utils import object_attributes, object_methods
@@ -20,6 +20,9 @@ class Matrix:
         data is initialized by setting the matrix.data attribute externally
     is_matpool : bool
         is this a matpool matrix
+    filename : str; default=None
+        the .npz/.h5 file the data was written to instead of being
+        held in memory (see ``OP2.set_matrix_output``)
 
     """
     def __init__(self, name, form, is_matpool=False):
@@ -49,6 +52,7 @@ class Matrix:
         self.data = None
         self.form = form
         self.is_matpool = is_matpool
+        self.filename = None
 
         # only exist for is_matpool = True
         self.col_nid = None
@@ -74,6 +78,30 @@ class Matrix:
         else:
             raise RuntimeError('form = %r' % self.form)
 
+    def load(self):
+        """
+        Loads the sparse matrix that was written to an .npz/.h5 file
+        by ``OP2.set_matrix_output``
+
+        Returns
+        -------
+        data : coo_matrix
+            the matrix
+
+        """
+        if self.data is not None:
+            return self.data
+        if self.filename is None:
+            raise RuntimeError('Matrix %r has no data and no filename' % self.name)
+        if self.filename.endswith('.npz'):
+            return load_npz(self.filename).tocoo()
+
+        import h5py
+        with h5py.File(self.filename, 'r') as h5_file:
+            shape = tuple(h5_file.attrs['shape'])
+            data = (h5_file['data'][()], h5_file['indices'][()], h5_file['indptr'][()])
+        return coo_matrix(csc_matrix(data, shape=shape))
+
     def export_to_hdf5(self, group, log):
         """exports the object to HDF5 format"""
         export_to_hdf5(self, group, log)
@@ -84,7 +112,8 @@ class Matrix:
         matrix = self.data
         if matrix is None:
             return
-        if isinstance(matrix, coo_matrix):
+        if issparse(matrix):
+            matrix = matrix.tocoo()
             data = {'row': matrix.row, 'col': matrix.col, 'data' : matrix.data}
             data_frame = pd.DataFrame(data=data).reindex(columns=['row', 'col', 'data'])
         elif isinstance(matrix, np.ndarray):
@@ -102,7 +131,8 @@ class Matrix:
             skip_msg = 'skipping %s because data is None\n\n' % self.name
             mat.write(skip_msg.encode('ascii'))
             return
-        if isinstance(matrix, coo_matrix):
+        if issparse(matrix):
+            matrix = matrix.tocoo()
             if print_full:
                 for row, col, value in zip(matrix.row, matrix.col, matrix.data):
                     mat.write(np.compat.asbytes("(%i, %i) %s\n" % (row, col, value)))
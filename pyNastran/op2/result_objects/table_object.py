@@ -23,7 +23,7 @@ these are used by:
 
 """
 import copy
-from struct import Struct, pack
+from struct import pack
 import warnings
 from typing import List
 
@@ -31,9 +31,12 @@ import numpy as np
 #from numpy import float32
 
 from pyNastran.op2.result_objects.op2_objects import ScalarObject
-from pyNastran.f06.f06_formatting import write_floats_13e, write_imag_floats_13e, write_float_12e
+from pyNastran.f06.f06_formatting import (
+    write_floats_13e, write_imag_floats_13e, write_float_12e,
+    write_floats_13e_array, write_f06_lines)
 from pyNastran.op2.errors import SixtyFourBitError
-from pyNastran.op2.op2_interface.write_utils import set_table3_field
+from pyNastran.op2.op2_interface.write_utils import (
+    set_table3_field, view_idtype_as_fdtype, is_ascii_requested, to_endian_bytes)
 
 float_types = (float, np.float32)
 integer_types = (int, np.int32)
@@ -1048,11 +1051,8 @@ class RealTableArray(TableArray):
             itable = -3
 
         #print('nonlinear_factor =', self.nonlinear_factor)
-        if self.is_sort1:
-            op2_format = endian + b'2i6f'
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
-        s = Struct(op2_format)
 
         node = self.node_gridtype[:, 0]
         gridtype = self.node_gridtype[:, 1]
@@ -1077,6 +1077,13 @@ class RealTableArray(TableArray):
 
         unused_device_code = self.device_code
         fascii.write('  ntimes = %s\n' % self.ntimes)
+        is_ascii = is_ascii_requested(fascii)
+
+        # the record is built once per time step and written in a single call
+        fdtype = np.dtype('float32')
+        data_out = np.empty((nnodes, 8), dtype=fdtype)
+        data_out[:, 0] = view_idtype_as_fdtype(nnodes_device, fdtype)
+        data_out[:, 1] = view_idtype_as_fdtype(gridtype, fdtype)
 
         #fmt = '%2i %6f'
         #print('ntotal=%s' % (ntotal))
@@ -1095,17 +1102,14 @@ class RealTableArray(TableArray):
             fascii.write('r4 [4, %s, 4]\n' % (itable))
             fascii.write('r4 [4, %i, 4]\n' % (4*ntotal))
 
-            t1 = self.data[itime, :, 0]
-            t2 = self.data[itime, :, 1]
-            t3 = self.data[itime, :, 2]
-            r1 = self.data[itime, :, 3]
-            r2 = self.data[itime, :, 4]
-            r3 = self.data[itime, :, 5]
-
-            for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(nnodes_device, gridtype, t1, t2, t3, r1, r2, r3):
-                data = [node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i]
-                fascii.write('  nid, grid_type, dx, dy, dz, rx, ry, rz = %s\n' % data)
-                op2_file.write(s.pack(*data))
+            # [node_id, gridtype, t1, t2, t3, r1, r2, r3]
+            data_out[:, 2:] = self.data[itime, :, :]
+            op2_file.write(to_endian_bytes(data_out, endian))
+            if is_ascii:
+                for node_id, gridtypei, datai in zip(nnodes_device, gridtype,
+                                                     self.data[itime, :, :].tolist()):
+                    data = [node_id, gridtypei] + datai
+                    fascii.write('  nid, grid_type, dx, dy, dz, rx, ry, rz = %s\n' % data)
 
             itable -= 1
             header = [4 * ntotal,]
@@ -1146,24 +1150,26 @@ class RealTableArray(TableArray):
         #words += self.getTableMarker()
         f06_file.write(''.join(header + words))
 
-        node = self.node_gridtype[:, 0]
-        gridtype = self.node_gridtype[:, 1]
-        t1 = self.data[0, :, 0]
-        t2 = self.data[0, :, 1]
-        t3 = self.data[0, :, 2]
-        r1 = self.data[0, :, 3]
-        r2 = self.data[0, :, 4]
-        r3 = self.data[0, :, 5]
-        for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(node, gridtype, t1, t2, t3, r1, r2, r3):
-            sgridtype = self.recast_gridtype_as_string(gridtypei)
-            vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-            vals2 = write_floats_13e(vals)
-            (dx, dy, dz, rx, ry, rz) = vals2
-            f06_file.write('%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                node_id, sgridtype, dx, dy, dz, rx, ry, rz))
+        sgridtypes = self._get_f06_sgridtypes()
+        self._write_f06_sort1_rows(f06_file, 0, sgridtypes, '%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n')
         f06_file.write(page_stamp % page_num)
         return page_num
 
+    def _get_f06_sgridtypes(self) -> np.ndarray:
+        """gets the grid type strings (e.g., 'G', 'S') for each node"""
+        gridtypes = self.node_gridtype[:, 1]
+        ugridtypes, igridtype = np.unique(gridtypes, return_inverse=True)
+        usgridtypes = np.array([self.recast_gridtype_as_string(gridtype)
+                                for gridtype in ugridtypes.tolist()])
+        return usgridtypes[igridtype]
+
+    def _write_f06_sort1_rows(self, f06_file, itime: int, sgridtypes: np.ndarray, fmt) -> None:
+        """writes the (node_id, grid_type, t1, t2, t3, r1, r2, r3) rows for a single time"""
+        nodes = self.node_gridtype[:, 0]
+        vals2 = write_floats_13e_array(self.data[itime, :, :6])
+        columns = [nodes, sgridtypes] + [vals2[:, i] for i in range(6)]
+        write_f06_lines(f06_file, fmt, columns)
+
     def _write_sort1_as_sort2(self, f06_file, page_num, page_stamp, header, words):
         nodes = self.node_gridtype[:, 0]
         gridtypes = self.node_gridtype[:, 1]
@@ -1197,35 +1203,31 @@ class RealTableArray(TableArray):
 
     def _write_sort1_as_sort1(self, f06_file, page_num, page_stamp, header, words):
         nodes = self.node_gridtype[:, 0]
-        gridtypes = self.node_gridtype[:, 1]
         unused_times = self._times
 
+        sgridtypes = self._get_f06_sgridtypes()
+        is_grid = np.isin(sgridtypes, ['G', 'H', 'L'])
+        is_scalar = np.isin(sgridtypes, ['S', 'M', 'E'])
+        if not np.all(is_grid | is_scalar):  # pragma: no cover
+            inode = np.where(~(is_grid | is_scalar))[0][0]
+            raise NotImplementedError(f'node_id={nodes[inode]} sgridtype={sgridtypes[inode]}')
+
+        # scalar points only write t1; '%.0s' drops the other values
+        fmt = np.where(
+            is_grid,
+            '%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n',
+            '%14i %6s     %s%.0s%.0s%.0s%.0s%.0s\n')
+        if is_grid.all():
+            fmt = str(fmt[0])
+
         for itime in range(self.ntimes):
             dt = self._times[itime]
-            t1 = self.data[itime, :, 0]
-            t2 = self.data[itime, :, 1]
-            t3 = self.data[itime, :, 2]
-            r1 = self.data[itime, :, 3]
-            r2 = self.data[itime, :, 4]
-            r3 = self.data[itime, :, 5]
-
             if isinstance(dt, float_types):
                 header[1] = ' %s = %10.4E\n' % (self.data_code['name'], dt)
             else:
                 header[1] = ' %s = %10i\n' % (self.data_code['name'], dt)
             f06_file.write(''.join(header + words))
-            for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(nodes, gridtypes, t1, t2, t3, r1, r2, r3):
-                sgridtype = self.recast_gridtype_as_string(gridtypei)
-                vals = [t1i, t2i, t3i, r1i, r2i, r3i]
-                vals2 = write_floats_13e(vals)
-                (dx, dy, dz, rx, ry, rz) = vals2
-                if sgridtype in ['G', 'H', 'L']:
-                    f06_file.write('%14i %6s     %-13s  %-13s  %-13s  %-13s  %-13s  %s\n' % (
-                        node_id, sgridtype, dx, dy, dz, rx, ry, rz))
-                elif sgridtype in ['S', 'M', 'E']:
-                    f06_file.write('%14i %6s     %s\n' % (node_id, sgridtype, dx))
-                else:  # pragma: no cover
-                    raise NotImplementedError(f'node_id={node_id} sgridtype={sgridtype} vals={vals2}')
+            self._write_f06_sort1_rows(f06_file, itime, sgridtypes, fmt)
             f06_file.write(page_stamp % page_num)
             page_num += 1
         return page_num
@@ -1573,11 +1575,8 @@ class ComplexTableArray(TableArray):
             itable = -3
 
         #print('nonlinear_factor =', self.nonlinear_factor)
-        if self.is_sort1:
-            op2_format = endian + b'2i 12f'
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
-        s = Struct(op2_format)
 
         node = self.node_gridtype[:, 0]
         max_id = node.max()
@@ -1602,6 +1601,13 @@ class ComplexTableArray(TableArray):
 
         unused_device_code = self.device_code
         fascii.write('  ntimes = %s\n' % self.ntimes)
+        is_ascii = is_ascii_requested(fascii)
+
+        # [node_id, gridtype, t1r, ..., r3r, t1i, ..., r3i]
+        fdtype = np.dtype('float32')
+        data_out = np.empty((nnodes, 14), dtype=fdtype)
+        data_out[:, 0] = view_idtype_as_fdtype(nnodes_device, fdtype)
+        data_out[:, 1] = view_idtype_as_fdtype(gridtype, fdtype)
 
         #fmt = '%2i %6f'
         #print('ntotal=%s' % (ntotal))
@@ -1620,19 +1626,16 @@ class ComplexTableArray(TableArray):
             fascii.write('r4 [4, %s, 4]\n' % (itable))
             fascii.write('r4 [4, %i, 4]\n' % (4*ntotal))
 
-            t1 = self.data[itime, :, 0]
-            t2 = self.data[itime, :, 1]
-            t3 = self.data[itime, :, 2]
-            r1 = self.data[itime, :, 3]
-            r2 = self.data[itime, :, 4]
-            r3 = self.data[itime, :, 5]
-
-            for node_id, gridtypei, t1i, t2i, t3i, r1i, r2i, r3i in zip(nnodes_device, gridtype, t1, t2, t3, r1, r2, r3):
-                data = [node_id, gridtypei,
-                        t1i.real, t2i.real, t3i.real, r1i.real, r2i.real, r3i.real,
-                        t1i.imag, t2i.imag, t3i.imag, r1i.imag, r2i.imag, r3i.imag]
-                fascii.write('  nid, grid_type, dx, dy, dz, rx, ry, rz = %s\n' % data)
-                op2_file.write(s.pack(*data))
+            datai = self.data[itime, :, :]
+            data_out[:, 2:8] = datai.real
+            data_out[:, 8:] = datai.imag
+            op2_file.write(to_endian_bytes(data_out, endian))
+            if is_ascii:
+                for node_id, gridtypei, realsi, imagsi in zip(nnodes_device, gridtype,
+                                                              datai.real.tolist(),
+                                                              datai.imag.tolist()):
+                    data = [node_id, gridtypei] + realsi + imagsi
+                    fascii.write('  nid, grid_type, dx, dy, dz, rx, ry, rz = %s\n' % data)
 
             itable -= 1
             header = [4 * ntotal,]
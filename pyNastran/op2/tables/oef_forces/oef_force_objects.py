@@ -17,7 +17,8 @@ from pyNastran.f06.f06_formatting import (
     write_float_13e, # write_float_12e,
     _eigenvalue_header,
 )
-from pyNastran.op2.op2_interface.write_utils import set_table3_field
+from pyNastran.op2.op2_interface.write_utils import (
+    set_table3_field, view_idtype_as_fdtype, is_ascii_requested, to_endian_bytes)
 from pyNastran.op2.writer.utils import fix_table3_types
 
 
@@ -2396,11 +2397,16 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
 
         #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
 
-        if self.is_sort1:
-            structi = Struct(endian + b'i 8f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
+        # [eid_device, mx, my, mxy, bmx, bmy, bmxy, tx, ty]
+        assert ntotali == 9, ntotali
+        fdtype = np.dtype('float32')
+        data_out = np.empty((nelements, 9), dtype=fdtype)
+        data_out[:, 0] = view_idtype_as_fdtype(eids_device, fdtype)
+        is_ascii = is_ascii_requested(op2_ascii)
+
         op2_ascii.write(f'nelements={nelements:d}\n')
         for itime in range(self.ntimes):
             self._write_table_3(op2_file, op2_ascii, new_result, itable, itime)
@@ -2418,25 +2424,12 @@ class RealPlateForceArray(RealForceObject):  # 33-CQUAD4, 74-CTRIA3
             op2_ascii.write(f'r4 [4, {itable:d}, 4]\n')
             op2_ascii.write(f'r4 [4, {4 * ntotal:d}, 4]\n')
 
-            mx = self.data[itime, :, 0]
-            my = self.data[itime, :, 1]
-            mxy = self.data[itime, :, 2]
-            bmx = self.data[itime, :, 3]
-            bmy = self.data[itime, :, 4]
-            bmxy = self.data[itime, :, 5]
-            tx = self.data[itime, :, 6]
-            ty = self.data[itime, :, 7]
-
-            nwide = 0
-            for eid_device, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi in zip(eids_device, mx, my, mxy, bmx, bmy, bmxy, tx, ty):
-                data = [eid_device, mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi]
-                #[mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi] = write_floats_13e(
-                #    [mxi, myi, mxyi, bmxi, bmyi, bmxyi, txi, tyi])
-                op2_file.write(structi.pack(*data))
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data[1:])))
-                nwide += len(data)
+            data_out[:, 1:] = self.data[itime, :, :]
+            op2_file.write(to_endian_bytes(data_out, endian))
+            if is_ascii:
+                for eid_device, datai in zip(eids_device, self.data[itime, :, :].tolist()):
+                    op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(datai)))
 
-            assert nwide == ntotal, f'nwide={nwide} ntotal={ntotal}'
             itable -= 1
             header = [4 * ntotal,]
             op2_file.write(pack('i', *header))
@@ -5,6 +5,8 @@ from numpy import zeros, searchsorted, ravel
 
 from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
+from pyNastran.op2.op2_interface.write_utils import (
+    view_idtype_as_fdtype, is_ascii_requested, to_endian_bytes)
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object, oes_data_code)
 from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
@@ -320,7 +322,7 @@ class RealBarArray(OES_Object):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -359,11 +361,16 @@ class RealBarArray(OES_Object):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i 15f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
+        # [eid_device, s1a, s2a, s3a, s4a, axial, smaxa, smina, MSt,
+        #              s1b, s2b, s3b, s4b,        smaxb, sminb, MSc]
+        fdtype = np.dtype('float32')
+        data_out = np.empty((nelements, 16), dtype=fdtype)
+        data_out[:, 0] = view_idtype_as_fdtype(eids_device, fdtype)
+        is_ascii = is_ascii_requested(op2_ascii)
+
         op2_ascii.write('nelements=%i\n' % nelements)
         for itime in range(self.ntimes):
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
@@ -381,37 +388,12 @@ class RealBarArray(OES_Object):
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
             op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
 
-            s1a = self.data[itime, :, 0]
-            s2a = self.data[itime, :, 1]
-            s3a = self.data[itime, :, 2]
-            s4a = self.data[itime, :, 3]
-
-            axial = self.data[itime, :, 4]
-            smaxa = self.data[itime, :, 5]
-            smina = self.data[itime, :, 6]
-            MSt = self.data[itime, :, 7]
-
-            s1b = self.data[itime, :, 8]
-            s2b = self.data[itime, :, 9]
-            s3b = self.data[itime, :, 10]
-            s4b = self.data[itime, :, 11]
-
-            smaxb = self.data[itime, :, 12]
-            sminb = self.data[itime, :, 13]
-            MSc = self.data[itime, :, 14]
-
-            for (eid_device,
-                 s1ai, s2ai, s3ai, s4ai, axiali, smaxai, sminai, MSti,
-                 s1bi, s2bi, s3bi, s4bi,         smaxbi, sminbi, MSci) in zip(
-                eids_device,
-                s1a, s2a, s3a, s4a, axial, smaxa, smina, MSt,
-                s1b, s2b, s3b, s4b,        smaxb, sminb, MSc):
-
-                data = [eid_device,
-                        s1ai, s2ai, s3ai, s4ai, axiali, smaxai, sminai, MSti,
-                        s1bi, s2bi, s3bi, s4bi,         smaxbi, sminbi, MSci]
-                op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
-                op2.write(struct1.pack(*data))
+            data_out[:, 1:] = self.data[itime, :, :]
+            op2.write(to_endian_bytes(data_out, endian))
+            if is_ascii:
+                for eid_device, datai in zip(eids_device, self.data[itime, :, :].tolist()):
+                    data = [eid_device] + datai
+                    op2_ascii.write('  eid_device=%s data=%s\n' % (eid_device, str(data)))
 
             itable -= 1
             header = [4 * ntotal,]
@@ -6,6 +6,8 @@ from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
 from pyNastran.f06.f06_formatting import write_floats_12e, _eigenvalue_header
+from pyNastran.op2.op2_interface.write_utils import (
+    view_idtype_as_fdtype, is_ascii_requested, to_endian_bytes)
 
 
 class RealCompositePlateArray(OES_Object):
@@ -388,7 +390,7 @@ class RealCompositePlateArray(OES_Object):
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -428,16 +430,21 @@ class RealCompositePlateArray(OES_Object):
         op2_ascii.write('  #elementi = [eid_device, fd1, sx1, sy1, txy1, angle1, major1, minor1, vm1,\n')
         op2_ascii.write('  #                        fd2, sx2, sy2, txy2, angle2, major2, minor2, vm2,]\n')
 
-        #struct1 = Struct(endian + b'i16f')
-        struct2 = Struct(endian + b'2i 9f')
         if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
+        # [eid_device, layer, o11, o22, t12, t1z, t2z, angle, major, minor, ovm]
+        assert ntotali == 11, ntotali
+        fdtype = np.dtype('float32')
+        data_out = np.empty((nlayers, 11), dtype=fdtype)
+        data_out[:, 0] = view_idtype_as_fdtype(eids_device, fdtype)
+        data_out[:, 1] = view_idtype_as_fdtype(layers, fdtype)
+        is_ascii = is_ascii_requested(op2_ascii)
+
         op2_ascii.write('nelements=%i\n' % nelements)
         ntimes = self.data.shape[0]
 
         for itime in range(ntimes):
-            nwide = 0
             self._write_table_3(op2, op2_ascii, new_result, itable, itime)
 
             # record 4
@@ -458,30 +465,16 @@ class RealCompositePlateArray(OES_Object):
             #f06_file.write(''.join(header + msg))
 
             #[o11, o22, t12, t1z, t2z, angle, major, minor, ovm]
-            o11 = self.data[itime, :, 0]
-            o22 = self.data[itime, :, 1]
-            t12 = self.data[itime, :, 2]
-            t1z = self.data[itime, :, 3]
-            t2z = self.data[itime, :, 4]
-            angle = self.data[itime, :, 5]
-            major = self.data[itime, :, 6]
-            minor = self.data[itime, :, 7]
-            ovm = self.data[itime, :, 8]
-
-            for eid_device, eid, layer, o11i, o22i, t12i, t1zi, t2zi, anglei, majori, minori, ovmi in zip(
-                    eids_device, eids, layers, o11, o22, t12, t1z, t2z, angle, major, minor, ovm):
-
-                data = [eid_device, layer, o11i, o22i, t12i, t1zi, t2zi, anglei, majori, minori, ovmi]
-                op2.write(struct2.pack(*data))
-
-                [o11i, o22i, t12i, t1zi, t2zi, majori, minori, ovmi] = write_floats_12e([
-                    o11i, o22i, t12i, t1zi, t2zi, majori, minori, ovmi])
-                op2_ascii.write('0 %8s %4s  %12s %12s %12s   %12s %12s  %6.2F %12s %12s %s\n'
-                                % (eid, layer, o11i, o22i, t12i, t1zi, t2zi, anglei, majori, minori, ovmi))
-
-                nwide += len(data)
+            data_out[:, 2:] = self.data[itime, :, :]
+            op2.write(to_endian_bytes(data_out, endian))
+            if is_ascii:
+                for eid, layer, datai in zip(eids, layers, self.data[itime, :, :].tolist()):
+                    o11i, o22i, t12i, t1zi, t2zi, anglei, majori, minori, ovmi = datai
+                    [o11i, o22i, t12i, t1zi, t2zi, majori, minori, ovmi] = write_floats_12e([
+                        o11i, o22i, t12i, t1zi, t2zi, majori, minori, ovmi])
+                    op2_ascii.write('0 %8s %4s  %12s %12s %12s   %12s %12s  %6.2F %12s %12s %s\n'
+                                    % (eid, layer, o11i, o22i, t12i, t1zi, t2zi, anglei, majori, minori, ovmi))
 
-            assert nwide == ntotal, "nwide=%s ntotal=%s" % (nwide, ntotal)
             itable -= 1
             header = [4 * ntotal,]
             op2.write(pack('i', *header))
@@ -1,6 +1,5 @@
 # coding: utf-8
 #pylint disable=C0103
-from itertools import count
 from typing import List
 import numpy as np
 
@@ -8,7 +7,9 @@ from pyNastran.utils.numpy_utils import integer_types
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import (
     StressObject, StrainObject, OES_Object)
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
-from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
+from pyNastran.op2.op2_interface.write_utils import view_idtype_as_fdtype, is_ascii_requested
+from pyNastran.f06.f06_formatting import (
+    write_floats_13e_array, write_f06_lines, _eigenvalue_header)
 
 
 class RealPlateArray(OES_Object):
@@ -307,6 +308,30 @@ class RealPlateArray(OES_Object):
 
         #cen_word = 'CEN/%i' % nnodes
         cen_word = cen
+        is_linear = self.element_type in {33, 74, 227, 228, 83}
+        is_bilinear = self.element_type in {64, 70, 75, 82, 144}
+        ilayer = np.arange(len(eids)) % 2
+        blank = np.full(len(eids), '', dtype='<U8')
+        if is_linear:  # CQUAD4, CTRIA3, CTRIAR linear, CQUADR linear
+            fmt = '%s  %6s   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n'
+            is_first = (ilayer == 0)
+            prefix = np.where(is_first, '0', ' ')
+            ids = [np.where(is_first, eids.astype(str), blank)]
+        elif is_bilinear:  # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
+            fmt = '%s  %8s %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n%s'
+            is_cen = (nids == 0) & (ilayer == 0)
+            prefix = np.where(is_cen, '0', ' ')
+            ids = [
+                np.where(is_cen, eids.astype(str), blank),
+                np.where(is_cen, cen_word, np.where(ilayer == 0, nids.astype(str), blank)),
+            ]
+            # a blank line after the second layer
+            suffix = np.where(ilayer == 1, '\n', '')
+        else:  # pragma: no cover
+            msg = 'element_name=%s self.element_type=%s' % (
+                self.element_name, self.element_type)
+            raise NotImplementedError(msg)
+
         for itime in range(ntimes):
             dt = self._times[itime]
             header = _eigenvalue_header(self, header, itime, ntimes, dt)
@@ -315,46 +340,14 @@ class RealPlateArray(OES_Object):
             #print("self.data.shape=%s itime=%s ieids=%s" % (str(self.data.shape), itime, str(ieids)))
 
             #[fiber_dist, oxx, oyy, txy, angle, majorP, minorP, ovm]
-            fiber_dist = self.data[itime, :, 0]
-            oxx = self.data[itime, :, 1]
-            oyy = self.data[itime, :, 2]
-            txy = self.data[itime, :, 3]
-            angle = self.data[itime, :, 4]
-            major_principal = self.data[itime, :, 5]
-            minor_principal = self.data[itime, :, 6]
-            ovm = self.data[itime, :, 7]
-
-            is_linear = self.element_type in {33, 74, 227, 228, 83}
-            is_bilinear = self.element_type in {64, 70, 75, 82, 144}
-            for (i, eid, nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi) in zip(
-                 count(), eids, nids, fiber_dist, oxx, oyy, txy, angle, major_principal, minor_principal, ovm):
-                [fdi, oxxi, oyyi, txyi, major, minor, ovmi] = write_floats_13e(
-                    [fdi, oxxi, oyyi, txyi, major, minor, ovmi])
-                ilayer = i % 2
-                # tria3
-                if is_linear:  # CQUAD4, CTRIA3, CTRIAR linear, CQUADR linear
-                    if ilayer == 0:
-                        f06_file.write('0  %6i   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n' % (
-                            eid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    else:
-                        f06_file.write('   %6s   %-13s     %-13s  %-13s  %-13s   %8.4f   %-13s   %-13s  %s\n' % (
-                            '', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-
-                elif is_bilinear:  # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
-                    # bilinear
-                    if nid == 0 and ilayer == 0:  # CEN
-                        f06_file.write('0  %8i %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
-                            eid, cen_word, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 0:
-                        f06_file.write('   %8s %8i  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
-                            '', nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 1:
-                        f06_file.write('   %8s %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n\n' % (
-                            '', '', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                else:  # pragma: no cover
-                    msg = 'element_name=%s self.element_type=%s' % (
-                        self.element_name, self.element_type)
-                    raise NotImplementedError(msg)
+            datai = self.data[itime, :, :]
+            fdi, oxxi, oyyi, txyi, major, minor, ovmi = write_floats_13e_array(
+                datai[:, [0, 1, 2, 3, 5, 6, 7]]).T
+            anglei = datai[:, 4]
+            columns = [prefix] + ids + [fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi]
+            if is_bilinear:
+                columns.append(suffix)
+            write_f06_lines(f06_file, fmt, columns)
 
             f06_file.write(page_stamp % page_num)
             page_num += 1
@@ -392,11 +385,29 @@ class RealPlateArray(OES_Object):
             raise NotImplementedError('name=%s type=%s' % (self.element_name, self.element_type))
         return nnodes, is_bilinear
 
+    def _write_op2_ascii(self, op2_ascii, data, eids, nids,
+                         is_bilinear: bool, cen_word_ascii: str) -> None:
+        """writes the op2 debug output for a single time"""
+        for i, (eid, nid, datai) in enumerate(zip(eids, nids, data.tolist())):
+            ilayer = i % 2
+            fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi = datai
+            if not is_bilinear:
+                op2_ascii.write('eid=%s ilayer=%i data=%s' % (eid, ilayer, str(datai[1:])))
+            elif nid == 0 and ilayer == 0:  # CEN
+                op2_ascii.write('0  %8i %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
+                    eid, cen_word_ascii, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
+            elif ilayer == 0:
+                op2_ascii.write('   %8s %8i  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
+                    '', nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
+            else:
+                op2_ascii.write('   %8s %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n\n' % (
+                    '', '', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
+
     def write_op2(self, op2, op2_ascii, itable, new_result,
                   date, is_mag_phase=False, endian='>'):
         """writes an OP2"""
         import inspect
-        from struct import Struct, pack
+        from struct import pack
         frame = inspect.currentframe()
         call_frame = inspect.getouterframes(frame, 2)
         op2_ascii.write('%s.write_op2: %s\n' % (self.__class__.__name__, call_frame[1][3]))
@@ -408,12 +419,10 @@ class RealPlateArray(OES_Object):
         nnodes, is_bilinear = self.get_nnodes_bilinear()
         if is_bilinear:
             nnodes_all = nnodes + 1
-            ntotal = 2 + 17 * nnodes_all
         else:
-            nnodes_all = nnodes
+            nnodes_all = 1
         #print("nnodes_all =", nnodes_all)
         cen_word_ascii = 'CEN/%i' % nnodes
-        cen_word = b'CEN/%i' % nnodes
 
         #msg.append('  element_node.shape = %s\n' % str(self.element_node.shape).replace('L', ''))
         #msg.append('  data.shape=%s\n' % str(self.data.shape).replace('L', ''))
@@ -421,8 +430,6 @@ class RealPlateArray(OES_Object):
         eids = self.element_node[:, 0]
         nids = self.element_node[:, 1]
 
-        eids_device = eids * 10 + self.device_code
-
         nelements = len(np.unique(eids))
         # 21 = 1 node, 3 principal, 6 components, 9 vectors, 2 p/ovm
         #ntotal = ((nnodes * 21) + 1) + (nelements * 4)
@@ -437,10 +444,35 @@ class RealPlateArray(OES_Object):
         op2_ascii.write('  #elementi = [eid_device, fd1, sx1, sy1, txy1, angle1, major1, minor1, vm1,\n')
         op2_ascii.write('  #                        fd2, sx2, sy2, txy2, angle2, major2, minor2, vm2,]\n')
 
-        if self.is_sort1:
-            struct1 = Struct(endian + b'i16f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
+        if self.element_type not in [33, 74, 227, 228, 64, 70, 75, 82, 144]:  # pragma: no cover
+            msg = f'element_name={self.element_name} element_type={self.element_type}'
+            raise NotImplementedError(msg)
+
+        # each element has 2 layers per node (plus the centroid for bilinear elements)
+        nrows_per_element = 2 * nnodes_all
+        assert len(eids) == nelements * nrows_per_element, (len(eids), nelements, nrows_per_element)
+        eids_device = eids[::nrows_per_element] * 10 + self.device_code
+
+        #  linear:   [eid_device, fd1, sx1, ..., vm1, fd2, sx2, ..., vm2]
+        #  bilinear: [eid_device, 'CEN/', nid, fd1, sx1, ..., vm2,
+        #                                 nid, fd1, sx1, ..., vm2, ...]
+        fdtype = np.dtype('float32')
+        data_out = np.empty((nelements, ntotali), dtype=fdtype)
+        nwide_expected = 2 + 17 * nnodes_all if is_bilinear else 17
+        assert ntotali == nwide_expected, (ntotali, nwide_expected)
+        data_out[:, 0] = view_idtype_as_fdtype(eids_device, fdtype)
+        if is_bilinear:
+            data_out[:, 1] = np.frombuffer(b'CEN/', dtype=fdtype)[0]
+            # [nid, layer1, layer2] for each node
+            nodes_out = data_out[:, 2:].reshape(nelements, nnodes_all, 17)
+            nodes_out[:, :, 0] = view_idtype_as_fdtype(
+                nids[::2], fdtype).reshape(nelements, nnodes_all)
+            stress_out = nodes_out[:, :, 1:]
+        else:
+            stress_out = data_out[:, 1:].reshape(nelements, 1, 16)
+        is_ascii = is_ascii_requested(op2_ascii)
 
         op2_ascii.write('nelements=%i\n' % nelements)
         for itime in range(self.ntimes):
@@ -459,61 +491,13 @@ class RealPlateArray(OES_Object):
             op2_ascii.write('r4 [4, %s, 4]\n' % (itable))
             op2_ascii.write('r4 [4, %i, 4]\n' % (4 * ntotal))
 
-            fiber_dist = self.data[itime, :, 0]
-            oxx = self.data[itime, :, 1]
-            oyy = self.data[itime, :, 2]
-            txy = self.data[itime, :, 3]
-            angle = self.data[itime, :, 4]
-            major_principal = self.data[itime, :, 5]
-            minor_principal = self.data[itime, :, 6]
-            ovm = self.data[itime, :, 7]
-
-            nwide = 0
-            for (i, eid_device, eid, nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi) in zip(
-                 count(), eids_device, eids, nids, fiber_dist, oxx, oyy, txy, angle, major_principal, minor_principal, ovm):
-                ilayer = i % 2
-                # tria3
-                if self.element_type in [33, 74, 227, 228]:
-                    # CQUAD4, CTRIA3, CTRIAR-linear, CQUADR-linear
-                    if ilayer == 0:
-                        #print([eid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi])
-                        data = [eid_device, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi]
-                        op2.write(pack('i8f', *data))
-                        op2_ascii.write('eid=%s ilayer=0 data=%s' % (eid, str(data[1:])))
-
-                    else:
-                        data = [fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi]
-                        op2.write(pack('8f', *data))
-                        op2_ascii.write('eid=%s ilayer=1 data=%s' % (eid, str(data[1:])))
-                    #print('eid=%-2s ilayer=%s data=%s' % (eid_device, ilayer, str(data[1:])))
-
-                elif self.element_type in [64, 70, 75, 82, 144]:
-                    # CQUAD8, CTRIAR, CTRIA6, CQUADR, CQUAD4
-                    # bilinear
-                    if nid == 0 and ilayer == 0:  # CEN
-                        data = [eid_device, cen_word, nid,
-                                fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi]
-                        op2.write(pack('i 4s i 8f', *data))
-                        op2_ascii.write('0  %8i %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
-                            eid, cen_word_ascii, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 0:
-                        data = [nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi]
-                        op2.write(pack('i 8f', *data))
-                        op2_ascii.write('   %8s %8i  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n' % (
-                            '', nid, fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    elif ilayer == 1:
-                        data = [fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi]
-                        op2.write(pack('8f', *data))
-                        op2_ascii.write('   %8s %8s  %-13s  %-13s %-13s %-13s   %8.4f  %-13s %-13s %s\n\n' % (
-                            '', '', fdi, oxxi, oyyi, txyi, anglei, major, minor, ovmi))
-                    else:  # pragma: no cover
-                        raise RuntimeError()
-                else:  # pragma: no cover
-                    msg = f'element_name={self.element_name} element_type={self.element_type}'
-                    raise NotImplementedError(msg)
-                nwide += len(data)
-
-            assert nwide == ntotal, "nwide=%s ntotal=%s" % (nwide, ntotal)
+            # [fiber_dist, oxx, oyy, txy, angle, major_principal, minor_principal, ovm]
+            stress_out[:, :, :] = self.data[itime, :, :].reshape(nelements, nnodes_all, 16)
+            op2.write(data_out)
+            if is_ascii:
+                self._write_op2_ascii(op2_ascii, self.data[itime, :, :],
+                                      eids, nids, is_bilinear, cen_word_ascii)
+
             itable -= 1
             header = [4 * ntotal,]
             op2.write(pack('i', *header))
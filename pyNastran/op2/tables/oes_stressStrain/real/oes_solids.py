@@ -1,6 +1,6 @@
 # pylint: disable=C0301,C0103,R0913,R0914,R0904,C0111,R0201,R0902
 from itertools import count
-from struct import Struct, pack
+from struct import pack
 from typing import Tuple, List, Any
 
 import numpy as np
@@ -11,7 +11,8 @@ from pyNastran.utils.numpy_utils import integer_types, float_types
 from pyNastran.f06.f06_formatting import write_floats_13e, _eigenvalue_header
 from pyNastran.op2.result_objects.op2_objects import get_times_dtype
 from pyNastran.op2.tables.oes_stressStrain.real.oes_objects import StressObject, StrainObject, OES_Object
-from pyNastran.op2.op2_interface.write_utils import to_column_bytes
+from pyNastran.op2.op2_interface.write_utils import (
+    to_column_bytes, view_idtype_as_fdtype, is_ascii_requested)
 
 
 class RealSolidArray(OES_Object):
@@ -460,14 +461,29 @@ class RealSolidArray(OES_Object):
         #print('ntotal=%s' % (ntotal))
         #assert ntotal == 193, ntotal
 
-        if self.is_sort1:
-            #op2_format = endian + b'2i6f'
-            struct1 = Struct(endian + b'ii4si')
-            struct2 = Struct(endian + b'i20f')
-        else:
+        if not self.is_sort1:
             raise NotImplementedError('SORT2')
 
-        cen = b'GRID'
+        # [eid_device, cid, 'GRID', nnodes] + [nid, oxx, txy, ..., v20] for each node
+        cnnodes = nnodes_expected + 1
+        assert ntotali == 4 + 21 * cnnodes, (ntotali, cnnodes)
+        assert nelements_nodes == nelements * cnnodes, (nelements_nodes, nelements, cnnodes)
+        eids_element = eids2[::cnnodes]
+        if np.array_equal(eids_element, eids3):
+            cids = cids3
+        else:
+            cids = np.array([cids3[where(eids3 == eid)[0][0]] for eid in eids_element])
+
+        fdtype = np.dtype('float32')
+        data_out = np.empty((nelements, ntotali), dtype=fdtype)
+        data_out[:, 0] = view_idtype_as_fdtype(eids_element * 10 + self.device_code, fdtype)
+        data_out[:, 1] = view_idtype_as_fdtype(cids, fdtype)
+        data_out[:, 2] = np.frombuffer(b'GRID', dtype=fdtype)[0]
+        data_out[:, 3] = view_idtype_as_fdtype(np.full(nelements, nnodes_expected, dtype='int32'), fdtype)
+        node_out = np.empty((nelements_nodes, 21), dtype=fdtype)
+        node_out[:, 0] = view_idtype_as_fdtype(nodes, fdtype)
+        is_ascii = is_ascii_requested(op2_ascii)
+
         op2_ascii.write(f'nelements={nelements:d}\n')
         for itime in range(self.ntimes):
             self._write_table_3(op2_file, op2_ascii, new_result, itable, itime)
@@ -497,46 +513,36 @@ class RealSolidArray(OES_Object):
             ovm = self.data[itime, :, 9]
             p = (o1 + o2 + o3) / -3.
 
-            #print('eids3', eids3)
-            cnnodes = nnodes_expected + 1
-            for i, deid, node_id, doxx, doyy, dozz, dtxy, dtyz, dtxz, do1, do2, do3, dp, dovm in zip(
-                    count(), eids2, nodes, oxx, oyy, ozz, txy, tyz, txz, o1, o2, o3, p, ovm):
-                #print('  eid =', deid, node_id)
-
-                j = where(eids3 == deid)[0]
-                assert len(j) > 0, j
-                cid = cids3[j][0]
-                A = [[doxx, dtxy, dtxz],
-                     [dtxy, doyy, dtyz],
-                     [dtxz, dtyz, dozz]]
-                (_lambda, v) = eigh(A)  # a hermitian matrix is a symmetric-real matrix
-
-                #node_id, oxxi, txyi, o1i, v[0, 1], v[0, 2], v[0, 0], pi, ovmi,
-                    #'', oyyi, tyzi, o2i, v[1, 1], v[1, 2], v[1, 0],
-                    #'', ozzi, txzi, o3i, v[2, 1], v[2, 2], v[2, 0]
-                    #(grid_device, sxx, sxy, s1, a1, a2, a3, pressure, svm,
-                     #syy, syz, s2, b1, b2, b3,
-                     #szz, sxz, s3, c1, c2, c3)
-
-                if i % cnnodes == 0:
-                    data = [deid * 10 + self.device_code, cid, cen, nnodes_expected]
-                    op2_ascii.write('  eid=%s cid=%s cen=%s nnodes = %s\n' % tuple(data))
-                    op2_file.write(
-                        struct1.pack(*data)
-                        #pack(b'2i 4s i', *data)
-                    )
-                #else:
-                op2_ascii.write('    nid=%i\n' % node_id)
-
-                data = [node_id,
-                        doxx, dtxy, do1, v[0, 1], v[0, 2], v[0, 0], dp, dovm,
-                        doyy, dtyz, do2, v[1, 1], v[1, 2], v[1, 0],
-                        dozz, dtxz, do3, v[2, 1], v[2, 2], v[2, 0], ]
-                op2_ascii.write('      oxx, txy, o1, v01, v02, v00, p, ovm = %s\n' % data[1:8])
-                op2_ascii.write('      oyy, tyz, o2, v11, v12, v10         = %s\n' % data[8:14])
-                op2_ascii.write('      ozz, txz, o3, v21, v22, v20         = %s\n' % data[14:])
-                op2_file.write(struct2.pack(*data))
-                i += 1
+            # the principal directions; a hermitian matrix is a symmetric-real matrix
+            A = np.empty((nelements_nodes, 3, 3), dtype=self.data.dtype)
+            A[:, 0, 0] = oxx
+            A[:, 1, 1] = oyy
+            A[:, 2, 2] = ozz
+            A[:, 0, 1] = A[:, 1, 0] = txy
+            A[:, 1, 2] = A[:, 2, 1] = tyz
+            A[:, 0, 2] = A[:, 2, 0] = txz
+            unused_lambda, v = eigh(A)
+
+            #(grid_device, sxx, sxy, s1, a1, a2, a3, pressure, svm,
+             #syy, syz, s2, b1, b2, b3,
+             #szz, sxz, s3, c1, c2, c3)
+            for icol, col in enumerate([
+                    oxx, txy, o1, v[:, 0, 1], v[:, 0, 2], v[:, 0, 0], p, ovm,
+                    oyy, tyz, o2, v[:, 1, 1], v[:, 1, 2], v[:, 1, 0],
+                    ozz, txz, o3, v[:, 2, 1], v[:, 2, 2], v[:, 2, 0]]):
+                node_out[:, icol + 1] = col
+            data_out[:, 4:] = node_out.reshape(nelements, cnnodes * 21)
+            op2_file.write(data_out)
+
+            if is_ascii:
+                for i, deid, node_id, datai in zip(count(), eids2, nodes, node_out[:, 1:].tolist()):
+                    if i % cnnodes == 0:
+                        op2_ascii.write('  eid=%s cid=%s cen=%s nnodes = %s\n' % (
+                            deid * 10 + self.device_code, cids[i // cnnodes], b'GRID', nnodes_expected))
+                    op2_ascii.write('    nid=%i\n' % node_id)
+                    op2_ascii.write('      oxx, txy, o1, v01, v02, v00, p, ovm = %s\n' % datai[:7])
+                    op2_ascii.write('      oyy, tyz, o2, v11, v12, v10         = %s\n' % datai[7:13])
+                    op2_ascii.write('      ozz, txz, o3, v21, v22, v20         = %s\n' % datai[13:])
 
             itable -= 1
             header = [4 * ntotal,]
@@ -685,9 +685,10 @@ class RealGridPointForcesArray(GridPointForces):
         eids : (Nelements, ) int ndarray
             an array of element ids to consider
         nids : (Nnodes, ) int ndarray
-            an array of node ids corresponding to xyz_cid0
+            an array of node ids corresponding to xyz_cid0;
+            grid point forces at other nodes are skipped
         icd_transform : dict[cd] = (Nnodesi, ) int ndarray
-            the mapping for nid_cd
+            the mapping for nid_cd (unused)
         element_centroids_cid0 : (Nelements, 3) float ndarray
             an array of element centroids corresponding to eids
         coords : dict[int] = CORDx
@@ -706,6 +707,15 @@ class RealGridPointForcesArray(GridPointForces):
         idir : int; default=0
             the axis of the coordinate system to consider
             as the axial direction
+        itime : int / None; default=0
+            int : the time to extract loads for
+            None : extract loads for all the times
+
+        Returns
+        -------
+        force_sum / moment_sum : (nstations, 3) float ndarray
+            the forces/moments at each station in the coord_out frame;
+            (ntimes, nstations, 3) if itime is None
 
         Notes
         -----
@@ -717,6 +727,14 @@ class RealGridPointForcesArray(GridPointForces):
         3b. Extract the interface loads and sum them about the
             summation point.
 
+        A grid point force row (nid, eid) is included at a station when
+        ``x_centroid[eid] <= station <= x[nid]``, so each row contributes
+        to a contiguous range of the sorted stations.  The rows are
+        summed with a single segmented reduction and cumulative sum
+        over the stations, rather than calling ``extract_interface_loads``
+        for every station.  The r x F term is split into
+        ``r x F - summation_point x F``, so it can be summed the same way.
+
         Examples
         --------
         Imagine a swept aircraft wing.  Define a coordinate system
@@ -728,66 +746,132 @@ class RealGridPointForcesArray(GridPointForces):
         .. todo:: Not Tested...Does 3b work?  Can 3a give the right answer?
 
         """
+        stations = np.asarray(stations, dtype='float64')
         nstations = len(stations)
         assert coord_out.type in ['CORD2R', 'CORD1R'], coord_out.type
         beta = coord_out.beta()
-        element_centroids_coord = element_centroids_cid0.dot(beta)
-        xyz_coord = xyz_cid0.dot(beta)
-        x_centroid = element_centroids_coord[:, idir]
-        x_coord = xyz_coord[:, idir]
-        #print(f'xmin={x_centroid.min()} xmax={x_centroid.max()} (centroids)')
-        #print(f'xmin={x_coord.min()} xmax={x_coord.max()}')
-
-        eids = np.unique(eids)
-        force_sum = zeros((nstations, 3), dtype='float32')
-        moment_sum = zeros((nstations, 3), dtype='float32')
-
-        for istation, station in enumerate(stations):
-            # we're picking the elements on one side of the centroid
-            # and nodes on the other side
-
-            # Calculate the nodes on the boundary.
-            # If we make a cutting plane and find all the nodes on
-            # one side of the cutting plane, we can take all the
-            # nodes within some tolerance of the station direction and
-            # find the free nodes
-            i = np.where(x_centroid <= station)[0]
-            j = np.where(x_coord >= station)[0]
-
-            # we'd break if we knew the user was traveling in the
-            # "correct" direction, but we don't
-            if len(i) == 0:
-                continue
-            if len(j) == 0:
-                continue
-            # summation point creation
-            offset = np.zeros(3, dtype='float64')
-            offset[idir] = station
-            summation_point = coord_out.origin + offset
-
-            if 0: # pragma: no cover
-                # I don't think this will work...
-                forcei, momenti = self.extract_freebody_loads(
-                    eids[i],
-                    coord_out, coords, nid_cd, icd_transform,
-                    # xyz_cid0, summation_point,
-                    itime=itime, debug=debug, log=log)
-
-                force_sum[istation, :] = forcei.sum(axis=0)
-                # TODO: extract_freebody_loads doesn't sum forces/moments
-                #       sum loads about summation point
-                moment_sum[istation, :] = momenti.sum(axis=0)
-            else:
-                forcei, momenti, force_sumi, moment_sumi = self.extract_interface_loads(
-                    eids[i], nids[j],
-                    coord_out, coords, nid_cd, icd_transform,
-                    xyz_cid0, summation_point, itime=itime, debug=debug,
-                    log=log)
-                log.info('neids=%s nnodes=%s force=%s moment=%s' % (
-                    len(i), len(j), force_sumi, moment_sumi
-                ))
-                force_sum[istation, :] = force_sumi
-                moment_sum[istation, :] = moment_sumi
+        x_centroid = element_centroids_cid0.dot(beta)[:, idir]
+        x_coord = xyz_cid0.dot(beta)[:, idir]
+
+        # summation point creation
+        offsets = np.zeros((nstations, 3), dtype='float64')
+        offsets[:, idir] = stations
+        summation_points = coord_out.origin + offsets
+
+        if itime is None:
+            itimes = np.arange(self.node_element.shape[0])
+        else:
+            itimes = np.array([itime])
+        ntimes = len(itimes)
+        force_sum = zeros((ntimes, nstations, 3), dtype='float32')
+        moment_sum = zeros((ntimes, nstations, 3), dtype='float32')
+
+        # the rows are usually the same for every time, so we can process
+        # the times together
+        node_element0 = self.node_element[itimes[0], :, :]
+        if all(array_equal(self.node_element[itimei, :, :], node_element0) for itimei in itimes[1:]):
+            time_groups = [np.arange(ntimes)]
+        else:
+            time_groups = [np.array([i]) for i in range(ntimes)]
+
+        for jtimes in time_groups:
+            force_sumi, moment_sumi = self._station_sums(
+                itimes[jtimes], stations, summation_points,
+                eids, nids, x_centroid, nid_cd, xyz_cid0, x_coord, coords, log)
+            force_sum[jtimes, :, :] = force_sumi @ beta.T
+            moment_sum[jtimes, :, :] = moment_sumi @ beta.T
+
+        if debug:
+            for istation in range(nstations):
+                log.info('station=%s force=%s moment=%s' % (
+                    stations[istation], force_sum[:, istation, :], moment_sum[:, istation, :]))
+        if itime is not None:
+            return force_sum[0, :, :], moment_sum[0, :, :]
+        return force_sum, moment_sum
+
+    def _station_sums(self, itimes, stations, summation_points,
+                      eids, nids, x_centroid, nid_cd, xyz_cid0, x_coord,
+                      coords, log, nvalues_chunk=10_000_000):
+        """
+        Sums the interface loads at all the stations for a set of times
+        that share the same grid point force rows
+
+        Returns
+        -------
+        force_sum / moment_sum : (ntimes, nstations, 3) float ndarray
+            the forces/moments about the summation points in the global frame
+        """
+        nstations = len(stations)
+        ntimes = len(itimes)
+        force_sum = zeros((ntimes, nstations, 3), dtype='float64')
+        moment_sum = zeros((ntimes, nstations, 3), dtype='float64')
+
+        gpforce_nids = self.node_element[itimes[0], :, 0]
+        gpforce_eids = self.node_element[itimes[0], :, 1]
+
+        # map the rows to the elements, the node positions and the node CD frames
+        ieid, is_eid = _lookup_ids(eids, gpforce_eids)
+        inid, is_nid = _lookup_ids(nids, gpforce_nids)
+        icd, is_cd = _lookup_ids(nid_cd[:, 0], gpforce_nids)
+
+        # each row contributes to the stations in [istation0, istation1)
+        irow = np.where(is_eid & is_nid & is_cd)[0]
+        ieid = ieid[irow]
+        inid = inid[irow]
+        icd = icd[irow]
+        isort_station = np.argsort(stations)
+        sorted_stations = stations[isort_station]
+        istation0 = np.searchsorted(sorted_stations, x_centroid[ieid], side='left')
+        istation1 = np.searchsorted(sorted_stations, x_coord[inid], side='right')
+        is_used = istation0 < istation1
+        irow = irow[is_used]
+        inid = inid[is_used]
+        icd = icd[is_used]
+        istation0 = istation0[is_used]
+        istation1 = istation1[is_used]
+        nrows = len(irow)
+        if nrows == 0:
+            if log is not None:
+                log.warning('no nodes/elements found at any station')
+            return force_sum, moment_sum
+
+        # rotate the loads from the output (CD) frames into the global frame
+        cds = nid_cd[icd, 1]
+        ucds = np.unique(cds)
+        cd_rows = [(np.where(cds == cd)[0], coords[cd].beta()) for cd in ucds]
+        xyz = xyz_cid0[inid, :]
+
+        # the segments of rows that start/stop at a station
+        order0 = np.argsort(istation0, kind='stable')
+        ustation0, ifirst0 = np.unique(istation0[order0], return_index=True)
+        order1 = np.argsort(istation1, kind='stable')
+        ustation1, ifirst1 = np.unique(istation1[order1], return_index=True)
+
+        ntimes_chunk = max(1, nvalues_chunk // (9 * nrows))
+        for itime0 in range(0, ntimes, ntimes_chunk):
+            itime1 = min(itime0 + ntimes_chunk, ntimes)
+            datai = self.data[itimes[itime0:itime1], :, :][:, irow, :]
+
+            # [force, moment, r x force] in the global frame
+            values = np.zeros((itime1 - itime0, nrows, 9), dtype='float64')
+            for jrow, beta_cd in cd_rows:
+                values[:, jrow, :3] = -datai[:, jrow, :3] @ beta_cd
+                values[:, jrow, 3:6] = -datai[:, jrow, 3:] @ beta_cd
+            values[:, :, 6:] = np.cross(xyz[np.newaxis, :, :], values[:, :, :3])
+
+            # difference array over the stations, then a cumulative sum
+            delta = np.zeros((itime1 - itime0, nstations + 1, 9), dtype='float64')
+            delta[:, ustation0, :] += np.add.reduceat(values[:, order0, :], ifirst0, axis=1)
+            delta[:, ustation1, :] -= np.add.reduceat(values[:, order1, :], ifirst1, axis=1)
+            sums = np.cumsum(delta[:, :nstations, :], axis=1)
+
+            force = np.empty(sums[:, :, :3].shape, dtype='float64')
+            force[:, isort_station, :] = sums[:, :, :3]
+            moment_rxf = np.empty(force.shape, dtype='float64')
+            moment_rxf[:, isort_station, :] = sums[:, :, 3:6] + sums[:, :, 6:]
+            force_sum[itime0:itime1, :, :] = force
+            moment_sum[itime0:itime1, :, :] = moment_rxf - np.cross(
+                summation_points[np.newaxis, :, :], force)
         return force_sum, moment_sum
 
     def add_sort1(self, dt, node_id, eid, ename, t1, t2, t3, r1, r2, r3):
@@ -1736,3 +1820,27 @@ class ComplexGridPointForcesArray(GridPointForces):
             op2_ascii.write('footer = %s\n' % header)
             new_result = False
         return itable
+
+
+def _lookup_ids(all_ids, ids):
+    """
+    Finds the index of each id in an unsorted array of ids
+
+    Returns
+    -------
+    index : (n, ) int ndarray
+        the index of ids in all_ids; 0 if the id isn't found
+    is_found : (n, ) bool ndarray
+        is the id in all_ids
+
+    """
+    all_ids = np.asarray(all_ids)
+    ids = np.asarray(ids)
+    if len(all_ids) == 0:
+        return np.zeros(ids.shape, dtype='int64'), np.zeros(ids.shape, dtype='bool')
+    isort = np.argsort(all_ids)
+    index = np.searchsorted(all_ids, ids, sorter=isort)
+    index[index == len(all_ids)] = 0
+    index = isort[index]
+    is_found = all_ids[index] == ids
+    return index, is_found
@@ -10,7 +10,8 @@ import pyNastran
 from pyNastran.op2.op2 import OP2
 from pyNastran.op2.op2_geom import read_op2_geom
 
-from pyNastran.op2.tables.ogf_gridPointForces.ogf_objects import RealGridPointForcesArray
+from pyNastran.op2.tables.ogf_gridPointForces.ogf_objects import (
+    RealGridPointForcesArray, _lookup_ids)
 
 test_path = pyNastran.__path__[0]
 model_path = os.path.abspath(os.path.join(test_path, '..', 'models'))
@@ -105,6 +106,17 @@ class TestGridPointForces(unittest.TestCase):
             log=op2.log)
         #print(gpforce)
 
+    def test_gpforce_lookup_ids(self):
+        """tests the id lookup for the grid point force filters"""
+        index, is_found = _lookup_ids([30, 10, 20], [20, 15, 30, 40])
+        assert np.array_equal(index[is_found], [2, 0]), index
+        assert np.array_equal(is_found, [True, False, True, False]), is_found
+
+        # nothing to find in
+        index, is_found = _lookup_ids(np.array([], dtype='int32'), [20, 15])
+        assert index.shape == (2, ), index.shape
+        assert not is_found.any(), is_found
+
     def test_op2_solid_shell_bar_01_gpforce(self):
         folder = os.path.join(model_path, 'sol_101_elements')
         #bdf_filename = os.path.join(folder, 'static_solid_shell_bar.bdf')
@@ -437,6 +449,12 @@ class TestGridPointForces(unittest.TestCase):
         #print("spc_goal =\n", op2_2.spc_forces[1].data[0, -3:, :])
         #print("gpf_goal =\n", op2_2.grid_point_forces[1].data[0, :2, :])
 
+        # the cylindrical/spherical grid point forces match the basic model
+        gpforce_1 = op2_1.grid_point_forces[1]
+        gpforce_2 = op2_2.grid_point_forces[1]
+        assert np.array_equal(gpforce_1.node_element, gpforce_2.node_element)
+        assert np.allclose(gpforce_1.data, gpforce_2.data, atol=1e-3), np.abs(
+            gpforce_1.data - gpforce_2.data).max()
         return
         msg = 'displacements baseline=\n%s\ndisplacements xyz=\n%s' % (
             op2_1.displacements[1].data[0, :, :], op2_2.displacements[1].data[0, :, :])
@@ -481,6 +499,65 @@ class TestGridPointForces(unittest.TestCase):
                 np.abs(total_moment_local_expected - total_moment_local))
             self.assertTrue(np.allclose(total_moment_local_expected, total_moment_local, atol=0.005), msg)
 
+    def test_op2_solid_shell_bar_01_shear_moment_diagram(self):
+        """the batched diagram matches a station-by-station interface load sum"""
+        from pyNastran.bdf.mesh_utils.cut_model_by_plane import get_element_centroids
+        log = SimpleLogger(level='warning')
+        folder = os.path.join(model_path, 'sol_101_elements')
+        for op2_filename in ['static_solid_shell_bar_xyz.op2', 'transient_solid_shell_bar.op2']:
+            model = read_op2_geom(os.path.join(folder, op2_filename), xref=True, log=log)
+            nid_cp_cd, xyz_cid0, unused_xyz_cp, icd_transform, unused_icp_transform = (
+                model.get_xyz_in_coord_array(cid=0))
+            nids = nid_cp_cd[:, 0]
+            nid_cd = nid_cp_cd[:, [0, 2]]
+            eids, element_centroids_cid0 = get_element_centroids(model)
+            coord_out = model.coords[0]
+            gpforce = model.grid_point_forces[1]
+
+            idir = 0
+            x_centroid = element_centroids_cid0[:, idir]
+            x_coord = xyz_cid0[:, idir]
+            stations = np.linspace(x_centroid.min() - 0.1, x_centroid.max() + 0.1, 11)
+            force_sum, moment_sum = gpforce.shear_moment_diagram(
+                xyz_cid0, eids, nids, icd_transform, element_centroids_cid0,
+                model.coords, nid_cd, stations, coord_out,
+                idir=idir, itime=0, log=log)
+            assert force_sum.shape == (len(stations), 3), force_sum.shape
+
+            # all the times at once
+            force_sum2, moment_sum2 = gpforce.shear_moment_diagram(
+                xyz_cid0, eids, nids, icd_transform, element_centroids_cid0,
+                model.coords, nid_cd, stations, coord_out,
+                idir=idir, itime=None, log=log)
+            ntimes = gpforce.data.shape[0]
+            assert force_sum2.shape == (ntimes, len(stations), 3), force_sum2.shape
+            assert np.allclose(force_sum2[0], force_sum)
+            assert np.allclose(moment_sum2[0], moment_sum)
+
+            ncheck = 0
+            for itime in range(ntimes):
+                for istation, station in enumerate(stations):
+                    i = np.where(x_centroid <= station)[0]
+                    j = np.where(x_coord >= station)[0]
+                    if len(i) == 0 or len(j) == 0:
+                        continue
+                    summation_point = np.array([station, 0., 0.])
+                    try:
+                        out = gpforce.extract_interface_loads(
+                            nids[j], eids[i], coord_out, model.coords, nid_cd, icd_transform,
+                            xyz_cid0, summation_point, itime=itime, log=log)
+                    except RuntimeError:
+                        # no interface; the batched version returns zeros
+                        assert np.abs(force_sum2[itime, istation, :]).max() == 0., istation
+                        continue
+                    force_expected, moment_expected = out[2], out[3]
+                    case = (op2_filename, itime, istation)
+                    assert np.allclose(force_sum2[itime, istation, :], force_expected, atol=1e-3), case
+                    assert np.allclose(moment_sum2[itime, istation, :], moment_expected, atol=1e-3), case
+                    ncheck += 1
+            assert ncheck > 0, op2_filename
+
+
 def _get_gpforce_data():
     data = [
         #eids, nids, cid, summation_point
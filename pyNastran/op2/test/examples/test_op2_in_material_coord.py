@@ -8,7 +8,7 @@ from pyNastran.utils import print_bad_path
 from pyNastran.bdf.bdf import BDF
 from pyNastran.op2.op2 import OP2
 from pyNastran.op2.data_in_material_coord import (
-    data_in_material_coord,
+    data_in_material_coord, get_material_angles,
     get_eids_from_op2_vector, force_vectors, stress_vectors,
     strain_vectors)
 pkg_path = pyNastran.__path__[0]
@@ -111,6 +111,36 @@ class TestMaterialCoordReal(unittest.TestCase):
                     assert np.allclose(data[:, check], ref_result, rtol=RTOL, atol=ATOL)
             #print('OK')
 
+    def test_composite_strain(self):
+        """the ply strains in the material coordinate system vary linearly through the laminate"""
+        log = get_logger(level='warning')
+        bdf = BDF(debug=False, log=log)
+        op2 = OP2(debug=False, log=log)
+        basepath = os.path.join(pkg_path, 'op2', 'test', 'examples', 'test_flat_plate_composite')
+        bdf.read_bdf(os.path.join(basepath, 'flat_plate_composite.bdf'))
+        op2.read_op2(os.path.join(basepath, 'flat_plate_composite.op2'))
+        ply_strain = op2.cquad4_composite_strain[1].data.copy()
+
+        material_angles = get_material_angles(bdf)
+        op2_new = data_in_material_coord(bdf, op2, material_angles=material_angles)
+
+        # the original op2 is unchanged & the other results aren't copied
+        assert np.array_equal(op2.cquad4_composite_strain[1].data, ply_strain)
+        assert op2_new.cquad4_composite_strain[1] is not op2.cquad4_composite_strain[1]
+        assert op2_new.cquad8_composite_strain[1] is not op2.cquad8_composite_strain[1]
+        assert op2_new.displacements is op2.displacements
+
+        vector = op2_new.cquad4_composite_strain[1]
+        for eid in np.unique(vector.element_layer[:, 0])[:5]:
+            irow = np.where(vector.element_layer[:, 0] == eid)[0]
+            prop = bdf.properties[bdf.elements[eid].pid]
+            z = prop.get_z_locations()
+            zply = (z[:-1] + z[1:])[vector.element_layer[irow, 1] - 1] / 2.
+            for icol in range(3):
+                strain = vector.data[0, irow, icol]
+                fit = np.polyval(np.polyfit(zply, strain, 1), zply)
+                assert np.allclose(fit, strain, atol=1e-3 * np.abs(strain).max())
+
 
 if __name__ == '__main__':  # pragma: no cover
     unittest.main()
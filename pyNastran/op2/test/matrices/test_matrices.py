@@ -1,5 +1,6 @@
 """defines OP2 Matrix Test"""
 import os
+import tempfile
 import unittest
 
 import numpy as np
@@ -73,6 +74,36 @@ class TestOP2Matrix(unittest.TestCase):
             #print(sil, 'neids=%s cdof=%s ndof=%s dof/grid=%s ngrid=%s' % (sil.shape[0], ndofci, ndofi, dof_per_grid, numgrid))
         #print(kdict)
 
+    def test_matrix_output(self):
+        """Tests writing the matrices to npz/h5 files instead of holding them in memory"""
+        op2_filename = os.path.join(PKG_PATH, 'op2', 'test', 'matrices', 'gpsc1.op2')
+        model = read_op2_geom(op2_filename, debug=False)
+        for file_format in ['npz', 'h5']:
+            with tempfile.TemporaryDirectory() as dirname:
+                op2 = OP2(debug=False)
+                op2.set_matrix_output(dirname, file_format=file_format)
+                op2.read_op2(op2_filename)
+                assert 'MRGGT' in op2.matrices  # MATPOOL
+                assert 'DELTAK' in op2.matrices  # MATRIX
+                for name, matrix in op2.matrices.items():
+                    assert matrix.data is None, name
+                    assert matrix.filename == os.path.join(dirname, f'{name}.{file_format}')
+                    data = matrix.load()
+                    assert data.format == 'coo', data.format
+                    expected = model.matrices[name].data
+                    assert expected.format == 'coo', expected.format
+                    assert np.array_equal(data.toarray(), expected.toarray()), name
+
+    def test_matrix_unknown_dtype(self):
+        """a MATRIX with an unknown tout is skipped instead of being built"""
+        from pyNastran.op2.op2_interface.op2_reader import _CscColumnBuffer
+        op2 = OP2(debug=False)
+        columns = _CscColumnBuffer(2, 2, 'float32')
+        columns.add(0, 0, np.array([1., 2.], dtype='float32'))
+        assert op2.op2_reader._cast_matrix_mat(columns, 2, 2, '???') is None
+        matrix = op2.op2_reader._cast_matrix_mat(columns, 2, 2, 'float32')
+        assert np.array_equal(matrix.toarray(), [[1., 0.], [2., 0.]])
+
     def test_op2_dmi_01(self):
         """tests DMI matrix style"""
         bdf_filename = os.path.join(MODEL_PATH, 'matrix', 'matrix.dat')
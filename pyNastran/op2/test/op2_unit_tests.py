@@ -1,6 +1,9 @@
 """various OP2 tests"""
 import os
+import tempfile
 import unittest
+from io import StringIO
+from contextlib import redirect_stdout
 import getpass
 from pathlib import Path
 
@@ -41,6 +44,12 @@ from pyNastran.bdf.mesh_utils.cut_model_by_plane import get_element_centroids, g
     #RealPlateBilinearForceArray, RealPlateForceArray)
 #from pyNastran.op2.tables.ogf_gridPointForces.ogf_objects import RealGridPointForcesArray
 from pyNastran.op2.export_to_vtk import export_to_vtk_filename
+from pyNastran.op2.result_envelope import ResultEnvelope, envelope_op2_files
+from pyNastran.op2.modal_recovery import ModalRecovery
+from pyNastran.op2.nodal_averaging import (
+    NodalAverager, get_nodal_averager, von_mises_2d, principal_2d)
+from pyNastran.op2.random_response import (
+    compute_random_response, psd_inputs_from_randps, miles_rms)
 from pyNastran.op2.vector_utils import filter1d, abs_max_min_global, abs_max_min_vector
 from pyNastran.op2.tables.oug.oug_displacements import RealDisplacementArray
 from pyNastran.femutils.test.utils import is_array_close
@@ -189,6 +198,220 @@ class TestOP2(Tester):
 
         ## TODO: fix the thetad in the cid=3 coordinates (nid=33,34)
 
+    def test_cd_transform_stack(self):
+        """tests the batched CD transforms are cached and match the per-node transform"""
+        log = get_logger(level='warning')
+        bdf_model = BDF(log=log)
+        bdf_model.add_cord2r(1, [1., 2., 3.], [1., 2., 4.], [2., 3., 3.])
+        bdf_model.add_cord2c(2, [0., 0., 0.], [0., 0., 1.], [1., 0., 0.])
+        bdf_model.add_cord2c(3, [1., 0., 0.], [1., 1., 1.], [2., 0., 0.])
+        nids = np.arange(1, 21)
+        for nid in nids:
+            bdf_model.add_grid(nid, [nid, 2. * nid, 0.5], cd=nid % 4)
+        bdf_model.cross_reference()
+        out = bdf_model.get_xyz_in_coord_array(cid=0, fdtype='float64', idtype='int32')
+        unused_nid_cp_cd, xyz_cid0, unused_xyz_cp, icd_transform, unused_icp_transform = out
+
+        rng = np.random.default_rng(42)
+        data = rng.random((3, len(nids), 6))
+        expected = data.copy()
+        for cid, inode in icd_transform.items():
+            if cid == 0:
+                continue
+            coord = bdf_model.coords[cid]
+            beta = coord.beta()
+            for inodei in inode:
+                if coord.type == 'CORD2R':
+                    xform = beta.T
+                else:
+                    thetar = np.radians(coord.xyz_to_coord(xyz_cid0[inodei, :])[1])
+                    cos, sin = np.cos(thetar), np.sin(thetar)
+                    rotation = np.array([[cos, -sin, 0.], [sin, cos, 0.], [0., 0., 1.]])
+                    xform = rotation @ beta
+                for itime in range(3):
+                    expected[itime, inodei, :3] = xform @ data[itime, inodei, :3]
+                    expected[itime, inodei, 3:] = xform @ data[itime, inodei, 3:]
+
+        data_code = {
+            'device_code' : 1,
+            'analysis_code' : 1,
+            'table_code' : 1,
+            'nonlinear_factor' : None,
+            'sort_bits' : [0, 0, 0],
+            'sort_method' : 1,
+            'is_msc' : True,
+            'format_code' : 1,
+            'data_names' : [],
+            'tCode' : 1,
+            'table_name' : 'OUGV1',
+            '_encoding' : 'utf-8',
+        }
+        op2_model = OP2(log=log)
+        for isubcase in [1, 2]:
+            disp = RealDisplacementArray(data_code, True, isubcase, None)
+            disp.data = data.copy()
+            op2_model.displacements[isubcase] = disp
+        op2_model.transform_displacements_to_global(
+            icd_transform, bdf_model.coords, xyz_cid0=xyz_cid0)
+        transform_stack = op2_model._cd_transform_cache[3]
+        assert op2_model._get_cd_transform_stack(
+            icd_transform, bdf_model.coords, xyz_cid0) is transform_stack
+        for isubcase in [1, 2]:
+            assert np.allclose(op2_model.displacements[isubcase].data, expected)
+
+    def test_result_envelope(self):
+        """tests the max/min envelope across OP2s matches the loaded results"""
+        log = get_logger(level='warning')
+        folder = MODEL_PATH / 'sol_101_elements'
+        op2_filenames = [
+            str(folder / 'static_solid_shell_bar.op2'),
+            str(folder / 'transient_solid_shell_bar.op2'),
+        ]
+        result_names = ['ctria3_stress', 'cquad4_stress']
+        envelope = envelope_op2_files(op2_filenames, result_names, 'von_mises', log=log)
+        envelope2 = envelope_op2_files(op2_filenames, result_names, 'von_mises',
+                                       nprocesses=2, log=log)
+        assert np.array_equal(envelope.max_value, envelope2.max_value)
+        assert np.array_equal(envelope.max_icase, envelope2.max_icase)
+        str(envelope)
+
+        # the same envelope from the loaded models
+        envelope3 = ResultEnvelope(result_names, 'von_mises')
+        max_values = {}
+        for op2_filename in op2_filenames:
+            model = read_op2(op2_filename, include_results=result_names, log=log)
+            envelope3.add_op2(model, op2_filename)
+            for result_name in result_names:
+                for result in model.get_result(result_name).values():
+                    ivm = result.get_headers().index('von_mises')
+                    vm = result.data[:, :, ivm].max(axis=0)
+                    for eid, vmi in zip(result.element_node[:, 0], vm):
+                        max_values[eid] = max(max_values.get(eid, -np.inf), vmi)
+        assert np.array_equal(envelope.ids, sorted(max_values))
+        assert np.allclose(envelope.max_value, [max_values[eid] for eid in envelope.ids])
+        assert np.array_equal(envelope.min_itime, envelope3.min_itime)
+
+        abs_max_value, abs_max_icase, abs_max_itime, unused_time = envelope.get_abs_max()
+        assert np.array_equal(abs_max_value, envelope.max_value)  # von mises is positive
+        op2_filenames_max, unused_subcases = envelope.get_cases(abs_max_icase)
+        for op2_filename, itime in zip(op2_filenames_max, abs_max_itime):
+            if op2_filename == op2_filenames[0]:
+                assert itime == 0, itime
+
+    def test_random_response(self):
+        """tests the PSD/RMS/crossings from a frequency response"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'elements', 'freq_random_elements.op2')
+        model = read_op2(op2_filename, include_results='displacements', log=log)
+        disp = model.displacements[1]
+        freqs = disp._times
+
+        bdf_model = BDF(log=log)
+        bdf_model.add_randps(10, 1, 1, x=4., tid=1)
+        bdf_model.add_tabrnd1(1, [1., 100.], [0.01, 1.], xaxis='LOG', yaxis='LOG')
+        bdf_model.cross_reference()
+        psd_inputs = psd_inputs_from_randps(bdf_model, 10, freqs)
+        assert np.allclose(psd_inputs[(1, 1)],
+                           np.where(freqs >= 1., 4. * 0.01 * freqs, 0.)), psd_inputs
+
+        freqs2, psd, rms, crossings = compute_random_response({1: disp}, psd_inputs)
+        assert np.array_equal(freqs, freqs2)
+        psd_expected = np.abs(disp.data.astype('complex128')) ** 2 * \
+            psd_inputs[(1, 1)].real[:, np.newaxis, np.newaxis]
+        assert np.allclose(psd, psd_expected)
+        psd_f = np.trapz(psd_expected, freqs, axis=0)
+        assert np.allclose(rms, np.sqrt(psd_f))
+        i = np.where(psd_f > 0.)
+        f2_psd_f = np.trapz(freqs[:, np.newaxis, np.newaxis] ** 2 * psd_expected, freqs, axis=0)
+        assert np.allclose(crossings[i], np.sqrt(f2_psd_f[i] / psd_f[i]))
+
+        # chunked without the PSD
+        unused_freqs, psd2, rms2, crossings2 = compute_random_response(
+            {1: disp}, psd_inputs, return_psd=False, nvalues_chunk=50)
+        assert psd2 is None
+        assert np.allclose(rms, rms2)
+        assert np.allclose(crossings, crossings2)
+        assert np.isclose(miles_rms(100., 10., 0.04), np.sqrt(np.pi / 2. * 40.))
+
+    def test_modal_recovery(self):
+        """tests the modal superposition of eigenvectors and modal stresses"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'mode_solid_shell_bar.op2')
+        model = read_op2(op2_filename, include_results=['eigenvectors', 'cquad4_stress'], log=log)
+        eigenvectors = model.eigenvectors[1]
+        nmodes = eigenvectors.data.shape[0]
+        modal_coordinates = np.random.default_rng(42).random((nmodes, 25))
+
+        recovery = ModalRecovery(eigenvectors)
+        assert recovery.headers == ['t1', 't2', 't3', 'r1', 'r2', 'r3'], recovery.headers
+        disp = recovery.recover_all(modal_coordinates, ntimes_chunk=10)
+        disp_expected = np.einsum('mt,mnc->tnc', modal_coordinates, eigenvectors.data)
+        assert np.allclose(disp, disp_expected)
+
+        itimes = [itime for itime, unused_data in recovery.recover(modal_coordinates, ntimes_chunk=10)]
+        assert itimes == [0, 10, 20], itimes
+
+        stress = model.cquad4_stress[1]
+        recovery = ModalRecovery(stress, ids=[7], imodes=[0, 2])
+        assert recovery.headers == ['oxx', 'oyy', 'txy'], recovery.headers
+        assert np.array_equal(np.unique(recovery.ids), [7]), recovery.ids
+        stress_recovered = recovery.recover_all(modal_coordinates[[0, 2], :])
+        irows = np.where(stress.element_node[:, 0] == 7)[0]
+        stress_expected = np.einsum('mt,mnc->tnc', modal_coordinates[[0, 2], :],
+                                    stress.data[[0, 2]][:, irows, 1:4])
+        assert np.allclose(stress_recovered, stress_expected)
+
+    def test_nodal_averaging(self):
+        """tests the element to node mapping of plate stresses"""
+        log = get_logger(level='warning')
+        bdf_model = BDF(log=log)
+        for nid, xyz in enumerate([[0., 0., 0.], [1., 0., 0.], [2., 0., 0.],
+                                   [0., 1., 0.], [1., 1., 0.], [2., 1., 0.]]):
+            bdf_model.add_grid(nid + 1, xyz)
+        bdf_model.add_cquad4(10, 1, [1, 2, 5, 4])
+        bdf_model.add_ctria3(11, 1, [2, 3, 5])
+        bdf_model.add_ctria3(12, 1, [3, 6, 5])
+
+        # (ntimes, nelements, ncolumns)
+        eids = np.array([10, 11, 12])
+        centroid = np.array([
+            [[1., 10.], [2., 20.], [4., 40.]],
+            [[-1., 5.], [3., -20.], [0., 0.]],
+        ])
+        averager = get_nodal_averager(bdf_model, eids)
+        assert get_nodal_averager(bdf_model, eids) is averager
+        assert np.array_equal(averager.nids, [1, 2, 3, 4, 5, 6]), averager.nids
+        mean = averager.mean(centroid)
+        assert mean.shape == (2, 6, 2), mean.shape
+        assert np.allclose(mean[0, :, 0], [1., 1.5, 3., 1., 7. / 3., 4.]), mean[0, :, 0]
+        assert np.allclose(averager.max(centroid)[1, :, 1], [5., 5., 0., 5., 5., 0.])
+        assert np.allclose(averager.abs_max(centroid[1, :, 1]), [5., -20., -20., 5., -20., 0.])
+
+        # the connectivity changed, so the cached averager isn't reused
+        bdf_model.elements[12].nodes = [3, 6, 4]
+        averager2 = get_nodal_averager(bdf_model, eids)
+        assert averager2 is not averager
+        assert np.allclose(averager2.mean(centroid[0, :, 0]), [1., 1.5, 3., 2.5, 1.5, 4.])
+
+        # corner results with 2 fibers
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        model = read_op2(op2_filename, include_results='cquad4_stress', log=log)
+        stress = model.cquad4_stress[1]
+        element_node = stress.element_node[::2, :]
+        averager = NodalAverager.from_element_node(element_node)
+        oxx = stress.data[:, ::2, 1]
+        oxx_mean = averager.mean(oxx)
+        for inode, nid in enumerate(averager.nids):
+            irows = np.where(element_node[:, 1] == nid)[0]
+            assert np.allclose(oxx_mean[:, inode], oxx[:, irows].mean(axis=1))
+
+        oxx, oyy, txy = stress.data[0, :, 1], stress.data[0, :, 2], stress.data[0, :, 3]
+        ovm = von_mises_2d(oxx, oyy, txy)
+        assert np.allclose(ovm, stress.data[0, :, 7], rtol=1e-4)
+        unused_angle, omax, omin = principal_2d(oxx, oyy, txy)
+        assert np.allclose(omax, stress.data[0, :, 5], rtol=1e-4)
+        assert np.allclose(omin, stress.data[0, :, 6], rtol=1e-4)
+
     def test_generalized_tables(self):
         """tests that set_additional_generalized_tables_to_read overwrites the GEOM1S class"""
         log = get_logger(level='warning')
@@ -297,6 +520,39 @@ class TestOP2(Tester):
         os.remove(f06_filename)
         os.remove('temp.debug')
 
+    def test_write_f06_nprocesses(self):
+        """the F06 is the same when the results are rendered in parallel"""
+        log = get_logger(level='warning')
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        for name in ['static_solid_shell_bar', 'mode_solid_shell_bar']:
+            op2_filename = os.path.join(folder, name + '.op2')
+            op2 = read_op2(op2_filename, debug=False, log=log)
+            with tempfile.TemporaryDirectory() as dirname:
+                f06_filename1 = os.path.join(dirname, name + '.test_serial.f06')
+                f06_filename2 = os.path.join(dirname, name + '.test_parallel.f06')
+                op2.write_f06(f06_filename1)
+                op2.page_num = 1
+                op2.write_f06(f06_filename2, nprocesses=2)
+                with open(f06_filename1, 'r') as f06_file1, open(f06_filename2, 'r') as f06_file2:
+                    lines1 = f06_file1.readlines()
+                    lines2 = f06_file2.readlines()
+            assert 'PAGE     3' in ''.join(lines2)
+            assert lines1 == lines2
+
+    def test_write_f06_nprocesses_error(self):
+        """a result that fails to render in parallel is logged like the serial case"""
+        log = get_logger(level='warning')
+        op2_filename = os.path.join(MODEL_PATH, 'sol_101_elements', 'static_solid_shell_bar.op2')
+        op2 = read_op2(op2_filename, debug=False, log=log)
+        displacement = op2.displacements[1]
+        displacement.data = displacement.data[:, :, :2]
+        stdout = StringIO()
+        with tempfile.TemporaryDirectory() as dirname:
+            f06_filename = os.path.join(dirname, 'static_solid_shell_bar.test_error.f06')
+            with self.assertRaises(IndexError), redirect_stdout(stdout):
+                op2.write_f06(f06_filename, nprocesses=2, quiet=True)
+        assert 'type=RealDisplacementArray' in stdout.getvalue(), stdout.getvalue()
+
     def test_beam_modes(self):
         """tests the eigenvalue table reading"""
         log = get_logger(level='warning')
@@ -8,6 +8,7 @@ defines some methods for working with arrays:
  - abs_max_min_vector(values)
  - abs_max_min(values, global_abs_max=True)
  - principal_3d(o11, o22, o33, o12, o23, o13)
+ - get_result_ids(result)
  - transform_force(force_in_local,
                    coord_out, coords,
                    nid_cd, i_transform)
@@ -352,6 +353,32 @@ def principal_3d(o11, o22, o33, o12, o23, o13):
     return pmax, pmin
 
 
+def get_result_ids(result) -> ndarray:
+    """
+    Gets the node/element id for each row of a result
+
+    Parameters
+    ----------
+    result : RealDisplacementArray, RealPlateStressArray, RealCBarForceArray, ...
+        the result
+
+    Returns
+    -------
+    ids : (nrows, ) int ndarray
+        the node id (nodal results) or element id (element results)
+
+    """
+    if hasattr(result, 'node_gridtype'):
+        return result.node_gridtype[:, 0]
+    if hasattr(result, 'element_node'):
+        return result.element_node[:, 0]
+    if hasattr(result, 'element_layer'):
+        return result.element_layer[:, 0]
+    if hasattr(result, 'element'):
+        return result.element
+    raise NotImplementedError(f'{result.class_name} does not have node/element ids')
+
+
 def transform_force(force_in_local,
                     coord_out: CORDx, coords: Dict[int, CORDx],
                     nid_cd: int, unused_icd_transform):
@@ -1,7 +1,12 @@
 from collections import defaultdict
 from struct import pack, Struct
+from typing import List
 
+import numpy as np
+
+from pyNastran.op2.op2_interface.write_utils import is_ascii_requested
 from .geom1_writer import write_geom_header, close_geom_table
+from .utils import pack_columns, get_sorted_cards
 
 def write_ept(op2, op2_ascii, obj, endian=b'<'):
     if not hasattr(obj, 'properties'):
@@ -180,23 +185,20 @@ def write_ept(op2, op2_ascii, obj, endian=b'<'):
 def write_card(op2_file, op2_ascii, obj, name, pids, spack, endian):
     op2_ascii.write('EPT-%s\n' % name)
     if name == 'PELAS':
-        for pid in sorted(pids):
-            prop = obj.properties[pid]
-            #(pid, k, ge, s) = out
-            data = [pid, prop.k, prop.ge, prop.s]
-            op2_file.write(spack.pack(*data))
+        #(pid, k, ge, s) = out
+        pids, props = get_sorted_cards(obj.properties, pids)
+        data = [pids, [prop.k for prop in props], [prop.ge for prop in props],
+                [prop.s for prop in props]]
+        op2_file.write(pack_columns(spack.format, data))
     elif name == 'PDAMP':
-        for pid in sorted(pids):
-            prop = obj.properties[pid]
-            #(pid, b) = out
-            data = [pid, prop.b]
-            op2_file.write(spack.pack(*data))
+        #(pid, b) = out
+        pids, props = get_sorted_cards(obj.properties, pids)
+        op2_file.write(pack_columns(spack.format, [pids, [prop.b for prop in props]]))
     elif name == 'PVISC':
-        for pid in sorted(pids):
-            prop = obj.properties[pid]
-            #(pid, ce, cr) = out
-            data = [pid, prop.ce, prop.cr]
-            op2_file.write(spack.pack(*data))
+        #(pid, ce, cr) = out
+        pids, props = get_sorted_cards(obj.properties, pids)
+        data = [pids, [prop.ce for prop in props], [prop.cr for prop in props]]
+        op2_file.write(pack_columns(spack.format, data))
     elif name == 'PBUSH1D':
         _write_pbush1d(name, obj, pids, spack, op2_file, op2_ascii, endian)
     elif name == 'PTUBE':
@@ -246,6 +248,7 @@ def write_card(op2_file, op2_ascii, obj, name, pids, spack, endian):
         #stress = data[4]
         #isop = data[5]
         #fctn = data[6].decode('latin1')
+        rows = []
         for pid in sorted(pids):
             prop = obj.properties[pid]
             mid = prop.mid
@@ -295,31 +298,32 @@ def write_card(op2_file, op2_ascii, obj, name, pids, spack, endian):
                 raise NotImplementedError('PSOLID; fctn=%r' % prop.fctn)
 
             data = [pid, mid, cordm, integ, stress, isop, fctn]
-            op2_ascii.write('  pid=%s mid=%s data=%s\n' % (pid, mid, data[2:]))
-            op2_file.write(spack.pack(*data))
+            rows.append(data)
+        op2_file.write(pack_columns(spack.format, list(zip(*rows))))
+        if is_ascii_requested(op2_ascii):
+            for data in rows:
+                op2_ascii.write('  pid=%s mid=%s data=%s\n' % (data[0], data[1], data[2:]))
     elif name == 'PSHEAR':
-        for pid in sorted(pids):
-            prop = obj.properties[pid]
-            #(pid, mid, t, nsm, f1, f2) = out
-            data = [pid, prop.mid, prop.t, prop.nsm, prop.f1, prop.f2]
-            op2_ascii.write('  pid=%s mid=%s data=%s\n' % (pid, prop.mid, data[2:]))
-            op2_file.write(spack.pack(*data))
+        #(pid, mid, t, nsm, f1, f2) = out
+        pids, props = get_sorted_cards(obj.properties, pids)
+        data = [pids, [prop.mid for prop in props], [prop.t for prop in props],
+                [prop.nsm for prop in props], [prop.f1 for prop in props],
+                [prop.f2 for prop in props]]
+        op2_file.write(pack_columns(spack.format, data))
+        _write_property_ascii(name, data, op2_ascii)
     elif name == 'PSHELL':
-        for pid in sorted(pids):
-            #(pid, mid1, t, mid2, bk, mid3, ts, nsm, z1, z2, mid4) = out
-            prop = obj.properties[pid]
-            mid1 = 0 if prop.mid1 is None else prop.mid1
-            mid2 = 0 if prop.mid2 is None else prop.mid2
-            mid3 = 0 if prop.mid3 is None else prop.mid3
-            mid4 = 0 if prop.mid4 is None else prop.mid4
-            data = [pid, mid1, prop.t, mid2, prop.twelveIt3, mid3,
-                    prop.tst, prop.nsm, prop.z1, prop.z2, mid4]
-            #print('PSHELL', data)
-            #print(prop.mid1, mid2, prop.mid3, prop.mid4)
-
-            op2_ascii.write(f'  {name} pid={pid} mid1={mid1} data={data[2:]}\n')
-            assert None not in data, f'  {name} pid={pid} mid1={mid1} data={data[2:]}'
-            op2_file.write(spack.pack(*data))
+        #(pid, mid1, t, mid2, bk, mid3, ts, nsm, z1, z2, mid4) = out
+        pids, props = get_sorted_cards(obj.properties, pids)
+        for prop in props:
+            assert None not in [prop.t, prop.twelveIt3, prop.tst, prop.nsm, prop.z1, prop.z2], (
+                f'  {name} pid={prop.pid} mid1={prop.mid1}')
+        data = [pids, _get_mid_array(props, 'mid1'), [prop.t for prop in props],
+                _get_mid_array(props, 'mid2'), [prop.twelveIt3 for prop in props],
+                _get_mid_array(props, 'mid3'), [prop.tst for prop in props],
+                [prop.nsm for prop in props], [prop.z1 for prop in props],
+                [prop.z2 for prop in props], _get_mid_array(props, 'mid4')]
+        op2_file.write(pack_columns(spack.format, data))
+        _write_property_ascii(name, data, op2_ascii)
     elif name == 'PLPLANE':
         #NX 10
         #1 PID     I Property identification number
@@ -350,12 +354,13 @@ def write_card(op2_file, op2_ascii, obj, name, pids, spack, endian):
             op2_ascii.write('  pid=%s mid=%s data=%s\n' % (pid, prop.mid, data[2:]))
             op2_file.write(spack.pack(*data))
     elif name == 'PROD':
-        for pid in sorted(pids):
-            prop = obj.properties[pid]
-            #(pid, mid, a, j, c, nsm) = out
-            data = [pid, prop.mid, prop.A, prop.j, prop.c, prop.nsm]
-            op2_ascii.write('  pid=%s mid=%s data=%s\n' % (pid, prop.mid, data[2:]))
-            op2_file.write(spack.pack(*data))
+        #(pid, mid, a, j, c, nsm) = out
+        pids, props = get_sorted_cards(obj.properties, pids)
+        data = [pids, [prop.mid for prop in props], [prop.A for prop in props],
+                [prop.j for prop in props], [prop.c for prop in props],
+                [prop.nsm for prop in props]]
+        op2_file.write(pack_columns(spack.format, data))
+        _write_property_ascii(name, data, op2_ascii)
     elif name == 'PLSOLID':
         #MSC 2016
         #1 PID I Property identification number
@@ -410,6 +415,19 @@ def write_card(op2_file, op2_ascii, obj, name, pids, spack, endian):
         raise NotImplementedError(name)
 
 
+def _get_mid_array(props, name: str) -> List[int]:
+    """gets a material id field for a series of properties; None -> 0"""
+    mids = [getattr(prop, name) for prop in props]
+    return [0 if mid is None else mid for mid in mids]
+
+def _write_property_ascii(name: str, columns, op2_ascii) -> None:
+    """writes the debug lines for a series of properties, if requested"""
+    if not is_ascii_requested(op2_ascii):
+        return
+    columns = [np.asarray(column).tolist() for column in columns]
+    for data in zip(*columns):
+        op2_ascii.write('  %s pid=%s mid=%s data=%s\n' % (name, data[0], data[1], list(data[2:])))
+
 def write_pbush(name, pids, itable, op2_file, op2_ascii, obj, endian=b'<',
                 nastran_format='nx'):
     """writes the PBUSH"""
@@ -2,7 +2,10 @@ from __future__ import annotations
 from collections import defaultdict
 from struct import pack, Struct
 from typing import List, TYPE_CHECKING
+import numpy as np
 from pyNastran.op2.errors import SixtyFourBitError
+from pyNastran.op2.op2_interface.write_utils import is_ascii_requested
+from pyNastran.op2.writer.utils import pack_columns, get_sorted_cards
 if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.op2.op2 import OP2
 
@@ -36,23 +39,17 @@ def write_geom1(op2, op2_ascii, obj: OP2, endian: bytes=b'<'):
         key = (4501, 45, 1)
         nbytes = write_block(op2_file, op2_ascii, nvalues, key)
 
-        spack = Struct('ii 3f 3i')
-        for unused_nid, node in sorted(obj.nodes.items()):
-            xyz = node.xyz
-            ps = node.ps
-            if ps == '':
-                psi = 0
-            else:
-                psi = int(ps)
-
-            seid = node.seid
-            if seid == '':
-                seidi = 0
-            else:
-                seidi = int(seid)
-            data = [node.nid, node.Cp(), xyz[0], xyz[1], xyz[2], node.Cd(), psi, seidi]
-            op2_file.write(spack.pack(*data))
-            op2_ascii.write('  nid=%s cp=%s xyz=(%s, %s, %s) cd=%s ps=%s seid=%s\n' % tuple(data))
+        unused_nids, nodes = get_sorted_cards(obj.nodes, list(obj.nodes.keys()))
+        nids = [node.nid for node in nodes]
+        cps = [node.Cp() for node in nodes]
+        xyz = np.array([node.xyz for node in nodes], dtype='float64').reshape(nnodes, 3)
+        cds = [node.Cd() for node in nodes]
+        ps = [0 if node.ps == '' else int(node.ps) for node in nodes]
+        seids = [0 if node.seid == '' else int(node.seid) for node in nodes]
+        op2_file.write(pack_columns(b'ii 3f 3i', [nids, cps, xyz, cds, ps, seids]))
+        if is_ascii_requested(op2_ascii):
+            for data in zip(nids, cps, xyz[:, 0], xyz[:, 1], xyz[:, 2], cds, ps, seids):
+                op2_ascii.write('  nid=%s cp=%s xyz=(%s, %s, %s) cd=%s ps=%s seid=%s\n' % data)
         op2_file.write(pack('i', nbytes))
         itable -= 1
         data = [
@@ -1,8 +1,13 @@
 from collections import defaultdict
 from struct import pack, Struct
+from typing import List
+
+import numpy as np
 
 from pyNastran.op2.errors import SixtyFourBitError
+from pyNastran.op2.op2_interface.write_utils import is_ascii_requested, to_endian_bytes
 from .geom1_writer import write_geom_header, close_geom_table
+from .utils import pack_columns, get_sorted_cards
 integer_types = int
 
 def write_geom2(op2, op2_ascii, obj, endian=b'<'):
@@ -179,39 +184,27 @@ def _write_cbeam(obj, name, eids, nelements, itable, op2_file, op2_ascii, endian
     nfields = 18
     nbytes = _write_intermediate_block(name, key, nfields, nelements, op2_file, op2_ascii)
 
-    s1 = Struct(endian + b'6i3f3i6f')
-    s3 = Struct(endian + b'12i6f')
-    for eid in sorted(eids):
-        elem = obj.elements[eid]
-        ga, gb = elem.node_ids
-        pid = elem.pid
-
-        # per DMAP: F = FE bit-wise AND with 3
-        #f = fe & 3
-        w1a, w2a, w3a = elem.wa
-        w1b, w2b, w3b = elem.wb
-        pa = elem.pa
-        pb = elem.pb
-        sa = elem.sa
-        sb = elem.sb
-        if elem.g0 is None:
-            x1, x2, x3 = elem.x
-            fe = 0
-            #(eid, pid, ga, gb, sa, sb, x1, x2, x3, fe,
-             #pa, pb, w1a, w2a, w3a, w1b, w2b, w3b) = out
-            data = [
-                eid, pid, ga, gb, sa, sb, x1, x2, x3, fe,
-                pa, pb, w1a, w2a, w3a, w1b, w2b, w3b]
-            op2_file.write(s1.pack(*data))
-        else:
-            fe = 2
-            g0 = elem.g0
-            #(eid, pid, ga, gb, sa, sb, g0, xxa, xxb, fe,
-            # pa, pb, w1a, w2a, w3a, w1b, w2b, w3b) = out
-            data = [
-                eid, pid, ga, gb, sa, sb, g0, 0, 0, fe,
-                pa, pb, w1a, w2a, w3a, w1b, w2b, w3b]
-            op2_file.write(s3.pack(*data))
+    eids, elems = get_sorted_cards(obj.elements, eids)
+
+    # per DMAP: F = FE bit-wise AND with 3
+    #f = fe & 3
+    # fe=0: (eid, pid, ga, gb, sa, sb, x1, x2, x3, fe,
+    #        pa, pb, w1a, w2a, w3a, w1b, w2b, w3b)
+    # fe=2: (eid, pid, ga, gb, sa, sb, g0, xxa, xxb, fe,
+    #        pa, pb, w1a, w2a, w3a, w1b, w2b, w3b)
+    data = np.zeros((nelements, 18), dtype='int32')
+    dataf = data.view('float32')
+    data[:, 0] = eids
+    data[:, 1] = [elem.pid for elem in elems]
+    data[:, 2:4] = [elem.node_ids for elem in elems]
+    data[:, 4] = [elem.sa for elem in elems]
+    data[:, 5] = [elem.sb for elem in elems]
+    _set_orientation(data, 6, elems)
+    data[:, 10] = [elem.pa for elem in elems]
+    data[:, 11] = [elem.pb for elem in elems]
+    dataf[:, 12:15] = np.array([elem.wa for elem in elems], dtype='float32')
+    dataf[:, 15:18] = np.array([elem.wb for elem in elems], dtype='float32')
+    op2_file.write(to_endian_bytes(data, endian))
 
     itable = _write_end_block(nbytes, itable, op2_file, op2_ascii)
     return itable
@@ -223,69 +216,67 @@ def _write_cbar(obj, name, eids, nelements, itable, op2_file, op2_ascii, endian)
     nfields = 16
     nbytes = _write_intermediate_block(name, key, nfields, nelements, op2_file, op2_ascii)
 
-    s1 = Struct(endian + b'4i3f3i6f')
-    s3 = Struct(endian + b'7ii2i6f')
-    for eid in sorted(eids):
-        elem = obj.elements[eid]
-        ga, gb = elem.node_ids
-        pid = elem.pid
-
-        # per DMAP: F = FE bit-wise AND with 3
-        #f = fe & 3
-        w1a, w2a, w3a = elem.wa
-        w1b, w2b, w3b = elem.wb
-        pa = elem.pa
-        pb = elem.pb
-        if elem.g0 is None:
-            x1, x2, x3 = elem.x
-            fe = 0
-            #(eid, pid, ga, gb, x1, x2, x3, _f, pa, pb,
-             #w1a, w2a, w3a, w1b, w2b, w3b) = out; fe=0
-             #(eid, pid, ga, gb, x1, x2, x3, _f, pa, pb,
-              #w1a, w2a, w3a, w1b, w2b, w3b) = out; fe=1
-            data = [
-                eid, pid, ga, gb, x1, x2, x3, fe, pa, pb,
-                w1a, w2a, w3a, w1b, w2b, w3b, ]
-            assert None not in data, 'CBAR-1; data=%s' % (data)
-            #print('CBAR data1 =', data)
-            op2_file.write(s1.pack(*data))
-        else:
-            fe = 2
-            g0 = elem.g0
-            #(eid, pid, ga, gb, g0, junk, junk, _f, pa,
-             #pb, w1a, w2a, w3a, w1b, w2b, w3b) = out
-            data = [
-                eid, pid, ga, gb, g0, 0, 0, fe, pa, pb,
-                w1a, w2a, w3a, w1b, w2b, w3b]
-            assert None not in data, 'CBAR-1; data=%s' % (data)
-            #print('CBAR data2 =', data)
-            op2_file.write(s3.pack(*data))
-
-        #if f == 0:
-            #out = s1.unpack(edata)
-            #(eid, pid, ga, gb, x1, x2, x3, _f, pa, pb,
-             #w1a, w2a, w3a, w1b, w2b, w3b) = out
-            #data_in = [[eid, pid, ga, gb, pa, pb, w1a, w2a, w3a, w1b, w2b, w3b],
-                       #[f, x1, x2, x3]]
-        #elif f == 1:
-            #out = s2.unpack(edata)
-            #(eid, pid, ga, gb, x1, x2, x3, _f, pa, pb,
-             #w1a, w2a, w3a, w1b, w2b, w3b) = out
-            #data_in = [[eid, pid, ga, gb, pa, pb, w1a, w2a, w3a, w1b, w2b, w3b],
-                       #[f, x1, x2, x3]]
-        #elif f == 2:
-            #out = s3.unpack(edata)
-            #(eid, pid, ga, gb, g0, junk, junk, _f, pa,
-             #pb, w1a, w2a, w3a, w1b, w2b, w3b) = out
-            #data_in = [[eid, pid, ga, gb, pa, pb, w1a,
-                        #w2a, w3a, w1b, w2b, w3b], [f, g0]]
-        #else:
-            #raise RuntimeError('invalid f value...f=%s' % (f))
-        op2_ascii.write('  eid=%s pid=%s nids=[%s, %s]\n' % (eid, pid, ga, gb))
+    eids, elems = get_sorted_cards(obj.elements, eids)
+    pids = [elem.pid for elem in elems]
+    nids = np.array([elem.node_ids for elem in elems], dtype='int32')
+    wa = np.array([elem.wa for elem in elems], dtype='float32')
+    wb = np.array([elem.wb for elem in elems], dtype='float32')
+    pa = [elem.pa for elem in elems]
+    pb = [elem.pb for elem in elems]
+
+    # per DMAP: F = FE bit-wise AND with 3
+    #f = fe & 3
+    # fe=0: (eid, pid, ga, gb, x1, x2, x3, _f, pa, pb,
+    #        w1a, w2a, w3a, w1b, w2b, w3b)
+    # fe=2: (eid, pid, ga, gb, g0, junk, junk, _f, pa,
+    #        pb, w1a, w2a, w3a, w1b, w2b, w3b)
+    data = np.zeros((nelements, 16), dtype='int32')
+    dataf = data.view('float32')
+    data[:, 0] = eids
+    data[:, 1] = pids
+    data[:, 2:4] = nids
+    _set_orientation(data, 4, elems)
+    data[:, 8] = pa
+    data[:, 9] = pb
+    dataf[:, 10:13] = wa
+    dataf[:, 13:16] = wb
+    op2_file.write(to_endian_bytes(data, endian))
+    if is_ascii_requested(op2_ascii):
+        for eid, pid, (ga, gb) in zip(eids, pids, nids.tolist()):
+            op2_ascii.write('  eid=%s pid=%s nids=[%s, %s]\n' % (eid, pid, ga, gb))
 
     itable = _write_end_block(nbytes, itable, op2_file, op2_ascii)
     return itable
 
+def _set_orientation(data, icol: int, elems) -> None:
+    """
+    sets the [x1, x2, x3, fe] or [g0, 0, 0, fe] fields for a CBAR/CBEAM
+    starting at column icol
+    """
+    dataf = data.view('float32')
+    is_g0 = np.array([elem.g0 is not None for elem in elems], dtype='bool')
+    ix = np.where(~is_g0)[0]
+    ig0 = np.where(is_g0)[0]
+    if len(ix):
+        dataf[ix, icol:icol+3] = np.array([elems[i].x for i in ix.tolist()], dtype='float32')
+        data[ix, icol+3] = 0
+    if len(ig0):
+        data[ig0, icol] = [elems[i].g0 for i in ig0.tolist()]
+        data[ig0, icol+1:icol+3] = 0
+        data[ig0, icol+3] = 2
+
+def _get_node_ids_array(elems, nnodes: int) -> np.ndarray:
+    """gets the (nelements, nnodes) node ids; None/missing nodes are 0"""
+    node_ids = [elem.node_ids for elem in elems]
+    nids = np.zeros((len(elems), nnodes), dtype='int32')
+    lengths = np.array([len(nidsi) for nidsi in node_ids], dtype='int32')
+    for nnodesi in np.unique(lengths).tolist():
+        i = np.where(lengths == nnodesi)[0]
+        # None -> nan -> 0
+        nidsi = np.array([node_ids[j] for j in i.tolist()], dtype='float64')
+        nids[i, :nnodesi] = np.nan_to_num(nidsi, nan=0.)
+    return nids
+
 def _write_solid(model, name, eids, nelements, itable, op2_file, op2_ascii, endian) -> int:
     """writes the solid elements"""
     if name == 'CTETRA':
@@ -305,24 +296,16 @@ def _write_solid(model, name, eids, nelements, itable, op2_file, op2_ascii, endi
     else:  # pragma: no cover
         raise NotImplementedError(name)
     nfields = nnodes + 2
-    spack = Struct(endian + b'%ii' % (nfields))
 
     nbytes = _write_intermediate_block(name, key, nfields, nelements, op2_file, op2_ascii)
-    for eid in sorted(eids):
-        elem = model.elements[eid]
-        nids = elem.node_ids
-        pid = elem.pid
-        if None in nids:
-            nids = [nid if nid is not None else 0 for nid in nids]
-        nnids = len(nids)
-        if nnids < nnodes:
-            nids2 = [0] * (nnodes - nnids)
-            data = [eid, pid] + nids + nids2
-        else:
-            data = [eid, pid] + nids
-        #print(name, data)
-        op2_ascii.write('  eid=%s pid=%s nids=%s\n' % (eid, pid, str(nids)))
-        op2_file.write(spack.pack(*data))
+    eids, elems = get_sorted_cards(model.elements, eids)
+    pids = [elem.pid for elem in elems]
+    nids = _get_node_ids_array(elems, nnodes)
+    op2_file.write(pack_columns(endian + b'%ii' % nfields, [eids, pids, nids]))
+    if is_ascii_requested(op2_ascii):
+        for eid, pid, elem in zip(eids, pids, elems):
+            nids = [nid if nid is not None else 0 for nid in elem.node_ids]
+            op2_ascii.write('  eid=%s pid=%s nids=%s\n' % (eid, pid, str(nids)))
 
     itable = _write_end_block(nbytes, itable, op2_file, op2_ascii)
     return itable
@@ -493,13 +476,13 @@ def write_card(name, eids, spack, obj, op2_file, op2_ascii, endian):
         _write_chbdyg(eids, spack, obj, op2_file, op2_ascii)
 
     elif name == 'PLOTEL':
-        for eid in sorted(eids):
-            elem = obj.plotels[eid]
-            nids = elem.node_ids
-            #(eid, n1, n2) = out
-            data = [eid] + nids
-            op2_ascii.write('  eid=%s nids=%s\n' % (eid, str(nids)))
-            op2_file.write(spack.pack(*data))
+        #(eid, n1, n2) = out
+        eids, elems = get_sorted_cards(obj.plotels, eids)
+        nids = np.array([elem.node_ids for elem in elems], dtype='int32')
+        op2_file.write(pack_columns(spack.format, [eids, nids]))
+        if is_ascii_requested(op2_ascii):
+            for eid, elem in zip(eids, elems):
+                op2_ascii.write('  eid=%s nids=%s\n' % (eid, str(elem.node_ids)))
     elif name == 'CBUSH':
         _write_cbush(eids, spack, obj, op2_file, op2_ascii, endian)
 
@@ -509,69 +492,42 @@ def write_card(name, eids, spack, obj, op2_file, op2_ascii, endian):
         _write_cgap(eids, spack, obj, op2_file, op2_ascii, endian)
 
     elif name in ['CQUAD4', 'CQUADR']:
-        for eid in sorted(eids):
-            elem = obj.elements[eid]
-            nids = elem.node_ids
-            pid = elem.pid
-            #(eid, pid, n1, n2, n3, n4, theta, zoffs, blank, tflag,
-             #t1, t2, t3, t4) = out
-            theta = get_theta_from_theta_mcid(elem.theta_mcid)
-            tflag = elem.tflag
-            #if tflag is None:
-                #tflag =
-            t1 = elem.T1 if elem.T1 is not None else -1.
-            t2 = elem.T2 if elem.T2 is not None else -1.
-            t3 = elem.T3 if elem.T3 is not None else -1.
-            t4 = elem.T4 if elem.T4 is not None else -1.
-            data = [eid, pid] + nids + [theta, elem.zoffset, 0,
-                                        tflag, t1, t2, t3, t4]
-            assert tflag in [0, 1], elem.get_stats()
-            #print('  CQUAD4 eid=%s pid=%s nids=%s data=%s\n' % (eid, pid, str(nids), data[6:]))
-            op2_ascii.write('  eid=%s pid=%s nids=%s\n' % (eid, pid, str(nids)))
-            assert None not in data, '  %s eid=%s pid=%s nids=%s\n%s' % (name, eid, pid, str(nids), data)
-            op2_file.write(spack.pack(*data))
+        #(eid, pid, n1, n2, n3, n4, theta, zoffs, blank, tflag,
+         #t1, t2, t3, t4) = out
+        eids, elems = get_sorted_cards(obj.elements, eids)
+        for elem in elems:
+            assert elem.tflag in [0, 1], elem.get_stats()
+        nids = np.array([elem.node_ids for elem in elems], dtype='int32')
+        zeros = np.zeros(len(eids), dtype='int32')
+        data = [eids, [elem.pid for elem in elems], nids,
+                _get_theta_array(elems), [elem.zoffset for elem in elems], zeros,
+                [elem.tflag for elem in elems], _get_thickness_array(elems, 4)]
+        op2_file.write(pack_columns(spack.format, data))
+        _write_element_ascii(eids, elems, op2_ascii)
     elif name == 'CQUAD8':  # current; not 2001
-        for eid in sorted(eids):
-            elem = obj.elements[eid]
-            nids = [nid if nid is not None else 0
-                    for nid in elem.node_ids]
-            pid = elem.pid
-             #(eid, pid, n1, n2, n3, n4, n5, n6, n7, n8, t1, t2,
-              #t3, t4, theta, zoffs, tflag) = out # current
-            #(eid, pid, n1, n2, n3, n4, n5, n6, n7, n8,
-            #t1, t2, t3, t4, theta, zoffs) = out  # cquad8; 2001
-            theta = get_theta_from_theta_mcid(elem.theta_mcid)
-            tflag = elem.tflag if elem.tflag is not None else 0
-            t1 = elem.T1 if elem.T1 is not None else -1.
-            t2 = elem.T2 if elem.T2 is not None else -1.
-            t3 = elem.T3 if elem.T3 is not None else -1.
-            t4 = elem.T4 if elem.T4 is not None else -1.
-            data = [eid, pid] + nids + [t1, t2, t3, t4,
-                                        theta, elem.zoffset, tflag]
-            assert None not in data, '%s data=%s' % (name, data)
+         #(eid, pid, n1, n2, n3, n4, n5, n6, n7, n8, t1, t2,
+          #t3, t4, theta, zoffs, tflag) = out # current
+        #(eid, pid, n1, n2, n3, n4, n5, n6, n7, n8,
+        #t1, t2, t3, t4, theta, zoffs) = out  # cquad8; 2001
+        eids, elems = get_sorted_cards(obj.elements, eids)
+        for elem in elems:
             assert isinstance(elem.tflag, int), elem.get_stats()
             assert elem.tflag in [-1, 0, 1], elem.get_stats()
-            #print('  CQUAD8 eid=%s pid=%s nids=%s data=%s\n' % (eid, pid, str(nids), data[6:]))
-            op2_ascii.write('  eid=%s pid=%s nids=%s\n' % (eid, pid, str(nids)))
-            op2_file.write(spack.pack(*data))
+        data = [eids, [elem.pid for elem in elems], _get_node_ids_array(elems, 8),
+                _get_thickness_array(elems, 4), _get_theta_array(elems),
+                [elem.zoffset for elem in elems], [elem.tflag for elem in elems]]
+        op2_file.write(pack_columns(spack.format, data))
+        _write_element_ascii(eids, elems, op2_ascii)
     elif name == 'CTRIA6':  # current; not 2001
-        for eid in sorted(eids):
-            elem = obj.elements[eid]
-            nids = [nid if nid is not None else 0
-                    for nid in elem.node_ids]
-            pid = elem.pid
-            #(eid, pid, n1, n2, n3, n4, n5, n6, theta, zoffs, t1, t2, t3, tflag) = out
-            theta = get_theta_from_theta_mcid(elem.theta_mcid)
-            t1 = elem.T1 if elem.T1 is not None else -1.
-            t2 = elem.T2 if elem.T2 is not None else -1.
-            t3 = elem.T3 if elem.T3 is not None else -1.
-            data = [eid, pid] + nids + [t1, t2, t3,
-                                        theta, elem.zoffset, elem.tflag]
-            assert None not in data, '%s data=%s' % (name, data)
+        #(eid, pid, n1, n2, n3, n4, n5, n6, theta, zoffs, t1, t2, t3, tflag) = out
+        eids, elems = get_sorted_cards(obj.elements, eids)
+        for elem in elems:
             assert elem.tflag in [-1, 0, 1], elem.get_stats()
-            #print('  CQUAD4 eid=%s pid=%s nids=%s data=%s\n' % (eid, pid, str(nids), data[6:]))
-            op2_ascii.write('  eid=%s pid=%s nids=%s\n' % (eid, pid, str(nids)))
-            op2_file.write(spack.pack(*data))
+        data = [eids, [elem.pid for elem in elems], _get_node_ids_array(elems, 6),
+                _get_thickness_array(elems, 3), _get_theta_array(elems),
+                [elem.zoffset for elem in elems], [elem.tflag for elem in elems]]
+        op2_file.write(pack_columns(spack.format, data))
+        _write_element_ascii(eids, elems, op2_ascii)
     elif name == 'CTRIAX':
         for eid in sorted(eids):
             elem = obj.elements[eid]
@@ -611,20 +567,17 @@ def write_card(name, eids, spack, obj, op2_file, op2_ascii, endian):
             op2_file.write(spack.pack(*data))
 
     elif name in ['CTRIA3', 'CTRIAR']:
-        for eid in sorted(eids):
-            elem = obj.elements[eid]
-            nids = elem.node_ids
-            pid = elem.pid
-            theta = get_theta_from_theta_mcid(elem.theta_mcid)
-            t1 = elem.T1 if elem.T1 is not None else -1.
-            t2 = elem.T2 if elem.T2 is not None else -1.
-            t3 = elem.T3 if elem.T3 is not None else -1.
-            #eid, pid, n1, n2, n3, theta_mcid, zoffs, blank1, blank2, tflag, t1, t2, t3
-            data = [eid, pid] + nids + [theta, elem.zoffset, 0, 0,
-                                        elem.tflag, t1, t2, t3]
+        #eid, pid, n1, n2, n3, theta_mcid, zoffs, blank1, blank2, tflag, t1, t2, t3
+        eids, elems = get_sorted_cards(obj.elements, eids)
+        for elem in elems:
             assert elem.tflag in [0, 1], elem.get_stats()
-            op2_ascii.write('  eid=%s pid=%s nids=%s\n' % (eid, pid, str(nids)))
-            op2_file.write(spack.pack(*data))
+        nids = np.array([elem.node_ids for elem in elems], dtype='int32')
+        zeros = np.zeros((len(eids), 2), dtype='int32')
+        data = [eids, [elem.pid for elem in elems], nids,
+                _get_theta_array(elems), [elem.zoffset for elem in elems], zeros,
+                [elem.tflag for elem in elems], _get_thickness_array(elems, 3)]
+        op2_file.write(pack_columns(spack.format, data))
+        _write_element_ascii(eids, elems, op2_ascii)
     elif name in ['CTRAX3', 'CTRAX6', 'CQUADX4', 'CQUADX8']:
         for eid in sorted(eids):
             elem = obj.elements[eid]
@@ -638,81 +591,59 @@ def write_card(name, eids, spack, obj, op2_file, op2_ascii, endian):
 
 
     elif name in ['CROD', 'CTUBE', 'CVISC', 'CSHEAR']:
-        for eid in sorted(eids):
-            elem = obj.elements[eid]
-            nids = elem.node_ids
-            pid = elem.pid
-            data = [eid, pid] + nids
-            #print(data)
-            op2_ascii.write('  eid=%s pid=%s nids=%s\n' % (eid, pid, str(nids)))
-            op2_file.write(spack.pack(*data))
+        eids, elems = get_sorted_cards(obj.elements, eids)
+        nids = np.array([elem.node_ids for elem in elems], dtype='int32')
+        op2_file.write(pack_columns(spack.format, [eids, [elem.pid for elem in elems], nids]))
+        _write_element_ascii(eids, elems, op2_ascii)
     elif name == 'CONROD':
-        for eid in sorted(eids):
-            elem = obj.elements[eid]
-            nids = elem.node_ids
-            #(eid, n1, n2, mid, a, j, c, nsm) = out
-            data = [eid] + nids + [elem.mid, elem.A, elem.j, elem.c, elem.nsm]
-            op2_ascii.write('  eid=%s nids=%s\n' % (eid, str(nids)))
-            op2_file.write(spack.pack(*data))
+        #(eid, n1, n2, mid, a, j, c, nsm) = out
+        eids, elems = get_sorted_cards(obj.elements, eids)
+        nids = np.array([elem.node_ids for elem in elems], dtype='int32')
+        data = [eids, nids, [elem.mid for elem in elems],
+                [elem.A for elem in elems], [elem.j for elem in elems],
+                [elem.c for elem in elems], [elem.nsm for elem in elems]]
+        op2_file.write(pack_columns(spack.format, data))
+        _write_element_ascii(eids, elems, op2_ascii, write_pid=False)
     elif name in ['CELAS1', 'CDAMP1']:
-        for eid in sorted(eids):
-            elem = obj.elements[eid]
-            n1, n2 = [nid if nid else 0 for nid in elem.node_ids]
-            pid = elem.pid
-            #(eid, pid, g1, g2, c1, c2)
-            data = [eid, pid, n1, n2, elem.c1, elem.c2]
-            #print(name, data)
-            op2_ascii.write('  eid=%s pid=%s nids=[%s, %s]\n' % (eid, pid, n1, n2))
-            op2_file.write(spack.pack(*data))
+        #(eid, pid, g1, g2, c1, c2)
+        eids, elems = get_sorted_cards(obj.elements, eids)
+        data = [eids, [elem.pid for elem in elems], _get_node_ids_array(elems, 2),
+                [elem.c1 for elem in elems], [elem.c2 for elem in elems]]
+        op2_file.write(pack_columns(spack.format, data))
+        _write_element_ascii(eids, elems, op2_ascii)
     elif name == 'CELAS2':
-        for eid in sorted(eids):
-            elem = obj.elements[eid]
-            n1, n2 = [nid if nid else 0 for nid in elem.node_ids]
-            #(eid, k, g1, g2, c1, c2, ge, s) = out
-            c2 = elem.c2 if elem.c2 is not None else 0
-            data = [eid, elem.k, n1, n2, elem.c1, c2, elem.ge, elem.s]
-            #print('CELAS2', data)
-            op2_ascii.write('  eid=%s nids=[%s, %s]\n' % (eid, n1, n2))
-            op2_file.write(spack.pack(*data))
+        #(eid, k, g1, g2, c1, c2, ge, s) = out
+        eids, elems = get_sorted_cards(obj.elements, eids)
+        data = [eids, [elem.k for elem in elems], _get_node_ids_array(elems, 2),
+                [elem.c1 for elem in elems], _get_int_array(elems, 'c2', 0),
+                [elem.ge for elem in elems], [elem.s for elem in elems]]
+        op2_file.write(pack_columns(spack.format, data))
+        _write_element_ascii(eids, elems, op2_ascii, write_pid=False)
     elif name in ['CELAS3', 'CDAMP3', 'CDAMP5']:
-        for eid in sorted(eids):
-            elem = obj.elements[eid]
-            n1, n2 = [nid if nid else 0 for nid in elem.node_ids]
-            pid = elem.pid
-            #(eid, pid, s1, s2) = out
-            data = [eid, pid, n1, n2]
-            #print(name, data)
-            op2_ascii.write('  eid=%s pid=%s nids=[%s, %s]\n' % (eid, pid, n1, n2))
-            op2_file.write(spack.pack(*data))
+        #(eid, pid, s1, s2) = out
+        eids, elems = get_sorted_cards(obj.elements, eids)
+        data = [eids, [elem.pid for elem in elems], _get_node_ids_array(elems, 2)]
+        op2_file.write(pack_columns(spack.format, data))
+        _write_element_ascii(eids, elems, op2_ascii)
     elif name == 'CELAS4':
-        for eid in sorted(eids):
-            elem = obj.elements[eid]
-            n1, n2 = [nid if nid else 0 for nid in elem.node_ids]
-            #(eid, k, s1, s2) = out
-            data = [eid, elem.k, n1, n2]
-            #print(data)
-            op2_ascii.write('  eid=%s nids=[%s, %s]\n' % (eid, n1, n2))
-            op2_file.write(spack.pack(*data))
+        #(eid, k, s1, s2) = out
+        eids, elems = get_sorted_cards(obj.elements, eids)
+        data = [eids, [elem.k for elem in elems], _get_node_ids_array(elems, 2)]
+        op2_file.write(pack_columns(spack.format, data))
+        _write_element_ascii(eids, elems, op2_ascii, write_pid=False)
     elif name == 'CDAMP2':
-        for eid in sorted(eids):
-            elem = obj.elements[eid]
-            n1, n2 = [nid if nid else 0 for nid in elem.node_ids]
-            #(eid, bdamp, g1, g2, c1, c2) = out
-            c1 = elem.c1 if elem.c1 is not None else 0
-            c2 = elem.c2 if elem.c2 is not None else 0
-            data = [eid, elem.b, n1, n2, c1, c2]
-            #print(name, data)
-            op2_ascii.write('  eid=%s nids=[%s, %s]\n' % (eid, n1, n2))
-            op2_file.write(spack.pack(*data))
+        #(eid, bdamp, g1, g2, c1, c2) = out
+        eids, elems = get_sorted_cards(obj.elements, eids)
+        data = [eids, [elem.b for elem in elems], _get_node_ids_array(elems, 2),
+                _get_int_array(elems, 'c1', 0), _get_int_array(elems, 'c2', 0)]
+        op2_file.write(pack_columns(spack.format, data))
+        _write_element_ascii(eids, elems, op2_ascii, write_pid=False)
     elif name == 'CDAMP4':
-        for eid in sorted(eids):
-            elem = obj.elements[eid]
-            n1, n2 = [nid if nid else 0 for nid in elem.node_ids]
-            #(eid, b, s1, s2) = out
-            data = [eid, elem.b, n1, n2]
-            #print(name, data)
-            op2_ascii.write('  eid=%s nids=[%s, %s]\n' % (eid, n1, n2))
-            op2_file.write(spack.pack(*data))
+        #(eid, b, s1, s2) = out
+        eids, elems = get_sorted_cards(obj.elements, eids)
+        data = [eids, [elem.b for elem in elems], _get_node_ids_array(elems, 2)]
+        op2_file.write(pack_columns(spack.format, data))
+        _write_element_ascii(eids, elems, op2_ascii, write_pid=False)
     elif name == 'SPOINT':
         nids = eids
         nids.sort()
@@ -722,6 +653,34 @@ def write_card(name, eids, spack, obj, op2_file, op2_ascii, endian):
     else:  # pragma: no cover
         raise NotImplementedError(name)
 
+def _get_theta_array(elems) -> List[float]:
+    """gets the theta/mcid field for a series of shell elements"""
+    return [get_theta_from_theta_mcid(elem.theta_mcid) for elem in elems]
+
+def _get_thickness_array(elems, nnodes: int) -> np.ndarray:
+    """gets the T1, T2, ... fields for a series of shells; None -> -1."""
+    names = ['T1', 'T2', 'T3', 'T4'][:nnodes]
+    thickness = np.array([[getattr(elem, name) for name in names] for elem in elems],
+                         dtype='float64')
+    thickness[np.isnan(thickness)] = -1.
+    return thickness
+
+def _get_int_array(elems, name: str, default: int) -> List[int]:
+    """gets an integer field for a series of elements; None -> default"""
+    values = [getattr(elem, name) for elem in elems]
+    return [value if value is not None else default for value in values]
+
+def _write_element_ascii(eids, elems, op2_ascii, write_pid: bool=True) -> None:
+    """writes the debug lines for a series of elements, if requested"""
+    if not is_ascii_requested(op2_ascii):
+        return
+    for eid, elem in zip(eids, elems):
+        nids = [nid if nid is not None else 0 for nid in elem.node_ids]
+        if write_pid:
+            op2_ascii.write('  eid=%s pid=%s nids=%s\n' % (eid, elem.pid, str(nids)))
+        else:
+            op2_ascii.write('  eid=%s nids=%s\n' % (eid, str(nids)))
+
 def get_theta_from_theta_mcid(theta_mcid):
     """the theta/mcid field is stored in a strange way"""
     if isinstance(theta_mcid, integer_types):
@@ -1,8 +1,12 @@
 from struct import pack, Struct
 from collections import defaultdict
 
+import numpy as np
+
+from pyNastran.op2.op2_interface.write_utils import is_ascii_requested
 from .geom1_writer import write_geom_header, close_geom_table
 from .geom4_writer import write_header, write_header_nvalues
+from .utils import pack_columns
 
 def write_geom3(op2, op2_ascii, obj, endian=b'<', nastran_format='nx'):
     if not hasattr(obj, 'loads') and not hasattr(obj, 'load_combinations'):
@@ -95,67 +99,52 @@ def write_geom3(op2, op2_ascii, obj, endian=b'<', nastran_format='nx'):
 def write_card(op2_file, op2_ascii, load_type, loads, endian, log,
                nastran_format: str='nx'):
     nloads = len(loads)
-    if load_type == 'FORCE':
-        key = (4201, 42, 18)
-        nfields = 7
-        spack = Struct(endian + b'3i 4f')
-        nbytes = write_header(load_type, nfields, nloads, key, op2_file, op2_ascii)
-        for load in loads:
-            data = [load.sid, load.node_id, load.Cid(), load.mag] + list(load.xyz)
-            op2_ascii.write('  FORCE data=%s\n' % str(data))
-            op2_file.write(spack.pack(*data))
-    elif load_type == 'FORCE1':
-        key = (4001, 40, 20)
-        nfields = 5
-        spack = Struct(endian + b'iifii')
-        nbytes = write_header(load_type, nfields, nloads, key, op2_file, op2_ascii)
-        for load in loads:
-            #(sid, node, mag, n1, n2) = out
-            data = [load.sid, load.node_id, load.mag, load.G1(), load.G2()]
-            op2_ascii.write('  FORCE1 data=%s\n' % str(data))
-            op2_file.write(spack.pack(*data))
-    elif load_type == 'FORCE2':
-        key = (4101, 41, 22)
-        nfields = 7
-        spack = Struct(endian + b'iif4i')
-        nbytes = write_header(load_type, nfields, nloads, key, op2_file, op2_ascii)
-        for load in loads:
-            #(sid, node_id, mag, n1, n2, n3, n4) = out
-            data = [load.sid, load.node_id, load.mag,
-                    load.G1(), load.G2(), load.G3(), load.G4()]
-            op2_ascii.write('  FORCE2 data=%s\n' % str(data))
-            op2_file.write(spack.pack(*data))
-
-    elif load_type == 'MOMENT':
-        key = (4801, 48, 19)
+    if load_type in ['FORCE', 'MOMENT']:
+        key = (4201, 42, 18) if load_type == 'FORCE' else (4801, 48, 19)
         nfields = 7
-        spack = Struct(endian + b'3i 4f')
+        fmt = endian + b'3i 4f'
         nbytes = write_header(load_type, nfields, nloads, key, op2_file, op2_ascii)
-        for load in loads:
-            data = [load.sid, load.node_id, load.Cid(), load.mag] + list(load.xyz)
-            op2_ascii.write('  MOMENT data=%s\n' % str(data))
-            op2_file.write(spack.pack(*data))
-    elif load_type == 'MOMENT1':
-        key = (4601, 46, 21)
+        data = [
+            [load.sid for load in loads],
+            [load.node_id for load in loads],
+            [load.Cid() for load in loads],
+            [load.mag for load in loads],
+            np.array([load.xyz for load in loads], dtype='float64'),
+        ]
+        op2_file.write(pack_columns(fmt, data))
+        _write_loads_ascii(load_type, data, op2_ascii)
+    elif load_type in ['FORCE1', 'MOMENT1']:
+        key = (4001, 40, 20) if load_type == 'FORCE1' else (4601, 46, 21)
         nfields = 5
-        spack = Struct(endian + b'iifii')
+        fmt = endian + b'iifii'
         nbytes = write_header(load_type, nfields, nloads, key, op2_file, op2_ascii)
-        for load in loads:
-            #(sid, node, mag, n1, n2) = out
-            data = [load.sid, load.node_id, load.mag, load.G1(), load.G2()]
-            op2_ascii.write('  MOMENT1 data=%s\n' % str(data))
-            op2_file.write(spack.pack(*data))
-    elif load_type == 'MOMENT2':
-        key = (4701, 47, 23)
+        #(sid, node, mag, n1, n2) = out
+        data = [
+            [load.sid for load in loads],
+            [load.node_id for load in loads],
+            [load.mag for load in loads],
+            [load.G1() for load in loads],
+            [load.G2() for load in loads],
+        ]
+        op2_file.write(pack_columns(fmt, data))
+        _write_loads_ascii(load_type, data, op2_ascii)
+    elif load_type in ['FORCE2', 'MOMENT2']:
+        key = (4101, 41, 22) if load_type == 'FORCE2' else (4701, 47, 23)
         nfields = 7
-        spack = Struct(endian + b'iif4i')
+        fmt = endian + b'iif4i'
         nbytes = write_header(load_type, nfields, nloads, key, op2_file, op2_ascii)
-        for load in loads:
-            #(sid, node_id, mag, n1, n2, n3, n4) = out
-            data = [load.sid, load.node_id, load.mag,
-                    load.G1(), load.G2(), load.G3(), load.G4()]
-            op2_ascii.write('  MOMENT2 data=%s\n' % str(data))
-            op2_file.write(spack.pack(*data))
+        #(sid, node_id, mag, n1, n2, n3, n4) = out
+        data = [
+            [load.sid for load in loads],
+            [load.node_id for load in loads],
+            [load.mag for load in loads],
+            [load.G1() for load in loads],
+            [load.G2() for load in loads],
+            [load.G3() for load in loads],
+            [load.G4() for load in loads],
+        ]
+        op2_file.write(pack_columns(fmt, data))
+        _write_loads_ascii(load_type, data, op2_ascii)
 
     elif load_type == 'GRAV':
         nbytes = _write_grav(load_type, loads, nloads, op2_file, op2_ascii, endian)
@@ -231,6 +220,20 @@ def write_card(op2_file, op2_ascii, load_type, loads, endian, log,
         raise NotImplementedError(load0)
     return nbytes
 
+def _write_loads_ascii(load_type: str, columns, op2_ascii) -> None:
+    """writes the debug lines for a series of loads, if requested"""
+    if not is_ascii_requested(op2_ascii):
+        return
+    columns = [np.asarray(column).tolist() for column in columns]
+    for row in zip(*columns):
+        data = []
+        for value in row:
+            if isinstance(value, list):
+                data.extend(value)
+            else:
+                data.append(value)
+        op2_ascii.write('  %s data=%s\n' % (load_type, str(data)))
+
 def _write_pload4(load_type, loads, op2_file, op2_ascii, endian, nastran_format='nx'):
     """writes the PLOAD4s"""
     key = (7209, 72, 299)
@@ -640,16 +643,22 @@ def _write_temp(load_type, loads, op2_file, op2_ascii, endian):
     """writes the TEMPs"""
     key = (5701, 57, 27)
     nfields = 3
-    spack = Struct(endian + b'iif')
+    fmt = endian + b'iif'
 
     nloads = _get_nloads_from_temperatures(loads)
     nbytes = write_header(load_type, nfields, nloads, key, op2_file, op2_ascii)
+    sids = []
+    nids = []
+    temps = []
     for load in loads:
         for nid, temp in sorted(load.temperatures.items()):
-            #(sid, g, T) = out
-            data = [load.sid, nid, temp]
-            op2_ascii.write('  TEMP data=%s\n' % str(data))
-            op2_file.write(spack.pack(*data))
+            nids.append(nid)
+            temps.append(temp)
+        sids.extend([load.sid] * len(load.temperatures))
+    #(sid, g, T) = out
+    data = [sids, nids, temps]
+    op2_file.write(pack_columns(fmt, data))
+    _write_loads_ascii(load_type, data, op2_ascii)
     return nbytes
 
 def _write_tempd(load_type, loads, nloads, op2_file, op2_ascii, endian):
@@ -3,6 +3,8 @@ from struct import pack, Struct
 from collections import defaultdict
 from typing import List, Dict, Tuple, Union, Any, TYPE_CHECKING
 
+import numpy as np
+
 from pyNastran.bdf.cards.collpase_card import collapse_thru_packs
 from pyNastran.op2.errors import SixtyFourBitError
 from .geom1_writer import write_geom_header, close_geom_table
@@ -296,13 +298,8 @@ def _write_rbe1(card_type: str, cards, unused_ncards: int, op2_file, op2_ascii,
     # TODO: neither reader or writer considers alpha; no current examples
     key = (6801, 68, 294)
     fields = []  # type: List[int]
-    fmt = endian
     for rbe1 in cards:
         fieldsi = [rbe1.eid]
-        ngn = len(rbe1.Gni)
-        ngm = len(rbe1.Gmi)
-        #fmt += b'i %if 2i %if 2i fi' % (ngn * 2, ngm * 2)
-        fmt += b'i %if 2i %if 2i' % (ngn * 2, ngm * 2)
         for gn, cn in zip(rbe1.Gni, rbe1.Cni):
             fieldsi += [gn, int(cn)]
         fieldsi += [-2, -2]
@@ -313,8 +310,8 @@ def _write_rbe1(card_type: str, cards, unused_ncards: int, op2_file, op2_ascii,
         fields += fieldsi
     nfields = len(fields)
     nbytes = write_header_nvalues(card_type, nfields, key, op2_file, op2_ascii)
-    op2_file.write(pack(fmt, *fields))
-    del fields, fmt
+    op2_file.write(np.array(fields, dtype=_int_dtype(endian)).tobytes())
+    del fields
     return nbytes
 
 def _write_rbe2(card_type: str, cards, unused_ncards: int, op2_file, op2_ascii,
@@ -338,24 +335,29 @@ def _write_rbe2(card_type: str, cards, unused_ncards: int, op2_file, op2_ascii,
             break
 
     key = (6901, 69, 295)
-    fields = []  # type: List[Union[int, float]]
-    fmt = endian
-    if is_alpha:
-        for rbe2 in cards:
-            ngm = len(rbe2.Gmi)
-            fmt += b'3i %ii fi' % ngm
-            fields += [rbe2.eid, rbe2.gn, int(rbe2.cm)] + rbe2.Gmi + [rbe2.alpha, -1]
-    else:
-        for rbe2 in cards:
-            ngm = len(rbe2.Gmi)
-            fmt += b'3i %ii i' % ngm
-            fields += [rbe2.eid, rbe2.gn, int(rbe2.cm)] + rbe2.Gmi + [-1]
+    fields = []  # type: List[int]
+    ialphas = []  # type: List[int]
+    alphas = []  # type: List[float]
+    for rbe2 in cards:
+        fields += [rbe2.eid, rbe2.gn, int(rbe2.cm)] + rbe2.Gmi
+        if is_alpha:
+            ialphas.append(len(fields))
+            alphas.append(rbe2.alpha)
+            fields.append(0)
+        fields.append(-1)
 
     nfields = len(fields)
     nbytes = write_header_nvalues(card_type, nfields, key, op2_file, op2_ascii)
-    op2_file.write(pack(fmt, *fields))
+    data = np.array(fields, dtype='int32')
+    if is_alpha:
+        data.view('float32')[ialphas] = alphas
+    op2_file.write(data.astype(_int_dtype(endian)).tobytes())
     return nbytes
 
+def _int_dtype(endian: bytes) -> str:
+    """gets the 32-bit integer dtype for the given byte order"""
+    return endian.decode('latin1') + 'i4'
+
 def _write_rbe3(card_type: str, cards, unused_ncards: int, op2_file, op2_ascii,
                 endian: bytes) -> int:
     """
@@ -2,8 +2,10 @@
 from collections import defaultdict
 from struct import pack, Struct
 
+from pyNastran.op2.op2_interface.write_utils import is_ascii_requested
 from .geom1_writer import write_geom_header, close_geom_table
 from .geom4_writer import write_header
+from .utils import pack_columns, get_sorted_cards
 
 def write_mpt(op2_file, op2_ascii, model, endian=b'<'):
     """writes the MPT/MPTS table"""
@@ -135,15 +137,17 @@ def _write_mat1(model, name, mids, nmaterials, op2_file, op2_ascii, endian):
     """writes the MAT1"""
     key = (103, 1, 77)
     nfields = 12
-    spack = Struct(endian + b'i10fi')
+    fmt = endian + b'i10fi'
     nbytes = write_header(name, nfields, nmaterials, key, op2_file, op2_ascii)
-    for mid in sorted(mids):
-        mat = model.materials[mid]
-        #mid, E, G, nu, rho, A, tref, ge, St, Sc, Ss, mcsid
-        data = [mid, mat.e, mat.g, mat.nu, mat.rho, mat.a, mat.tref,
-                mat.ge, mat.St, mat.Sc, mat.Ss, mat.mcsid]
-        op2_ascii.write('  mid=%s data=%s\n' % (mid, data[1:]))
-        op2_file.write(spack.pack(*data))
+    mids, mats = get_sorted_cards(model.materials, mids)
+    #mid, E, G, nu, rho, A, tref, ge, St, Sc, Ss, mcsid
+    data = [mids] + [
+        [getattr(mat, word) for mat in mats]
+        for word in ['e', 'g', 'nu', 'rho', 'a', 'tref', 'ge', 'St', 'Sc', 'Ss', 'mcsid']]
+    op2_file.write(pack_columns(fmt, data))
+    if is_ascii_requested(op2_ascii):
+        for mid, datai in zip(mids.tolist(), zip(*data[1:])):
+            op2_ascii.write('  mid=%s data=%s\n' % (mid, list(datai)))
     return nbytes
 
 def _write_mat2(model, name, mids, nmaterials, op2_file, op2_ascii, endian):
@@ -7,7 +7,7 @@ from cpylog import get_logger2
 
 #import pyNastran
 from pyNastran.op2.op2_interface.op2_f06_common import OP2_F06_Common
-from pyNastran.op2.op2_interface.write_utils import _write_markers
+from pyNastran.op2.op2_interface.write_utils import _write_markers, TrashWriter
 #from pyNastran.op2.errors import FatalError
 from .geom1_writer import write_geom1
 from .geom2_writer import write_geom2
@@ -23,15 +23,6 @@ if TYPE_CHECKING:  # pragma: no cover
     from pyNastran.op2.op2 import OP2
 
 
-class TrashWriter:
-    def __init__(self, *args, **kwargs):
-        pass
-    def write(self, data):
-        pass
-    def close(self):
-        pass
-
-
 class OP2Writer(OP2_F06_Common):
     def __init__(self, log=None, debug: bool=False):
         self.log = get_logger2(log, debug)
@@ -1,5 +1,7 @@
 import unittest
 import os
+import tempfile
+from struct import Struct
 from cpylog import SimpleLogger
 
 import pyNastran
@@ -10,6 +12,9 @@ from pyNastran.op2.op2_geom import read_op2_geom#, OP2Geom,
 from pyNastran.op2.op2 import read_op2
 #from pyNastran.op2.test.test_op2 import run_op2
 #from pyNastran.op2.writer.op2_writer import OP2Writer
+from pyNastran.op2.writer.op2_writer import _write_op2
+from pyNastran.op2.op2_interface.write_utils import TrashWriter
+from pyNastran.op2.writer.utils import pack_columns, get_sorted_cards
 
 PKG_PATH = pyNastran.__path__[0]
 MODEL_PATH = os.path.abspath(os.path.join(PKG_PATH, '..', 'models'))
@@ -316,6 +321,29 @@ class TestOP2Writer(unittest.TestCase):
                              skip_results=['params', ],
                              stop_on_failure=True, debug=False)
 
+    def test_write_ascii(self):
+        """the op2 debug (ascii) output doesn't change the op2"""
+        log = SimpleLogger(level='warning', encoding='utf-8')
+        folder = os.path.join(MODEL_PATH, 'sol_101_elements')
+        op2_filename = os.path.join(folder, 'static_solid_shell_bar.op2')
+        op2 = read_op2_geom(op2_filename, debug_file=None, log=log)
+
+        with tempfile.TemporaryDirectory() as dirname:
+            op2_filename_out1 = os.path.join(dirname, 'static_solid_shell_bar_out1.op2')
+            op2_filename_out2 = os.path.join(dirname, 'static_solid_shell_bar_out2.op2')
+            op2_filename_ascii = os.path.join(dirname, 'static_solid_shell_bar_out2.op2.txt')
+            with open(op2_filename_out1, 'wb') as op2_file:
+                _write_op2(op2_file, TrashWriter(), op2, set())
+            with open(op2_filename_out2, 'wb') as op2_file, open(op2_filename_ascii, 'w') as op2_ascii:
+                _write_op2(op2_file, op2_ascii, op2, set())
+
+            with open(op2_filename_out1, 'rb') as op2_file1, open(op2_filename_out2, 'rb') as op2_file2:
+                assert op2_file1.read() == op2_file2.read()
+            with open(op2_filename_ascii, 'r') as op2_ascii:
+                ascii_out = op2_ascii.read()
+        assert 'RealPlateStressArray.write_op2' in ascii_out
+        assert 'nid, grid_type, dx, dy, dz, rx, ry, rz' in ascii_out
+
     #def test_thermal_3(self):
         #"""tests basic op2 thermal writing"""
         #folder = os.path.join(MODEL_PATH, 'other')
@@ -1,4 +1,4 @@
-from typing import List, Any
+from typing import List, Dict, Tuple, Any
 import numpy as np
 
 def fix_table3_types(table3, size: int=4) -> List[Any]:
@@ -22,3 +22,80 @@ def fix_table3_types(table3, size: int=4) -> List[Any]:
         table3_new.append(v)
     assert n == 584, n
     return table3_new
+
+
+def struct_to_dtype(fmt: bytes) -> np.dtype:
+    """
+    Converts a Struct format (e.g., b'<2i 4f 8s') into a structured
+    dtype with one field per value (f0, f1, ...)
+    """
+    fmt = fmt.decode('latin1') if isinstance(fmt, bytes) else fmt
+    endian = '='
+    if fmt and fmt[0] in '<>=!@':
+        endian = '>' if fmt[0] == '!' else fmt[0]
+        fmt = fmt[1:]
+    if endian == '@':
+        endian = '='
+
+    formats = []
+    count = ''
+    for char in fmt.replace(' ', ''):
+        if char.isdigit():
+            count += char
+            continue
+        ncount = int(count) if count else 1
+        count = ''
+        if char == 'i':
+            formats.extend([endian + 'i4'] * ncount)
+        elif char == 'f':
+            formats.extend([endian + 'f4'] * ncount)
+        elif char == 's':
+            formats.append('S%i' % ncount)
+        else:  # pragma: no cover
+            raise NotImplementedError(f'char={char!r} fmt={fmt!r}')
+    names = ['f%i' % i for i in range(len(formats))]
+    return np.dtype({'names': names, 'formats': formats})
+
+
+def pack_columns(fmt: bytes, columns: List[Any]) -> bytes:
+    """
+    Vectorized version of ``Struct(fmt).pack(*row)`` for many rows
+
+    Parameters
+    ----------
+    fmt : bytes
+        a Struct format for a single row (e.g., b'<2i 4f')
+    columns : List[array-like]
+        the values for each row; a 2D column (nrows, n) fills n
+        consecutive fields
+
+    Returns
+    -------
+    data : bytes
+        the packed rows
+
+    """
+    dtype = struct_to_dtype(fmt)
+    names = dtype.names
+    nrows = len(columns[0])
+    data = np.empty(nrows, dtype=dtype)
+    ifield = 0
+    for column in columns:
+        column = np.asarray(column)
+        if column.ndim == 2:
+            for icol in range(column.shape[1]):
+                data[names[ifield]] = column[:, icol]
+                ifield += 1
+        else:
+            data[names[ifield]] = column
+            ifield += 1
+    assert ifield == len(names), f'nfields={ifield} expected={len(names)}; fmt={fmt!r}'
+    return data.tobytes()
+
+
+def get_sorted_cards(cards: Dict[int, Any], ids: List[int]) -> Tuple[np.ndarray, List[Any]]:
+    """gets the ids (sorted with argsort) and the corresponding cards"""
+    ids_array = np.asarray(ids, dtype='int64')
+    ids_array = ids_array[np.argsort(ids_array, kind='stable')]
+    sorted_cards = [cards[idi] for idi in ids_array.tolist()]
+    return ids_array, sorted_cards
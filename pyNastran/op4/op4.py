@@ -1,11 +1,12 @@
 """Main OP4 class"""
+import io
 import sys
 import os
 from struct import pack, unpack, Struct
 
 import numpy as np
-from numpy import array, zeros, float32, float64, complex64, complex128, ndarray
-from scipy.sparse import coo_matrix  # type: ignore
+from numpy import zeros, float32, float64, complex64, complex128, ndarray
+from scipy.sparse import coo_matrix, csc_matrix, issparse  # type: ignore
 from cpylog import get_logger2
 
 from pyNastran.utils import is_binary_file as file_is_binary
@@ -13,7 +14,7 @@ from pyNastran.utils.mathematics import print_matrix #, print_annotated_matrix
 
 
 def read_op4(op4_filename=None, matrix_names=None, precision='default',
-             debug=False, log=None):
+             lazy=False, debug=False, log=None):
     """
     Reads a NASTRAN OUTPUT4 file, and stores the
     matrices as the output arguments.  The number of
@@ -54,6 +55,9 @@ def read_op4(op4_filename=None, matrix_names=None, precision='default',
     precision : str; {'default', 'single', 'double'}
         specifies if the matrices are in single or double precsion
         which means the format will be whatever the file is in
+    lazy : bool; default=False
+        only index the matrices; each matrix is a ``LazyOP4Matrix``
+        that is decoded (optionally by column) when ``load`` is called
 
     Returns
     -------
@@ -82,6 +86,10 @@ def read_op4(op4_filename=None, matrix_names=None, precision='default',
         | Dense  | NUMPY.NDARRAY           |
         +--------+-------------------------+
         | Sparse | SCIPY.SPARSE.COO_MATRIX |
+        |        | (ASCII)                 |
+        +--------+-------------------------+
+        | Sparse | SCIPY.SPARSE.CSC_MATRIX |
+        |        | (binary)                |
         +--------+-------------------------+
 
     .. note:: based off the MATLAB code SAVEOP4 developed by ATA-E and
@@ -92,7 +100,7 @@ def read_op4(op4_filename=None, matrix_names=None, precision='default',
 
     """
     op4 = OP4(log=log, debug=debug)
-    return op4.read_op4(op4_filename, matrix_names, precision)
+    return op4.read_op4(op4_filename, matrix_names, precision, lazy=lazy)
 
 
 class OP4:
@@ -108,10 +116,10 @@ class OP4:
         self.debug = debug
         #assert debug == True, debug
         self.log = get_logger2(log, debug)
-        self._new = False
         self.large = None
 
-    def read_op4(self, op4_filename=None, matrix_names=None, precision='default'):
+    def read_op4(self, op4_filename=None, matrix_names=None, precision='default',
+                 lazy=False):
         """See ``read_op4``"""
         if precision not in ('default', 'single', 'double'):
             msg = "precision=%r and must be 'single', 'double', or 'default'" % precision
@@ -134,13 +142,167 @@ class OP4:
         #assert isinstance(matrix_names, list), 'type(matrix_names)=%s' % type(matrix_names)
 
         if file_is_binary(op4_filename):
+            if lazy:
+                return self.read_op4_index_binary(op4_filename, matrix_names, precision)
             return self.read_op4_binary(op4_filename, matrix_names, precision)
+        if lazy:
+            return self.read_op4_index_ascii(op4_filename, matrix_names, precision)
         return self.read_op4_ascii(op4_filename, matrix_names, precision)
 
+#--------------------------------------------------------------------------
+    def read_op4_index_binary(self, op4_filename, matrix_names=None, precision='default'):
+        """
+        Indexes a binary OP4 without decoding any values
+
+        Only the matrix headers and the column record markers are read,
+        so each matrix can be decoded later (see ``LazyOP4Matrix``).
+
+        Returns
+        -------
+        matrices : dict[str] = (int, LazyOP4Matrix)
+            the matrices in the same form as ``read_op4``
+
+        """
+        matrices = {}
+        nbytes_file = os.path.getsize(op4_filename)
+        with open(op4_filename, mode='rb') as op4:
+            endian = self._determine_endian(op4)
+            offset = 0
+            while offset < nbytes_file:
+                op4.seek(offset)
+                (record_length,) = unpack(endian + 'i', op4.read(4))
+                if record_length == 24:
+                    (ncols, nrows, form, matrix_type, name) = unpack(
+                        endian + '4i8s', op4.read(record_length))
+                elif record_length == 48:
+                    (ncols, nrows, form, matrix_type, name) = unpack(
+                        endian + '4Q16s', op4.read(record_length))
+                else:
+                    msg = 'record_length=%s offset=%s filename=%r' % (
+                        record_length, offset, op4_filename)
+                    raise NotImplementedError(msg)
+                is_big_mat, nrows = get_big_mat_nrows(nrows)
+                name = name.strip().decode('ascii')
+                data_format = self._get_matrix_info(matrix_type, debug=False)[2]
+                nbytes_end = 8 if data_format == 'd' else 4
+
+                # skip over the column records
+                record_icols = []
+                record_irows = []
+                record_nwords = []
+                record_offsets = []
+                marker = Struct(endian + '4i')
+                position = offset + 4 + record_length
+                while 1:
+                    op4.seek(position + 4)
+                    unused_a, icol, irow, nwords = marker.unpack(op4.read(16))
+                    position += 20
+                    if icol == ncols + 1:
+                        position += 4 + nbytes_end
+                        break
+                    record_icols.append(icol)
+                    record_irows.append(irow)
+                    record_nwords.append(nwords)
+                    record_offsets.append(position)
+                    position += 4 * nwords
+
+                is_sparse = bool(record_irows) and record_irows[0] == 0
+                if matrix_names is None or name in matrix_names:
+                    matrix = LazyOP4Matrix(
+                        op4_filename, name, form, matrix_type, nrows, ncols,
+                        offset, is_binary=True, is_sparse=is_sparse,
+                        is_big_mat=is_big_mat, endian=endian, precision=precision,
+                        log=self.log)
+                    matrix.record_icols = np.array(record_icols, dtype='int32')
+                    matrix.record_irows = np.array(record_irows, dtype='int32')
+                    matrix.record_nwords = np.array(record_nwords, dtype='int64')
+                    matrix.record_offsets = np.array(record_offsets, dtype='int64')
+                    _save_matrix(matrices, name, form, matrix)
+                offset = position
+        return matrices
+
+    def read_op4_index_ascii(self, op4_filename, matrix_names=None, precision='default'):
+        """
+        Indexes an ASCII OP4 without decoding any values
+
+        The matrix header lines are found by scanning the file, so each
+        matrix can be decoded later (see ``LazyOP4Matrix``).
+
+        Returns
+        -------
+        matrices : dict[str] = (int, LazyOP4Matrix)
+            the matrices in the same form as ``read_op4``
+
+        """
+        matrices = {}
+        with open(op4_filename, mode='rb') as op4:
+            offset = 0
+            for line in op4:
+                offset_line = offset
+                offset += len(line)
+                # the header is the only line with 4 integers and
+                # a format (e.g., 1P,3E23.16)
+                if b',' not in line[40:]:
+                    continue
+                sline = line[:32].split()
+                if len(sline) != 4:
+                    continue
+                ncols, nrows, form, matrix_type = (int(value) for value in sline)
+                is_big_mat, nrows = get_big_mat_nrows(nrows)
+                name = line[32:40].strip().decode('ascii')
+                if matrix_names is None or name in matrix_names:
+                    matrix = LazyOP4Matrix(
+                        op4_filename, name, form, matrix_type, nrows, ncols,
+                        offset_line, is_binary=False, is_sparse=None,
+                        is_big_mat=is_big_mat, precision=precision, log=self.log)
+                    _save_matrix(matrices, name, form, matrix)
+        return matrices
+
+    def _read_columns_binary(self, op4, matrix, icols):
+        """
+        Reads a subset of the columns of an indexed binary matrix
+
+        Parameters
+        ----------
+        op4 : file
+            the open file
+        matrix : LazyOP4Matrix
+            the indexed matrix
+        icols : (ncols, ) int ndarray
+            the sorted, unique, 0-based columns to read
+
+        """
+        (nwords_per_value, unused_nbytes_per_value, unused_data_format,
+         file_dtype) = self._get_matrix_info(matrix.matrix_type, debug=False)
+        value_dtype = np.dtype(file_dtype).newbyteorder(self._endian)
+        dtype = matrix.dtype
+
+        # the records of the selected columns
+        irecords = np.flatnonzero(np.isin(matrix.record_icols - 1, icols))
+        icols_new = np.searchsorted(icols, matrix.record_icols[irecords] - 1)
+        ncols = len(icols)
+        if matrix.is_sparse:
+            sparse = _SparseColumnBuffer(ncols, dtype, value_dtype, nwords_per_value,
+                                         matrix.is_big_mat, self._endian)
+            for irecord, icol in zip(irecords, icols_new):
+                op4.seek(matrix.record_offsets[irecord])
+                sparse.add_record(icol + 1, op4.read(4 * matrix.record_nwords[irecord]))
+            return sparse.to_csc(matrix.nrows).tocoo()
+
+        A = zeros((matrix.nrows, ncols), dtype=dtype)
+        for irecord, icol in zip(irecords, icols_new):
+            op4.seek(matrix.record_offsets[irecord])
+            nvalues = matrix.record_nwords[irecord] // nwords_per_value
+            irow = matrix.record_irows[irecord] - 1
+            A[irow:irow + nvalues, icol] = np.frombuffer(
+                op4.read(4 * nvalues * nwords_per_value), dtype=value_dtype)
+        return A
+
 #--------------------------------------------------------------------------
     def read_op4_ascii(self, op4_filename, matrix_names=None, precision='default'):
         """matrix_names must be a list or None, but basically the same"""
-        with open(op4_filename, 'r') as op4:
+        with open(op4_filename, 'r') as op4_file:
+            op4 = _AsciiLineReader(op4_file)
             matrices = {}
             name = 'dummyName'
             while name is not None:
@@ -177,8 +339,8 @@ class OP4:
                 name, nrows, ncols, form, matrix_type))
         assert ncols > 0, 'ncols=%s' % ncols
         size = line[40:].strip()
-        line_size = size.split(',')[1].split('E')[1].split('.')[0]  # 3E23.16 to 23
-        line_size = int(line_size)
+        # 1P,3E23.16 to 23; D exponents (e.g., 1P,3D23.16) are also supported
+        line_size = int(size.split(',')[1].upper().replace('D', 'E').split('E')[1].split('.')[0])
 
         line = op4.readline().rstrip()
         iline += 1
@@ -204,407 +366,204 @@ class OP4:
             self.log.info("form=%s name=%s A=\n%s" % (form, name, str(A)))
         return (name, form, A)
 
-    def _read_real_sparse_ascii(self, op4, iline, nrows, ncols, line_size, line, dtype, is_big_mat):
-        """Reads a sparse real ASCII matrix"""
-        self.log.debug('_read_real_sparse_ascii')
-        rows = []
-        cols = []
-        entries = []
-        nloops = 0
-        was_broken = False
-        while 1:
-            if nloops > 0 and not was_broken:
-                line = op4.readline().rstrip()
-                iline += 1
-            was_broken = False
-
-            icol, irow, nwords = line.split()
-            icol = int(icol)
-
-            if icol > ncols:
-                break
-
-            irow = int(irow)
-            nwords = int(nwords)
-
-            # This loop condition is overly complicated, but the first time
-            # it will always execute.
-            # Later if there is a sparse continuation line marker of
-            # 1 (very large) integer, there will be no scientific notation value.
-            # There also may be another sparse marker with 2 values.  These are not large.
-            # The scientific check prevents you from getting stuck in an infinite
-            # loop b/c no lines are read if there was one float value.
-            # The check for 1 (or 2) integers is to prevent the check for 3 integers
-            # which starts a new column.  We only want to continue a column.
-            run_loop = True
-            sline = line.strip().split()
-            # next sparse entry
-            while (len(sline) == 1 or len(sline) == 2) and 'E' not in line or run_loop:
-                if is_big_mat:
-                    irow, iline = self._get_irow_big_ascii(op4, iline, line, sline, irow)
-                else:
-                    irow, iline = self._get_irow_small_ascii(op4, iline, line, sline, irow)
-
-                run_loop = False
-                #iword = 0
-                #is_done_reading_row = False
-                while nwords:
-                    n = 0
-                    line = op4.readline().rstrip()
-                    iline += 1
-                    nwords_in_line = line.count('E')
-                    if nwords_in_line == 0:
-                        was_broken = True
-                        break
-
-                    for unused_i in range(nwords_in_line):
-                        word = line[n:n + line_size]
-                        rows.append(irow)
-                        cols.append(icol)
-                        entries.append(word)
-                        if self.debug:
-                            self.log.debug('  irow=%s icol=%s word=%.4g' % (
-                                irow - 1, icol - 1, float(word)))
-                        n += line_size
-                        irow += 1
-                    #iword += nwords_in_line
-                    nwords -= nwords_in_line
-                sline = line.strip().split()
-                nloops += 1
-
-        op4.readline()
-        iline += 1
-
-        #if rows == []:  # NULL matrix
-            #raise NotImplementedError()
-
-        rows = array(rows, dtype='int32') - 1
-        cols = array(cols, dtype='int32') - 1
-        A = coo_matrix((entries, (rows, cols)), shape=(nrows, ncols), dtype=dtype)
-        #print("type = %s %s" % (type(A),type(A.toarray())))
-        #A = A.toarray()
-        return A, iline
-
-    def _read_real_sparse_ascii_new(self, op4, iline, nrows, ncols, line_size, line,
-                                    dtype, is_big_mat):
-        """Reads a sparse real ASCII matrix"""
-        self.log.debug('_read_real_sparse_ascii')
-        rows = []
-        cols = []
-        entries = []
-        nloops = 0
-        was_broken = False
-        while 1:
-            if nloops > 0 and not was_broken:
-                line = op4.readline().rstrip()
-                iline += 1
-            was_broken = False
-
-            icol, irow, nwords = line.split()
-            icol = int(icol)
-
-            if icol > ncols:
-                break
-
-            irow = int(irow)
-            nwords = int(nwords)
-
-            # This loop condition is overly complicated, but the first time
-            # it will always execute.
-            # Later if there is a sparse continuation line marker of
-            # 1 (very large) integer, there will be no scientific notation value.
-            # There also may be another sparse marker with 2 values.  These are not large.
-            # The scientific check prevents you from getting stuck in an infinite
-            # loop b/c no lines are read if there was one float value.
-            # The check for 1 (or 2) integers is to prevent the check for 3 integers
-            # which starts a new column.  We only want to continue a column.
-            run_loop = True
-            sline = line.strip().split()
-            # next sparse entry
-            jrow1 = len(rows)
-            while (len(sline) == 1 or len(sline) == 2) and 'E' not in line or run_loop:
-                if is_big_mat:
-                    irow, iline = self._get_irow_big_ascii(op4, iline, line, sline, irow)
-                else:
-                    irow, iline = self._get_irow_small_ascii(op4, iline, line, sline, irow)
-
-                run_loop = False
-                #is_done_reading_row = False
-                while nwords:
-                    line = op4.readline().rstrip()
-                    iline += 1
-                    nwords_in_line = line.count('E')
-                    if nwords_in_line == 0:
-                        was_broken = True
-                        break
-
-                    irows = list(range(irow, irow + nwords_in_line))
-                    n = 0
-                    for unused_i in range(nwords_in_line):
-                        word = line[n:n + line_size]
-                        entries.append(word)
-                        n += line_size
-                    rows.extend(irows)
-                    #icols = [icol] * nwords_in_line
-                    #cols.extend(icols)
-                    irow += nwords_in_line
-                    #assert len(rows) == len(cols), 'rows=%s\ncols=%s' % (rows, cols)
-                    #assert len(rows) == len(entries)
-                    nwords -= nwords_in_line
-                sline = line.strip().split()
-                nloops += 1
-            jrow2 = len(rows)
-
-            icols = [icol] * (jrow2 - jrow1)
-            cols.append(icols)
-
-        op4.readline()
-        iline += 1
+    def _read_real_ascii(self, op4, iline, nrows, ncols, line_size, line, dtype,
+                         is_sparse, is_big_mat):
+        """Reads a real ASCII matrix"""
+        return self._read_ascii_matrix_data(op4, iline, nrows, ncols, line_size, line, dtype,
+                                            is_sparse, is_big_mat, is_complex=False)
 
-        #if rows == []:  # NULL matrix
-            #raise NotImplementedError()
+    def _read_complex_ascii(self, op4, iline, nrows, ncols, line_size, line,
+                            dtype, is_sparse, is_big_mat):
+        """Reads a complex ASCII matrix"""
+        return self._read_ascii_matrix_data(op4, iline, nrows, ncols, line_size, line, dtype,
+                                            is_sparse, is_big_mat, is_complex=True)
 
-        cols = np.hstack(cols)
-        rows = array(rows, dtype='int32') - 1
-        cols = array(cols, dtype='int32') - 1
-        A = coo_matrix((entries, (rows, cols)), shape=(nrows, ncols), dtype=dtype)
-        #print("type = %s %s" % (type(A),type(A.toarray())))
-        #A = A.toarray()
-        return A, iline
+    def _read_ascii_matrix_data(self, op4, iline, nrows, ncols, line_size, line, dtype,
+                                is_sparse, is_big_mat, is_complex):
+        """
+        Reads the columns of an ASCII matrix
 
-    def _read_real_dense_ascii(self, op4, iline, nrows, ncols, line_size, line, dtype, is_big_mat):
-        """Reads a real dense ASCII matrix"""
-        self.log.debug('_read_real_dense_ascii')
-        A = zeros((nrows, ncols), dtype=dtype)  # Initialize a real matrix
-        nloops = 0
-        was_broken = False
-        while 1:
-            if nloops > 0 and not was_broken:
-                line = op4.readline().rstrip()
-                iline += 1
-            was_broken = False
-
-            (icol, irow, nwords) = line.split()
-            icol = int(icol)
-
-            if icol > ncols:
-                break
+        The file is read in blocks of lines that are classified with numpy.
+        A value line has a decimal point, while the column
+        (icol, irow, nwords) and string (IS or L+1, irow) headers are
+        integers.  Every header starts a string of consecutive rows.
+        The value lines are parsed as fixed-width fields (using the width
+        from the header format) with a numpy call per block of lines.  The headers are checked against the shape
+        of the matrix, so a bad record raises a RuntimeError.
 
-            irow = int(irow)
-            nwords = int(nwords)
-
-            # This loop condition is overly complicated, but the first time
-            # it will always execute.
-            # Later if there is a sparse continuation line marker of
-            # 1 (very large) integer, there will be no scientific notation value.
-            # There also may be another sparse marker with 2 values.  These are not large.
-            # The scientific check prevents you from getting stuck in an infinite
-            # loop b/c no lines are read if there was one float value.
-            # The check for 1 (or 2) integers is to prevent the check for 3 integers
-            # which starts a new column.  We only want to continue a column.
-            run_loop = True
-            sline = line.strip().split()
-            # next dense entry
-            while (len(sline) == 1 or len(sline) == 2) and 'E' not in line or run_loop:
-                run_loop = False
-                #i = 0
-                #iword = 0
-                #is_done_reading_row = False
-                while nwords:
-                    n = 0
-                    line = op4.readline().rstrip()
-                    iline += 1
-                    nwords_in_line = line.count('E')
-                    if nwords_in_line == 0:
-                        was_broken = True
-                        break
+        Parameters
+        ----------
+        op4 : _AsciiLineReader
+            the file
+        line : str
+            the first column header line
 
-                    for unused_i in range(nwords_in_line):
-                        word = line[n:n + line_size]
-                        A[irow - 1, icol - 1] = word
-                        n += line_size
-                        irow += 1
-                    #iword += nwords_in_line
-                    nwords -= nwords_in_line
-                sline = line.strip().split()
-                nloops += 1
-        op4.readline()
-        iline += 1
-        return A, iline
+        Returns
+        -------
+        A : ndarray / coo_matrix
+            the dense or sparse matrix
+        iline : int
+            the current line number
 
-    def _read_real_ascii(self, op4, iline, nrows, ncols, line_size, line, dtype,
-                         is_sparse, is_big_mat):
-        """Reads a real ASCII matrix"""
-        if is_sparse:
-            if self._new:
-                A, iline = self._read_real_sparse_ascii_new(op4, iline, nrows, ncols,
-                                                            line_size, line, dtype, is_big_mat)
+        """
+        if self.debug:
+            self.log.debug('_read_ascii_matrix_data; is_sparse=%s is_complex=%s '
+                           'is_big_mat=%s' % (is_sparse, is_complex, is_big_mat))
+        string_icol = []
+        string_irow = []
+        fields = []
+        nfields_per_line = []
+        value_line_istring = []
+        nstrings = 0
+        icol = 0
+        text = line + '\n'
+        is_done = False
+        while not is_done:
+            if not text:
+                text = op4.read_chunk()
+                if not text:
+                    msg = 'Line %i: unexpected end of file' % iline
+                    raise RuntimeError(msg)
+            lines = _AsciiLines(text)
+            iheader, header_ints = lines.get_headers()
+            ntokens = lines.ntokens[iheader]
+            if ntokens.max(initial=0) > 3:
+                iline_bad = iheader[ntokens > 3][0]
+                msg = 'Line %i: unexpected line %r' % (
+                    iline + iline_bad, text[lines.start[iline_bad]:lines.end[iline_bad]])
+                raise RuntimeError(msg)
+
+            # the first and second integers on each header line
+            itoken = np.cumsum(ntokens) - ntokens
+            header_ints = np.append(header_ints, [0, 0, 0])
+            int1 = np.where(ntokens >= 1, header_ints[itoken], 0)
+            int2 = np.where(ntokens >= 2, header_ints[itoken + 1], 0)
+            int3 = np.where(ntokens >= 3, header_ints[itoken + 2], 0)
+
+            # column headers are (icol, irow, nwords); the matrix ends
+            # with icol=ncols+1
+            is_column = ntokens == 3
+            iend = lines.nlines
+            iend_headers = np.flatnonzero(is_column & (int1 > ncols))
+            if len(iend_headers):
+                is_done = True
+                iend = iheader[iend_headers[0]]
+                nheaders = iend_headers[0]
+                iheader = iheader[:nheaders]
+                ntokens = ntokens[:nheaders]
+                is_column = is_column[:nheaders]
+                int1 = int1[:nheaders]
+                int2 = int2[:nheaders]
+                int3 = int3[:nheaders]
+
+            self._check_ascii_headers(text, lines, iline, iheader, ntokens, is_column,
+                                      int1, int2, int3, nrows, ncols, is_sparse, is_big_mat)
+
+            # the column of every header is the column of the previous column header
+            iprevious = np.maximum.accumulate(np.where(is_column, np.arange(len(iheader)), -1))
+            header_icol = np.where(iprevious >= 0, int1[iprevious], icol)
+            if is_column.any():
+                icol = int1[is_column][-1]
+
+            # a string is a dense column (irow > 0) or a sparse string header
+            IS = int1
+            header_irow = np.where(ntokens == 1, IS - 65536 * (IS // 65536), int2)
+            is_string_header = (is_column & (int2 > 0)) | (ntokens == 1) | (ntokens == 2)
+            string_icol.append(header_icol[is_string_header])
+            string_irow.append(header_irow[is_string_header])
+            is_string = np.zeros(lines.nlines, dtype='bool')
+            is_string[iheader[is_string_header]] = True
+
+            ivalue_lines = np.flatnonzero(lines.is_value[:iend])
+            nfields_per_line.append(lines.nexponents[ivalue_lines])
+            value_line_istring.append(nstrings - 1 + np.cumsum(is_string)[ivalue_lines])
+            nstrings += is_string.sum()
+            fields.append(lines.get_fields(iend, line_size))
+
+            if is_done:
+                # the value at the end of the matrix
+                if iend + 2 < lines.nlines:
+                    op4.push_back(text[lines.start[iend + 2]:])
+                elif iend + 1 == lines.nlines:
+                    op4.readline()
+                iline += iend + 2
             else:
-                A, iline = self._read_real_sparse_ascii(op4, iline, nrows, ncols,
-                                                        line_size, line, dtype, is_big_mat)
+                iline += lines.nlines
+            text = ''
+
+        fields = np.hstack(fields)
+        nfields_per_line = np.hstack(nfields_per_line)
+        value_line_istring = np.hstack(value_line_istring).astype('int64')
+        field_istring = np.repeat(value_line_istring, nfields_per_line)
+        if is_complex:
+            values = fields[0::2] + 1j * fields[1::2]
+            value_istring = field_istring[0::2]
         else:
-            A, iline = self._read_real_dense_ascii(op4, iline, nrows, ncols,
-                                                   line_size, line, dtype, is_big_mat)
-        return A, iline
-
-    def _read_complex_sparse_ascii(self, op4, iline, nrows, ncols, line_size,
-                                   line, dtype, is_big_mat):
-        """Reads a sparse complex ASCII matrix"""
-        rows = []
-        cols = []
-        entries = []
-        nloops = 0
-        was_broken = False
-        while 1:
-            if nloops > 0 and not was_broken:
-                line = op4.readline().rstrip()
-                iline += 1
-            was_broken = False
-
-            (icol, irow, nwords) = line.split()
-            icol = int(icol)
-
-            if icol > ncols:
-                break
-
-            irow = int(irow)
-            nwords = int(nwords)
-
-            run_loop = True
-            sline = line.strip().split()
-            # next sparse entry
-            while (len(sline) == 1 or len(sline) == 2) and 'E' not in line or run_loop:
-                if is_big_mat:
-                    irow, iline = self._get_irow_big_ascii(op4, iline, line, sline, irow)
-                else:
-                    irow, iline = self._get_irow_small_ascii(op4, iline, line, sline, irow)
-                run_loop = False
-
-                #i = 0
-                is_real = True
-                #is_done_reading_row = False
-                while nwords:
-                    n = 0
-                    line = op4.readline().rstrip()
-                    iline += 1
-                    nwords_in_line = line.count('E')
-                    if nwords_in_line == 0:
-                        was_broken = True
-                        break
-
-                    for unused_i in range(nwords_in_line):
-                        value = float(line[n:n + line_size])
-
-                        if is_real:
-                            real_value = value
-                            is_real = False
-                        else:
-                            rows.append(irow)
-                            cols.append(icol)
-                            entries.append(complex(real_value, value))
-                            irow += 1
-                            is_real = True
-                        n += line_size
-                    nwords -= nwords_in_line
-                sline = line.strip().split()
-                nloops += 1
-
-        rows = array(rows, dtype='int32') - 1
-        cols = array(cols, dtype='int32') - 1
-        A = coo_matrix((entries, (rows, cols)), shape=(nrows, ncols), dtype=dtype)
-        op4.readline()
-        iline += 1
-        return A, iline
+            values = fields
+            value_istring = field_istring
+
+        # the row is the starting row of the string + the position in the string
+        nvalues = len(values)
+        string_nvalues = np.bincount(value_istring, minlength=nstrings)
+        string_ivalue0 = np.cumsum(string_nvalues) - string_nvalues
+        string_irow = np.hstack(string_irow).astype('int64') - 1
+        string_icol = np.hstack(string_icol).astype('int64') - 1
+        rows = (string_irow[value_istring] +
+                np.arange(nvalues, dtype='int64') - string_ivalue0[value_istring])
+        cols = string_icol[value_istring]
+        if nvalues and (rows.min() < 0 or rows.max() >= nrows):
+            ivalue = np.flatnonzero((rows < 0) | (rows >= nrows))[0]
+            msg = 'irow=%i in icol=%i is out of range; nrows=%i' % (
+                rows[ivalue] + 1, cols[ivalue] + 1, nrows)
+            raise RuntimeError(msg)
 
-    def _read_complex_ascii(self, op4, iline, nrows, ncols, line_size, line,
-                            dtype, is_sparse, is_big_mat):
-        """Reads a complex ASCII matrix"""
         if is_sparse:
-            A, iline = self._read_complex_sparse_ascii(op4, iline, nrows, ncols,
-                                                       line_size, line, dtype, is_big_mat)
+            A = coo_matrix((values, (rows.astype('int32'), cols.astype('int32'))),
+                           shape=(nrows, ncols), dtype=dtype)
         else:
-            A, iline = self._read_complex_dense_ascii(op4, iline, nrows, ncols,
-                                                      line_size, line, dtype, is_big_mat)
+            A = zeros((nrows, ncols), dtype=dtype)
+            A[rows, cols] = values
         return A, iline
 
-    def _read_complex_dense_ascii(self, op4, iline, nrows, ncols, line_size, line, dtype,
-                                  is_big_mat):
-        """Reads a dense complex ASCII matrix"""
-        A = zeros((nrows, ncols), dtype=dtype)  # Initialize a complex matrix
-
-        nloops = 0
-        was_broken = False
-        while 1:
-            if nloops > 0 and not was_broken:
-                line = op4.readline().rstrip()
-                iline += 1
-            was_broken = False
-
-            (icol, irow, nwords) = line.split()
-            icol = int(icol)
-
-            if icol > ncols:
-                break
+    @staticmethod
+    def _check_ascii_headers(text, lines, iline, iheader, ntokens, is_column,
+                             int1, int2, int3, nrows, ncols, is_sparse, is_big_mat):
+        """
+        Checks the column (icol, irow, nwords) and string (IS or L+1, irow)
+        headers of a block of lines against the shape of the matrix
 
-            irow = int(irow)
-            nwords = int(nwords)
-
-            run_loop = True
-            sline = line.strip().split()
-
-            # next sparse entry
-            while (len(sline) == 1 or len(sline) == 2) and 'E' not in line or run_loop:
-                run_loop = False
-
-                iword = 0
-                #unused_is_done_reading_row = False
-                while nwords:
-                    n = 0
-                    line = op4.readline().rstrip()
-                    iline += 1
-                    nwords_in_line = line.count('E')
-                    if nwords_in_line == 0:
-                        was_broken = True
-                        break
+        Raises
+        ------
+        RuntimeError : an out of range or inconsistent header
 
-                    for unused_i in range(nwords_in_line):
-                        value = float(line[n:n + line_size])
-
-                        if iword % 2 == 0:
-                            #A[irow - 1, icol - 1].real = value
-                            real_value = value
-                        else:
-                            A[irow - 1, icol - 1] = complex(real_value, value)
-                            irow += 1
-                        iword += 1
-                        n += line_size
-                    nwords -= nwords_in_line
-                sline = line.strip().split()
-                iline += 1
-                nloops += 1
-
-        op4.readline()
-        iline += 1
-        return A, iline
+        """
+        # a dense column starts at irow >= 1; a sparse column has irow=0
+        if is_sparse:
+            is_bad_irow = int2 != 0
+        else:
+            is_bad_irow = (int2 < 1) | (int2 > nrows)
+        is_bad = is_column & ((int1 < 1) | (int1 > ncols) | is_bad_irow | (int3 < 0))
 
-    def _get_irow_small_ascii(self, op4, iline, line, sline, irow):
-        sline = line.strip().split()
-        if len(sline) == 1:
-            IS = int(line)
+        # the string headers are IS=irow+65536*(L+1) for a small matrix
+        # and (L+1, irow) for a big matrix
+        is_string_header = ~is_column
+        if is_sparse:
+            if is_big_mat:
+                is_bad_string = (ntokens != 2) | (int2 < 1) | (int2 > nrows)
+            else:
+                irow = int1 - 65536 * (int1 // 65536)
+                is_bad_string = (ntokens != 1) | (irow < 1) | (irow > nrows)
+            is_bad |= is_string_header & is_bad_string
         else:
-            line = op4.readline().strip()
-            try:
-                IS = int(line)
-            except ValueError:
-                msg = 'Line %i: Failed getting IROW from %r' % (iline, line)
-                raise ValueError(msg)
-            iline += 1
-        L = IS // 65536 - 1
-        irow = IS - 65536 * (L + 1)
-        if self.debug:
-            self.log.info('small_mat-next row')
-            self.log.info('  IS=%s L=%s irow=%s' % (IS, L, irow))
-        return irow, iline
+            is_bad |= is_string_header
+
+        if is_bad.any():
+            ibad = np.flatnonzero(is_bad)[0]
+            iline_bad = iheader[ibad]
+            msg = 'Line %i: invalid header %r; nrows=%i ncols=%i is_sparse=%s is_big_mat=%s' % (
+                iline + iline_bad, text[lines.start[iline_bad]:lines.end[iline_bad]],
+                nrows, ncols, is_sparse, is_big_mat)
+            raise RuntimeError(msg)
 
     def _get_irow_small_binary(self, op4, data):
         """
@@ -630,20 +589,6 @@ class OP4:
             assert L > 0, L
         return irow, L
 
-    def _get_irow_big_ascii(self, op4, iline, line, sline, irow):
-        sline = line.strip().split()
-        if len(sline) == 2:
-            pass
-        else:
-            sline = op4.readline().strip().split()
-            iline += 1
-        assert len(sline) == 2, 'sline=%s len(sline)=%s' % (sline, len(sline))
-        (idummy, irow) = sline
-        irow = int(irow)
-        if self.debug:
-            self.log.debug("idummy=%s irow=%s" % (idummy, irow))
-        return irow, iline
-
     def _get_irow_big_binary(self, op4, data):
         """
         Returns
@@ -898,114 +843,66 @@ class OP4:
         return A
 
     def _read_real_sparse_binary(self, op4, nrows, ncols, matrix_type, is_big_mat):
+        """Reads a sparse real binary matrix"""
         if self.debug:
             self.log.info('_read_real_sparse_binary')
-        out = self._get_matrix_info(matrix_type, debug=False)
-        (nwords_per_value, nbytes_per_value, data_format, dtype) = out
-        rows = []
-        cols = []
-        entries = []
+        return self._read_sparse_binary(op4, nrows, ncols, matrix_type, is_big_mat)
+
+    def _read_sparse_binary(self, op4, nrows, ncols, matrix_type, is_big_mat,
+                            nbytes_flush=16_000_000):
+        """
+        Reads a sparse binary matrix (real or complex)
+
+        The column records are read as raw bytes.  Blocks of records are
+        then decoded with numpy (see ``_SparseColumnBuffer``), so the work
+        is linear in the size of the matrix.
+
+        Returns
+        -------
+        A : coo_matrix
+            the matrix, which is sorted by column (like the ASCII reader)
 
-        data = ''
+        """
+        (nwords_per_value, unused_nbytes_per_value, unused_data_format,
+         dtype) = self._get_matrix_info(matrix_type, debug=False)
+        value_dtype = np.dtype(dtype).newbyteorder(self._endian)
+        nheader_bytes = 8 if is_big_mat else 4
+        header_struct = Struct(self._endian + ('2i' if is_big_mat else 'i'))
+
+        sparse = _SparseColumnBuffer(ncols, dtype, value_dtype, nwords_per_value,
+                                     is_big_mat, self._endian)
         icol = -1  # dummy value so the loop starts
-        while icol < ncols + 1:  # if isDense
-            #if record_length==0:
+        while icol < ncols + 1:
             assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-            (icol, irow, nwords) = self.get_markers_sparse(op4, is_big_mat)
-            L = nwords
-
+            (icol, unused_irow, nwords) = self.get_markers_sparse(op4, is_big_mat)
             if icol == ncols + 1:
                 if self.debug:
                     self.log.info('breaking on icol=%s ncol+1=%s' % (icol, ncols + 1))
                 break
 
-            if is_big_mat:
-                irow, L = self._get_irow_big_binary(op4, data[:8])
-                data = data[8:]
-            else:
-                irow, L = self._get_irow_small_binary(op4, data[:4])
-                data = data[4:]
-
-            if L == -1:
+            # the first string header gets checked for the end of the matrix
+            # before we read the rest of the record
+            header = op4.read(nheader_bytes)
+            self.n += nheader_bytes
+            nwords_string = _unpack_sparse_header(header_struct, header, 0, is_big_mat)[1]
+            if nwords_string == -1:
                 if self.debug:
                     self.log.info('breaking on L=-1')
                 break
 
-            if self.debug:
-                self.log.info("  next icol")
-                self.log.info("    n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                self._show(op4, 100, types='qd')
-                self.log.info('**************************************************')
-
-            #if nwords == 0 and is_big_mat:
-                #self.n -= 4
-                #op4.seek(self.n)
-                #break
-
             record_length = 4 * nwords
-            data = op4.read(record_length)
+            record = header + op4.read(record_length)
             self.n += record_length
             if self.debug:
-                self.log.info("  data_format=%s record_length=%s n_next=%s" % (
-                    data_format, record_length, self.n))
-            #if icol == ncols + 1:
-                #break
+                self.log.info('  icol=%s nwords=%s n_next=%s' % (icol, nwords, self.n))
 
-            i = 0
-            while len(data) > 0:
-                if i > 0:
-                    if is_big_mat:
-                        (irow, L) = self._get_irow_big_binary(op4, data[0:8])
-                        data = data[8:]
-                    else:
-                        (irow, L) = self._get_irow_small_binary(op4, data[0:4])
-                        data = data[4:]
-                    assert irow > 0
-                nvalues = L // nwords_per_value
-                str_values = self._endian + '%i%s' % (nvalues, data_format)
-
-                if self.debug:
-                    self.log.info('irow=%s L=%s nwords_per_value=%s nvalues=%s '
-                                  'nbytes_per_value=%s' % (irow, L, nwords_per_value,
-                                                           nvalues, nbytes_per_value))
-                    self.log.info('str_values = %r' % str_values)
-
-                value_list = unpack(str_values, data[0:nvalues * nbytes_per_value])
-                assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
+            sparse.add_record(icol, record)
+            if sparse.nbytes > nbytes_flush:
+                sparse.flush()
 
-                #irow -= 1
-                #icol -= 1
-                if self.debug:
-                    self.log.info('rows = %s' % list(i+irow-1 for i in range(nvalues)))
-                    self.log.info('cols = %s ' % ([icol-1] * nvalues))
-                    self.log.info('value_list = %s' % str(value_list))
-
-                rows.extend([i+irow-1 for i in range(nvalues)])
-                irow += nvalues
-                cols.extend([icol-1] * nvalues)
-                entries.extend(value_list)
-
-                record_length -= nvalues * nbytes_per_value
-                data = data[nvalues * nbytes_per_value:]
-                if self.debug:
-                    self.log.info("  record_length=%s nbytes_per_value=%s len(data)=%s" % (
-                        record_length, nbytes_per_value, len(data)))
-                    ##print(A)
-                    #print("********")  # ,data
-                    #print(self.print_block(data))
-                i += 1
-            #print "-------------------------------"
-
-        #if rows == []:  # NULL matrix
-            #raise NotImplementedError()
-
-        A = coo_matrix((entries, (rows, cols)), shape=(nrows, ncols),
-                       dtype=dtype)
         op4.read(4)
         self.n += 4
-
-        return A
+        return sparse.to_csc(nrows).tocoo()
 
     def _show(self, op4, n, types='ifs', endian=None):
         """Shows binary data"""
@@ -1234,112 +1131,7 @@ class OP4:
         """Reads a sparse complex binary matrix"""
         if self.debug:
             self.log.info('_read_complex_sparse_binary')
-        out = self._get_matrix_info(matrix_type, debug=False)
-        (nwords_per_value, nbytes_per_value, data_format, dtype) = out
-        rows = []
-        cols = []
-        entries = []
-        record_length = 0
-        data = ''
-        icol = -1  # dummy value so the loop starts
-        while icol < ncols + 1:  # if isDense
-            #if record_length == 0:
-            assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-            (icol, irow, nwords) = self.get_markers_sparse(op4, is_big_mat)
-            if self.debug:
-                self.log.info("n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                self.log.info("-----------")
-
-            L = nwords
-            if icol == ncols + 1:
-                break
-
-            if is_big_mat:
-                (irow, L) = self._get_irow_big_binary(op4, data[:8])
-                data = data[8:]
-            else:
-                (irow, L) = self._get_irow_small_binary(op4, data[:4])
-                data = data[4:]
-
-            if L == -1:
-                if self.debug:
-                    self.log.info('breaking on L=-1')
-                break
-
-            if self.debug:
-                self.log.info("n=%s icol=%s irow=%s nwords=%s" % (
-                    self.n, icol, irow, nwords))
-                self._show(op4, 100, types='qf')
-                self.log.info('\n\n')
-
-            #if nwords == 0 and is_big_mat:
-                #self.n -= 4
-                #op4.seek(self.n)
-                #break
-
-            record_length = 4 * nwords
-            data = op4.read(record_length)
-            self.n += record_length
-            if self.debug:
-                self.log.info("data_format=%s record_length=%s n_next=%s" % (
-                    data_format, record_length, self.n))
-            if icol == ncols + 1:
-                continue
-
-            nvalues = nwords // nwords_per_value
-            while record_length >= nbytes_per_value:
-                if self.debug:
-                    self.log.info("inner while...")
-                    self.log.info("nwords  = %s" % nwords)
-                    self.log.info("nvalues = %s" % nvalues)
-                    self.log.info("nwords_per_value = %s" % nwords_per_value)
-
-                #if nvalues == 0:
-                    #assert icol == ncols + 1
-                    #break
-
-                # we have 2x values for complex
-                str_values = self._endian + '%i%s' % (nvalues * 2, data_format)
-                if self.debug:
-                    self.log.info("  str_values = %s" % str_values)
-                    self.log.info("  nvalues*nbytes_per_value=%s len(data)=%s" % (
-                        nvalues * nbytes_per_value, len(data)))
-                value_list = unpack(str_values, data[0:nvalues * nbytes_per_value])
-                assert self.n == op4.tell(), 'n=%s tell=%s' % (self.n, op4.tell())
-                #self.show(op4, 4)
-                #print(self.print_block(data))
-                if self.debug:
-                    self.log.info("  value_list = %s" % str(value_list))
-
-                #irow -= 1
-                #icol -= 1
-                irow -= 1
-                icol -= 1
-
-                cols += [icol] * nvalues
-                rows += [i + irow for i in range(nvalues)]
-                for i, value in enumerate(value_list):
-                    if i % 2 == 0:
-                        real_value = value
-                    else:
-                        if self.debug:
-                            self.log.info("  A[%s,%s] = %s" % (
-                                irow, icol, complex(real_value, value)))
-                        #A[irow, icol] = complex(real_value, value)
-                        entries.append(complex(real_value, value))
-                        irow += 1
-
-                record_length -= nvalues * nbytes_per_value
-                data = data[nvalues * nbytes_per_value:]
-                #print("record_length=%s nbytes_per_value=%s" % (record_length, nbytes_per_value))
-                #print(print_matrix(A))
-                #print("********", data)
-
-        A = coo_matrix((entries, (rows, cols)), shape=(nrows, ncols), dtype=dtype)
-        op4.read(4)
-        self.n += 4
-        return A
+        return self._read_sparse_binary(op4, nrows, ncols, matrix_type, is_big_mat)
 
     def get_markers_sparse(self, op4, is_big_mat):
         if is_big_mat:
@@ -1378,7 +1170,7 @@ class OP4:
             The filename to write
             String -> opens a file (closed at the end)
             file   -> no file is opened and it's not closed
-        matrices : Dict[str] = (form, np.ndarray)
+        matrices : Dict[str] = (form, np.ndarray / coo_matrix / csr_matrix / csc_matrix)
             the matrices to write
 
         name_order: str / List[str]; default=None -> sorted based on name
@@ -1414,7 +1206,8 @@ class OP4:
         #else:        op4_form = 2   # rectangular
 
         if isinstance(op4_filename, str):
-            with open(op4_filename, 'w') as op4:
+            mode = 'wb' if is_binary else 'w'
+            with open(op4_filename, mode) as op4:
                 self._write_op4_file(op4, name_order, is_binary, precision, matrices)
         else:
             op4 = op4_filename
@@ -1439,13 +1232,16 @@ class OP4:
             if not form in (1, 2, 3, 6, 8, 9):
                 raise ValueError('form=%r and must be in [1, 2, 3, 6, 8, 9]' % form)
 
-            if isinstance(matrix, coo_matrix):
+            if issparse(matrix):
                 #write_DMIG(f, name, matrix, form, precision='default')
                 if is_binary:
-                    raise NotImplementedError('sparse binary op4 writing not implemented')
+                    _write_sparse_matrix_binary(
+                        op4, name, matrix, form=form,
+                        precision=precision, is_big_mat=is_big_mat,
+                        endian=self._endian)
                 else:
                     _write_sparse_matrix_ascii(
-                        op4, name, matrix, form=form,
+                        op4, name, matrix.tocoo(), form=form,
                         precision=precision, is_big_mat=is_big_mat)
             elif isinstance(matrix, ndarray):
                 if is_binary:
@@ -1678,6 +1474,447 @@ class OP4:
         op4.seek(0)
         return endian
 
+class LazyOP4Matrix:
+    """
+    A matrix in an OP4 that is decoded on access
+
+    The header (name, form, type, shape) and the byte offset of the matrix
+    are known, so only the requested matrix is read.  For binary files,
+    the offsets of the column records are also known, so a subset of the
+    columns may be read.
+
+    .. code-block:: python
+
+       >>> matrices = read_op4(op4_filename, lazy=True)
+       >>> form, phg = matrices['PHG']
+       >>> phg.shape
+       (1200, 500)
+       >>> A = phg.load()
+       >>> A100 = phg.load(columns=slice(100, 200))
+
+    """
+    def __init__(self, op4_filename, name, form, matrix_type, nrows, ncols, offset,
+                 is_binary, is_sparse, is_big_mat, endian='', precision='default', log=None):
+        self.op4_filename = op4_filename
+        self.name = name
+        self.form = form
+        self.matrix_type = matrix_type
+        self.nrows = nrows
+        self.ncols = ncols
+        self.offset = offset
+        self.is_binary = is_binary
+        self.is_sparse = is_sparse
+        self.is_big_mat = is_big_mat
+        self.endian = endian
+        self.precision = precision
+        self.log = log
+
+        # column records (binary only)
+        self.record_icols = None
+        self.record_irows = None
+        self.record_nwords = None
+        self.record_offsets = None
+
+    @property
+    def shape(self):
+        """the shape of the matrix"""
+        return (self.nrows, self.ncols)
+
+    @property
+    def dtype(self):
+        """the dtype of the matrix"""
+        return np.dtype(get_dtype(self.matrix_type, self.precision))
+
+    def load(self, columns=None):
+        """
+        Decodes the matrix
+
+        Parameters
+        ----------
+        columns : slice / (n, ) int ndarray; default=None -> all
+            the 0-based columns to load
+
+        Returns
+        -------
+        matrix : ndarray / coo_matrix
+            the matrix (or the columns of the matrix)
+
+        """
+        op4 = OP4(log=self.log)
+        if columns is not None:
+            icols = np.unique(np.arange(self.ncols)[columns])
+            if self.is_binary:
+                op4._endian = self.endian
+                with open(self.op4_filename, mode='rb') as op4_file:
+                    return op4._read_columns_binary(op4_file, self, icols)
+
+        if self.is_binary:
+            op4._endian = self.endian
+            with open(self.op4_filename, mode='rb') as op4_file:
+                op4_file.seek(self.offset)
+                op4.n = self.offset
+                unused_name, unused_form, matrix = op4._read_matrix_binary(
+                    op4_file, self.precision, None)
+            if matrix.dtype != self.dtype:
+                matrix = matrix.astype(self.dtype)
+        else:
+            # the offset is a byte offset (from read_op4_index_ascii), so
+            # seek in binary mode and decode the lines from there
+            with open(self.op4_filename, mode='rb') as op4_file:
+                op4_file.seek(self.offset)
+                text_file = io.TextIOWrapper(op4_file)
+                unused_name, unused_form, matrix = op4._read_matrix_ascii(
+                    _AsciiLineReader(text_file), None, self.precision)
+
+        if columns is not None:
+            if isinstance(matrix, ndarray):
+                return matrix[:, icols]
+            return matrix.tocsc()[:, icols].tocoo()
+        return matrix
+
+    def __repr__(self):
+        msg = 'LazyOP4Matrix(name=%r, form=%s, matrix_type=%s, shape=%s, is_sparse=%s)' % (
+            self.name, self.form, self.matrix_type, self.shape, self.is_sparse)
+        return msg
+
+
+class _AsciiLineReader:
+    """
+    Reads an ASCII OP4 a line at a time or in blocks of lines.  Text
+    that was read in a block, but belongs to the next matrix, is pushed
+    back.
+    """
+    def __init__(self, op4, nbytes_chunk=4_000_000):
+        self.op4 = op4
+        self.nbytes_chunk = nbytes_chunk
+        self.text = ''
+
+    def readline(self):
+        """reads a line"""
+        if self.text:
+            i = self.text.find('\n')
+            if i == -1:
+                line = self.text + self.op4.readline()
+                self.text = ''
+            else:
+                line = self.text[:i + 1]
+                self.text = self.text[i + 1:]
+            return line
+        return self.op4.readline()
+
+    def read_chunk(self):
+        """reads a block of complete lines"""
+        if self.text:
+            text = self.text
+            self.text = ''
+            return text
+        text = self.op4.read(self.nbytes_chunk)
+        if text and text[-1] != '\n':
+            text += self.op4.readline()
+        return text
+
+    def push_back(self, text):
+        """puts back text that will be read next"""
+        self.text = text + self.text
+
+    def close(self):
+        """closes the file"""
+        self.op4.close()
+
+
+class _AsciiLines:
+    """classifies a block of ASCII OP4 lines with numpy"""
+    def __init__(self, text):
+        self.raw = np.frombuffer(text.encode('latin1'), dtype='uint8')
+        raw = self.raw
+        nbytes = len(raw)
+
+        # the end is the index of the newline
+        end = np.flatnonzero(raw == 10)
+        if nbytes and raw[-1] != 10:
+            end = np.append(end, nbytes)
+        start = np.zeros(len(end), dtype='int64')
+        start[1:] = end[:-1] + 1
+        self.start = start
+        self.end = end
+        self.nlines = len(end)
+
+        # a value line has a decimal point; the number of values is the
+        # number of exponents (E/D)
+        ndots = _count_per_line(raw == ord('.'), start, end)
+        is_exponent = ((raw == ord('E')) | (raw == ord('D')) |
+                       (raw == ord('e')) | (raw == ord('d')))
+        self.is_value = ndots > 0
+        self.nexponents = _count_per_line(is_exponent, start, end)
+
+        # the number of integers on the header lines
+        self.is_space = (raw == 32) | (raw == 10) | (raw == 13) | (raw == 9)
+        is_token_start = ~self.is_space
+        is_token_start[1:] &= self.is_space[:-1]
+        self.ntokens = _count_per_line(is_token_start, start, end)
+
+    def get_headers(self):
+        """
+        Gets the integers on the header (non-value) lines
+
+        Returns
+        -------
+        iheader : (nheaders, ) int ndarray
+            the header lines
+        ints : (ntokens, ) int ndarray
+            the integers on the header lines
+
+        """
+        iheader = np.flatnonzero(~self.is_value)
+        line_nbytes = np.diff(np.append(self.start, len(self.raw)))
+        is_header_byte = np.repeat(~self.is_value, line_nbytes)
+        header_bytes = self.raw[is_header_byte].tobytes().replace(b'\n', b' ')
+        ints = np.array(header_bytes.split(), dtype='int64')
+        return iheader, ints
+
+    def get_fields(self, iend, line_size):
+        """
+        Parses the fixed-width fields of the value lines before line iend
+
+        Each value line has ``nexponents`` fields that are ``line_size``
+        characters wide (e.g., 23 for 1P,3E23.16), so trailing blanks are
+        ignored and short lines are padded.  Some writers don't use the
+        width in the format (e.g., 1P,5E16.9 with 24 character fields),
+        so a wider field is used if the values don't fit.
+
+        Returns
+        -------
+        fields : (nfields, ) float ndarray
+            the values
+
+        """
+        ivalue = np.flatnonzero(self.is_value[:iend])
+        if len(ivalue) == 0:
+            return np.zeros(0, dtype='float64')
+        raw = self.raw
+        start = self.start[ivalue]
+        nfields = self.nexponents[ivalue]
+
+        # the number of characters without the trailing whitespace
+        position = np.arange(len(raw), dtype='int64')
+        last_nonspace = np.maximum.reduceat(np.where(self.is_space, -1, position),
+                                            self.start)[ivalue]
+        nchars = last_nonspace - start + 1
+        if (nchars > nfields * line_size).any():
+            line_size = int((-(-nchars // np.maximum(nfields, 1))).max())
+        nchars_fields = nfields * line_size
+
+        # gather the fields; the characters past the end of a line are blank
+        ntotal = nchars_fields.sum()
+        ichar = (np.arange(ntotal, dtype='int64') -
+                 np.repeat(np.cumsum(nchars_fields) - nchars_fields, nchars_fields))
+        is_char = ichar < np.repeat(nchars, nchars_fields)
+        chars = np.full(ntotal, ord(' '), dtype='uint8')
+        chars[is_char] = raw[(np.repeat(start, nchars_fields) + ichar)[is_char]]
+        values_bytes = chars.tobytes().replace(b'D', b'E').replace(b'd', b'e')
+        return np.frombuffer(values_bytes, dtype='S%i' % line_size).astype('float64')
+
+
+def _count_per_line(is_char, start, end):
+    """counts the characters in each line"""
+    if len(start) == 0:
+        return np.zeros(0, dtype='int64')
+    count = np.add.reduceat(is_char.view('uint8'), start, dtype='int64')
+    # reduceat returns the value at start for empty lines
+    count[start == end] = 0
+    return count
+
+
+def _unpack_sparse_header(header_struct, data, offset, is_big_mat):
+    """
+    Unpacks the string header of a sparse column record
+
+    Returns
+    -------
+    irow : int
+        the 1-based starting row of the string
+    nwords : int
+        the number of words in the string
+
+    """
+    if is_big_mat:
+        nwords_plus_1, irow = header_struct.unpack_from(data, offset)
+        return irow, nwords_plus_1 - 1
+    IS, = header_struct.unpack_from(data, offset)
+    nwords = IS // 65536 - 1
+    irow = IS - 65536 * (nwords + 1)
+    return irow, nwords
+
+def _resize_array(array_old, n, capacity):
+    """grows a preallocated array, keeping the first n values"""
+    array_new = np.zeros(capacity, dtype=array_old.dtype)
+    array_new[:n] = array_old[:n]
+    return array_new
+
+
+class _SparseColumnBuffer:
+    """
+    Collects the sparse column records and decodes them in blocks into
+    preallocated CSC arrays.
+
+    A record is a series of strings (a header and a run of values).  The
+    location of a string depends on the previous string, so the records
+    of a block are walked in lockstep (the i-th string of every record
+    at once).  The values are then gathered with a single fancy index.
+    """
+    def __init__(self, ncols, dtype, value_dtype, nwords_per_value, is_big_mat, endian):
+        self.ncols = ncols
+        self.value_dtype = value_dtype
+        self.int_dtype = np.dtype(endian + 'i4')
+        self.nwords_per_value = nwords_per_value
+        self.nheader_words = 2 if is_big_mat else 1
+        self.is_big_mat = is_big_mat
+        self.col_nnz = np.zeros(ncols, dtype='int64')
+        self.is_sorted = True
+        self.icol_old = 0
+
+        capacity = max(ncols, 16)
+        self.indices = np.zeros(capacity, dtype='int32')
+        self.data = np.zeros(capacity, dtype=dtype)
+        self.cols = []
+        self.nnz = 0
+
+        # the current block
+        self.records = []
+        self.icols = []
+        self.nbytes = 0
+
+    def add_record(self, icol, record):
+        """a record is a bytes object with the (header, values) strings of a column"""
+        self.records.append(record)
+        self.icols.append(icol)
+        self.nbytes += len(record)
+        if icol < self.icol_old:
+            self.is_sorted = False
+        self.icol_old = icol
+
+    def _walk_strings(self, words, record_start, record_end):
+        """
+        Finds the strings in the records
+
+        Returns
+        -------
+        string_record : (nstrings, ) int array
+            the index of the record
+        string_word : (nstrings, ) int array
+            the word index of the first value
+        string_irow : (nstrings, ) int array
+            the 0-based starting row
+        string_nvalues : (nstrings, ) int array
+            the number of values in the string
+
+        """
+        nheader_words = self.nheader_words
+        nwords_per_value = self.nwords_per_value
+        string_record = []
+        string_word = []
+        string_irow = []
+        string_nvalues = []
+
+        position = record_start.copy()
+        irecord = np.arange(len(record_start))
+        while len(irecord):
+            iword = position[irecord]
+            if self.is_big_mat:
+                nwords = words[iword] - 1
+                irow = words[iword + 1]
+            else:
+                IS = words[iword]
+                nwords = IS // 65536 - 1
+                irow = IS - 65536 * (nwords + 1)
+            if irow.min() < 1 or nwords.min() < 0:
+                msg = 'invalid sparse string header; irow=%s nwords=%s' % (
+                    irow[irow < 1], nwords[nwords < 0])
+                raise RuntimeError(msg)
+            nvalues = nwords // nwords_per_value
+            string_record.append(irecord)
+            string_word.append(iword + nheader_words)
+            string_irow.append(irow - 1)
+            string_nvalues.append(nvalues)
+
+            position[irecord] = iword + nheader_words + nvalues * nwords_per_value
+            irecord = irecord[position[irecord] + nheader_words <= record_end[irecord]]
+
+        if (position > record_end).any():
+            msg = 'the sparse strings overrun the column records'
+            raise RuntimeError(msg)
+
+        string_record = np.hstack(string_record)
+        isort = np.argsort(string_record, kind='stable')
+        return (
+            string_record[isort],
+            np.hstack(string_word)[isort],
+            np.hstack(string_irow).astype('int64')[isort],
+            np.hstack(string_nvalues).astype('int64')[isort],
+        )
+
+    def flush(self):
+        """decodes the records of the current block"""
+        if not self.records:
+            return
+        record_nwords = np.array([len(record) for record in self.records], dtype='int64') // 4
+        record_end = np.cumsum(record_nwords)
+        record_start = record_end - record_nwords
+        words = np.frombuffer(b''.join(self.records), dtype=self.int_dtype)
+        record_icol = np.array(self.icols, dtype='int64') - 1
+        self.records = []
+        self.icols = []
+        self.nbytes = 0
+
+        string_record, string_word, string_irow, string_nvalues = self._walk_strings(
+            words, record_start, record_end)
+        string_icol = record_icol[string_record]
+
+        nvalues = string_nvalues.sum()
+        istart = np.cumsum(string_nvalues) - string_nvalues
+        ivalue = np.arange(nvalues, dtype='int64') - np.repeat(istart, string_nvalues)
+        value_word = np.repeat(string_word, string_nvalues) + ivalue * self.nwords_per_value
+        if self.nwords_per_value > 1:
+            value_word = value_word[:, np.newaxis] + np.arange(self.nwords_per_value)
+        values = words.view('uint32')[value_word].view(self.value_dtype).ravel()
+        rows = np.repeat(string_irow, string_nvalues) + ivalue
+
+        nnz = self.nnz
+        nnz2 = nnz + nvalues
+        if nnz2 > len(self.data):
+            capacity = max(2 * len(self.data), nnz2)
+            self.indices = _resize_array(self.indices, nnz, capacity)
+            self.data = _resize_array(self.data, nnz, capacity)
+        self.indices[nnz:nnz2] = rows
+        self.data[nnz:nnz2] = values
+        self.nnz = nnz2
+
+        if not self.is_sorted and not self.cols and nnz:
+            # the previous blocks were in column order
+            self.cols.append(np.repeat(np.arange(self.ncols, dtype='int64'), self.col_nnz))
+        self.col_nnz += np.bincount(string_icol, weights=string_nvalues,
+                                    minlength=self.ncols).astype('int64')
+        if not self.is_sorted:
+            self.cols.append(np.repeat(string_icol, string_nvalues))
+
+    def to_csc(self, nrows):
+        """builds the csc_matrix"""
+        self.flush()
+        nnz = self.nnz
+        indices = self.indices[:nnz]
+        data = self.data[:nnz]
+        shape = (nrows, self.ncols)
+        if not self.is_sorted:
+            # the columns came in out of order, so let scipy sort it out
+            cols = np.hstack(self.cols) if self.cols else np.zeros(0, dtype='int64')
+            A = coo_matrix((data, (indices, cols)), shape=shape, dtype=data.dtype)
+            return A.tocsc()
+
+        indptr = np.zeros(self.ncols + 1, dtype='int64')
+        np.cumsum(self.col_nnz, out=indptr[1:])
+        return csc_matrix((data, indices, indptr), shape=shape, dtype=data.dtype)
+
+
 def _save_matrix(matrices, name, form, matrix):
     """save the matrix"""
     if name in matrices:
@@ -1826,6 +2063,150 @@ def _write_sparse_matrix_ascii(op4, name, A, form: int=2, is_big_mat: bool=False
     op4.write('%8i%8i%8i\n' % (ncols + 1, 1, 1))
     op4.write(' 1.0000000000000000E+00\n')
 
+def _write_sparse_matrix_binary(op4, name, A, form: int=2, is_big_mat: bool=False,
+                                precision: str='default', endian: str='<',
+                                nvalues_chunk: int=1_000_000):
+    """
+    Writes a sparse binary matrix
+
+    Parameters
+    ----------
+    op4 : file
+        a file opened in binary mode
+    name : str
+        the name of the matrix (8 characters max)
+    A : coo_matrix, csr_matrix, csc_matrix
+        the matrix to write
+    form : int; default=2
+        the matrix form
+    is_big_mat : bool; default=False
+        write the BIGMAT format; matrices with more than 65535 rows
+        are always written as BIGMAT
+    precision : str; default='default'
+        'default', 'single', 'double'
+    endian : str; default='<'
+        the endian of the file
+    nvalues_chunk : int; default=1_000_000
+        the approximate number of values written per block of columns
+
+    Each column is a record of strings (a header followed by a run of
+    consecutive rows).  The records for a block of columns are assembled
+    into a single word array and written with ``tobytes``.
+
+    """
+    if isinstance(name, bytes):
+        name = name.decode('ascii')
+    assert len(name) <= 8, 'name=%r is too long; 8 characters max' % name
+    A = A.tocsc(copy=True)
+    A.sum_duplicates()
+    (nrows, ncols) = A.shape
+    matrix_type = _get_type_nwv(A, precision)[0]
+    dtype = get_dtype(matrix_type)
+    nwords_per_value = {1: 1, 2: 2, 3: 2, 4: 4}[matrix_type]
+    if nrows > 65535:
+        is_big_mat = True
+
+    if endian == '':
+        endian = '='
+    int_dtype = np.dtype(endian + 'i4')
+    value_dtype = np.dtype(dtype).newbyteorder(endian)
+
+    nrows_header = -nrows if is_big_mat else nrows
+    name_bytes = ('%-8s' % name).encode('ascii')
+    op4.write(pack(endian + '5i8si', 24, ncols, nrows_header, form, matrix_type,
+                   name_bytes, 24))
+
+    # the small format packs the string length into the upper bits of
+    # the row, so long runs are split up
+    if is_big_mat:
+        nheader_words = 2
+        nvalues_max = nrows
+    else:
+        nheader_words = 1
+        nvalues_max = 32766 // nwords_per_value
+
+    indptr = A.indptr.astype('int64')
+    col_nnz = np.diff(indptr)
+    icols_nonzero = np.flatnonzero(col_nnz)
+    icol0 = 0
+    while icol0 < len(icols_nonzero):
+        # pick the block of columns such that we write about nvalues_chunk values
+        inz0 = indptr[icols_nonzero[icol0]]
+        icol1 = np.searchsorted(indptr[icols_nonzero + 1], inz0 + nvalues_chunk, side='right')
+        icol1 = max(icol1, icol0 + 1)
+        icols = icols_nonzero[icol0:icol1]
+        inz1 = indptr[icols[-1] + 1]
+        _write_sparse_binary_columns(
+            op4, A.indices[inz0:inz1], A.data[inz0:inz1], indptr[icols] - inz0,
+            col_nnz[icols], icols,
+            nheader_words, nwords_per_value, nvalues_max, is_big_mat,
+            int_dtype, value_dtype)
+        icol0 = icol1
+
+    # end of the matrix
+    if matrix_type in [1, 3]:  # single precision
+        op4.write(pack(endian + '4ifi', 16, ncols + 1, 1, 1, 1.0, 16))
+    else:  # double precision
+        op4.write(pack(endian + '4idi', 20, ncols + 1, 1, 2, 1.0, 20))
+
+def _write_sparse_binary_columns(op4, rows, data, icol_start, col_nnz, icols,
+                                 nheader_words, nwords_per_value, nvalues_max, is_big_mat,
+                                 int_dtype, value_dtype):
+    """writes the column records for a block of sparse columns"""
+    nnz = len(rows)
+    ivalue = np.arange(nnz, dtype='int64')
+    icol_local = np.repeat(np.arange(len(icols), dtype='int64'), col_nnz)
+
+    # a string starts at the start of a column, at a gap in the rows,
+    # or when the string is too long
+    is_run_start = np.ones(nnz, dtype='bool')
+    is_run_start[1:] = (rows[1:] != rows[:-1] + 1) | (icol_local[1:] != icol_local[:-1])
+    irun_start = np.flatnonzero(is_run_start)
+    run_offset = ivalue - np.repeat(irun_start, np.diff(np.append(irun_start, nnz)))
+    is_string_start = is_run_start | (run_offset % nvalues_max == 0)
+
+    istring_start = np.flatnonzero(is_string_start)
+    string_nvalues = np.diff(np.append(istring_start, nnz))
+    string_icol = icol_local[istring_start]
+    string_nwords = string_nvalues * nwords_per_value
+    string_size = nheader_words + string_nwords
+
+    # words per column record (excluding the 5 words of markers and ids)
+    record_nwords = np.bincount(string_icol, weights=string_size,
+                                minlength=len(icols)).astype('int64')
+    record_size = record_nwords + 5
+    record_start = np.zeros(len(icols), dtype='int64')
+    np.cumsum(record_size[:-1], out=record_start[1:])
+
+    # the word offset of each string header in the block
+    string_cumsum = np.cumsum(string_size) - string_size
+    first_string = np.searchsorted(string_icol, np.arange(len(icols)))
+    string_start = (record_start[string_icol] + 4 +
+                    string_cumsum - string_cumsum[first_string[string_icol]])
+
+    words = np.zeros(record_size.sum(), dtype='uint32')
+    record_length = 4 * (record_nwords + 3)
+    words[record_start] = record_length.astype(int_dtype).view('uint32')
+    words[record_start + 1] = (icols + 1).astype(int_dtype).view('uint32')
+    words[record_start + 3] = record_nwords.astype(int_dtype).view('uint32')
+    words[record_start + record_size - 1] = words[record_start]
+
+    irow = rows[istring_start].astype('int64') + 1
+    if is_big_mat:
+        words[string_start] = (string_nwords + 1).astype(int_dtype).view('uint32')
+        words[string_start + 1] = irow.astype(int_dtype).view('uint32')
+    else:
+        IS = irow + 65536 * (string_nwords + 1)
+        words[string_start] = IS.astype(int_dtype).view('uint32')
+
+    # the first word of each value
+    value_start = (np.repeat(string_start + nheader_words, string_nvalues) +
+                   (ivalue - np.repeat(istring_start, string_nvalues)) * nwords_per_value)
+    value_words = data.astype(value_dtype).view('uint32').reshape(nnz, nwords_per_value)
+    for iword in range(nwords_per_value):
+        words[value_start + iword] = value_words[:, iword]
+    op4.write(words.tobytes())
+
 def get_big_mat_nrows(nrows: int):
     """
     Parameters
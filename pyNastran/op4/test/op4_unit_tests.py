@@ -1,10 +1,12 @@
 """runs various OP4 tests"""
 import os
+import tempfile
 import unittest
 
 import numpy as np
 from numpy import ones, reshape, arange
 from numpy import ndarray, eye, array_equal, zeros
+from scipy.sparse import coo_matrix
 from pyNastran.op4.op4 import OP4, read_op4
 
 import pyNastran.op4.test
@@ -308,6 +310,224 @@ class TestOP4(unittest.TestCase):
         #for line in Kgg:
             #print(line)
 
+    def test_op4_sparse_binary_coo(self):
+        """tests the sparse binary/ascii readers both build a coo_matrix"""
+        for fname in ['mat_b_s1.op4', 'mat_b_s2.op4']:
+            matrices = read_op4(os.path.join(OP4_PATH, fname))
+            matrices_ascii = read_op4(os.path.join(OP4_PATH, fname.replace('_b_', '_t_')))
+            for name, (form, A) in sorted(matrices.items()):
+                if isinstance(A, ndarray):
+                    continue
+                forma, Aa = matrices_ascii[name]
+                assert A.format == 'coo', (fname, name, A.format)
+                assert Aa.format == 'coo', (fname, name, Aa.format)
+                assert form == forma, (fname, name, form, forma)
+                assert A.dtype == Aa.dtype, (fname, name, A.dtype, Aa.dtype)
+                assert np.array_equal(A.toarray(), Aa.toarray()), (fname, name)
+
+            (unused_form, A) = matrices['EYE10']
+            assert np.array_equal(A.row, arange(10)), A.row
+            assert np.array_equal(A.col, arange(10)), A.col
+
+    def test_op4_lazy(self):
+        """tests the indexed OP4 reader"""
+        for fname in ['mat_b_dn.op4', 'mat_b_s1.op4', 'mat_b_s2.op4',
+                      'mat_t_dn.op4', 'mat_t_s1.op4', 'testplate_kgg.op4']:
+            op4_filename = os.path.join(OP4_PATH, fname)
+            matrices = read_op4(op4_filename)
+            lazy_matrices = read_op4(op4_filename, lazy=True)
+            assert sorted(matrices) == sorted(lazy_matrices), fname
+            for name, (form, matrix) in matrices.items():
+                lazy_form, lazy_matrix = lazy_matrices[name]
+                assert form == lazy_form, (fname, name)
+                assert matrix.shape == lazy_matrix.shape, (fname, name)
+                assert matrix.dtype == lazy_matrix.dtype, (fname, name)
+
+                matrix2 = lazy_matrix.load()
+                assert type(matrix) == type(matrix2), (fname, name)
+                if isinstance(matrix, ndarray):
+                    dense_matrix = matrix
+                    assert array_equal(dense_matrix, matrix2), (fname, name)
+                else:
+                    dense_matrix = matrix.toarray()
+                    assert array_equal(dense_matrix, matrix2.toarray()), (fname, name)
+
+                columns = lazy_matrix.load(columns=slice(1, None, 2))
+                if not isinstance(columns, ndarray):
+                    columns = columns.toarray()
+                assert array_equal(dense_matrix[:, 1::2], columns), (fname, name)
+
+        lazy_matrices = read_op4(os.path.join(OP4_PATH, 'mat_b_s1.op4'),
+                                 matrix_names='RND1CD', lazy=True)
+        assert list(lazy_matrices) == ['RND1CD'], list(lazy_matrices)
+
+    def test_op4_lazy_precision_crlf(self):
+        """the lazy reader honors precision and CRLF line endings"""
+        op4_filename = os.path.join(OP4_PATH, 'mat_b_dn.op4')
+        matrices = read_op4(op4_filename, precision='single')
+        lazy_matrices = read_op4(op4_filename, precision='single', lazy=True)
+        for name, (unused_form, matrix) in matrices.items():
+            lazy_matrix = lazy_matrices[name][1]
+            assert lazy_matrix.dtype.name in ('float32', 'complex64'), (name, lazy_matrix.dtype)
+            assert lazy_matrix.load().dtype == lazy_matrix.dtype, name
+            columns = lazy_matrix.load(columns=[0])
+            assert columns.dtype == lazy_matrix.dtype, (name, columns.dtype)
+            if not isinstance(columns, ndarray):
+                columns = columns.toarray()
+            assert np.allclose(columns, lazy_matrix.load()[:, [0]]), name
+
+        op4_filename = os.path.join(OP4_PATH, 'mat_t_dn.op4')
+        matrices = read_op4(op4_filename)
+        with open(op4_filename, 'r') as op4_file:
+            lines = op4_file.read().splitlines()
+        with tempfile.TemporaryDirectory() as dirname:
+            op4_filename2 = os.path.join(dirname, 'crlf.op4')
+            with open(op4_filename2, 'wb') as op4_file:
+                op4_file.write(('\r\n'.join(lines) + '\r\n').encode('ascii'))
+            lazy_matrices = read_op4(op4_filename2, lazy=True)
+            assert sorted(matrices) == sorted(lazy_matrices)
+            for name, (unused_form, matrix) in matrices.items():
+                matrix2 = lazy_matrices[name][1].load()
+                if not isinstance(matrix, ndarray):
+                    matrix = matrix.toarray()
+                    matrix2 = matrix2.toarray()
+                assert array_equal(matrix, matrix2), name
+
+    def test_op4_ascii_d_exponent(self):
+        """tests ASCII matrices with D exponents and trailing whitespace"""
+        for fname in ['mat_t_dn.op4', 'mat_t_s1.op4', 'mat_t_s2.op4']:
+            op4_filename = os.path.join(OP4_PATH, fname)
+            matrices = read_op4(op4_filename)
+            with open(op4_filename, 'r') as op4_file:
+                lines = op4_file.readlines()
+
+            with tempfile.TemporaryDirectory() as dirname:
+                op4_filename2 = os.path.join(dirname, 'd_exponent.op4')
+                with open(op4_filename2, 'w') as op4_file:
+                    for line in lines:
+                        if '.' in line[:32]:
+                            line = line.replace('E', 'D').rstrip() + '  \n'
+                        op4_file.write(line)
+                matrices2 = read_op4(op4_filename2)
+
+            assert sorted(matrices) == sorted(matrices2), fname
+            for name, (form, matrix) in matrices.items():
+                form2, matrix2 = matrices2[name]
+                assert form == form2, (fname, name)
+                assert type(matrix) == type(matrix2), (fname, name)
+                if not isinstance(matrix, ndarray):
+                    matrix = matrix.toarray()
+                    matrix2 = matrix2.toarray()
+                assert array_equal(matrix, matrix2), (fname, name)
+
+    def test_op4_ascii_field_width(self):
+        """tests the ASCII field width comes from the header format"""
+        # left justified fields with trailing blanks and a short last line
+        values = ['%-23s' % ('%.16E' % value) for value in [1., 2., 3., 4.]]
+        lines = [
+            '%8i%8i%8i%8i%-8s1P,3E23.16' % (1, 4, 2, 2, 'A'),
+            '%8i%8i%8i' % (1, 1, 4),
+            ''.join(values[:3]),
+            values[3] + '   ',
+            '%8i%8i%8i' % (2, 1, 1),
+            values[0],
+        ]
+        with tempfile.TemporaryDirectory() as dirname:
+            op4_filename = os.path.join(dirname, 'field_width.op4')
+            with open(op4_filename, 'w') as op4_file:
+                op4_file.write('\n'.join(lines) + '\n')
+            unused_form, matrix = read_op4(op4_filename)['A']
+        assert array_equal(matrix, [[1.], [2.], [3.], [4.]]), matrix
+
+        # the writer didn't use the 16 character width in the format
+        unused_form, matrix = read_op4(os.path.join(OP4_PATH, 'long_name.op4'))['ABCDEFGF']
+        assert array_equal(matrix, [[10.]]), matrix
+
+    def test_op4_ascii_bad_headers(self):
+        """tests that out of range ASCII column/string headers raise"""
+        value = ' 1.0000000000000000E+00'
+        dense_lines = [
+            '%8i%8i%8i%8i%-8s1P,3E23.16' % (2, 2, 6, 2, 'A'),
+            '%8i%8i%8i' % (1, 1, 2), value * 2,
+            '%8i%8i%8i' % (2, 1, 2), value * 2,
+            '%8i%8i%8i' % (3, 1, 1), value,
+        ]
+        sparse_lines = [
+            '%8i%8i%8i%8i%-8s1P,3E23.16' % (2, 2, 6, 2, 'A'),
+            '%8i%8i%8i' % (1, 0, 3), '%8i' % (1 + 65536 * 3), value,
+            '%8i%8i%8i' % (2, 0, 3), '%8i' % (2 + 65536 * 3), value,
+            '%8i%8i%8i' % (3, 1, 1), value,
+        ]
+
+        # a small matrix string header with BIGMAT rows
+        bigmat_lines = list(sparse_lines)
+        bigmat_lines[0] = '%8i%8i%8i%8i%-8s1P,3E23.16' % (2, 70000, 6, 2, 'A')
+
+        # a sparse string after the last row
+        string_lines = list(sparse_lines)
+        string_lines[5] = '%8i' % (3 + 65536 * 3)
+
+        # a dense column after the last row
+        irow_lines = list(dense_lines)
+        irow_lines[1] = '%8i%8i%8i' % (1, 3, 2)
+
+        # a column before the first column
+        icol_lines = list(dense_lines)
+        icol_lines[3] = '%8i%8i%8i' % (0, 1, 2)
+
+        # a dense string that runs past the last row
+        overflow_lines = list(dense_lines)
+        overflow_lines[3] = '%8i%8i%8i' % (2, 2, 2)
+
+        with tempfile.TemporaryDirectory() as dirname:
+            op4_filename = os.path.join(dirname, 'bad_headers.op4')
+            for lines in [dense_lines, sparse_lines]:
+                with open(op4_filename, 'w') as op4_file:
+                    op4_file.write('\n'.join(lines) + '\n')
+                unused_form, matrix = read_op4(op4_filename)['A']
+                assert matrix.shape == (2, 2), matrix.shape
+
+            for lines in [bigmat_lines, string_lines, irow_lines, icol_lines, overflow_lines]:
+                with open(op4_filename, 'w') as op4_file:
+                    op4_file.write('\n'.join(lines) + '\n')
+                with self.assertRaisesRegex(RuntimeError, 'invalid header|out of range'):
+                    read_op4(op4_filename)
+
+    def test_op4_sparse_binary_write(self):
+        """tests sparse binary writing for small/BIGMAT and real/complex matrices"""
+        from scipy.sparse import random as sparse_random
+        from pyNastran.op4.op4 import _write_sparse_matrix_binary
+        A = sparse_random(70, 50, density=0.2, random_state=1, format='coo')
+        B = A + 1j * sparse_random(70, 50, density=0.2, random_state=2, format='coo')
+        matrices = {
+            'AS': (2, A.astype('float32')),
+            'AD': (2, A.tocsr()),
+            'BS': (2, B.astype('complex64').tocsc()),
+            'BD': (2, B.tocoo()),
+        }
+        with tempfile.TemporaryDirectory() as dirname:
+            op4_filename = os.path.join(dirname, 'sparse_binary.op4')
+            op4 = OP4()
+            op4.write_op4(op4_filename, matrices, is_binary=True)
+            matrices2 = read_op4(op4_filename)
+            for name, (form, matrix) in matrices.items():
+                form2, matrix2 = matrices2[name]
+                assert form == form2, (name, form, form2)
+                assert matrix.dtype == matrix2.dtype, (name, matrix.dtype, matrix2.dtype)
+                assert np.array_equal(matrix.toarray(), matrix2.toarray()), name
+
+            # BIGMAT with small blocks of columns, a long string, and a null matrix
+            dense_column = np.arange(1., 40001.).reshape(40000, 1)
+            with open(op4_filename, 'wb') as op4_file:
+                _write_sparse_matrix_binary(op4_file, 'A', A, form=2, is_big_mat=True,
+                                            nvalues_chunk=17)
+                _write_sparse_matrix_binary(op4_file, 'DENSE', coo_matrix(dense_column))
+                _write_sparse_matrix_binary(op4_file, 'NULL', coo_matrix((3, 4)))
+            matrices2 = read_op4(op4_filename)
+            assert np.array_equal(matrices2['A'][1].toarray(), A.toarray())
+            assert np.array_equal(matrices2['DENSE'][1].toarray(), dense_column)
+            assert np.array_equal(matrices2['NULL'][1], np.zeros((3, 4)))
+
 def get_matrices():
     """creates dummy matrices"""
     strings = np.array([